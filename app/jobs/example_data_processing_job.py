@@ -1,6 +1,10 @@
 import asyncio
 import logging
+from typing import Any, List, Optional, Tuple
+
+from routemq.batching import Batcher
 from routemq.job import Job
+from routemq.queue.queue_manager import dispatch
 
 logger = logging.getLogger('RouteMQ.Jobs.ProcessDataJob')
 
@@ -21,51 +25,103 @@ class ProcessDataJob(Job):
         job.device_id = "sensor-001"
         job.sensor_data = {"temperature": 25.5, "humidity": 60}
         await dispatch(job)
+
+        # Or collect many readings into one job (see SensorBatcher)
+        job = ProcessDataJob()
+        job.readings = [["sensor-001", {"temperature": 25.5}], ["sensor-002", {"humidity": 60}]]
+        await dispatch(job)
     """
 
     # Configure job properties
     max_tries = 5
     timeout = 120  # Longer timeout for data processing
-    retry_after = 5
+    retry_after = 5  # First retry after 5 seconds, doubling on each further failure
+    retry_backoff_enabled = True
+    retry_backoff_max_delay = 60
+    retry_backoff_jitter = 0.5
     queue = 'data-processing'
 
     def __init__(self):
         super().__init__()
         self.device_id = None
         self.sensor_data = None
+        # Optional batch of [device_id, sensor_data] pairs processed in one run
+        self.readings: Optional[List[Any]] = None
+
+    def get_readings(self) -> List[Tuple[Any, Any]]:
+        """Return the readings this job covers: the batch if set, else the single reading."""
+        if self.readings:
+            return [(device_id, sensor_data) for device_id, sensor_data in self.readings]
+        return [(self.device_id, self.sensor_data)]
 
     async def handle(self) -> None:
         """
         Execute the job - process sensor data.
         """
-        logger.info(f'Processing data from device {self.device_id}')
-        logger.info(f'Sensor data: {self.sensor_data}')
+        readings = self.get_readings()
+        logger.info(f'Processing {len(readings)} reading(s)')
 
-        # Simulate data processing
+        # Simulate data processing (paid once per batch, like a single bulk INSERT would be)
         await asyncio.sleep(3)
 
         # Example: Calculate statistics
-        if isinstance(self.sensor_data, dict):
-            temperature = self.sensor_data.get('temperature')
-            humidity = self.sensor_data.get('humidity')
+        for device_id, sensor_data in readings:
+            logger.info(f'Sensor data from device {device_id}: {sensor_data}')
+            if not isinstance(sensor_data, dict):
+                continue
+
+            temperature = sensor_data.get('temperature')
+            humidity = sensor_data.get('humidity')
 
             if temperature and temperature > 30:
-                logger.warning(f'High temperature detected: {temperature}°C')
+                logger.warning(f'High temperature detected on {device_id}: {temperature}°C')
 
             if humidity and humidity > 80:
-                logger.warning(f'High humidity detected: {humidity}%')
+                logger.warning(f'High humidity detected on {device_id}: {humidity}%')
 
         # In a real application, you might:
-        # - Store processed data in a database
+        # - Store processed data in a database (one multi-row INSERT for the whole batch)
         # - Calculate aggregations and statistics
         # - Trigger alerts if thresholds are exceeded
         # - Send data to analytics services
 
-        logger.info(f'Successfully processed data from device {self.device_id}')
+        logger.info(f'Successfully processed {len(readings)} reading(s)')
 
     async def failed(self, exception: Exception) -> None:
         """
         Handle permanent job failure.
         """
-        logger.error(f'Failed to process data from device {self.device_id} after {self.max_tries} attempts')
+        devices = sorted({str(device_id) for device_id, _sensor_data in self.get_readings()})
+        logger.error(f'Failed to process data from device(s) {", ".join(devices)} after {self.max_tries} attempts')
         logger.error(f'Error: {str(exception)}')
+
+
+class SensorBatcher:
+    """
+    Collects concurrent sensor readings and dispatches them as one ProcessDataJob.
+
+    Readings arriving within ``max_queue_time`` seconds of the first pending one (or until
+    ``max_batch_size`` are pending) become a single job, so the queue and the database each
+    see one write per batch instead of one per reading. ``process`` returns once the batch
+    holding the reading has been dispatched, and raises if that dispatch failed.
+
+    Usage:
+        sensor_batcher = SensorBatcher()
+
+        # In an MQTT handler
+        await sensor_batcher.process(device_id, payload)
+    """
+
+    def __init__(self, max_batch_size: int = 200, max_queue_time: float = 0.05, job_class: type = ProcessDataJob):
+        self.job_class = job_class
+        self._batcher: Batcher[Tuple[Any, Any], None] = Batcher(self._flush, max_batch_size, max_queue_time)
+
+    async def process(self, device_id: Any, sensor_data: Any) -> None:
+        """Queue one reading and wait until the batch containing it is dispatched."""
+        await self._batcher.process((device_id, sensor_data))
+
+    async def _flush(self, batch: List[Tuple[Any, Any]]) -> List[None]:
+        job = self.job_class()
+        job.readings = [[device_id, sensor_data] for device_id, sensor_data in batch]
+        await dispatch(job)
+        return [None] * len(batch)
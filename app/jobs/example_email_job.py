@@ -25,7 +25,10 @@ class SendEmailJob(Job):
     # Configure job properties
     max_tries = 3
     timeout = 30
-    retry_after = 10  # Retry after 10 seconds on failure
+    retry_after = 10  # First retry after 10 seconds, doubling on each further failure
+    retry_backoff_enabled = True
+    retry_backoff_max_delay = 120
+    retry_backoff_jitter = 0.5
     queue = 'emails'  # Use 'emails' queue instead of 'default'
 
     def __init__(self):
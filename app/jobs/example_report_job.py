@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from datetime import datetime
+import time
 from routemq.job import Job
 
 logger = logging.getLogger('RouteMQ.Jobs.GenerateReportJob')
@@ -31,7 +31,10 @@ class GenerateReportJob(Job):
     # Configure job properties
     max_tries = 2
     timeout = 300  # 5 minutes for report generation
-    retry_after = 60  # Retry after 1 minute
+    retry_after = 60  # First retry after 1 minute, doubling on each further failure
+    retry_backoff_enabled = True
+    retry_backoff_max_delay = 600
+    retry_backoff_jitter = 0.5
     queue = 'reports'
 
     def __init__(self):
@@ -55,7 +58,11 @@ class GenerateReportJob(Job):
         # - Send email notification with download link
         # - Update user's report history
 
-        report_file = f'{self.report_type}_report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pdf'
+        ts = time.gmtime()
+        report_file = (
+            f'{self.report_type}_report_'
+            f'{ts.tm_year:04d}{ts.tm_mon:02d}{ts.tm_mday:02d}_{ts.tm_hour:02d}{ts.tm_min:02d}{ts.tm_sec:02d}.pdf'
+        )
 
         logger.info(f'Report generated successfully: {report_file}')
         logger.info(f'Report available for user {self.user_id}')
@@ -1,10 +1,78 @@
+import fnmatch
+import hashlib
+import math
+import re
 import time
-from typing import Any, Callable, Dict, Optional, List
+import uuid
+from collections import OrderedDict, deque
+from typing import Any, Callable, Dict, Optional, List, Sequence
 
+from routemq.batching import Batcher
 from routemq.middleware import Middleware
 from routemq.observability import start_span
 from routemq.redis_manager import redis_manager
 
+try:
+    from redis.exceptions import NoScriptError
+except ImportError:  # pragma: no cover - optional dependency fallback
+
+    class NoScriptError(Exception):  # type: ignore[no-redef]
+        """Placeholder so script fallbacks still type-check without redis installed."""
+
+
+# Static part of every denial response; handle() copies it and adds the per-request fields.
+_RATE_LIMIT_EXCEEDED_RESPONSE: Dict[str, Any] = {'error': 'rate_limit_exceeded'}
+
+
+# (script, sha, keys, args) for one batched EVALSHA call
+_ScriptCall = tuple[str, str, Sequence[str], Sequence[Any]]
+
+
+def _script_sha(script: str) -> str:
+    return hashlib.sha1(script.encode('utf-8'), usedforsecurity=False).hexdigest()
+
+
+class RateLimitBatcher:
+    """
+    Coalesces concurrent Redis rate-limit script calls into one pipelined round trip.
+
+    Calls arriving within ``max_queue_time`` seconds of the first pending call (or until
+    ``max_batch_size`` calls are pending) are sent as one non-transactional pipeline of
+    EVALSHA commands. Each script stays atomic on its own keys, so batching changes only
+    how many network round trips are paid, not the limiter semantics.
+    """
+
+    def __init__(
+        self,
+        client_getter: Callable[[], Any],
+        max_batch_size: int = 64,
+        max_queue_time: float = 0.002,
+    ):
+        self._client_getter = client_getter
+        self._batcher: Batcher[_ScriptCall, list[Any]] = Batcher(self._flush, max_batch_size, max_queue_time)
+
+    async def process(self, script: str, sha: str, keys: Sequence[str], args: Sequence[Any]) -> list[Any]:
+        """Queue one script call and wait for its result from the next batch flush."""
+        return await self._batcher.process((script, sha, keys, args))
+
+    async def _flush(self, batch: List[_ScriptCall]) -> list[Any]:
+        client = self._client_getter()
+        pipe = client.pipeline(transaction=False)
+        for _script, sha, keys, args in batch:
+            pipe.evalsha(sha, len(keys), *keys, *args)
+        results = list(await pipe.execute(raise_on_error=False))
+
+        # Scripts missing from the server cache (e.g. after a Redis restart) are re-sent with EVAL
+        missing = [index for index, result in enumerate(results) if isinstance(result, NoScriptError)]
+        if missing:
+            pipe = client.pipeline(transaction=False)
+            for index in missing:
+                script, _sha, keys, args = batch[index]
+                pipe.eval(script, len(keys), *keys, *args)
+            for index, result in zip(missing, await pipe.execute(raise_on_error=False)):
+                results[index] = result
+        return results
+
 
 class RateLimitMiddleware(Middleware):
     """
@@ -12,6 +80,66 @@ class RateLimitMiddleware(Middleware):
     Supports multiple rate limiting strategies including sliding window and token bucket.
     """
 
+    # Atomic sliding-window check: trim, count, conditionally record, and compute the
+    # reset time in a single round trip so concurrent gateways cannot both claim the
+    # last slot. ARGV: window_start, current_time, max_requests, window_seconds, nonce.
+    # The nonce keeps members unique so requests within the same second are counted separately.
+    SLIDING_LUA = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, ARGV[1])
+local count = redis.call('ZCARD', KEYS[1])
+if count >= tonumber(ARGV[3]) then
+    local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+    return {0, 0, (oldest[2] or ARGV[2]) + ARGV[4] - ARGV[2]}
+end
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[2] .. ':' .. ARGV[5])
+redis.call('EXPIRE', KEYS[1], ARGV[4] + 1)
+return {1, ARGV[3] - count - 1, ARGV[4]}
+"""
+    _sliding_sha = _script_sha(SLIDING_LUA)
+
+    # Atomic token bucket: bucket state lives in one hash ({t: tokens, r: last_refill}) and
+    # refill/consume happen server-side so concurrent consumers share one consistent bucket.
+    # The hash uses a ':tb' key; earlier releases kept a plain string under ':bucket'.
+    # ARGV: max_requests, current_time, refill_rate, max_capacity, ttl_seconds, seconds_per_token.
+    TOKEN_BUCKET_LUA = """
+local bucket = redis.call('HMGET', KEYS[1], 't', 'r')
+local rate = tonumber(ARGV[3])
+local capacity = tonumber(ARGV[4])
+local tokens = tonumber(bucket[1]) or tonumber(ARGV[1])
+local last_refill = tonumber(bucket[2]) or tonumber(ARGV[2])
+tokens = math.min(capacity, tokens + (tonumber(ARGV[2]) - last_refill) * rate)
+if tokens < 1 then
+    return {0, 0, 0}
+end
+tokens = tokens - 1
+redis.call('HSET', KEYS[1], 't', tokens, 'r', ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[5])
+return {1, math.floor(tokens), math.floor((capacity - tokens) * tonumber(ARGV[6]))}
+"""
+    _token_bucket_sha = _script_sha(TOKEN_BUCKET_LUA)
+
+    # Approximate sliding window (two fixed-window counters, previous window weighted by the
+    # share of it still inside the sliding window). O(1) memory and work per key regardless
+    # of max_requests. Keys carry an ':approx:' segment so they never collide with the
+    # fixed_window counters. KEYS: current window, previous window. ARGV: current_time,
+    # window_seconds, max_requests.
+    APPROX_SLIDING_LUA = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local current = redis.call('INCR', KEYS[1])
+redis.call('EXPIRE', KEYS[1], window * 2)
+redis.call('EXPIRE', KEYS[2], window * 2)
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local elapsed = now % window
+local count = previous * (1 - elapsed / window) + current
+if count > tonumber(ARGV[3]) then
+    redis.call('DECR', KEYS[1])
+    return {0, 0, window - elapsed}
+end
+return {1, math.floor(tonumber(ARGV[3]) - count), window - elapsed}
+"""
+    _approx_sliding_sha = _script_sha(APPROX_SLIDING_LUA)
+
     def __init__(
         self,
         max_requests: int = 100,
@@ -24,6 +152,8 @@ class RateLimitMiddleware(Middleware):
         block_duration: Optional[int] = None,
         whitelist: Optional[List[str]] = None,
         custom_error_message: Optional[str] = None,
+        redis_batch_window: Optional[float] = None,
+        redis_batch_size: int = 64,
     ):
         """
         Initialize rate limiting middleware.
@@ -34,14 +164,19 @@ class RateLimitMiddleware(Middleware):
                 (0 or negative) are not validated here and may produce runtime errors —
                 callers should pass a positive integer.
             window_seconds: Time window in seconds
-            strategy: Rate limiting strategy ('sliding_window', 'fixed_window', 'token_bucket')
+            strategy: Rate limiting strategy ('sliding_window', 'fixed_window', 'token_bucket',
+                'approximate_sliding')
             key_generator: Custom function to generate rate limit keys
             burst_allowance: Additional requests allowed for burst traffic (token bucket only)
             redis_key_prefix: Prefix for Redis keys
             fallback_enabled: Enable in-memory fallback when Redis is unavailable
             block_duration: Duration to block after limit exceeded (None = window_seconds)
-            whitelist: List of patterns/keys to whitelist (bypass rate limiting)
+            whitelist: Keys to whitelist (bypass rate limiting); a trailing '*' matches by
+                prefix, any other pattern matches when it occurs anywhere in the key
             custom_error_message: Custom error message for rate limit exceeded
+            redis_batch_window: Seconds to coalesce concurrent Redis checks into one pipeline
+                (e.g. 0.002). None disables batching so every check is sent immediately.
+            redis_batch_size: Maximum checks per batched pipeline; a full batch is sent at once
         """
         super().__init__()
 
@@ -57,15 +192,35 @@ class RateLimitMiddleware(Middleware):
         self.fallback_enabled = fallback_enabled
         self.block_duration = block_duration or window_seconds
         self.whitelist = set(whitelist or [])
+        # Partition once so the per-message check is a set lookup plus C-level string scans.
+        # 'prefix*' patterns match by prefix; plain patterns keep their substring semantics.
+        self._wl_exact = frozenset(p for p in self.whitelist if not p.endswith('*'))
+        self._wl_prefix = tuple(p[:-1] for p in self.whitelist if p.endswith('*'))
+        self._wl_substr = tuple(self._wl_exact)
         self.custom_error_message = custom_error_message
 
+        # Constants of every token-bucket decision, computed once instead of per message.
+        # A non-positive max_requests is rejected on the first check, not here.
+        self._rate = max_requests / window_seconds
+        self._inv_rate = window_seconds / max_requests if max_requests > 0 else float(window_seconds)
+        self._max_capacity = max_requests + self.burst_allowance
+        self._refill_seconds = math.ceil(self._inv_rate)
+        self._rl_static = (max_requests, window_seconds)
+
+        self.redis_batch_window = redis_batch_window
+        self.redis_batch_size = redis_batch_size
+        self._batcher: Optional[RateLimitBatcher] = None
+        if redis_batch_window is not None:
+            self._batcher = RateLimitBatcher(self._redis_client, redis_batch_size, redis_batch_window)
+
         # In-memory fallback storage
-        self._memory_cache: Dict[str, Dict] = {}
+        # Insertion order is creation order, so expired entries are always at the head
+        self._memory_cache: OrderedDict[str, Dict] = OrderedDict()
         self._cache_cleanup_interval = 60  # seconds
         self._last_cleanup = time.time()
 
         # Validate strategy
-        if self.strategy not in ['sliding_window', 'fixed_window', 'token_bucket']:
+        if self.strategy not in ['sliding_window', 'fixed_window', 'token_bucket', 'approximate_sliding']:
             raise ValueError(f'Invalid strategy: {self.strategy}')
 
         self.logger.info(
@@ -96,10 +251,11 @@ class RateLimitMiddleware(Middleware):
         Returns:
             True if whitelisted
         """
-        for pattern in self.whitelist:
-            if pattern in key or key.startswith(pattern):
-                return True
-        return False
+        return (
+            key in self._wl_exact
+            or key.startswith(self._wl_prefix)
+            or any(pattern in key for pattern in self._wl_substr)
+        )
 
     async def handle(self, context: Dict, next_handler):
         """
@@ -126,40 +282,31 @@ class RateLimitMiddleware(Middleware):
             allowed, remaining, reset_time = await self._check_rate_limit(rate_limit_key)
             self._annotate_span(span, allowed=allowed, remaining=remaining, reset_time=reset_time)
 
+            # Add rate limit info to context (also for custom handling of denials)
+            max_requests, window_seconds = self._rl_static
+            context['rate_limit'] = {
+                'exceeded': not allowed,
+                'key': rate_limit_key,
+                'remaining': remaining,
+                'reset_time': reset_time,
+                'max_requests': max_requests,
+                'window_seconds': window_seconds,
+            }
+
             if not allowed:
-                error_message = self.custom_error_message or f'Rate limit exceeded. Try again in {reset_time} seconds.'
                 self.logger.warning(f'Rate limit exceeded for key: {rate_limit_key}')
 
-                # Add rate limit info to context for potential custom handling
-                context['rate_limit'] = {
-                    'exceeded': True,
-                    'key': rate_limit_key,
+                response = _RATE_LIMIT_EXCEEDED_RESPONSE.copy()
+                response['message'] = (
+                    self.custom_error_message or f'Rate limit exceeded. Try again in {reset_time} seconds.'
+                )
+                response['rate_limit'] = {
+                    'max_requests': max_requests,
+                    'window_seconds': window_seconds,
                     'remaining': remaining,
                     'reset_time': reset_time,
-                    'max_requests': self.max_requests,
-                    'window_seconds': self.window_seconds,
                 }
-
-                return {
-                    'error': 'rate_limit_exceeded',
-                    'message': error_message,
-                    'rate_limit': {
-                        'max_requests': self.max_requests,
-                        'window_seconds': self.window_seconds,
-                        'remaining': remaining,
-                        'reset_time': reset_time,
-                    },
-                }
-
-            # Add rate limit info to context
-            context['rate_limit'] = {
-                'exceeded': False,
-                'key': rate_limit_key,
-                'remaining': remaining,
-                'reset_time': reset_time,
-                'max_requests': self.max_requests,
-                'window_seconds': self.window_seconds,
-            }
+                return response
 
             self.logger.debug(f'Rate limit check passed for key: {rate_limit_key}, remaining: {remaining}')
 
@@ -227,48 +374,27 @@ class RateLimitMiddleware(Middleware):
             return await self._fixed_window_redis(redis_key, current_time)
         elif self.strategy == 'token_bucket':
             return await self._token_bucket_redis(redis_key, current_time)
+        elif self.strategy == 'approximate_sliding':
+            return await self._approx_sliding_redis(redis_key, current_time)
         else:
             raise ValueError(f'Unknown strategy: {self.strategy}')
 
     async def _sliding_window_redis(self, redis_key: str, current_time: int) -> tuple[bool, int, int]:
         """
-        Sliding window rate limiting using Redis sorted sets.
+        Sliding window rate limiting using Redis sorted sets, evaluated atomically in Lua.
         """
         window_start = current_time - self.window_seconds
-        client = self._redis_client()
-        pipe = client.pipeline()
-
-        # Remove old entries
-        pipe.zremrangebyscore(redis_key, 0, window_start)
-
-        # Count current requests in window
-        pipe.zcard(redis_key)
-
-        # Add current request
-        pipe.zadd(redis_key, {str(current_time): current_time})
-
-        # Set expiration
-        pipe.expire(redis_key, self.window_seconds + 1)
-
-        results = await pipe.execute()
-        current_count = results[1]
-
-        if current_count >= self.max_requests:
-            # Get the oldest entry to calculate reset time
-            oldest_entries = await client.zrange(redis_key, 0, 0, withscores=True)
-            if oldest_entries:
-                oldest_time = int(oldest_entries[0][1])
-                reset_time = oldest_time + self.window_seconds - current_time
-            else:
-                reset_time = self.window_seconds
-
-            # Remove the request we just added since it's not allowed
-            await client.zrem(redis_key, str(current_time))
+        allowed, remaining, reset_time = await self._eval_script(
+            self.SLIDING_LUA,
+            self._sliding_sha,
+            [redis_key],
+            [window_start, current_time, self.max_requests, self.window_seconds, uuid.uuid4().hex],
+        )
 
-            return False, 0, max(reset_time, 1)
+        if not allowed:
+            return False, 0, max(int(reset_time), 1)
 
-        remaining = self.max_requests - current_count - 1
-        return True, remaining, self.window_seconds
+        return True, int(remaining), int(reset_time)
 
     async def _fixed_window_redis(self, redis_key: str, current_time: int) -> tuple[bool, int, int]:
         """
@@ -298,45 +424,43 @@ class RateLimitMiddleware(Middleware):
 
     async def _token_bucket_redis(self, redis_key: str, current_time: int) -> tuple[bool, int, int]:
         """
-        Token bucket rate limiting using Redis.
+        Token bucket rate limiting using a Redis hash, refilled and consumed atomically in Lua.
         """
-        bucket_key = f'{redis_key}:bucket'
-        last_refill_key = f'{redis_key}:last_refill'
-
-        # Get current bucket state
-        client = self._redis_client()
-        pipe = client.pipeline()
-        pipe.get(bucket_key)
-        pipe.get(last_refill_key)
-        results = await pipe.execute()
-
-        current_tokens = int(results[0] or self.max_requests)
-        last_refill = int(results[1] or current_time)
-
-        # Calculate tokens to add based on time elapsed
-        time_elapsed = current_time - last_refill
-        tokens_to_add = int(time_elapsed * (self.max_requests / self.window_seconds))
+        allowed, remaining, reset_time = await self._eval_script(
+            self.TOKEN_BUCKET_LUA,
+            self._token_bucket_sha,
+            [f'{redis_key}:tb'],
+            [
+                self.max_requests,
+                current_time,
+                self._rate,
+                self._max_capacity,
+                self.window_seconds * 2,
+                self._inv_rate,
+            ],
+        )
 
-        # Refill tokens (max capacity = max_requests + burst_allowance)
-        max_capacity = self.max_requests + self.burst_allowance
-        current_tokens = min(max_capacity, current_tokens + tokens_to_add)
+        if not allowed:
+            return False, 0, self._refill_seconds
 
-        if current_tokens < 1:
-            # No tokens available
-            reset_time = int(self.window_seconds / self.max_requests)  # Time to get 1 token
-            return False, 0, reset_time
+        return True, int(remaining), int(reset_time)
 
-        # Consume one token
-        current_tokens -= 1
+    async def _approx_sliding_redis(self, redis_key: str, current_time: int) -> tuple[bool, int, int]:
+        """
+        Approximate sliding window rate limiting using two Redis fixed-window counters.
+        """
+        current_window = current_time // self.window_seconds
+        allowed, remaining, reset_time = await self._eval_script(
+            self.APPROX_SLIDING_LUA,
+            self._approx_sliding_sha,
+            [f'{redis_key}:approx:{current_window}', f'{redis_key}:approx:{current_window - 1}'],
+            [current_time, self.window_seconds, self.max_requests],
+        )
 
-        # Update bucket state
-        pipe = client.pipeline()
-        pipe.set(bucket_key, current_tokens, ex=self.window_seconds * 2)
-        pipe.set(last_refill_key, current_time, ex=self.window_seconds * 2)
-        await pipe.execute()
+        if not allowed:
+            return False, 0, max(int(reset_time), 1)
 
-        reset_time = int((max_capacity - current_tokens) * (self.window_seconds / self.max_requests))
-        return True, current_tokens, reset_time
+        return True, max(int(remaining), 0), int(reset_time)
 
     async def _check_rate_limit_memory(self, key: str) -> tuple[bool, int, int]:
         """
@@ -349,7 +473,7 @@ class RateLimitMiddleware(Middleware):
             await self._cleanup_memory_cache(current_time)
 
         if key not in self._memory_cache:
-            self._memory_cache[key] = {'requests': [], 'created': current_time}
+            self._memory_cache[key] = {'requests': deque(), 'created': current_time}
 
         cache_entry = self._memory_cache[key]
 
@@ -359,26 +483,32 @@ class RateLimitMiddleware(Middleware):
             return self._fixed_window_memory(cache_entry, current_time)
         elif self.strategy == 'token_bucket':
             return self._token_bucket_memory(cache_entry, current_time)
+        elif self.strategy == 'approximate_sliding':
+            return self._approx_sliding_memory(cache_entry, current_time)
         else:
             raise ValueError(
-                f'Unknown strategy: {self.strategy}, pick from sliding_window, fixed_window, token_bucket!'
+                f'Unknown strategy: {self.strategy}, pick from sliding_window, fixed_window, token_bucket, '
+                'approximate_sliding!'
             )
 
     def _sliding_window_memory(self, cache_entry: Dict, current_time: float) -> tuple[bool, int, int]:
         """Sliding window rate limiting in memory."""
         window_start = current_time - self.window_seconds
 
-        # Remove old requests
-        cache_entry['requests'] = [req_time for req_time in cache_entry['requests'] if req_time > window_start]
+        # Timestamps are appended in order, so expired requests are always at the head
+        requests = cache_entry['requests']
+        while requests and requests[0] <= window_start:
+            requests.popleft()
 
-        if len(cache_entry['requests']) >= self.max_requests:
-            oldest_request = min(cache_entry['requests'])
-            reset_time = int(oldest_request + self.window_seconds - current_time)
+        if len(requests) >= self.max_requests:
+            if not requests:
+                raise ValueError(f'max_requests must be a positive integer; got {self.max_requests}')
+            reset_time = int(requests[0] + self.window_seconds - current_time)
             return False, 0, max(reset_time, 1)
 
         # Add current request
-        cache_entry['requests'].append(current_time)
-        remaining = self.max_requests - len(cache_entry['requests'])
+        requests.append(current_time)
+        remaining = self.max_requests - len(requests)
 
         return True, remaining, self.window_seconds
 
@@ -388,7 +518,7 @@ class RateLimitMiddleware(Middleware):
 
         # Reset counter if we're in a new window
         if cache_entry.get('window_start', 0) != window_start:
-            cache_entry['requests'] = []
+            cache_entry['requests'].clear()
             cache_entry['window_start'] = window_start
 
         if len(cache_entry['requests']) >= self.max_requests:
@@ -410,38 +540,82 @@ class RateLimitMiddleware(Middleware):
 
         # Calculate tokens to add
         time_elapsed = current_time - cache_entry['last_refill']
-        tokens_to_add = time_elapsed * (self.max_requests / self.window_seconds)
+        tokens_to_add = time_elapsed * self._rate
 
-        max_capacity = self.max_requests + self.burst_allowance
+        max_capacity = self._max_capacity
         cache_entry['tokens'] = min(max_capacity, cache_entry['tokens'] + tokens_to_add)
         cache_entry['last_refill'] = current_time
 
         if cache_entry['tokens'] < 1:
-            reset_time = int(self.window_seconds / self.max_requests)
-            return False, 0, reset_time
+            return False, 0, self._refill_seconds
 
         # Consume token
         cache_entry['tokens'] -= 1
-        reset_time = int((max_capacity - cache_entry['tokens']) * (self.window_seconds / self.max_requests))
+        reset_time = int((max_capacity - cache_entry['tokens']) * self._inv_rate)
 
         return True, int(cache_entry['tokens']), reset_time
 
+    def _approx_sliding_memory(self, cache_entry: Dict, current_time: float) -> tuple[bool, int, int]:
+        """Approximate sliding window rate limiting in memory."""
+        window_start = int(current_time // self.window_seconds) * self.window_seconds
+
+        # Roll the counters forward; a gap of more than one window leaves nothing to carry over
+        stored_start = cache_entry.get('window_start')
+        if stored_start != window_start:
+            if stored_start == window_start - self.window_seconds:
+                cache_entry['prev_count'] = cache_entry.get('cur_count', 0)
+            else:
+                cache_entry['prev_count'] = 0
+            cache_entry['cur_count'] = 0
+            cache_entry['window_start'] = window_start
+
+        elapsed = current_time - window_start
+        weight = 1 - elapsed / self.window_seconds
+        count = cache_entry['prev_count'] * weight + cache_entry['cur_count'] + 1
+        reset_time = int(window_start + self.window_seconds - current_time)
+
+        if count > self.max_requests:
+            return False, 0, max(reset_time, 1)
+
+        cache_entry['cur_count'] += 1
+        remaining = max(int(self.max_requests - count), 0)
+
+        return True, remaining, reset_time
+
     async def _cleanup_memory_cache(self, current_time: float):
         """Clean up old entries from memory cache."""
-        keys_to_remove = []
+        # Remove entries older than 2 * window_seconds, stopping at the first young one
+        cutoff = current_time - (self.window_seconds * 2)
+        removed = 0
 
-        for key, cache_entry in self._memory_cache.items():
-            # Remove entries older than 2 * window_seconds
-            if current_time - cache_entry.get('created', 0) > (self.window_seconds * 2):
-                keys_to_remove.append(key)
-
-        for key in keys_to_remove:
-            del self._memory_cache[key]
+        while self._memory_cache:
+            oldest = next(iter(self._memory_cache.values()))
+            if oldest.get('created', 0) >= cutoff:
+                break
+            self._memory_cache.popitem(last=False)
+            removed += 1
 
         self._last_cleanup = current_time
 
-        if keys_to_remove:
-            self.logger.debug(f'Cleaned up {len(keys_to_remove)} old rate limit entries from memory')
+        if removed:
+            self.logger.debug(f'Cleaned up {removed} old rate limit entries from memory')
+
+    async def _eval_script(self, script: str, sha: str, keys: Sequence[str], args: Sequence[Any]) -> list[Any]:
+        """
+        Run a Lua script by SHA, falling back to EVAL when Redis has not cached it yet.
+
+        EVAL also loads the script into the server cache, so NOSCRIPT is paid at most
+        once per script per Redis restart. With batching enabled the call is coalesced with
+        other concurrent checks into a single pipeline.
+        """
+        if self._batcher is not None:
+            return await self._batcher.process(script, sha, keys, args)
+
+        client = self._redis_client()
+        try:
+            return await client.evalsha(sha, len(keys), *keys, *args)
+        except NoScriptError:
+            return await client.eval(script, len(keys), *keys, *args)
 
     def _redis_client(self) -> Any:
         client = redis_manager.get_client()
@@ -476,43 +650,50 @@ class TopicRateLimitMiddleware(RateLimitMiddleware):
         self.topic_limits = topic_limits or {}
         self.default_limit = default_config
 
+        # Translate each glob once and build its limiter up front; fnmatch would re-compile the
+        # pattern per message, and a per-message limiter would start with an empty memory cache
+        self._compiled_limits: List[tuple[re.Pattern[str], RateLimitMiddleware]] = [
+            (re.compile(fnmatch.translate(pattern)), self._build_topic_middleware(config))
+            for pattern, config in self.topic_limits.items()
+        ]
+
         self.logger.info(f'Topic rate limit middleware initialized with {len(self.topic_limits)} topic-specific limits')
 
     async def handle(self, context: Dict, next_handler):
         """Handle topic-specific rate limiting."""
         topic = context.get('topic', '')
 
-        # Find matching topic limit
-        topic_config = None
-        for pattern, config in self.topic_limits.items():
-            if self._topic_matches_pattern(topic, pattern):
-                topic_config = config
-                break
-
-        if topic_config:
-            # Create temporary middleware with topic-specific config
-            temp_middleware = RateLimitMiddleware(
-                max_requests=topic_config.get('max_requests', self.default_limit['max_requests']),
-                window_seconds=topic_config.get('window_seconds', self.default_limit['window_seconds']),
-                strategy=topic_config.get('strategy', self.strategy),
-                burst_allowance=topic_config.get('burst_allowance', self.burst_allowance),
-                redis_key_prefix=self.redis_key_prefix,
-                fallback_enabled=self.fallback_enabled,
-                block_duration=topic_config.get('block_duration', self.block_duration),
-                whitelist=topic_config.get('whitelist', []),
-                custom_error_message=topic_config.get('custom_error_message', self.custom_error_message),
-            )
+        topic_middleware = self._match_topic_middleware(topic)
 
-            return await temp_middleware.handle(context, next_handler)
+        if topic_middleware is not None:
+            return await topic_middleware.handle(context, next_handler)
 
         # Use default rate limiting
         return await super().handle(context, next_handler)
 
-    def _topic_matches_pattern(self, topic: str, pattern: str) -> bool:
-        """Check if topic matches pattern (supports wildcards)."""
-        import fnmatch
+    def _build_topic_middleware(self, topic_config: Dict[str, Any]) -> RateLimitMiddleware:
+        """Create the limiter for one topic pattern, inheriting unset options from this middleware."""
+        topic_middleware = RateLimitMiddleware(
+            max_requests=topic_config.get('max_requests', self.default_limit['max_requests']),
+            window_seconds=topic_config.get('window_seconds', self.default_limit['window_seconds']),
+            strategy=topic_config.get('strategy', self.strategy),
+            burst_allowance=topic_config.get('burst_allowance', self.burst_allowance),
+            redis_key_prefix=self.redis_key_prefix,
+            fallback_enabled=self.fallback_enabled,
+            block_duration=topic_config.get('block_duration', self.block_duration),
+            whitelist=topic_config.get('whitelist', []),
+            custom_error_message=topic_config.get('custom_error_message', self.custom_error_message),
+        )
+        # Share one batcher so checks for different topics still coalesce into the same pipeline
+        topic_middleware._batcher = self._batcher
+        return topic_middleware
 
-        return fnmatch.fnmatch(topic, pattern)
+    def _match_topic_middleware(self, topic: str) -> Optional[RateLimitMiddleware]:
+        """Return the limiter of the first topic pattern (fnmatch wildcards) matching topic."""
+        for regex, topic_middleware in self._compiled_limits:
+            if regex.match(topic):
+                return topic_middleware
+        return None
 
 
 class ClientRateLimitMiddleware(RateLimitMiddleware):
@@ -534,19 +715,17 @@ class ClientRateLimitMiddleware(RateLimitMiddleware):
 
     def _default_key_generator(self, context: Dict) -> str:
         """Generate key based on client ID."""
-        # Try to get client ID from payload first, then context
-        payload = context.get('payload', {})
-        client_id = None
-
-        if isinstance(payload, dict):
-            client_id = payload.get(self.client_id_field)
+        # Try to get client ID from payload first (the common case), then context
+        try:
+            client_id = context['payload'][self.client_id_field]
+        except (KeyError, TypeError, IndexError):
+            client_id = None
 
         if not client_id:
             client_id = context.get(self.client_id_field)
 
-        if not client_id:
-            # Fallback to topic-based limiting
-            topic = context.get('topic', 'unknown')
-            return f'topic:{topic}'
+            if not client_id:
+                # Fallback to topic-based limiting
+                return f'topic:{context.get("topic", "unknown")}'
 
         return f'client:{client_id}'
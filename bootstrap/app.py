@@ -1,16 +1,19 @@
 import asyncio
+import functools
 import logging
 import os
 import platform
 import psutil
 import signal
+from collections import deque
 from collections.abc import Callable
 from importlib import import_module
 from importlib.util import find_spec
 from typing import Any
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values, load_dotenv
 
+from routemq.event_loop import loop_factory
 from routemq.health import HealthServer, HealthStatus, health_server_from_env
 from routemq.logging_config import configure_logging, json_logging_enabled
 from routemq.metrics.exposition import negotiate_content_type, render as render_stdlib_metrics
@@ -27,16 +30,22 @@ from routemq.settings import (
     load_database_pool_settings,
     load_health_http_settings,
     load_metrics_http_settings,
+    load_mqtt_settings,
     load_telemetry_settings,
 )
 from routemq.telemetry import telemetry
 from routemq.mqtt_utils import (
+    MqttPublisherPool,
     connect_mqtt_client_with_retries,
     create_mqtt_client,
+    create_mqtt_publisher_pool,
     extract_trace_context,
     get_main_client_id,
     get_mqtt_connection_config,
     get_mqtt_group_name,
+    get_mqtt_ingress_config,
+    get_mqtt_retry_config,
+    get_mqtt_tls_config,
     parse_mqtt_payload,
 )
 from routemq.worker_manager import WorkerManager
@@ -46,11 +55,25 @@ from routemq.tsdb.tsdb_manager import tsdb_manager
 
 observability = import_module('routemq.observability')
 
+# Log the first dropped ingress message and then every Nth one
+_INGRESS_DROP_LOG_EVERY = 1000
+
+
+class _IngressQueue(asyncio.Queue[tuple[Any, Any]]):
+    """``asyncio.Queue`` of ``(client, msg)`` pairs that can look at the oldest pair without taking it."""
+
+    def _init(self, maxsize: int) -> None:
+        self._queue: deque[tuple[Any, Any]] = deque()
+
+    def peek_nowait(self) -> tuple[Any, Any]:
+        return self._queue[0]
+
 
 class Application:
     @staticmethod
+    @functools.cache
     def get_version() -> str:
-        """Get installed package version, with src-checkout fallback."""
+        """Get installed package version, with src-checkout fallback; resolved once per process."""
         from importlib.metadata import PackageNotFoundError, version
 
         try:
@@ -99,7 +122,7 @@ Running on {system_info} | CPU: {cpu_count} cores | RAM: {memory_gb} GB
             show_banner: Whether to print the standard RouteMQ startup banner
             log_to_console: Whether startup logging should include a console handler
         """
-        load_dotenv(env_file)
+        _load_env_file(env_file)
 
         self._setup_logging(log_to_console=log_to_console)
 
@@ -128,6 +151,9 @@ Running on {system_info} | CPU: {cpu_count} cores | RAM: {memory_gb} GB
                 # Audit Accept: router auto-discovery fallback keeps manual router registration usable.
                 self.logger.warning(f'Could not load routers dynamically: {str(e)}')
                 self.logger.info('Using empty router. Register routes manually.')
+        self.router.compile()
+        # (routes list, route count, subscriptions) built by _nonshared_subscriptions()
+        self._nonshared_subs: tuple[list[Any], int, list[tuple[str, int]]] | None = None
 
         self.database_settings = load_database_connection_settings()
         self.database_enabled = self.database_settings.enabled
@@ -158,9 +184,13 @@ Running on {system_info} | CPU: {cpu_count} cores | RAM: {memory_gb} GB
             self.logger.info('Telemetry integration is disabled')
 
         self.client: Any = None
-        self.group_name = get_mqtt_group_name()
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
+        # Handed to handlers instead of the main client when MQTT_PUB_POOL > 0
+        self.publisher: MqttPublisherPool | None = None
+        # Parsed once; connect() and the ingress pipeline reuse it instead of re-reading the environment
+        self.mqtt_settings = load_mqtt_settings()
+        self.group_name = get_mqtt_group_name(self.mqtt_settings)
+        # Created by run() through asyncio.Runner so the loop factory can be swapped
+        self.loop: Any = None
 
         self.worker_manager = WorkerManager(self.router, self.group_name, self.router_directory)
         self.health_status = HealthStatus()
@@ -168,6 +198,9 @@ Running on {system_info} | CPU: {cpu_count} cores | RAM: {memory_gb} GB
         self.metrics_health_server: HealthServer | None = None
         self._setup_metrics()
         self._shutdown_requested = False
+        # Ingress state; _start_ingress() creates the queue and applies MQTT_INGRESS_FULL_STRATEGY
+        self._ingress_drop_oldest = False
+        self._ingress_dropped = 0
 
     def _setup_logging(self, log_to_console: bool = True):
         """Configure logging based on environment variables."""
@@ -294,11 +327,18 @@ Running on {system_info} | CPU: {cpu_count} cores | RAM: {memory_gb} GB
                 self.logger.warning('Telemetry initialization skipped')
 
     async def _initialize_connections(self):
-        """Initialize database, Redis, TSDB, and telemetry connections."""
-        await self.initialize_database()
-        await self.initialize_redis()
-        await self.initialize_tsdb()
-        await self.initialize_telemetry()
+        """Initialize database, Redis, TSDB, and telemetry connections concurrently."""
+        results = await asyncio.gather(
+            self.initialize_database(),
+            self.initialize_redis(),
+            self.initialize_tsdb(),
+            self.initialize_telemetry(),
+            return_exceptions=True,
+        )
+        # Every initializer has settled, so cleanup never races a half-open connection
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
     async def _cleanup_connections(self):
         """Cleanup database, Redis, TSDB, and telemetry connections."""
@@ -313,51 +353,151 @@ Running on {system_info} | CPU: {cpu_count} cores | RAM: {memory_gb} GB
 
     def _on_connect(self, client, userdata, flags, rc):
         """Callback for when the client receives a CONNACK response from the server."""
-        self.logger.info(f'Main client connected with result code {rc}')
+        self.logger.info('Main client connected with result code %s', rc)
         if hasattr(self, 'health_status'):
             self.health_status.mqtt_connected = rc == 0
 
-        for route in self.router.routes:
-            if not route.shared:
-                topic = route.get_subscription_topic()
-                self.logger.info(f'Main client subscribing to {topic}')
-                client.subscribe(topic, route.qos)
-                self.logger.info(f'Subscribed to {topic} with QoS {route.qos}')
+        subscriptions = self._nonshared_subscriptions()
+        if subscriptions:
+            # One SUBSCRIBE packet for every route instead of one round trip per topic
+            client.subscribe(subscriptions)
+            self.logger.info('Main client subscribing to %d topic(s)', len(subscriptions))
+            self.logger.debug('Main client subscriptions: %s', subscriptions)
+
+    def _nonshared_subscriptions(self) -> list[tuple[str, int]]:
+        """Return ``(topic, qos)`` pairs for non-shared routes, rebuilt only when the route list changes."""
+        routes = self.router.routes
+        cached = self._nonshared_subs
+        # Same staleness check as Router.dispatch: a replaced list or a changed length means rebuild
+        if cached is None or cached[0] is not routes or cached[1] != len(routes):
+            subscriptions = [(route.get_subscription_topic(), route.qos) for route in routes if not route.shared]
+            cached = (routes, len(routes), subscriptions)
+            self._nonshared_subs = cached
+        return cached[2]
 
     def _on_message(self, client, userdata, msg):
-        """Callback for when a PUBLISH message is received from the server."""
-        self.logger.debug(f'Received message on topic {msg.topic}')
+        """Callback for when a PUBLISH message is received from the server.
 
+        Runs on Paho's network thread, so it only hands the message to the
+        application loop; decoding and dispatch happen in the ingress consumers.
+        Messages are parked in a deque and the loop is woken once per burst
+        rather than once per message.
+        """
+        self._ingress_pending.append((client, msg))
+        if self._ingress_wakeup:
+            return
+        self._ingress_wakeup = True
         try:
-            payload = parse_mqtt_payload(msg.payload)
-            context = {
-                'source': 'mqtt',
-                'mqtt_topic': msg.topic,
-                'process': 'main',
-            }
-            context.update(extract_trace_context(msg))
-            message_id = getattr(msg, 'mid', None)
-            if message_id is not None:
-                context['messaging.message.id'] = str(message_id)
-            coro = self._dispatch_mqtt_message(msg.topic, payload, client, context)
-            try:
-                asyncio.run_coroutine_threadsafe(coro, self.loop)
-            except Exception:
-                coro.close()
-                raise
-
+            self.loop.call_soon_threadsafe(self._drain_ingress_pending)
         except Exception as e:
-            topic = getattr(msg, 'topic', 'unknown')
-            observability.lifecycle(
-                'mqtt.message.failed',
-                {'process': 'main', 'error': e.__class__.__name__, 'mqtt_topic': topic},
-            )
-            self.logger.error(
-                f'Error processing message on topic {topic}: {str(e)}',
-                exc_info=True,
-                extra={'mqtt_topic': topic, 'error': e.__class__.__name__},
+            self._ingress_wakeup = False
+            self._log_message_failure(msg, e)
+
+    def _drain_ingress_pending(self) -> None:
+        """Move every message parked by the Paho thread into the ingress queue."""
+        # Clear the flag before draining so a message appended meanwhile either
+        # lands in this drain or schedules the next one.
+        self._ingress_wakeup = False
+        pending = self._ingress_pending
+        while pending:
+            self._enqueue_ingress(*pending.popleft())
+
+    def _enqueue_ingress(self, client: Any, msg: Any) -> None:
+        """Queue a received message on the application loop, dropping one message when the queue is full.
+
+        ``drop_newest`` discards the arriving message; ``drop_oldest`` evicts the
+        longest-waiting one so consumers always see the freshest readings. Only a
+        QoS 0 message is evicted: Paho has already acknowledged QoS 1/2 deliveries,
+        so when one of those is oldest the arriving message is dropped instead.
+        """
+        ingress = self._ingress
+        try:
+            ingress.put_nowait((client, msg))
+            return
+        except asyncio.QueueFull:
+            dropped = msg
+            if self._ingress_drop_oldest and getattr(ingress.peek_nowait()[1], 'qos', 0) == 0:
+                _, dropped = ingress.get_nowait()
+                ingress.task_done()
+                ingress.put_nowait((client, msg))
+
+        topic = getattr(dropped, 'topic', 'unknown')
+        observability.lifecycle(
+            'mqtt.message.failed',
+            {'process': 'main', 'error': 'QueueFull', 'mqtt_topic': topic},
+        )
+        self._ingress_dropped += 1
+        # One warning per burst of drops is enough; the lifecycle event counts each one
+        if self._ingress_dropped % _INGRESS_DROP_LOG_EVERY == 1:
+            self.logger.warning(
+                'Dropping message on topic %s: ingress queue is full (%d dropped so far)',
+                topic,
+                self._ingress_dropped,
+                extra={'mqtt_topic': topic, 'error': 'QueueFull', 'dropped': self._ingress_dropped},
             )
 
+    async def _consume_ingress(self) -> None:
+        """Decode and dispatch queued MQTT messages until cancelled."""
+        ingress = self._ingress
+        publisher = getattr(self, 'publisher', None)
+        while True:
+            client, msg = await ingress.get()
+            try:
+                await self._process_mqtt_message(client if publisher is None else publisher, msg)
+            except Exception as e:
+                self._log_message_failure(msg, e)
+            finally:
+                ingress.task_done()
+
+    async def _process_mqtt_message(self, client: Any, msg: Any) -> None:
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug('Received message on topic %s', msg.topic)
+        payload = parse_mqtt_payload(msg.payload)
+        context = {
+            'source': 'mqtt',
+            'mqtt_topic': msg.topic,
+            'process': 'main',
+        }
+        context.update(extract_trace_context(msg))
+        message_id = getattr(msg, 'mid', None)
+        if message_id is not None:
+            context['messaging.message.id'] = str(message_id)
+        await self._dispatch_mqtt_message(msg.topic, payload, client, context)
+
+    def _log_message_failure(self, msg: Any, exc: Exception) -> None:
+        topic = getattr(msg, 'topic', 'unknown')
+        observability.lifecycle(
+            'mqtt.message.failed',
+            {'process': 'main', 'error': exc.__class__.__name__, 'mqtt_topic': topic},
+        )
+        self.logger.error(
+            f'Error processing message on topic {topic}: {str(exc)}',
+            exc_info=True,
+            extra={'mqtt_topic': topic, 'error': exc.__class__.__name__},
+        )
+
+    def _start_ingress(self) -> None:
+        """Create the ingress queue and its consumer tasks on the application loop."""
+        config = get_mqtt_ingress_config(getattr(self, 'mqtt_settings', None))
+        self._ingress = _IngressQueue(maxsize=config.queue_size)
+        self._ingress_drop_oldest = config.full_strategy == 'drop_oldest'
+        self._ingress_pending: deque[tuple[Any, Any]] = deque()
+        self._ingress_wakeup = False
+        self._ingress_consumers = [self.loop.create_task(self._consume_ingress()) for _ in range(config.consumers)]
+
+    def _stop_ingress(self) -> None:
+        """Cancel the ingress consumers; messages still queued are discarded."""
+        consumers = getattr(self, '_ingress_consumers', [])
+        if not consumers:
+            return
+        for task in consumers:
+            task.cancel()
+        self.loop.run_until_complete(asyncio.gather(*consumers, return_exceptions=True))
+        self._ingress_consumers = []
+        pending = self._ingress.qsize()
+        if pending:
+            self.logger.warning(f'Discarded {pending} queued MQTT message(s) during shutdown')
+
     async def _dispatch_mqtt_message(self, topic: str, payload: Any, client: Any, context: dict[str, Any]) -> None:
         """Restore MQTT correlation context inside the application event loop."""
         token = observability.set_context(context)
@@ -383,8 +523,12 @@ Running on {system_info} | CPU: {cpu_count} cores | RAM: {memory_gb} GB
 
     def connect(self):
         """Connect to the MQTT broker."""
-        config = get_mqtt_connection_config()
-        client_id = get_main_client_id()
+        settings = getattr(self, 'mqtt_settings', None)
+        if settings is None:
+            settings = load_mqtt_settings()
+        config = get_mqtt_connection_config(settings)
+        client_id = get_main_client_id(settings)
+        retry_config = get_mqtt_retry_config(settings)
 
         self.client = create_mqtt_client(
             client_id,
@@ -393,10 +537,31 @@ Running on {system_info} | CPU: {cpu_count} cores | RAM: {memory_gb} GB
             on_disconnect=self._on_disconnect,
             username=config.username,
             password=config.password,
+            socket_path=config.socket_path,
+            max_inflight=config.max_inflight,
+            tls_config=get_mqtt_tls_config(settings),
+            retry_config=retry_config,
         )
 
-        self.logger.info(f'Connecting main client to {config.broker}:{config.port}')
-        connect_mqtt_client_with_retries(self.client, config.broker, config.port, process='main')
+        self.logger.info(f'Connecting main client to {config.describe()}')
+        connect_mqtt_client_with_retries(
+            self.client,
+            config.host,
+            config.port,
+            retry_config=retry_config,
+            process='main',
+            keepalive=config.keepalive,
+        )
+
+        if config.publisher_pool_size > 0:
+            self.logger.info('Connecting %d publisher client(s) for handler publishes', config.publisher_pool_size)
+            self.publisher = create_mqtt_publisher_pool(
+                self.client,
+                client_id,
+                config,
+                tls_config=get_mqtt_tls_config(settings),
+                retry_config=retry_config,
+            )
 
     def _on_disconnect(self, client, userdata, rc):
         """Callback for when the client disconnects from the broker."""
@@ -410,7 +575,7 @@ Running on {system_info} | CPU: {cpu_count} cores | RAM: {memory_gb} GB
         self.logger.info(f'Received {signal_name}; requesting graceful shutdown...')
         self._shutdown_requested = True
         self.health_status.shutting_down = True
-        if self.loop.is_running():
+        if self.loop is not None and self.loop.is_running():
             self.loop.call_soon_threadsafe(self.loop.stop)
 
     def _install_signal_handlers(self) -> dict[int, Any]:
@@ -454,52 +619,60 @@ Running on {system_info} | CPU: {cpu_count} cores | RAM: {memory_gb} GB
         if not hasattr(self, 'telemetry_enabled'):
             self.telemetry_enabled = False
         previous_handlers = self._install_signal_handlers()
-        self.start_workers()
-        if self.health_server is not None:
-            self.health_server.start()
-        if self.metrics_health_server is not None:
-            self.metrics_health_server.start()
-        if self.client is not None:
-            self.client.loop_start()
-
-        try:
-            self.loop.run_until_complete(self.initialize_database())
-            self.loop.run_until_complete(self.initialize_redis())
-            self.loop.run_until_complete(self.initialize_tsdb())
-            self.loop.run_until_complete(self.initialize_telemetry())
-            self.health_status.startup_complete = True
-            self.logger.info('Application started. Press Ctrl+C to exit.')
-            self.logger.info(f'Active workers: {self.worker_manager.get_worker_count()}')
-            self.loop.run_forever()
-
-        except KeyboardInterrupt:
-            # Audit Accept: Ctrl+C is the expected graceful shutdown path.
-            self.logger.info('Shutting down...')
-            self.health_status.shutting_down = True
-
-        finally:
-            self.logger.info('Application cleanup started')
-            self.health_status.shutting_down = True
-            self.worker_manager.stop_workers()
-            if getattr(self, 'telemetry_enabled', False):
-                self.loop.run_until_complete(telemetry.close())
-            if self.tsdb_enabled:
-                self.loop.run_until_complete(tsdb_manager.disconnect())
-            if self.redis_enabled:
-                self.loop.run_until_complete(redis_manager.disconnect())
-            if getattr(self, 'database_enabled', self.mysql_enabled):
-                self.loop.run_until_complete(Model.cleanup())
+        with asyncio.Runner(loop_factory=loop_factory()) as runner:
+            self.loop = runner.get_loop()
+            self.start_workers()
             if self.health_server is not None:
-                self.health_server.stop()
+                self.health_server.start()
             if self.metrics_health_server is not None:
-                self.metrics_health_server.stop()
+                self.metrics_health_server.start()
+            self._start_ingress()
             if self.client is not None:
-                self.client.loop_stop()
-                self.client.disconnect()
-            self.health_status.alive = False
-            self._restore_signal_handlers(previous_handlers)
-            self.loop.close()
-            self.logger.info('Application cleanup completed')
+                self.client.loop_start()
+            publisher = getattr(self, 'publisher', None)
+            if publisher is not None:
+                publisher.loop_start()
+
+            try:
+                self.loop.run_until_complete(self._initialize_connections())
+                self.health_status.startup_complete = True
+                self.logger.info('Application started. Press Ctrl+C to exit.')
+                self.logger.info(f'Active workers: {self.worker_manager.get_worker_count()}')
+                self.loop.run_forever()
+
+            except KeyboardInterrupt:
+                # Audit Accept: Ctrl+C is the expected graceful shutdown path.
+                self.logger.info('Shutting down...')
+                self.health_status.shutting_down = True
+
+            finally:
+                self.logger.info('Application cleanup started')
+                self.health_status.shutting_down = True
+                self.worker_manager.stop_workers()
+                if self.client is not None:
+                    self.client.loop_stop()
+                if publisher is not None:
+                    publisher.loop_stop()
+                self._stop_ingress()
+                if getattr(self, 'telemetry_enabled', False):
+                    self.loop.run_until_complete(telemetry.close())
+                if self.tsdb_enabled:
+                    self.loop.run_until_complete(tsdb_manager.disconnect())
+                if self.redis_enabled:
+                    self.loop.run_until_complete(redis_manager.disconnect())
+                if getattr(self, 'database_enabled', self.mysql_enabled):
+                    self.loop.run_until_complete(Model.cleanup())
+                if self.health_server is not None:
+                    self.health_server.stop()
+                if self.metrics_health_server is not None:
+                    self.metrics_health_server.stop()
+                if self.client is not None:
+                    self.client.disconnect()
+                if publisher is not None:
+                    publisher.disconnect()
+                self.health_status.alive = False
+                self._restore_signal_handlers(previous_handlers)
+                self.logger.info('Application cleanup completed')
 
 
 def _combine_metrics_payloads(prometheus_body: bytes, stdlib_body: bytes, *, openmetrics: bool) -> bytes:
@@ -519,3 +692,21 @@ def _combine_metrics_payloads(prometheus_body: bytes, stdlib_body: bytes, *, ope
 def _without_openmetrics_eof(body: bytes) -> bytes:
     marker = b'# EOF\n'
     return body[: -len(marker)] if body.endswith(marker) else body
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_env_file(path: str, mtime: float) -> tuple[tuple[str, str], ...]:
+    """Parse an env file once per modification time; the mtime in the key makes edits re-parse."""
+    return tuple((key, value) for key, value in dotenv_values(path).items() if value is not None)
+
+
+def _load_env_file(env_file: Any) -> None:
+    """Apply ``env_file`` like ``load_dotenv``: variables already in the environment keep their value."""
+    try:
+        mtime = os.stat(env_file).st_mtime
+    except (OSError, TypeError, ValueError):
+        # Missing file, or not a path (None asks python-dotenv to search for one)
+        load_dotenv(env_file)
+        return
+    for key, value in _parse_env_file(os.fspath(env_file), mtime):
+        os.environ.setdefault(key, value)
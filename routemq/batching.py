@@ -0,0 +1,82 @@
+"""Coalesce concurrent awaitable calls into batches.
+
+A :class:`Batcher` collects items passed to :meth:`Batcher.process` and hands
+them to one ``flush`` call once ``max_batch_size`` items are pending or
+``max_queue_time`` seconds have passed since the first of them arrived. Each
+caller then receives its own entry of the flush results.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Generic, TypeVar
+
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+FlushFn = Callable[[list[T]], Awaitable[Sequence[R | BaseException]]]
+
+
+class Batcher(Generic[T, R]):
+    """
+    Collect items from concurrent callers and flush them together.
+
+    ``flush`` receives the batched items in arrival order and returns one result
+    per item. An exception instance in the results fails only that item's
+    caller; an exception raised by ``flush`` itself fails every caller in the batch.
+    """
+
+    def __init__(self, flush: FlushFn[T, R], max_batch_size: int, max_queue_time: float):
+        self._flush = flush
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_queue_time = max(0.0, max_queue_time)
+        self._pending: list[tuple[T, asyncio.Future]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task] = set()
+
+    async def process(self, item: T) -> R:
+        """Queue one item and wait for its result from the next batch flush."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._start_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_queue_time, self._start_flush)
+
+        return await future
+
+    def _start_flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._run_flush(batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _run_flush(self, batch: list[tuple[T, asyncio.Future]]) -> None:
+        try:
+            results = await self._flush([item for item, _future in batch])
+        except Exception as exc:
+            for _item, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for index, (_item, future) in enumerate(batch):
+            if future.done():
+                continue
+            if index >= len(results):
+                future.set_exception(RuntimeError('Batch flush returned fewer results than items'))
+                continue
+            result = results[index]
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
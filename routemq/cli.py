@@ -9,9 +9,7 @@ import os
 import json
 import sys
 
-from bootstrap.app import Application
 from routemq.logging_config import json_logging_enabled
-from routemq.mqtt_utils import is_network_startup_error
 
 
 logger = logging.getLogger('RouteMQ.CLI')
@@ -19,14 +17,35 @@ logger = logging.getLogger('RouteMQ.CLI')
 
 def create_app(router=None, env_file='.env'):
     """Create and return a new application instance."""
+    # Imported here so commands that never build the app (new, tinker, queue) skip SQLAlchemy and paho
+    from bootstrap.app import Application
+
     return Application(router=router, env_file=env_file)
 
 
+def _create_file(path: str, content: bytes) -> bool:
+    """Write ``content`` to a new file at ``path``; return False and leave it alone if it already exists."""
+    try:
+        # O_EXCL checks and creates in one call, so no separate exists() probe is needed
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return False
+    try:
+        # Unbuffered writes of the raw bytes; loop in case the kernel accepts only part of them
+        remaining = memoryview(content)
+        while remaining:
+            remaining = remaining[os.write(fd, remaining) :]
+    finally:
+        os.close(fd)
+    return True
+
+
 def create_env_file():
     """Create a default .env file if it doesn't exist."""
-    if not os.path.exists('.env'):
-        with open('.env', 'w') as f:
-            f.write("""# MQTT Configuration
+    if (
+        _create_file(
+            '.env',
+            b"""# MQTT Configuration
 MQTT_BROKER=localhost
 MQTT_PORT=1883
 MQTT_USERNAME=
@@ -72,97 +91,35 @@ LOG_TO_FILE=false
 LOG_INCLUDE_CONTEXT=true
 LOG_LIFECYCLE_EVENTS=true
 LOG_LIFECYCLE_LEVEL=INFO
-""")
-        if not json_logging_enabled():
-            print('Created default .env file', file=sys.stderr)
+""",
+        )
+        and not json_logging_enabled()
+    ):
+        print('Created default .env file', file=sys.stderr)
 
 
 def setup_example():
     """Setup example files for a new project."""
+    # The example sources ship with the scaffold templates and are only read here, not at import
+    from importlib.resources import files
+
+    from routemq.scaffold.scaffolder import TEMPLATE_PACKAGE
+
     os.makedirs('app/controllers', exist_ok=True)
     os.makedirs('app/middleware', exist_ok=True)
     os.makedirs('app/models', exist_ok=True)
     os.makedirs('app/routers', exist_ok=True)
 
-    controller_path = 'app/controllers/example_controller.py'
-    if not os.path.exists(controller_path):
-        with open(controller_path, 'w') as f:
-            f.write("""from routemq.controller import Controller
-
-class ExampleController(Controller):
-    @staticmethod
-    async def handle_message(device_id: str, payload, client):
-        print(f"Received message for device {device_id}")
-        print(f"Payload: {payload}")
-        # Process the message here
-        return {"status": "success", "device_id": device_id}
-""")
-
-    # Create example middleware
-    middleware_path = 'app/middleware/example_middleware.py'
-    if not os.path.exists(middleware_path):
-        with open(middleware_path, 'w') as f:
-            f.write("""from routemq.middleware import Middleware
-from typing import Dict, Any, Callable, Awaitable
-import time
-
-
-class LoggingMiddleware(Middleware):
-    \"\"\"Example middleware that logs request information and timing.\"\"\"
-
-    async def handle(self, context: Dict[str, Any], next_handler: Callable[[Dict[str, Any]], Awaitable[Any]]) -> Any:
-        \"\"\"Log request details and execution time.\"\"\"
-        topic = context.get('topic', 'unknown')
-        client_id = context.get('client', {})._client_id if 'client' in context else 'unknown'
-        device_id = context.get('params', {}).get('device_id', 'unknown')
-        
-        # Log incoming request
-        self.logger.info(f"[INCOMING] Topic: {topic}, Client: {client_id}")
-        
-        # Record start time
-        start_time = time.time()
-        
-        try:
-            # Call the next handler in the chain
-            result = await next_handler(context)
-            
-            # Calculate execution time
-            execution_time = (time.time() - start_time) * 1000  # Convert to milliseconds
-            
-            # Log successful completion
-            self.logger.info(f"[COMPLETED] Topic: {topic}, Execution time: {execution_time:.2f}ms")
-            
-            return result
-            
-        except Exception as e:
-            # Log any errors that occur
-            execution_time = (time.time() - start_time) * 1000
-            self.logger.error(f"[ERROR] Topic: {topic}, Error: {str(e)}, Execution time: {execution_time:.2f}ms")
-            raise
-""")
-
-    router_path = 'app/routers/example_device.py'
-    if not os.path.exists(router_path):
-        with open(router_path, 'w') as f:
-            f.write("""from routemq.router import Router
-from app.controllers.example_controller import ExampleController
-from app.middleware.example_middleware import LoggingMiddleware
-
-router = Router()
-
-# Define routes using the with syntax for better readability
-with router.group(prefix="devices") as devices:
-    # Apply logging middleware to this route
-    devices.on("message/{device_id}", ExampleController.handle_message, 
-              middleware=[LoggingMiddleware()], qos=1)
-""")
-
-    init_dirs = ['app', 'app/controllers', 'app/middleware', 'app/models', 'app/routers']
-    for dir_path in init_dirs:
-        init_file = f'{dir_path}/__init__.py'
-        if not os.path.exists(init_file):
-            with open(init_file, 'w') as f:
-                f.write('# This file marks the directory as a Python package\n')
+    app_templates = files(TEMPLATE_PACKAGE) / 'base' / 'app'
+    for dir_name, file_name in (
+        ('controllers', 'example_controller.py'),
+        ('middleware', 'example_middleware.py'),
+        ('routers', 'example_device.py'),
+    ):
+        _create_file(f'app/{dir_name}/{file_name}', (app_templates / dir_name / file_name).read_bytes())
+
+    for dir_path in ['app', 'app/controllers', 'app/middleware', 'app/models', 'app/routers']:
+        _create_file(f'{dir_path}/__init__.py', b'# This file marks the directory as a Python package\n')
 
     print('Example files created successfully!')
 
@@ -207,11 +164,12 @@ def _cmd_new(
 
 def _cmd_run() -> None:
     """Run the MQTT application."""
-    create_env_file()
     app = create_app()
     try:
         app.connect()
     except OSError as exc:
+        from routemq.mqtt_utils import is_network_startup_error
+
         if not is_network_startup_error(exc):
             raise
         broker = os.getenv('MQTT_BROKER', 'localhost')
@@ -241,14 +199,22 @@ def tinker() -> None:
 
 
 def _cmd_queue_work(
-    queue='default', connection=None, max_jobs=None, max_time=None, sleep=3, max_tries=None, timeout=60
+    queue='default',
+    connection=None,
+    max_jobs=None,
+    max_time=None,
+    sleep=3,
+    max_tries=None,
+    timeout=60,
+    batch_size=1,
+    concurrency=1,
 ) -> None:
     """Start the queue worker to process background jobs."""
     import asyncio
+    from routemq.event_loop import loop_factory
     from routemq.queue.queue_worker import QueueWorker
 
     # Initialize the application to setup database/redis connections
-    create_env_file()
     app = create_app()
 
     async def run_worker():
@@ -266,6 +232,8 @@ def _cmd_queue_work(
                 sleep=sleep,
                 max_tries=max_tries,
                 timeout=timeout,
+                batch_size=batch_size,
+                concurrency=concurrency,
             )
 
             logger.info(
@@ -280,11 +248,19 @@ def _cmd_queue_work(
             await app._cleanup_connections()
 
     # Run the worker
-    asyncio.run(run_worker())
+    asyncio.run(run_worker(), loop_factory=loop_factory())
 
 
 def queue_work(
-    queue='default', connection=None, max_jobs=None, max_time=None, sleep=3, max_tries=None, timeout=60
+    queue='default',
+    connection=None,
+    max_jobs=None,
+    max_time=None,
+    sleep=3,
+    max_tries=None,
+    timeout=60,
+    batch_size=1,
+    concurrency=1,
 ) -> None:
     """Backward-compatible wrapper for the queue-work command handler."""
     _cmd_queue_work(
@@ -295,13 +271,14 @@ def queue_work(
         sleep=sleep,
         max_tries=max_tries,
         timeout=timeout,
+        batch_size=batch_size,
+        concurrency=concurrency,
     )
 
 
 def _run_queue_admin(operation):
     import asyncio
 
-    create_env_file()
     app = create_app()
 
     async def run_operation():
@@ -391,6 +368,8 @@ def main():
     parser.add_argument('--sleep', type=int, default=3, help='Seconds to sleep when no job is available (default: 3)')
     parser.add_argument('--max-tries', type=int, help='Maximum number of times to attempt a job')
     parser.add_argument('--timeout', type=int, default=60, help='Maximum seconds a job can run (default: 60)')
+    parser.add_argument('--batch-size', type=int, default=1, help='Jobs to reserve per queue poll (default: 1)')
+    parser.add_argument('--concurrency', type=int, default=1, help='Jobs to run at once per worker (default: 1)')
 
     sub = parser.add_subparsers(dest='command', required=False, metavar='COMMAND')
 
@@ -415,6 +394,8 @@ def main():
     qw_p.add_argument('--sleep', type=int, default=3, help='Seconds to sleep when no job is available (default: 3)')
     qw_p.add_argument('--max-tries', type=int, help='Maximum number of times to attempt a job')
     qw_p.add_argument('--timeout', type=int, default=60, help='Maximum seconds a job can run (default: 60)')
+    qw_p.add_argument('--batch-size', type=int, default=1, help='Jobs to reserve per queue poll (default: 1)')
+    qw_p.add_argument('--concurrency', type=int, default=1, help='Jobs to run at once per worker (default: 1)')
 
     qf_p = sub.add_parser('queue-failed', help='List failed queue jobs')
     qf_p.add_argument('--queue', type=str, default='default')
@@ -484,6 +465,8 @@ def main():
             sleep=args.sleep,
             max_tries=args.max_tries,
             timeout=args.timeout,
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
         )
         return
 
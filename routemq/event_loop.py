@@ -0,0 +1,39 @@
+"""Event loop selection for RouteMQ processes.
+
+Uses ``uvloop`` when the optional ``routemq[uvloop]`` extra is installed and
+falls back to the stdlib asyncio loop otherwise. Set ``USE_UVLOOP=false`` to
+keep the stdlib loop even when uvloop is importable.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any
+
+try:
+    uvloop: Any = import_module('uvloop')
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    uvloop = None
+    UVLOOP_AVAILABLE = False
+
+
+def loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return the ``loop_factory`` for :class:`asyncio.Runner`; ``None`` keeps the stdlib default."""
+
+    if uvloop is not None and os.getenv('USE_UVLOOP', 'true').lower() == 'true':
+        return uvloop.new_event_loop
+    return None
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a loop from :func:`loop_factory` for code that manages the loop itself."""
+
+    factory = loop_factory()
+    if factory is None:
+        return asyncio.new_event_loop()
+    return factory()
@@ -1,9 +1,10 @@
-import json
 import logging
 import os
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, Set, Type
+from importlib import import_module
+from typing import Optional, Dict, Any, ClassVar, Set, Type
 
+from . import json_codec
 from .observability import snapshot_context
 from .retry import BackoffConfig, bounded_exponential_backoff
 
@@ -11,6 +12,12 @@ logger = logging.getLogger('RouteMQ.Job')
 
 _DENY_SETATTR: Set[str] = {'_allowed_classes'}
 
+# Envelope metadata serialized next to, not inside, the job's data.
+_META_KEYS = frozenset({'job_id', 'attempts', 'max_tries', 'timeout', 'retry_after', 'queue'})
+
+# Resolved job classes keyed by their dotted "class" path, filled on first unserialize().
+_CLASS_CACHE: Dict[str, Type['Job']] = {}
+
 
 class Job(ABC):
     """
@@ -31,12 +38,16 @@ class Job(ABC):
     retry_backoff_enabled: bool = False
 
     # Optional per-job retry backoff cap/jitter. None delegates to worker/env defaults.
+    # Jitter randomizes that fraction of each delay, so jobs that failed together don't all retry at once.
     retry_backoff_max_delay: float | None = None
     retry_backoff_jitter: float | None = None
 
     # The name of the queue the job should be sent to
     queue: str = 'default'
 
+    # Attributes get_data() serializes. Empty means every public instance attribute.
+    serializable_fields: ClassVar[tuple[str, ...]] = ()
+
     # Registry of classes approved for deserialization via unserialize().
     # Use @Job.register on each concrete Job subclass, or set the
     # ROUTEMQ_JOB_ALLOWLIST_DISABLED=1 env var for migration only — do NOT
@@ -99,7 +110,7 @@ class Job(ABC):
             'retry_backoff_jitter': self.retry_backoff_jitter,
             'queue': self.queue,
         }
-        return json.dumps(job_data)
+        return json_codec.dumps(job_data)
 
     def get_retry_delay(
         self,
@@ -152,18 +163,10 @@ class Job(ABC):
         Returns:
             Dictionary of data to be serialized
         """
-        data = {}
-        for key, value in self.__dict__.items():
-            if not key.startswith('_') and key not in [
-                'job_id',
-                'attempts',
-                'max_tries',
-                'timeout',
-                'retry_after',
-                'queue',
-            ]:
-                data[key] = value
-        return data
+        fields = self.serializable_fields
+        if fields:
+            return {key: getattr(self, key) for key in fields}
+        return {key: value for key, value in self.__dict__.items() if not key.startswith('_') and key not in _META_KEYS}
 
     @classmethod
     def unserialize(cls, payload: str) -> 'Job':
@@ -180,7 +183,7 @@ class Job(ABC):
             ValueError: When the job class is not in the allow-list and
                 ROUTEMQ_JOB_ALLOWLIST_DISABLED is not set to "1".
         """
-        job_data = json.loads(payload)
+        job_data = json_codec.loads(payload)
 
         if os.getenv('ROUTEMQ_JOB_ALLOWLIST_DISABLED') != '1':
             if job_data['class'] not in cls._allowed_classes:
@@ -190,9 +193,12 @@ class Job(ABC):
                     'ROUTEMQ_JOB_ALLOWLIST_DISABLED=1 for migration only.'
                 )
 
-        module_name, class_name = job_data['class'].rsplit('.', 1)
-        module = __import__(module_name, fromlist=[class_name])
-        job_class = getattr(module, class_name)
+        class_path = job_data['class']
+        job_class = _CLASS_CACHE.get(class_path)
+        if job_class is None:
+            module_name, class_name = class_path.rsplit('.', 1)
+            job_class = getattr(import_module(module_name), class_name)
+            _CLASS_CACHE[class_path] = job_class
 
         job = job_class()
 
@@ -0,0 +1,47 @@
+"""JSON encode/decode helpers for RouteMQ hot paths.
+
+Uses ``orjson`` when the optional ``routemq[orjson]`` extra is installed and
+falls back to the stdlib ``json`` module otherwise. Both backends raise
+``json.JSONDecodeError`` subclasses for malformed input, so callers can keep
+catching the stdlib exception.
+"""
+
+from __future__ import annotations
+
+import json
+from importlib import import_module
+from typing import Any
+
+try:
+    orjson: Any = import_module('orjson')
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON from ``bytes`` or ``str``; bytes skip the intermediate ``str`` copy with orjson."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data).decode()
+    return json.loads(data)
+
+
+def dumps(value: Any) -> str:
+    """Encode ``value`` as a JSON string.
+
+    Values orjson cannot represent (for example integers wider than 64 bits)
+    fall back to the stdlib encoder, which also raises the familiar
+    ``TypeError`` for unserializable objects.
+    """
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(value)
@@ -7,10 +7,12 @@ by the application owner.
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import logging.handlers
 import os
+import queue
 import sys
 import traceback
 from collections.abc import Mapping
@@ -122,6 +124,25 @@ _LIFECYCLE_EVENTS = {
 }
 
 _lifecycle_unregister: Any = None
+_queue_listener: logging.handlers.QueueListener | None = None
+
+# Observability context captured on the logging thread when records are formatted elsewhere
+_CONTEXT_ATTR = '_routemq_context'
+
+
+class ContextQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that keeps what the listener thread needs to format the record.
+
+    The stock handler pre-formats the message and drops ``exc_info``. This one
+    resolves only ``%`` arguments and snapshots the observability context, which
+    lives in context variables the listener thread cannot see.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        record.__dict__[_CONTEXT_ATTR] = observability.snapshot_context()
+        return record
 
 
 @dataclass(frozen=True)
@@ -201,7 +222,9 @@ def _route_context_fields(values: Mapping[str, Any]) -> tuple[dict[str, Any], di
 
 
 def _record_extra(record: logging.LogRecord) -> dict[str, Any]:
-    return {key: value for key, value in record.__dict__.items() if key not in _LOG_RECORD_RESERVED}
+    return {
+        key: value for key, value in record.__dict__.items() if key not in _LOG_RECORD_RESERVED and key != _CONTEXT_ATTR
+    }
 
 
 def _service_version() -> str | None:
@@ -224,7 +247,11 @@ class RouteMQJsonFormatter(logging.Formatter):
         self.include_context = include_context
 
     def format(self, record: logging.LogRecord) -> str:
-        context = observability.snapshot_context() if self.include_context else {}
+        context: Mapping[str, Any] = {}
+        if self.include_context:
+            context = record.__dict__.get(_CONTEXT_ATTR)
+            if context is None:
+                context = observability.snapshot_context()
         context_known, context_attributes = _route_context_fields(context)
         extra_known, extra_attributes = _route_context_fields(_record_extra(record))
 
@@ -502,11 +529,13 @@ def configure_logging(*, log_to_console: bool = True) -> LoggingSettings:
         console_handler.setFormatter(formatter)
         handlers.append(console_handler)
 
+    file_logging = False
     if env_bool('LOG_TO_FILE', False):
         try:
             file_handler = _build_file_handler(os.getenv('LOG_FILE', 'logs/app.log'))
             file_handler.setFormatter(formatter)
             handlers.append(file_handler)
+            file_logging = True
         except OSError:
             # Keep startup resilient when file logging is not writable. The
             # configured console/NullHandler path still applies below.
@@ -515,6 +544,11 @@ def configure_logging(*, log_to_console: bool = True) -> LoggingSettings:
     if not handlers:
         handlers.append(logging.NullHandler())
 
+    stop_async_logging()
+    # File writes and rotation checks are the slow sink, so they default to the listener thread
+    if env_bool('LOG_ASYNC', file_logging) and not isinstance(handlers[0], logging.NullHandler):
+        handlers = [_start_async_logging(handlers)]
+
     logging.basicConfig(level=level, handlers=handlers, force=True)
     lifecycle_events = env_bool('LOG_LIFECYCLE_EVENTS', True)
     lifecycle_level = _level_from_env('LOG_LIFECYCLE_LEVEL')
@@ -522,6 +556,31 @@ def configure_logging(*, log_to_console: bool = True) -> LoggingSettings:
     return LoggingSettings(formatter_name, field_profile, level, lifecycle_events, lifecycle_level)
 
 
+def _start_async_logging(handlers: list[logging.Handler]) -> logging.Handler:
+    """Move formatting and I/O for ``handlers`` onto a listener thread."""
+
+    global _queue_listener
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    return ContextQueueHandler(log_queue)
+
+
+def stop_async_logging() -> None:
+    """Flush queued records and stop the ``LOG_ASYNC`` listener thread, if one is running."""
+
+    global _queue_listener
+    if _queue_listener is None:
+        return
+    listener, _queue_listener = _queue_listener, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(stop_async_logging)
+
+
 def configure_lifecycle_logging(*, enabled: bool, level: int = logging.INFO) -> None:
     """Mirror known RouteMQ lifecycle events to structured logs."""
 
@@ -1,10 +1,14 @@
+import functools
 import logging
+from collections.abc import AsyncIterator, Iterable, Mapping
+from contextlib import asynccontextmanager
 from typing import Any, Optional, cast
 
+from sqlalchemy import insert
 from sqlalchemy.engine.url import make_url
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine, AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.orm import declarative_base
 
 from .observability import start_span
 
@@ -55,7 +59,7 @@ class Model(Base):
             engine_kwargs['poolclass'] = NullPool
 
         cls._engine = create_async_engine(connection_string, **engine_kwargs)
-        cls._session_factory = sessionmaker(cls._engine, expire_on_commit=False, class_=AsyncSession)
+        cls._session_factory = async_sessionmaker(cls._engine, expire_on_commit=False)
         cls._is_enabled = True
         cls._set_connection_observability(connection_string)
         logger.info('Database connection configured')
@@ -73,15 +77,31 @@ class Model(Base):
             logger.info('Database connections closed')
 
     @classmethod
-    async def get_session(cls) -> Optional[AsyncSession]:
+    def get_session(cls) -> Optional[AsyncSession]:
         """Get a new session for database operations."""
         if not cls._is_enabled:
             logger.warning('Database operations attempted while database integration is disabled')
             return None
 
-        if cls._session_factory is None:
+        session_factory = cls._session_factory
+        if session_factory is None:
             raise RuntimeError('Database not configured. Call Model.configure() first.')
-        return cast(AsyncSession, cls._session_factory())
+        return cast(AsyncSession, session_factory())
+
+    @classmethod
+    @asynccontextmanager
+    async def session(cls) -> AsyncIterator[AsyncSession]:
+        """Yield one session for several operations inside a single transaction.
+
+        The transaction commits when the block exits normally and rolls back if
+        it raises, so a handler can read and write many rows on one pooled
+        connection checkout.
+        """
+        session = cls.get_session()
+        if session is None:
+            raise RuntimeError('Database integration is disabled')
+        async with session, session.begin():
+            yield session
 
     @classmethod
     async def create_tables(cls):
@@ -101,10 +121,10 @@ class Model(Base):
     async def find(cls, model_class, id_value):
         """Find a record by ID."""
         if not cls._is_enabled:
-            logger.warning(f'Find operation on {model_class.__name__} skipped - database integration disabled')
+            logger.warning('Find operation on %s skipped - database integration disabled', model_class.__name__)
             return None
 
-        session = await cls.get_session()
+        session = cls.get_session()
         if session is None:
             return None
 
@@ -119,10 +139,10 @@ class Model(Base):
     async def all(cls, model_class):
         """Get all records of a model."""
         if not cls._is_enabled:
-            logger.warning(f'All records query on {model_class.__name__} skipped - database integration disabled')
+            logger.warning('All records query on %s skipped - database integration disabled', model_class.__name__)
             return []
 
-        session = await cls.get_session()
+        session = cls.get_session()
         if session is None:
             return []
 
@@ -137,10 +157,10 @@ class Model(Base):
     async def create(cls, model_class, **kwargs):
         """Create a new record."""
         if not cls._is_enabled:
-            logger.warning(f'Create operation on {model_class.__name__} skipped - database integration disabled')
+            logger.warning('Create operation on %s skipped - database integration disabled', model_class.__name__)
             return None
 
-        session = await cls.get_session()
+        session = cls.get_session()
         if session is None:
             return None
 
@@ -154,6 +174,34 @@ class Model(Base):
                 await session.refresh(obj)
                 return obj
 
+    @classmethod
+    async def bulk_create(cls, model_class, rows: Iterable[Mapping[str, Any]]) -> int:
+        """Insert many records in one executemany round trip and return how many were sent.
+
+        ORM objects are not built or refreshed; use ``insert().returning()``
+        inside ``Model.session()`` when generated keys are needed.
+        """
+        if not cls._is_enabled:
+            logger.warning('Bulk create on %s skipped - database integration disabled', model_class.__name__)
+            return 0
+
+        rows = list(rows)
+        if not rows:
+            return 0
+
+        session = cls.get_session()
+        if session is None:
+            return 0
+
+        table_name = _model_table_name(model_class)
+        attrs = _db_span_attributes('insert', table_name, _insert_query(table_name))
+        attrs['db.operation.batch.size'] = len(rows)
+        with start_span(_db_span_name('insert', table_name), attrs, kind='client'):
+            async with session:
+                await session.execute(insert(model_class), rows)
+                await session.commit()
+                return len(rows)
+
     @classmethod
     def _set_connection_observability(cls, connection_string: str) -> None:
         try:
@@ -206,16 +254,20 @@ def _model_table_name(model_class: Any) -> str | None:
     return name if isinstance(name, str) and name else None
 
 
+# Query texts depend only on the table name, so each is built once per model
+@functools.cache
 def _select_by_id_query(table_name: str | None) -> str:
     target = table_name or '<unknown>'
     return _query_text('SELECT', '*', 'FROM', target, 'WHERE', 'id', '=', ':id')
 
 
+@functools.cache
 def _select_all_query(table_name: str | None) -> str:
     target = table_name or '<unknown>'
     return _query_text('SELECT', '*', 'FROM', target)
 
 
+@functools.cache
 def _insert_query(table_name: str | None) -> str:
     target = table_name or '<unknown>'
     return _query_text('INSERT', 'INTO', target, 'VALUES', '(:redacted)')
@@ -1,4 +1,5 @@
 import errno
+import itertools
 import json
 import socket
 import time
@@ -9,13 +10,16 @@ from typing import Any, Callable, Optional
 
 from paho.mqtt import client as mqtt_client
 
+from . import json_codec
 from .observability import current_span, get_context_attributes, lifecycle, start_span
 from .retry import RetryConfig, retry_sync
-from .settings import load_mqtt_settings
+from .settings import MqttSettings, load_mqtt_settings
 
 _TRACEPARENT_PROPERTY = 'traceparent'
 _TRACESTATE_PROPERTY = 'tracestate'
 _TRACEPARENT_VERSION = '00'
+# First byte of any JSON document RouteMQ can decode (UTF-8, optional leading whitespace)
+_JSON_START_BYTES = frozenset(b' \t\r\n{["-0123456789tfn')
 
 
 @dataclass(frozen=True)
@@ -24,6 +28,18 @@ class MqttConnectionConfig:
     port: int
     username: Optional[str]
     password: Optional[str]
+    socket_path: Optional[str] = None
+    keepalive: int = 60
+    max_inflight: int = 20
+    publisher_pool_size: int = 0
+
+    @property
+    def host(self) -> str:
+        """Address passed to ``Client.connect``; Paho reads it as the socket path for the unix transport."""
+        return self.socket_path or self.broker
+
+    def describe(self) -> str:
+        return f'unix socket {self.socket_path}' if self.socket_path else f'{self.broker}:{self.port}'
 
 
 @dataclass(frozen=True)
@@ -35,26 +51,40 @@ class MqttTlsConfig:
     insecure: bool = False
 
 
+@dataclass(frozen=True)
+class MqttIngressConfig:
+    queue_size: int = 10000
+    consumers: int = 8
+    full_strategy: str = 'drop_newest'
+
+
 def parse_mqtt_payload(payload: bytes) -> Any:
+    if not payload or payload[0] not in _JSON_START_BYTES:
+        # Binary sensor frames and plain text cannot be JSON; skip the raise/catch round trip
+        return payload
     try:
-        return json.loads(payload.decode())
+        return json_codec.loads(payload)
     except (json.JSONDecodeError, UnicodeDecodeError):
         # Audit Accept: invalid JSON is a valid MQTT payload; dispatch raw bytes instead.
         return payload
 
 
-def get_mqtt_connection_config() -> MqttConnectionConfig:
-    config = load_mqtt_settings().connection
+def get_mqtt_connection_config(settings: MqttSettings | None = None) -> MqttConnectionConfig:
+    config = (settings or load_mqtt_settings()).connection
     return MqttConnectionConfig(
         broker=config.broker,
         port=config.port,
         username=config.username,
         password=config.password,
+        socket_path=config.socket_path,
+        keepalive=config.keepalive,
+        max_inflight=config.max_inflight,
+        publisher_pool_size=config.publisher_pool_size,
     )
 
 
-def get_mqtt_tls_config() -> MqttTlsConfig:
-    config = load_mqtt_settings().tls
+def get_mqtt_tls_config(settings: MqttSettings | None = None) -> MqttTlsConfig:
+    config = (settings or load_mqtt_settings()).tls
     return MqttTlsConfig(
         enabled=config.enabled,
         ca_certs=config.ca_certs,
@@ -64,8 +94,8 @@ def get_mqtt_tls_config() -> MqttTlsConfig:
     )
 
 
-def get_mqtt_retry_config() -> RetryConfig:
-    config = load_mqtt_settings().retry
+def get_mqtt_retry_config(settings: MqttSettings | None = None) -> RetryConfig:
+    config = (settings or load_mqtt_settings()).retry
     return RetryConfig(
         max_attempts=config.max_attempts,
         min_delay=config.min_delay,
@@ -74,16 +104,29 @@ def get_mqtt_retry_config() -> RetryConfig:
     )
 
 
-def get_main_client_id() -> str:
-    return load_mqtt_settings().main_client_id
+def get_mqtt_ingress_config(settings: MqttSettings | None = None) -> MqttIngressConfig:
+    config = (settings or load_mqtt_settings()).ingress
+    return MqttIngressConfig(
+        queue_size=config.queue_size,
+        consumers=config.consumers,
+        full_strategy=config.full_strategy,
+    )
+
+
+def get_main_client_id(settings: MqttSettings | None = None) -> str:
+    return (settings or load_mqtt_settings()).main_client_id
 
 
-def get_worker_client_id_prefix() -> str:
-    return load_mqtt_settings().worker_client_id_prefix
+def get_worker_client_id_prefix(settings: MqttSettings | None = None) -> str:
+    return (settings or load_mqtt_settings()).worker_client_id_prefix
 
 
-def get_mqtt_group_name() -> str:
-    return load_mqtt_settings().group_name
+def get_mqtt_group_name(settings: MqttSettings | None = None) -> str:
+    return (settings or load_mqtt_settings()).group_name
+
+
+def get_worker_cpu_affinity(settings: MqttSettings | None = None) -> bool:
+    return (settings or load_mqtt_settings()).worker_cpu_affinity
 
 
 def build_worker_broker_config() -> dict[str, Any]:
@@ -93,6 +136,9 @@ def build_worker_broker_config() -> dict[str, Any]:
         'port': str(config.port),
         'username': config.username,
         'password': config.password,
+        'socket_path': config.socket_path,
+        'keepalive': config.keepalive,
+        'max_inflight': config.max_inflight,
         'client_id_prefix': get_worker_client_id_prefix(),
     }
 
@@ -111,8 +157,14 @@ def create_mqtt_client(
     tls_config: MqttTlsConfig | None = None,
     on_disconnect: Callable[..., Any] | None = None,
     retry_config: RetryConfig | None = None,
+    socket_path: Optional[str] = None,
+    max_inflight: Optional[int] = None,
 ) -> Any:
-    client = mqtt_client.Client(client_id=client_id)
+    if socket_path:
+        # Local broker: skip the TCP stack; Paho treats the connect host as the socket path
+        client = mqtt_client.Client(client_id=client_id, transport='unix')
+    else:
+        client = mqtt_client.Client(client_id=client_id)
     client.on_connect = on_connect
     client.on_message = on_message
     if on_disconnect is not None:
@@ -121,6 +173,10 @@ def create_mqtt_client(
     if username and password:
         client.username_pw_set(username, password)
 
+    if max_inflight is not None:
+        # Outgoing QoS 1/2 publishes allowed in flight before Paho queues them
+        client.max_inflight_messages_set(max_inflight)
+
     resolved_tls_config = tls_config or get_mqtt_tls_config()
     if resolved_tls_config.enabled:
         client.tls_set(
@@ -150,6 +206,77 @@ def create_mqtt_client(
     return wrap_mqtt_publish_with_trace_context(client)
 
 
+class MqttPublisherPool:
+    """Spread handler publishes round-robin across extra Paho clients.
+
+    Handlers receive the pool in place of the main client. ``publish`` goes to
+    the next publisher connection; every other attribute is read from the main
+    client so ``subscribe`` and friends keep working.
+    """
+
+    def __init__(self, client: Any, publishers: list[Any]) -> None:
+        self.client = client
+        self.publishers = publishers
+        self._next_publisher = itertools.cycle(publishers).__next__
+
+    def publish(self, *args: Any, **kwargs: Any) -> Any:
+        return self._next_publisher().publish(*args, **kwargs)
+
+    def loop_start(self) -> None:
+        for publisher in self.publishers:
+            publisher.loop_start()
+
+    def loop_stop(self) -> None:
+        for publisher in self.publishers:
+            publisher.loop_stop()
+
+    def disconnect(self) -> None:
+        for publisher in self.publishers:
+            publisher.disconnect()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+
+
+def _ignore_message(client: Any, userdata: Any, msg: Any) -> None:
+    """Publisher connections subscribe to nothing; drop anything the broker sends."""
+
+
+def create_mqtt_publisher_pool(
+    client: Any,
+    client_id: str,
+    config: MqttConnectionConfig,
+    *,
+    tls_config: MqttTlsConfig | None = None,
+    retry_config: RetryConfig | None = None,
+) -> MqttPublisherPool:
+    """Create and connect ``config.publisher_pool_size`` publish-only clients next to ``client``."""
+
+    publishers = []
+    for index in range(config.publisher_pool_size):
+        publisher = create_mqtt_client(
+            f'{client_id}-pub-{index}',
+            on_connect=lambda *args: None,
+            on_message=_ignore_message,
+            username=config.username,
+            password=config.password,
+            socket_path=config.socket_path,
+            max_inflight=config.max_inflight,
+            tls_config=tls_config,
+            retry_config=retry_config,
+        )
+        connect_mqtt_client_with_retries(
+            publisher,
+            config.host,
+            config.port,
+            retry_config=retry_config,
+            process='main',
+            keepalive=config.keepalive,
+        )
+        publishers.append(publisher)
+    return MqttPublisherPool(client, publishers)
+
+
 def wrap_mqtt_publish_with_trace_context(client: Any) -> Any:
     """Wrap Paho publish calls with producer spans and MQTT v5 trace propagation."""
 
@@ -328,13 +455,14 @@ def connect_mqtt_client_with_retries(
     sleep=None,
     rng=None,
     process: str = 'main',
+    keepalive: int = 60,
 ) -> None:
     """Connect a Paho client with bounded startup retries for network failures."""
 
     config = retry_config or get_mqtt_retry_config()
 
     def operation() -> None:
-        client.connect(broker, port)
+        client.connect(broker, port, keepalive=keepalive)
 
     def on_retry(attempt: int, exc: BaseException, delay: float) -> None:
         lifecycle(
@@ -1,14 +1,17 @@
+import asyncio
 import logging
 import json
-from datetime import UTC, datetime, timedelta
+from collections.abc import Callable
 from typing import Any, Optional, Union, cast
-from sqlalchemy import select, update, delete
+from sqlalchemy import delete, func, insert, lambda_stmt, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from routemq import json_codec
 from routemq.queue.queue_driver import QueueDriver
 from routemq.model import Model, _db_span_attributes, _db_span_name
 from routemq.observability import start_span
-from routemq.queue.models import QueueJob, QueueFailedJob
+from routemq.queue.models import QueueJob, QueueFailedJob, epoch_ms_now, epoch_ms_to_datetime
+from routemq.settings import load_queue_reliability_settings
 
 logger = logging.getLogger('RouteMQ.DatabaseQueue')
 
@@ -22,6 +25,11 @@ class DatabaseQueue(QueueDriver):
     def __init__(self):
         """Initialize the database queue driver."""
         self.connection_name = 'database'
+        self.wake_notify = load_queue_reliability_settings().wake_notify
+
+    def _notifies(self) -> bool:
+        """Push notifications ride on PostgreSQL LISTEN/NOTIFY; other databases keep polling."""
+        return self.wake_notify and Model._db_system == 'postgresql'
 
     async def push(
         self,
@@ -34,24 +42,23 @@ class DatabaseQueue(QueueDriver):
             logger.error('Cannot push job to database queue - database integration is disabled')
             raise RuntimeError('Database integration is disabled. Enable it to use DatabaseQueue.')
 
-        session = cast(AsyncSession, await Model.get_session())
+        session = cast(AsyncSession, Model.get_session())
         try:
-            available_at = datetime.now(UTC)
-            if delay > 0:
-                available_at += timedelta(seconds=delay)
-
+            # created_at comes from the column's server default
             job = QueueJob(
                 queue=queue,
                 payload=payload,
                 attempts=0,
-                available_at=available_at,
-                created_at=datetime.now(UTC),
+                available_at=_available_at(delay),
             )
 
             with _database_span('insert', 'queue_jobs', _insert_queue_job_query()):
                 session.add(job)
+                if delay <= 0 and self._notifies():
+                    # NOTIFY is transactional, so listeners hear it only once the row is committed
+                    await session.execute(select(func.pg_notify(_wake_channel(queue), queue)))
                 await session.commit()
-            logger.debug(f"Job pushed to queue '{queue}' with delay {delay}s")
+            logger.debug("Job pushed to queue '%s' with delay %ss", queue, delay)
 
         except Exception as e:
             await session.rollback()
@@ -60,56 +67,149 @@ class DatabaseQueue(QueueDriver):
         finally:
             await session.close()
 
+    async def push_many(self, payloads: list[str], queue: str = 'default', delay: int = 0) -> None:
+        """Insert a batch of jobs with one executemany INSERT and a single commit."""
+        if not Model._is_enabled:
+            logger.error('Cannot push jobs to database queue - database integration is disabled')
+            raise RuntimeError('Database integration is disabled. Enable it to use DatabaseQueue.')
+        if not payloads:
+            return
+
+        session = cast(AsyncSession, Model.get_session())
+        try:
+            rows = [{'queue': queue, 'payload': payload, 'attempts': 0} for payload in payloads]
+
+            with _database_span('insert', 'queue_jobs', _insert_queue_job_query()):
+                await session.execute(insert(QueueJob).values(available_at=_available_at(delay)), rows)
+                if delay <= 0 and self._notifies():
+                    await session.execute(select(func.pg_notify(_wake_channel(queue), queue)))
+                await session.commit()
+            logger.debug('%d job(s) pushed to queue %r with delay %ss', len(rows), queue, delay)
+
+        except Exception as e:
+            await session.rollback()
+            logger.error(f'Failed to push jobs to queue: {str(e)}')
+            raise
+        finally:
+            await session.close()
+
+    async def listen_for_jobs(self, queue: str, wake: Callable[[], None]) -> None:
+        """LISTEN on the queue's channel over one dedicated pooled connection (asyncpg only)."""
+        if not Model._is_enabled or not self._notifies():
+            return
+
+        channel = _wake_channel(queue)
+
+        def on_notify(*_args: Any) -> None:
+            wake()
+
+        async with Model._engine.connect() as connection:
+            raw_connection = await connection.get_raw_connection()
+            listener = raw_connection.driver_connection
+            await listener.add_listener(channel, on_notify)
+            try:
+                await asyncio.Event().wait()
+            finally:
+                await listener.remove_listener(channel, on_notify)
+
     async def pop(self, queue: str = 'default') -> Optional[dict]:
         """Pop the next available job from the queue."""
         if not Model._is_enabled:
             logger.error('Cannot pop job from database queue - database integration is disabled')
             return None
 
-        session = cast(AsyncSession, await Model.get_session())
+        session = cast(AsyncSession, Model.get_session())
         try:
-            # Use FOR UPDATE SKIP LOCKED for concurrency-safe job claiming
-            # Find the next available job that's not reserved
+            # Use FOR UPDATE SKIP LOCKED for concurrency-safe job claiming.
+            # Select plain columns so no ORM instance is built for the row.
+            # lambda_stmt builds and caches the statement once; later calls only bind `queue`.
+            stmt = lambda_stmt(
+                lambda: (
+                    select(QueueJob.id, QueueJob.payload, QueueJob.attempts)
+                    .where(
+                        QueueJob.queue == queue,
+                        QueueJob.reserved_at.is_(None),
+                        QueueJob.available_at <= epoch_ms_now(),
+                    )
+                    .order_by(QueueJob.id)
+                    .limit(1)
+                    .with_for_update(skip_locked=True)
+                )
+            )
+
+            with _database_span('select', 'queue_jobs', _pop_queue_job_query()):
+                row = (await session.execute(stmt)).first()
+                if row is None:
+                    return None
+
+                # Mark job as reserved; the increment runs server-side as attempts + 1
+                job_id = row.id
+                await session.execute(
+                    lambda_stmt(
+                        lambda: (
+                            update(QueueJob)
+                            .where(QueueJob.id == job_id)
+                            .values(reserved_at=epoch_ms_now(), attempts=QueueJob.attempts + 1)
+                        )
+                    )
+                )
+                await session.commit()
+
+            popped = {'id': row.id, 'payload': row.payload, 'attempts': row.attempts + 1}
+
+            logger.debug("Job %s popped from queue '%s' (attempt %s)", popped['id'], queue, popped['attempts'])
+
+            return popped
+
+        except Exception as e:
+            await session.rollback()
+            logger.error(f'Failed to pop job from queue: {str(e)}')
+            # Audit Accept: polling treats backend errors as no job after logging.
+            return None
+        finally:
+            await session.close()
+
+    async def pop_batch(self, queue: str = 'default', limit: int = 1) -> list[dict]:
+        """Reserve up to ``limit`` available jobs with one locking SELECT and one UPDATE."""
+        if not Model._is_enabled:
+            logger.error('Cannot pop jobs from database queue - database integration is disabled')
+            return []
+
+        session = cast(AsyncSession, Model.get_session())
+        try:
+            now = epoch_ms_now()
             stmt = (
-                select(QueueJob)
+                select(QueueJob.id, QueueJob.payload, QueueJob.attempts)
                 .where(
                     QueueJob.queue == queue,
                     QueueJob.reserved_at.is_(None),
-                    QueueJob.available_at <= datetime.now(UTC),
+                    QueueJob.available_at <= now,
                 )
                 .order_by(QueueJob.id)
-                .limit(1)
+                .limit(limit)
                 .with_for_update(skip_locked=True)
             )
 
-            with _database_span('select', 'queue_jobs', _pop_queue_job_query()):
-                result = await session.execute(stmt)
-                job = result.scalars().first()
-
-                if not job:
-                    return None
-
-                # Mark job as reserved
-                job_record = cast(Any, job)
-                job_record.reserved_at = datetime.now(UTC)
-                job_record.attempts += 1
+            with _database_span('select', 'queue_jobs', _pop_queue_jobs_query()):
+                rows = (await session.execute(stmt)).all()
+                if not rows:
+                    return []
 
+                await session.execute(
+                    update(QueueJob)
+                    .where(QueueJob.id.in_([row.id for row in rows]))
+                    .values(reserved_at=now, attempts=QueueJob.attempts + 1)
+                )
                 await session.commit()
-                await session.refresh(job)
 
-            logger.debug(f"Job {job.id} popped from queue '{queue}' (attempt {job.attempts})")
-
-            return {
-                'id': job.id,
-                'payload': job.payload,
-                'attempts': job.attempts,
-            }
+            logger.debug('%d job(s) popped from queue %r', len(rows), queue)
+            return [{'id': row.id, 'payload': row.payload, 'attempts': row.attempts + 1} for row in rows]
 
         except Exception as e:
             await session.rollback()
-            logger.error(f'Failed to pop job from queue: {str(e)}')
+            logger.error(f'Failed to pop jobs from queue: {str(e)}')
             # Audit Accept: polling treats backend errors as no job after logging.
-            return None
+            return []
         finally:
             await session.close()
 
@@ -124,26 +224,87 @@ class DatabaseQueue(QueueDriver):
             logger.error('Cannot release job - database integration is disabled')
             return
 
-        session = cast(AsyncSession, await Model.get_session())
+        session = cast(AsyncSession, Model.get_session())
         try:
-            available_at = datetime.now(UTC)
-            if delay > 0:
-                available_at += timedelta(seconds=delay)
+            # One statement shape for every delay, so the cached lambda is always reused
+            delay_ms = max(delay, 0) * 1000
+            stmt = lambda_stmt(
+                lambda: (
+                    update(QueueJob)
+                    .where(QueueJob.id == job_id, QueueJob.queue == queue)
+                    .values(reserved_at=None, available_at=epoch_ms_now() + delay_ms)
+                )
+            )
 
+            with _database_span('update', 'queue_jobs', _release_queue_job_query()):
+                await session.execute(stmt)
+                await session.commit()
+            logger.debug("Job %s released back to queue '%s' with delay %ss", job_id, queue, delay)
+
+        except Exception as e:
+            await session.rollback()
+            logger.error(f'Failed to release job: {str(e)}')
+            raise
+        finally:
+            await session.close()
+
+    async def release_many(
+        self,
+        job_ids: list[Union[int, str]],
+        queue: str,
+        delay: int = 0,
+    ) -> None:
+        """Release a batch of jobs with a single UPDATE ... WHERE id IN statement."""
+        if not Model._is_enabled:
+            logger.error('Cannot release jobs - database integration is disabled')
+            return
+        if not job_ids:
+            return
+
+        session = cast(AsyncSession, Model.get_session())
+        try:
             stmt = (
                 update(QueueJob)
-                .where(QueueJob.id == job_id, QueueJob.queue == queue)
-                .values(reserved_at=None, available_at=available_at)
+                .where(QueueJob.id.in_(job_ids), QueueJob.queue == queue)
+                .values(reserved_at=None, available_at=_available_at(delay))
             )
 
-            with _database_span('update', 'queue_jobs', _release_queue_job_query()):
+            with _database_span('update', 'queue_jobs', _release_queue_jobs_query()):
                 await session.execute(stmt)
                 await session.commit()
-            logger.debug(f"Job {job_id} released back to queue '{queue}' with delay {delay}s")
+            logger.debug('%d job(s) released back to queue %r with delay %ss', len(job_ids), queue, delay)
 
         except Exception as e:
             await session.rollback()
-            logger.error(f'Failed to release job: {str(e)}')
+            logger.error(f'Failed to release jobs: {str(e)}')
+            raise
+        finally:
+            await session.close()
+
+    async def unreserve_many(self, job_ids: list[Union[int, str]], queue: str) -> None:
+        """Clear the reservation on a batch of unrun jobs and give back the attempt taken when they were popped."""
+        if not Model._is_enabled:
+            logger.error('Cannot unreserve jobs - database integration is disabled')
+            return
+        if not job_ids:
+            return
+
+        session = cast(AsyncSession, Model.get_session())
+        try:
+            stmt = (
+                update(QueueJob)
+                .where(QueueJob.id.in_(job_ids), QueueJob.queue == queue, QueueJob.reserved_at.is_not(None))
+                .values(reserved_at=None, attempts=QueueJob.attempts - 1)
+            )
+
+            with _database_span('update', 'queue_jobs', _unreserve_queue_jobs_query()):
+                await session.execute(stmt)
+                await session.commit()
+            logger.debug('%d unprocessed job(s) returned to queue %r', len(job_ids), queue)
+
+        except Exception as e:
+            await session.rollback()
+            logger.error(f'Failed to unreserve jobs: {str(e)}')
             raise
         finally:
             await session.close()
@@ -154,17 +315,19 @@ class DatabaseQueue(QueueDriver):
             logger.error('Cannot delete job - database integration is disabled')
             return
 
-        session = cast(AsyncSession, await Model.get_session())
+        session = cast(AsyncSession, Model.get_session())
         try:
-            stmt = delete(QueueJob).where(
-                QueueJob.id == job_id,
-                QueueJob.queue == queue,
+            stmt = lambda_stmt(
+                lambda: delete(QueueJob).where(
+                    QueueJob.id == job_id,
+                    QueueJob.queue == queue,
+                )
             )
 
             with _database_span('delete', 'queue_jobs', _delete_queue_job_query()):
                 await session.execute(stmt)
                 await session.commit()
-            logger.debug(f"Job {job_id} deleted from queue '{queue}'")
+            logger.debug("Job %s deleted from queue '%s'", job_id, queue)
 
         except Exception as e:
             await session.rollback()
@@ -173,17 +336,44 @@ class DatabaseQueue(QueueDriver):
         finally:
             await session.close()
 
+    async def delete_many(self, job_ids: list[Union[int, str]], queue: str) -> None:
+        """Delete a batch of jobs with a single DELETE ... WHERE id IN statement."""
+        if not Model._is_enabled:
+            logger.error('Cannot delete jobs - database integration is disabled')
+            return
+        if not job_ids:
+            return
+
+        session = cast(AsyncSession, Model.get_session())
+        try:
+            stmt = delete(QueueJob).where(
+                QueueJob.id.in_(job_ids),
+                QueueJob.queue == queue,
+            )
+
+            with _database_span('delete', 'queue_jobs', _delete_queue_jobs_query()):
+                await session.execute(stmt)
+                await session.commit()
+            logger.debug('%d job(s) deleted from queue %r', len(job_ids), queue)
+
+        except Exception as e:
+            await session.rollback()
+            logger.error(f'Failed to delete jobs: {str(e)}')
+            raise
+        finally:
+            await session.close()
+
     async def heartbeat(self, job_id: Union[int, str], queue: str) -> bool:
         """Refresh the reserved_at timestamp for an active database job."""
         if not Model._is_enabled:
             return False
 
-        session = cast(AsyncSession, await Model.get_session())
+        session = cast(AsyncSession, Model.get_session())
         try:
             stmt = (
                 update(QueueJob)
                 .where(QueueJob.id == job_id, QueueJob.queue == queue, QueueJob.reserved_at.is_not(None))
-                .values(reserved_at=datetime.now(UTC))
+                .values(reserved_at=epoch_ms_now())
             )
             with _database_span('update', 'queue_jobs', _heartbeat_queue_job_query()):
                 result = await session.execute(stmt)
@@ -208,14 +398,13 @@ class DatabaseQueue(QueueDriver):
             logger.error('Cannot store failed job - database integration is disabled')
             return
 
-        session = cast(AsyncSession, await Model.get_session())
+        session = cast(AsyncSession, Model.get_session())
         try:
             failed_job = QueueFailedJob(
                 connection=connection,
                 queue=queue,
                 payload=payload,
                 exception=exception,
-                failed_at=datetime.now(UTC),
             )
 
             with _database_span('insert', 'queue_failed_jobs', _insert_failed_job_query()):
@@ -230,10 +419,32 @@ class DatabaseQueue(QueueDriver):
         finally:
             await session.close()
 
+    async def failed_many(self, failed_jobs: list[dict[str, str]]) -> None:
+        """Store a batch of failed jobs with one executemany INSERT and a single commit."""
+        if not Model._is_enabled:
+            logger.error('Cannot store failed jobs - database integration is disabled')
+            return
+        if not failed_jobs:
+            return
+
+        session = cast(AsyncSession, Model.get_session())
+        try:
+            with _database_span('insert', 'queue_failed_jobs', _insert_failed_job_query()):
+                await session.execute(insert(QueueFailedJob), failed_jobs)
+                await session.commit()
+            logger.info('%d failed job(s) stored', len(failed_jobs))
+
+        except Exception as e:
+            await session.rollback()
+            logger.error(f'Failed to store failed jobs: {str(e)}')
+            raise
+        finally:
+            await session.close()
+
     async def list_failed_jobs(self, queue: str | None = None) -> list[dict[str, Any]]:
         if not Model._is_enabled:
             return []
-        session = cast(AsyncSession, await Model.get_session())
+        session = cast(AsyncSession, Model.get_session())
         try:
             stmt = select(QueueFailedJob).order_by(QueueFailedJob.id)
             if queue is not None:
@@ -259,7 +470,7 @@ class DatabaseQueue(QueueDriver):
     async def forget_failed_job(self, job_id: Union[int, str]) -> bool:
         if not Model._is_enabled:
             return False
-        session = cast(AsyncSession, await Model.get_session())
+        session = cast(AsyncSession, Model.get_session())
         try:
             with _database_span('delete', 'queue_failed_jobs', _delete_failed_job_query()):
                 result = await session.execute(select(QueueFailedJob).where(QueueFailedJob.id == int(job_id)))
@@ -278,7 +489,7 @@ class DatabaseQueue(QueueDriver):
     async def flush_failed_jobs(self, queue: str | None = None) -> int:
         if not Model._is_enabled:
             return 0
-        session = cast(AsyncSession, await Model.get_session())
+        session = cast(AsyncSession, Model.get_session())
         try:
             stmt = delete(QueueFailedJob)
             if queue is not None:
@@ -297,7 +508,7 @@ class DatabaseQueue(QueueDriver):
     async def _get_failed_job_model(self, job_id: Union[int, str]):
         if not Model._is_enabled:
             return None
-        session = cast(AsyncSession, await Model.get_session())
+        session = cast(AsyncSession, Model.get_session())
         try:
             with _database_span('select', 'queue_failed_jobs', _select_failed_job_query()):
                 result = await session.execute(select(QueueFailedJob).where(QueueFailedJob.id == int(job_id)))
@@ -311,16 +522,14 @@ class DatabaseQueue(QueueDriver):
             logger.error('Cannot reap expired jobs - database integration is disabled')
             return 0
 
-        session = cast(AsyncSession, await Model.get_session())
+        session = cast(AsyncSession, Model.get_session())
         try:
-            now = datetime.now(UTC)
-            cutoff = now - timedelta(seconds=visibility_timeout)
             stmt = (
                 select(QueueJob)
                 .where(
                     QueueJob.queue == queue,
                     QueueJob.reserved_at.is_not(None),
-                    QueueJob.reserved_at < cutoff,
+                    QueueJob.reserved_at < epoch_ms_now() - visibility_timeout * 1000,
                 )
                 .order_by(QueueJob.id)
             )
@@ -337,13 +546,12 @@ class DatabaseQueue(QueueDriver):
                             queue=queue,
                             payload=str(job_record.payload),
                             exception=f'Job reservation expired after {visibility_timeout}s visibility timeout',
-                            failed_at=now,
                         )
                         session.add(failed_job)
                         await session.delete(job)
                     else:
                         job_record.reserved_at = None
-                        job_record.available_at = now
+                        job_record.available_at = epoch_ms_now()
 
                 await session.commit()
             return len(jobs)
@@ -361,24 +569,52 @@ class DatabaseQueue(QueueDriver):
             logger.error('Cannot get queue size - database integration is disabled')
             return 0
 
-        session = cast(AsyncSession, await Model.get_session())
         try:
-            stmt = select(QueueJob).where(
+            stmt = select(func.count(QueueJob.id)).where(
                 QueueJob.queue == queue,
                 QueueJob.reserved_at.is_(None),
             )
 
-            with _database_span('select', 'queue_jobs', _queue_size_query()):
-                result = await session.execute(stmt)
-                jobs = result.scalars().all()
-            return len(jobs)
+            # A lone COUNT needs no transaction; autocommit skips the BEGIN/ROLLBACK round trips
+            async with Model._engine.connect() as connection:
+                await connection.execution_options(isolation_level='AUTOCOMMIT')
+                with _database_span('select', 'queue_jobs', _queue_size_query()):
+                    result = await connection.execute(stmt)
+            return int(result.scalar_one())
 
         except Exception as e:
             logger.error(f'Failed to get queue size: {str(e)}')
             # Audit Accept: queue depth is advisory and must not break callers.
             return 0
-        finally:
-            await session.close()
+
+    async def size_approx(self, queue: str = 'default') -> int:
+        """Estimate the table's row count from MySQL/PostgreSQL metadata.
+
+        The estimate covers every queue and reserved jobs too; other databases
+        fall back to :meth:`size`.
+        """
+        if not Model._is_enabled:
+            logger.error('Cannot get queue size - database integration is disabled')
+            return 0
+
+        if Model._db_system == 'mysql':
+            query = _mysql_table_rows_query()
+        elif Model._db_system == 'postgresql':
+            query = _postgres_reltuples_query()
+        else:
+            return await self.size(queue)
+
+        try:
+            async with Model._engine.connect() as connection:
+                await connection.execution_options(isolation_level='AUTOCOMMIT')
+                with _database_span('select', 'queue_jobs', query):
+                    result = await connection.execute(text(query), {'table': QueueJob.__tablename__})
+            return max(int(result.scalar() or 0), 0)
+
+        except Exception as e:
+            logger.error(f'Failed to estimate queue size: {str(e)}')
+            # Audit Accept: queue depth is advisory and must not break callers.
+            return 0
 
     async def stats(self, queue: str = 'default') -> dict[str, Any]:
         """Return ready/reserved/delayed/failed queue depth statistics."""
@@ -387,17 +623,18 @@ class DatabaseQueue(QueueDriver):
             logger.error('Cannot get queue stats - database integration is disabled')
             return empty_stats
 
-        session = cast(AsyncSession, await Model.get_session())
+        session = cast(AsyncSession, Model.get_session())
         try:
-            now = datetime.now(UTC)
             with _database_span('select', 'queue_jobs', _queue_stats_query()):
+                # Classify against the database clock, the one push and pop set and compare available_at with
+                now = cast(int, await session.scalar(select(epoch_ms_now())))
                 jobs_result = await session.execute(select(QueueJob).where(QueueJob.queue == queue))
                 jobs = cast(list[Any], list(jobs_result.scalars().all()))
                 failed_result = await session.execute(select(QueueFailedJob).where(QueueFailedJob.queue == queue))
                 failed_jobs = cast(list[Any], list(failed_result.scalars().all()))
 
-            ready_jobs = [job for job in jobs if job.reserved_at is None and _as_utc(job.available_at) <= now]
-            delayed_jobs = [job for job in jobs if job.reserved_at is None and _as_utc(job.available_at) > now]
+            ready_jobs = [job for job in jobs if job.reserved_at is None and job.available_at <= now]
+            delayed_jobs = [job for job in jobs if job.reserved_at is None and job.available_at > now]
             reserved_jobs = [job for job in jobs if job.reserved_at is not None]
             oldest_ready_age = _oldest_ready_age_seconds(ready_jobs, now)
             return {
@@ -415,9 +652,19 @@ class DatabaseQueue(QueueDriver):
             await session.close()
 
 
+def _wake_channel(queue: str) -> str:
+    return f'routemq_queue_{queue}'
+
+
+def _available_at(delay: int):
+    """Database-clock availability time, so every worker compares against one clock."""
+    now = epoch_ms_now()
+    return now + delay * 1000 if delay > 0 else now
+
+
 def _payload_max_tries(payload: str, default: int = 3) -> int:
     try:
-        value = json.loads(payload).get('max_tries', default)
+        value = json_codec.loads(payload).get('max_tries', default)
         return max(1, int(value))
     except (TypeError, ValueError, json.JSONDecodeError):
         return default
@@ -430,7 +677,7 @@ def _failed_job_to_dict(job) -> dict[str, Any]:
         'queue': job.queue,
         'payload': job.payload,
         'exception': job.exception,
-        'failed_at': job.failed_at.isoformat() if hasattr(job.failed_at, 'isoformat') else str(job.failed_at),
+        'failed_at': _failed_at_iso(job.failed_at),
     }
 
 
@@ -443,11 +690,15 @@ def _database_span(operation: str, collection: str, query_text: str):
 
 
 def _insert_queue_job_query() -> str:
-    return 'INSERT INTO queue_jobs (queue, payload, attempts, available_at, created_at) VALUES (:queue, :payload, :attempts, :available_at, :created_at)'
+    return 'INSERT INTO queue_jobs (queue, payload, attempts, available_at) VALUES (:queue, :payload, :attempts, :available_at)'
 
 
 def _pop_queue_job_query() -> str:
-    return 'SELECT * FROM queue_jobs WHERE queue = :queue AND reserved_at IS NULL AND available_at <= :now ORDER BY id LIMIT 1 FOR UPDATE SKIP LOCKED'
+    return 'SELECT id, payload, attempts FROM queue_jobs WHERE queue = :queue AND reserved_at IS NULL AND available_at <= :now ORDER BY id LIMIT 1 FOR UPDATE SKIP LOCKED; UPDATE queue_jobs SET reserved_at = :now, attempts = attempts + 1 WHERE id = :id'
+
+
+def _pop_queue_jobs_query() -> str:
+    return 'SELECT id, payload, attempts FROM queue_jobs WHERE queue = :queue AND reserved_at IS NULL AND available_at <= :now ORDER BY id LIMIT :limit FOR UPDATE SKIP LOCKED; UPDATE queue_jobs SET reserved_at = :now, attempts = attempts + 1 WHERE id IN (:ids)'
 
 
 def _release_queue_job_query() -> str:
@@ -458,12 +709,29 @@ def _delete_queue_job_query() -> str:
     return 'DELETE FROM queue_jobs WHERE id = :id AND queue = :queue'
 
 
+def _release_queue_jobs_query() -> str:
+    return (
+        'UPDATE queue_jobs SET reserved_at = NULL, available_at = :available_at WHERE id IN (:ids) AND queue = :queue'
+    )
+
+
+def _unreserve_queue_jobs_query() -> str:
+    return (
+        'UPDATE queue_jobs SET reserved_at = NULL, attempts = attempts - 1 '
+        'WHERE id IN (:ids) AND queue = :queue AND reserved_at IS NOT NULL'
+    )
+
+
+def _delete_queue_jobs_query() -> str:
+    return 'DELETE FROM queue_jobs WHERE id IN (:ids) AND queue = :queue'
+
+
 def _heartbeat_queue_job_query() -> str:
     return 'UPDATE queue_jobs SET reserved_at = :now WHERE id = :id AND queue = :queue AND reserved_at IS NOT NULL'
 
 
 def _insert_failed_job_query() -> str:
-    return 'INSERT INTO queue_failed_jobs (connection, queue, payload, exception, failed_at) VALUES (:connection, :queue, :payload, :exception, :failed_at)'
+    return 'INSERT INTO queue_failed_jobs (connection, queue, payload, exception) VALUES (:connection, :queue, :payload, :exception)'
 
 
 def _select_failed_jobs_query(has_queue_filter: bool) -> str:
@@ -491,24 +759,32 @@ def _reap_expired_jobs_query() -> str:
 
 
 def _queue_size_query() -> str:
-    return 'SELECT * FROM queue_jobs WHERE queue = :queue AND reserved_at IS NULL'
+    return 'SELECT COUNT(id) FROM queue_jobs WHERE queue = :queue AND reserved_at IS NULL'
+
+
+def _mysql_table_rows_query() -> str:
+    return 'SELECT table_rows FROM information_schema.tables WHERE table_schema = DATABASE() AND table_name = :table'
+
+
+def _postgres_reltuples_query() -> str:
+    return 'SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)'
 
 
 def _queue_stats_query() -> str:
     return 'SELECT * FROM queue_jobs WHERE queue = :queue; SELECT * FROM queue_failed_jobs WHERE queue = :queue'
 
 
-def _as_utc(value: datetime) -> datetime:
-    if value.tzinfo is None:
-        return value.replace(tzinfo=UTC)
-    return value.astimezone(UTC)
+def _failed_at_iso(value: Any) -> str:
+    if isinstance(value, int):
+        return epoch_ms_to_datetime(value).isoformat()
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
 
 
-def _oldest_ready_age_seconds(jobs: list[Any], now: datetime) -> float:
+def _oldest_ready_age_seconds(jobs: list[Any], now: int) -> float:
     if not jobs:
         return 0.0
-    oldest = min(_as_utc(getattr(job, 'created_at', None) or job.available_at) for job in jobs)
-    return max(0.0, (now - oldest).total_seconds())
+    oldest = min(getattr(job, 'created_at', None) or job.available_at for job in jobs)
+    return max(0.0, (now - oldest) / 1000)
 
 
 def _empty_queue_stats(queue: str) -> dict[str, Any]:
@@ -1,23 +1,121 @@
+import time
+import zlib
 from datetime import UTC, datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, Index
+from sqlalchemy import BigInteger, Column, Integer, LargeBinary, String, Index, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.types import TypeDecorator
 
 from routemq.model import Model
 
 
+def epoch_ms() -> int:
+    """Current time as integer Unix milliseconds, the unit of every queue timestamp column."""
+    return time.time_ns() // 1_000_000
+
+
+def epoch_ms_to_datetime(value: int) -> datetime:
+    """Convert a stored Unix-millisecond timestamp to an aware UTC datetime."""
+    return datetime.fromtimestamp(value / 1000, UTC)
+
+
+class epoch_ms_now(FunctionElement):
+    """Database-side current time in Unix milliseconds, for ``server_default``."""
+
+    type = BigInteger()
+    inherit_cache = True
+
+
+@compiles(epoch_ms_now)
+def _epoch_ms_now_default(element, compiler, **kw):
+    return 'CAST(EXTRACT(EPOCH FROM CURRENT_TIMESTAMP) * 1000 AS BIGINT)'
+
+
+@compiles(epoch_ms_now, 'postgresql')
+def _epoch_ms_now_postgresql(element, compiler, **kw):
+    return 'CAST(EXTRACT(EPOCH FROM now()) * 1000 AS BIGINT)'
+
+
+@compiles(epoch_ms_now, 'mysql')
+def _epoch_ms_now_mysql(element, compiler, **kw):
+    # Expression defaults need MySQL 8.0.13+ / MariaDB 10.2+, and MySQL only accepts them inside parentheses
+    return '(CAST(UNIX_TIMESTAMP(NOW(3)) * 1000 AS SIGNED))'
+
+
+@compiles(epoch_ms_now, 'sqlite')
+def _epoch_ms_now_sqlite(element, compiler, **kw):
+    return "CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)"
+
+
+class CompressedText(TypeDecorator):
+    """
+    Text stored as zlib-compressed bytes.
+
+    Python code keeps reading and writing ``str``. Stored values carry a one-byte marker:
+    ``\\x01`` for zlib data and ``\\x00`` for values too short to be worth compressing.
+    Bytes without a marker are read as plain UTF-8, so rows copied over from the old
+    ``TEXT`` column (``convert_to(payload, 'UTF8')``) still load.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    RAW = b'\x00'
+    ZLIB = b'\x01'
+    # Below this many bytes zlib's header and checksum outweigh the savings
+    MIN_COMPRESS_SIZE = 128
+    COMPRESSION_LEVEL = 6
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        data = value.encode('utf-8')
+        if len(data) < self.MIN_COMPRESS_SIZE:
+            return self.RAW + data
+        return self.ZLIB + zlib.compress(data, self.COMPRESSION_LEVEL)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return value
+        data = bytes(value)
+        marker, body = data[:1], data[1:]
+        if marker == self.ZLIB:
+            return zlib.decompress(body).decode('utf-8')
+        if marker == self.RAW:
+            return body.decode('utf-8')
+        return data.decode('utf-8')
+
+
 class QueueJob(Model):
     """Model for queue_jobs table - stores pending and reserved jobs."""
 
     __tablename__ = 'queue_jobs'
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    queue = Column(String(255), nullable=False, index=True, default='default')
-    payload = Column(Text, nullable=False)
+    # No single-column index: queue_jobs_dequeue_idx leads with queue and serves queue-only lookups
+    queue = Column(String(255), nullable=False, default='default')
+    payload = Column(CompressedText, nullable=False)
     attempts = Column(Integer, nullable=False, default=0)
-    reserved_at = Column(DateTime, nullable=True)
-    available_at = Column(DateTime, nullable=False)
-    created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(UTC))
+    # Unix milliseconds: comparisons stay integer-only and the dequeue index stays narrow
+    reserved_at = Column(BigInteger, nullable=True)
+    available_at = Column(BigInteger, nullable=False)
+    # Filled by the database when omitted, so bulk inserts need no per-row Python default
+    created_at = Column(BigInteger, nullable=False, server_default=epoch_ms_now())
 
-    __table_args__ = (Index('queue_jobs_queue_reserved_at_index', 'queue', 'reserved_at'),)
+    __table_args__ = (
+        # Covers every predicate of the dequeue query plus its ORDER BY id, so pop() is an
+        # index range scan that SKIP LOCKED can walk without touching unrelated rows
+        Index('queue_jobs_dequeue_idx', 'queue', 'reserved_at', 'available_at', 'id'),
+        # PostgreSQL only: indexes just the unreserved rows, so reserved jobs never bloat the scan
+        Index(
+            'queue_jobs_pending_idx',
+            'queue',
+            'available_at',
+            postgresql_where=text('reserved_at IS NULL'),
+        ).ddl_if(dialect='postgresql'),
+    )
 
     def __repr__(self):
         return f"<QueueJob(id={self.id}, queue='{self.queue}', attempts={self.attempts})>"
@@ -31,9 +129,11 @@ class QueueFailedJob(Model):
     id = Column(Integer, primary_key=True, autoincrement=True)
     connection = Column(String(255), nullable=False)
     queue = Column(String(255), nullable=False, index=True)
-    payload = Column(Text, nullable=False)
-    exception = Column(Text, nullable=False)
-    failed_at = Column(DateTime, nullable=False, default=lambda: datetime.now(UTC))
+    payload = Column(CompressedText, nullable=False)
+    exception = Column(CompressedText, nullable=False)
+    failed_at = Column(BigInteger, nullable=False, server_default=epoch_ms_now())  # Unix milliseconds
+
+    __table_args__ = (Index('queue_failed_jobs_failed_at_idx', 'failed_at'),)
 
     def __repr__(self):
         return f"<QueueFailedJob(id={self.id}, queue='{self.queue}', failed_at='{self.failed_at}')>"
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import Any, Optional, Union
 from datetime import datetime
 
@@ -26,6 +27,44 @@ class QueueDriver(ABC):
         """
         pass
 
+    async def push_many(self, payloads: list[str], queue: str = 'default', delay: int = 0) -> None:
+        """
+        Push several jobs onto the same queue.
+
+        Drivers that can enqueue a batch in one round trip override this; the
+        default calls :meth:`push` once per payload.
+
+        Args:
+            payloads: Serialized job data
+            queue: Queue name
+            delay: Delay in seconds before the jobs become available
+        """
+        for payload in payloads:
+            await self.push(payload, queue, delay)
+
+    async def listen_for_jobs(self, queue: str, wake: Callable[[], None]) -> None:
+        """
+        Call ``wake`` whenever a job is pushed onto ``queue``, until cancelled.
+
+        Workers run this in a background task to cut their idle sleep short.
+        Drivers without a notification channel return at once and workers keep
+        polling every ``sleep`` seconds.
+
+        Args:
+            queue: Queue name
+            wake: Callback to invoke for each push notification
+        """
+        return None
+
+    @property
+    def pop_blocks(self) -> bool:
+        """
+        Whether an empty :meth:`pop` has already waited on the backend for a job.
+
+        Workers skip their idle sleep after an empty pop from such a driver.
+        """
+        return False
+
     @abstractmethod
     async def pop(self, queue: str = 'default') -> Optional[dict]:
         """
@@ -39,6 +78,28 @@ class QueueDriver(ABC):
         """
         pass
 
+    async def pop_batch(self, queue: str = 'default', limit: int = 1) -> list[dict]:
+        """
+        Pop up to ``limit`` available jobs from the queue.
+
+        Drivers that can reserve several jobs in one round trip override this;
+        the default calls :meth:`pop` until the queue runs dry.
+
+        Args:
+            queue: Queue name
+            limit: Maximum number of jobs to reserve
+
+        Returns:
+            List of job dictionaries ({id, payload, attempts}), possibly empty
+        """
+        jobs = []
+        for _ in range(limit):
+            job = await self.pop(queue)
+            if job is None:
+                break
+            jobs.append(job)
+        return jobs
+
     @abstractmethod
     async def release(
         self,
@@ -56,6 +117,41 @@ class QueueDriver(ABC):
         """
         pass
 
+    async def release_many(
+        self,
+        job_ids: list[Union[int, str]],
+        queue: str,
+        delay: int = 0,
+    ) -> None:
+        """
+        Release several jobs back to the queue with the same delay.
+
+        Drivers that can release a batch in one round trip override this; the
+        default calls :meth:`release` once per job.
+
+        Args:
+            job_ids: Job identifiers
+            queue: Queue name
+            delay: Delay in seconds before the jobs become available again
+        """
+        for job_id in job_ids:
+            await self.release(job_id, queue, delay)
+
+    async def unreserve_many(self, job_ids: list[Union[int, str]], queue: str) -> None:
+        """
+        Return reserved jobs that never ran to the queue, as if they had not been popped.
+
+        Unlike :meth:`release_many`, this undoes the attempt counted when the jobs
+        were reserved, so a worker handing back its unprocessed buffer does not use
+        up their tries. Drivers that count attempts at reservation override this;
+        the default releases the jobs immediately.
+
+        Args:
+            job_ids: Job identifiers, in the order they were reserved
+            queue: Queue name
+        """
+        await self.release_many(job_ids, queue, 0)
+
     @abstractmethod
     async def delete(self, job_id: Union[int, str], queue: str) -> None:
         """
@@ -67,6 +163,20 @@ class QueueDriver(ABC):
         """
         pass
 
+    async def delete_many(self, job_ids: list[Union[int, str]], queue: str) -> None:
+        """
+        Delete several jobs from the queue.
+
+        Drivers that can remove a batch in one round trip override this; the
+        default calls :meth:`delete` once per job.
+
+        Args:
+            job_ids: Job identifiers
+            queue: Queue name
+        """
+        for job_id in job_ids:
+            await self.delete(job_id, queue)
+
     @abstractmethod
     async def failed(
         self,
@@ -86,6 +196,19 @@ class QueueDriver(ABC):
         """
         pass
 
+    async def failed_many(self, failed_jobs: list[dict[str, str]]) -> None:
+        """
+        Store several failed jobs.
+
+        Drivers that can write a batch in one round trip override this; the
+        default calls :meth:`failed` once per record.
+
+        Args:
+            failed_jobs: Records with the keyword arguments of :meth:`failed`
+        """
+        for failed_job in failed_jobs:
+            await self.failed(**failed_job)
+
     @abstractmethod
     async def size(self, queue: str = 'default') -> int:
         """
@@ -99,6 +222,21 @@ class QueueDriver(ABC):
         """
         pass
 
+    async def size_approx(self, queue: str = 'default') -> int:
+        """
+        Get a cheap, possibly stale estimate of the queue size.
+
+        Drivers that can read an estimate from metadata override this; the
+        default returns the exact :meth:`size`.
+
+        Args:
+            queue: Queue name
+
+        Returns:
+            Estimated number of jobs in the queue
+        """
+        return await self.size(queue)
+
     async def stats(self, queue: str = 'default') -> dict[str, Any]:
         """Return queue-depth statistics when supported by the driver."""
         ready = await self.size(queue)
@@ -54,6 +54,8 @@ class QueueManager:
 
         self._initialized = True
         self._default_connection = os.getenv('QUEUE_CONNECTION', 'redis')
+        # One driver per resolved connection, with the factory that built it
+        self._drivers: dict[str, tuple[QueueDriverFactory, QueueDriver]] = {}
         logger.info(f'QueueManager initialized with default connection: {self._default_connection}')
 
     def get_driver(self, connection: Optional[str] = None) -> QueueDriver:
@@ -69,14 +71,19 @@ class QueueManager:
         Raises:
             RuntimeError: If the requested driver is not available
         """
-        self._ensure_driver_registry_loaded()
         connection = self._resolve_connection(connection)
         factory = self._driver_factories[connection]
+        cached = self._drivers.get(connection)
+        # Re-registering a connection swaps the factory, which invalidates its cached driver
+        if cached is not None and cached[0] is factory:
+            return cached[1]
+
         driver = factory()
 
         if not isinstance(driver, QueueDriver):
             raise TypeError(f"Queue driver factory for '{connection}' did not return a QueueDriver instance")
 
+        self._drivers[connection] = (factory, driver)
         return driver
 
     @classmethod
@@ -265,30 +272,40 @@ class QueueManager:
         """
         driver = self.get_driver(connection)
 
+        # One driver call per destination queue rather than one per job
+        by_queue: dict[str, list[Job]] = {}
         for job in jobs:
-            q = queue or job.queue
-            attributes = {
-                'job_class': job.__class__.__name__,
-                'queue': q,
-                'connection': connection or self._default_connection,
-                'bulk': True,
-            }
+            by_queue.setdefault(queue or job.queue, []).append(job)
+
+        for q, queue_jobs in by_queue.items():
             span_attributes = {
                 'messaging.system': 'routemq.queue',
                 'messaging.destination': q,
-                'routemq.job.name': job.__class__.__name__,
+                'messaging.batch.message_count': len(queue_jobs),
             }
             with _start_span('queue.enqueue', span_attributes, kind='producer'):
-                job.capture_observability_context(attributes)
-                payload = job.serialize()
-                _lifecycle('queue.enqueue.started', attributes)
+                job_attributes = []
+                payloads = []
+                for job in queue_jobs:
+                    attributes = {
+                        'job_class': job.__class__.__name__,
+                        'queue': q,
+                        'connection': connection or self._default_connection,
+                        'bulk': True,
+                    }
+                    job.capture_observability_context(attributes)
+                    payloads.append(job.serialize())
+                    job_attributes.append(attributes)
+                    _lifecycle('queue.enqueue.started', attributes)
                 try:
-                    await driver.push(payload, q)
+                    await driver.push_many(payloads, q)
                 except Exception as exc:
-                    _lifecycle('queue.enqueue.failed', {**attributes, 'error': exc.__class__.__name__})
+                    for attributes in job_attributes:
+                        _lifecycle('queue.enqueue.failed', {**attributes, 'error': exc.__class__.__name__})
                     raise
                 else:
-                    _lifecycle('queue.enqueue.succeeded', attributes)
+                    for attributes in job_attributes:
+                        _lifecycle('queue.enqueue.succeeded', attributes)
 
         logger.info(f'Bulk dispatched {len(jobs)} jobs to queue')
 
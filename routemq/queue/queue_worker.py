@@ -5,10 +5,12 @@ import logging
 import os
 import signal
 import socket
+import time
 import traceback
 import uuid
+from collections import deque
 from datetime import UTC, datetime
-from typing import Optional
+from typing import Optional, cast
 
 from routemq.job import Job
 from routemq.queue.queue_driver import QueueDriver
@@ -46,6 +48,8 @@ class QueueWorker:
         sleep: int = 3,
         max_tries: Optional[int] = None,
         timeout: int = 60,
+        batch_size: int = 1,
+        concurrency: int = 1,
     ):
         """
         Initialize the queue worker.
@@ -58,6 +62,8 @@ class QueueWorker:
             sleep: Number of seconds to sleep when no job is available
             max_tries: Maximum number of times to attempt a job
             timeout: Maximum number of seconds a job can run
+            batch_size: Number of jobs to reserve per pop; extra jobs wait in a local buffer
+            concurrency: Number of jobs to run at once on this worker's event loop
         """
         self.queue_name = queue_name
         self.connection = connection
@@ -66,6 +72,13 @@ class QueueWorker:
         self.sleep = sleep
         self.max_tries = max_tries
         self.timeout = timeout
+        self.batch_size = max(1, batch_size)
+        # Jobs already reserved by pop_batch but not yet processed
+        self._local_queue: deque[dict] = deque()
+        self.concurrency = max(1, concurrency)
+        # Free job slots and running job tasks; unused when jobs run one at a time
+        self._job_slots = asyncio.Semaphore(self.concurrency) if self.concurrency > 1 else None
+        self._job_tasks: set[asyncio.Task[None]] = set()
         retry_settings = load_queue_retry_settings()
         reliability_settings = load_queue_reliability_settings()
         self.retry_backoff_enabled = retry_settings.backoff_enabled
@@ -75,8 +88,14 @@ class QueueWorker:
         self.reaper_interval = reliability_settings.reaper_interval
         self.shutdown_grace = reliability_settings.shutdown_grace
         self.heartbeat_interval = reliability_settings.heartbeat_interval
+        self.complete_batch_delay_ms = reliability_settings.complete_batch_delay_ms
+        # Finished job ids waiting for the next batched delete, failed-job records
+        # that must be stored before their jobs are deleted, and retried job ids
+        # grouped by their release delay
+        self._pending_deletes: list[str | int] = []
+        self._pending_fails: list[dict[str, str]] = []
+        self._pending_releases: dict[int, list[str | int]] = {}
 
-        self.should_quit = False
         self.paused = False
         self.jobs_processed = 0
         self.jobs_failed = 0
@@ -85,7 +104,12 @@ class QueueWorker:
         self.worker_id = f'{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}'
         self.state = 'running'
         self.current_job_id: str | int | None = None
+        # Every job currently running; each keeps its reservation alive while listed
+        self._active_job_ids: set[str | int] = set()
+        # Single source of truth for shutdown; sleeps wait on it so a stop request ends them at once
         self._shutdown_event = asyncio.Event()
+        # Set by the driver's push notifications to end an idle sleep early
+        self._wake_event = asyncio.Event()
         self._last_reaper_run = 0.0
 
         self.queue_manager = QueueManager()
@@ -95,12 +119,22 @@ class QueueWorker:
         signal.signal(signal.SIGTERM, self._handle_signal)
         signal.signal(signal.SIGINT, self._handle_signal)
 
+    @property
+    def should_quit(self) -> bool:
+        return self._shutdown_event.is_set()
+
+    @should_quit.setter
+    def should_quit(self, value: bool) -> None:
+        if value:
+            self._shutdown_event.set()
+        else:
+            self._shutdown_event.clear()
+
     def _handle_signal(self, signum, frame):
         """Handle shutdown signals."""
         logger.info(f'Received signal {signum}, initiating graceful shutdown...')
         self.should_quit = True
         self.state = 'stopping'
-        self._shutdown_event.set()
         try:
             mark_worker_dead(os.getpid())
         except Exception:
@@ -114,9 +148,11 @@ class QueueWorker:
         logger.info(f"Queue worker started for queue '{self.queue_name}' (connection: {self.connection or 'default'})")
 
         self.driver = self.queue_manager.get_driver(self.connection)
-        self.start_time = asyncio.get_running_loop().time()
+        self.start_time = time.monotonic()
         self.state = 'running'
         await self._write_worker_heartbeat()
+        flusher = asyncio.create_task(self._run_flusher()) if self.complete_batch_delay_ms > 0 else None
+        listener = asyncio.create_task(self._listen_for_jobs())
 
         while not self.should_quit:
             # Check if we've reached max jobs or max time
@@ -132,15 +168,18 @@ class QueueWorker:
             # Try to get a job from the queue
             try:
                 await self._run_reaper_if_due()
-                job_data = await self.driver.pop(self.queue_name)
+                if self._job_slots is not None:
+                    if not await self._start_concurrent_job():
+                        await self._wait_when_idle()
+                    continue
+
+                job_data = await self._next_job()
 
                 if job_data:
                     await self._process_job(job_data)
                     self.jobs_processed += 1
                 else:
-                    # No jobs available, sleep
-                    logger.debug(f'No jobs available, sleeping for {self.sleep}s')
-                    await self._interruptible_sleep(self.sleep)
+                    await self._wait_when_idle()
 
             except Exception as e:
                 logger.error(
@@ -150,10 +189,166 @@ class QueueWorker:
                 )
                 await self._interruptible_sleep(self.sleep)
 
+        if self._job_tasks:
+            await asyncio.gather(*self._job_tasks, return_exceptions=True)
+        listener.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await listener
+        if flusher is not None:
+            # Stop the flusher through the shutdown event rather than cancelling it: a cancel
+            # landing mid-flush would drop the batch it had already taken off the pending lists
+            self.should_quit = True
+            await flusher
+        await self._flush_completions()
+        await self._release_buffered_jobs()
         self.state = 'dead'
         await self._mark_worker_dead()
         logger.info(f'Queue worker stopped. Processed {self.jobs_processed} jobs.')
 
+    async def _next_job(self) -> Optional[dict]:
+        """Return the next reserved job, refilling the local buffer one batch at a time."""
+        driver = cast(QueueDriver, self.driver)
+        local_queue = self._local_queue
+        if not local_queue:
+            if self.batch_size == 1:
+                return await driver.pop(self.queue_name)
+            local_queue.extend(await driver.pop_batch(self.queue_name, self.batch_size))
+        return local_queue.popleft() if local_queue else None
+
+    async def _start_concurrent_job(self) -> bool:
+        """Wait for a free slot, then pop a job and run it in the background.
+
+        Returns ``False`` when the queue had nothing ready.
+        """
+        slots = cast(asyncio.Semaphore, self._job_slots)
+        await slots.acquire()
+        try:
+            # A slot can free up after shutdown was requested; do not reserve more work then
+            job_data = None if self.should_quit else await self._next_job()
+        except BaseException:
+            slots.release()
+            raise
+        if not job_data:
+            slots.release()
+            return self.should_quit
+
+        task = asyncio.create_task(self._run_concurrent_job(job_data))
+        self._job_tasks.add(task)
+        task.add_done_callback(self._job_tasks.discard)
+        return True
+
+    async def _run_concurrent_job(self, job_data: dict) -> None:
+        try:
+            await self._process_job(job_data)
+            self.jobs_processed += 1
+        except Exception as e:
+            job_id = job_data.get('id')
+            logger.error(
+                f'Failed to process job {job_id} on queue {self.queue_name}: {str(e)}',
+                exc_info=True,
+                extra={'job_id': job_id, 'queue': self.queue_name, 'error': e.__class__.__name__},
+            )
+        finally:
+            cast(asyncio.Semaphore, self._job_slots).release()
+
+    async def _complete_job(self, job_id: str | int) -> None:
+        """Delete a finished job now, or queue it for the next batched delete."""
+        if self.complete_batch_delay_ms > 0:
+            self._pending_deletes.append(job_id)
+            return
+        await cast(QueueDriver, self.driver).delete(job_id, self.queue_name)
+
+    async def _release_job(self, job_id: str | int, delay: int) -> None:
+        """Release a job for retry now, or queue it for the next batched release."""
+        if self.complete_batch_delay_ms > 0:
+            self._pending_releases.setdefault(delay, []).append(job_id)
+            return
+        await cast(QueueDriver, self.driver).release(job_id, self.queue_name, delay)
+
+    async def _flush_completions(self) -> None:
+        """Release retried jobs, store failed jobs, then delete finished jobs, one driver call each."""
+        driver = self.driver
+        if driver is None:
+            return
+
+        pending_releases = self._pending_releases
+        self._pending_releases = {}
+        for delay, release_ids in pending_releases.items():
+            try:
+                await driver.release_many(release_ids, self.queue_name, delay)
+            except Exception as e:
+                # Keep them for the next flush; until then they stay reserved, not lost
+                self._pending_releases.setdefault(delay, []).extend(release_ids)
+                logger.error(
+                    f'Failed to release {len(release_ids)} retried job(s): {str(e)}',
+                    extra={'queue': self.queue_name, 'error': e.__class__.__name__},
+                )
+
+        failed_jobs = self._pending_fails
+        if failed_jobs:
+            self._pending_fails = []
+            try:
+                await driver.failed_many(failed_jobs)
+            except Exception as e:
+                # Keep the records and skip the deletes: a job is only removed once its
+                # failure is stored, and until then it stays reserved, not lost
+                self._pending_fails = failed_jobs + self._pending_fails
+                logger.error(
+                    f'Failed to store {len(failed_jobs)} failed job(s): {str(e)}',
+                    extra={'queue': self.queue_name, 'error': e.__class__.__name__},
+                )
+                return
+
+        job_ids = self._pending_deletes
+        if not job_ids:
+            return
+        self._pending_deletes = []
+        try:
+            await driver.delete_many(job_ids, self.queue_name)
+        except Exception as e:
+            # Keep them for the next flush; until then they stay reserved, not lost
+            self._pending_deletes.extend(job_ids)
+            logger.error(
+                f'Failed to delete {len(job_ids)} completed job(s): {str(e)}',
+                extra={'queue': self.queue_name, 'error': e.__class__.__name__},
+            )
+
+    async def _run_flusher(self) -> None:
+        interval = self.complete_batch_delay_ms / 1000
+        while not self.should_quit:
+            await self._interruptible_sleep(interval)
+            await self._flush_completions()
+
+    async def _listen_for_jobs(self) -> None:
+        driver = self.driver
+        if driver is None:
+            return
+        try:
+            await driver.listen_for_jobs(self.queue_name, self._wake_event.set)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Without notifications the worker still polls every `sleep` seconds
+            logger.warning(
+                f'Queue wake-up listener stopped, falling back to polling: {str(e)}',
+                extra={'queue': self.queue_name, 'error': e.__class__.__name__},
+            )
+
+    async def _release_buffered_jobs(self) -> None:
+        """Hand reserved-but-unprocessed jobs back to the queue when the worker stops."""
+        driver = self.driver
+        if not self._local_queue or driver is None:
+            return
+        job_ids = [job_data['id'] for job_data in self._local_queue]
+        self._local_queue.clear()
+        try:
+            await driver.unreserve_many(job_ids, self.queue_name)
+        except Exception as e:
+            logger.error(
+                f'Failed to unreserve {len(job_ids)} buffered job(s): {str(e)}',
+                extra={'queue': self.queue_name, 'error': e.__class__.__name__},
+            )
+
     async def _process_job(self, job_data: dict) -> None:
         """
         Process a single job.
@@ -170,15 +365,26 @@ class QueueWorker:
 
         logger.info(f'Processing job {job_id} (attempt {attempts})')
 
+        # Unserialize exactly once; a payload that cannot be decoded will never succeed
+        try:
+            job = Job.unserialize(payload)
+        except Exception as unserialize_error:
+            logger.error(
+                f'Failed to unserialize job {job_id}: {unserialize_error}',
+                exc_info=True,
+                extra={'job_id': job_id, 'queue': self.queue_name, 'error': unserialize_error.__class__.__name__},
+            )
+            # Delete the corrupted job
+            await driver.delete(job_id, self.queue_name)
+            return
+        job.job_id = job_id
+        job.attempts = attempts
+
         token = None
-        job: Job | None = None
         heartbeat_task: asyncio.Task[None] | None = None
         self.current_job_id = job_id
+        self._active_job_ids.add(job_id)
         try:
-            # Unserialize the job
-            job = Job.unserialize(payload)
-            job.job_id = job_id
-            job.attempts = attempts
             attributes = {
                 'job_id': job_id,
                 'job_class': job.__class__.__name__,
@@ -200,8 +406,8 @@ class QueueWorker:
                 if attempts > max_tries:
                     logger.warning(f'Job {job_id} exceeded max tries ({max_tries}), moving to failed queue')
                     lifecycle('queue.job.dead_lettered', {**attributes, 'reason': 'max_tries_exceeded'})
-                    await self._fail_job(job, Exception('Max tries exceeded'))
-                    await driver.delete(job_id, self.queue_name)
+                    await self._fail_job(job, Exception('Max tries exceeded'), payload)
+                    await self._complete_job(job_id)
                     return
 
                 # Execute the job with timeout
@@ -211,7 +417,7 @@ class QueueWorker:
                     await asyncio.wait_for(self._run_job_with_shutdown_grace(job), timeout=job.timeout or self.timeout)
 
                     # Job succeeded, delete from queue
-                    await driver.delete(job_id, self.queue_name)
+                    await self._complete_job(job_id)
                     lifecycle('queue.job.succeeded', attributes)
                     logger.info(f'Job {job_id} completed successfully')
 
@@ -231,33 +437,6 @@ class QueueWorker:
                 extra={'job_id': job_id, 'queue': self.queue_name, 'error': e.__class__.__name__},
             )
 
-            # Try to get the job object if it wasn't unserialized
-            try:
-                if job is None:
-                    job = Job.unserialize(payload)
-                    job.job_id = job_id
-                    job.attempts = attempts
-                    if token is None:
-                        attributes = {
-                            'job_id': job_id,
-                            'job_class': job.__class__.__name__,
-                            'queue': self.queue_name,
-                            'attempts': attempts,
-                        }
-                        job_context = (
-                            job.get_observability_context() if hasattr(job, 'get_observability_context') else {}
-                        )
-                        token = set_context(_consumer_context(job_context), **attributes)
-            except Exception as unserialize_error:
-                logger.error(
-                    f'Failed to unserialize job {job_id}: {unserialize_error}',
-                    exc_info=True,
-                    extra={'job_id': job_id, 'queue': self.queue_name, 'error': unserialize_error.__class__.__name__},
-                )
-                # Delete the corrupted job
-                await driver.delete(job_id, self.queue_name)
-                return
-
             # Check if we should retry
             max_tries = self.max_tries or job.max_tries
             if attempts < max_tries:
@@ -276,7 +455,7 @@ class QueueWorker:
                         delay = job.retry_after
                 else:
                     delay = job.retry_after
-                await driver.release(job_id, self.queue_name, delay)
+                await self._release_job(job_id, delay)
                 lifecycle(
                     'queue.job.retried',
                     {
@@ -300,15 +479,16 @@ class QueueWorker:
                         'error': e.__class__.__name__,
                     },
                 )
-                await self._fail_job(job, e)
+                await self._fail_job(job, e, payload)
                 self.jobs_failed += 1
-                await driver.delete(job_id, self.queue_name)
+                await self._complete_job(job_id)
         finally:
             if heartbeat_task is not None:
                 heartbeat_task.cancel()
                 with contextlib.suppress(asyncio.CancelledError):
                     await heartbeat_task
-            self.current_job_id = None
+            self._active_job_ids.discard(job_id)
+            self.current_job_id = next(iter(self._active_job_ids), None)
             if self.state == 'draining' and self.should_quit:
                 self.state = 'stopping'
             if token is not None:
@@ -337,7 +517,7 @@ class QueueWorker:
                 await shutdown_task
 
     async def _heartbeat_active_job(self, job_id: str | int) -> None:
-        while self.current_job_id == job_id:
+        while job_id in self._active_job_ids:
             await self._call_driver_optional('heartbeat', job_id, self.queue_name)
             await self._write_worker_heartbeat()
             await asyncio.sleep(self.heartbeat_interval)
@@ -363,7 +543,7 @@ class QueueWorker:
     async def _run_reaper_if_due(self) -> None:
         if self.reaper_interval <= 0:
             return
-        now = asyncio.get_running_loop().time()
+        now = time.monotonic()
         if now - self._last_reaper_run < self.reaper_interval:
             return
         self._last_reaper_run = now
@@ -396,13 +576,39 @@ class QueueWorker:
         except asyncio.TimeoutError:
             return
 
-    async def _fail_job(self, job: Job, exception: Exception) -> None:
+    async def _wait_when_idle(self) -> None:
+        """Sleep after an empty pop, unless the driver's pop already waited for a job."""
+        if getattr(self.driver, 'pop_blocks', False) is True:
+            await asyncio.sleep(0)
+            return
+        # No jobs available, sleep until the next push or the poll interval
+        logger.debug('No jobs available, sleeping for %ss', self.sleep)
+        await self._wait_for_jobs(self.sleep)
+
+    async def _wait_for_jobs(self, seconds: float) -> None:
+        """Sleep like ``_interruptible_sleep`` but also wake when a push notification arrives."""
+        if seconds <= 0:
+            await asyncio.sleep(0)
+            return
+        waiters = {
+            asyncio.ensure_future(self._wake_event.wait()),
+            asyncio.ensure_future(self._shutdown_event.wait()),
+        }
+        try:
+            await asyncio.wait(waiters, timeout=seconds, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        self._wake_event.clear()
+
+    async def _fail_job(self, job: Job, exception: Exception, payload: str) -> None:
         """
         Handle a permanently failed job.
 
         Args:
             job: The job that failed
             exception: The exception that caused the failure
+            payload: The payload the job was popped with, stored as-is for retries
         """
         driver = self.driver
         if driver is None:
@@ -416,12 +622,17 @@ class QueueWorker:
             exception_str = f'{exception.__class__.__name__}: {str(exception)}\n'
             exception_str += traceback.format_exc()
 
-            await driver.failed(
-                connection=self.connection or 'default',
-                queue=self.queue_name,
-                payload=job.serialize(),
-                exception=exception_str,
-            )
+            failed_job = {
+                'connection': self.connection or 'default',
+                'queue': self.queue_name,
+                'payload': payload,
+                'exception': exception_str,
+            }
+            if self.complete_batch_delay_ms > 0:
+                # Stored by the next flush, ahead of the job's batched delete
+                self._pending_fails.append(failed_job)
+            else:
+                await driver.failed(**failed_job)
 
             logger.info(f'Job {job.job_id} moved to failed queue')
 
@@ -435,19 +646,12 @@ class QueueWorker:
     def _should_stop(self) -> bool:
         """Check if the worker should stop based on limits."""
         # Check max jobs
-        if self.max_jobs and self.jobs_processed >= self.max_jobs:
+        if self.max_jobs and self.jobs_processed + len(self._job_tasks) >= self.max_jobs:
             return True
 
         # Check max time
         if self.max_time and self.start_time:
-            try:
-                now = asyncio.get_running_loop().time()
-            except RuntimeError:
-                # Audit Accept: support legacy synchronous callers of _should_stop.
-                legacy_get_loop = getattr(asyncio, ''.join(('get_event_', 'loop')))
-                now = legacy_get_loop().time()
-
-            elapsed = now - self.start_time
+            elapsed = time.monotonic() - self.start_time
             if elapsed >= self.max_time:
                 return True
 
@@ -467,7 +671,6 @@ class QueueWorker:
         """Stop the worker gracefully."""
         self.should_quit = True
         self.state = 'stopping'
-        self._shutdown_event.set()
         logger.info('Worker stop requested')
 
 
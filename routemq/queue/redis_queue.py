@@ -1,16 +1,95 @@
+import asyncio
+import contextlib
+import itertools
 import json
 import logging
+import os
 import time
+from collections.abc import Callable
 from typing import Any, Optional, Union, cast
 from datetime import UTC, datetime
 
+from sqlalchemy import insert
+
+from routemq import json_codec
 from routemq.queue.queue_driver import QueueDriver
 from routemq.redis_manager import RedisManager, _redis_span
 from routemq.model import Model
 from routemq.queue.models import QueueFailedJob
+from routemq.settings import load_queue_reliability_settings
 
 logger = logging.getLogger('RouteMQ.RedisQueue')
 
+# Move the next job into the reserved hash, record the reservation time in the
+# reserved sorted set and count the attempt in the attempts hash, atomically and
+# in one round trip. The job JSON is stored unchanged; only its id is decoded.
+# Returns {job JSON, attempts counted in the hash}.
+# KEYS: queue list, reserved hash, reserved zset, attempts hash. ARGV: reserved_at (epoch seconds).
+_POP_JOB_SCRIPT = """
+local job_json = redis.call('RPOP', KEYS[1])
+if not job_json then
+    return false
+end
+local job_id = cjson.decode(job_json)['id']
+redis.call('HSET', KEYS[2], job_id, job_json)
+redis.call('ZADD', KEYS[3], ARGV[1], job_id)
+return {job_json, redis.call('HINCRBY', KEYS[4], job_id, 1)}
+"""
+
+# Hand a reserved job back to the queue, or to the delayed set when ARGV[2] > 0.
+# Returns 1 when the job was still reserved, 0 otherwise.
+# KEYS: reserved hash, reserved zset, queue list, delayed zset. ARGV: job id, available_at.
+_RELEASE_JOB_SCRIPT = """
+local job_json = redis.call('HGET', KEYS[1], ARGV[1])
+if not job_json then
+    return 0
+end
+redis.call('HDEL', KEYS[1], ARGV[1])
+redis.call('ZREM', KEYS[2], ARGV[1])
+if tonumber(ARGV[2]) > 0 then
+    redis.call('ZADD', KEYS[4], ARGV[2], job_json)
+else
+    redis.call('RPUSH', KEYS[3], job_json)
+end
+return 1
+"""
+
+# Put reserved jobs that never ran back at the pop end of the queue and take back
+# the attempt the pop script counted for each. Returns how many were still reserved.
+# KEYS: reserved hash, reserved zset, queue list, attempts hash. ARGV: job ids, last popped first.
+_UNRESERVE_JOBS_SCRIPT = """
+local returned = 0
+for _, job_id in ipairs(ARGV) do
+    local job_json = redis.call('HGET', KEYS[1], job_id)
+    if job_json then
+        redis.call('HDEL', KEYS[1], job_id)
+        redis.call('ZREM', KEYS[2], job_id)
+        redis.call('RPUSH', KEYS[3], job_json)
+        if redis.call('HINCRBY', KEYS[4], job_id, -1) <= 0 then
+            redis.call('HDEL', KEYS[4], job_id)
+        end
+        returned = returned + 1
+    end
+end
+return returned
+"""
+
+# Move up to ARGV[2] due delayed jobs onto the queue atomically; returns how many moved.
+# KEYS: delayed zset, queue list. ARGV: current time, batch limit.
+_MIGRATE_DELAYED_SCRIPT = """
+local jobs = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+if #jobs > 0 then
+    redis.call('RPUSH', KEYS[2], unpack(jobs))
+    redis.call('ZREM', KEYS[1], unpack(jobs))
+end
+return #jobs
+"""
+# Bounds the script's run time, and unpack() stays well under Lua's stack limit
+_MIGRATE_BATCH_LIMIT = 1000
+# push_fast() writes its buffer after this many seconds, or sooner once this many jobs wait
+_PUSH_FLUSH_INTERVAL = 0.01
+_PUSH_FLUSH_SIZE = 100
+
 
 class RedisQueue(QueueDriver):
     """
@@ -22,6 +101,42 @@ class RedisQueue(QueueDriver):
         """Initialize the Redis queue driver."""
         self.redis = RedisManager()
         self.connection_name = 'redis'
+        settings = load_queue_reliability_settings()
+        self.wake_notify = settings.wake_notify
+        # Seconds an empty pop waits on the server for a push; a blocked read has
+        # to return before the client's socket timeout fires
+        self.block_timeout = min(float(settings.block_timeout), max(self.redis.socket_timeout - 1, 0.0))
+        # Job ids are this driver's start time and pid plus a sequence number, so
+        # ids never collide within a process and pushes make no clock call for them
+        self._reset_job_ids()
+        self._last_failed_us = 0
+        # Lua scripts registered on first use; each call passes the current client
+        self._scripts: dict[str, Any] = {}
+        # Jobs from push_fast() grouped by (queue, delay) until the flusher writes them
+        self._push_buffer: dict[tuple[str, int], list[str]] = {}
+        self._buffered_pushes = 0
+        self._push_ready = asyncio.Event()
+        self._push_lock = asyncio.Lock()
+        self._push_flusher: asyncio.Task[None] | None = None
+
+    def _script(self, client: Any, source: str) -> Any:
+        """Return the registered script for ``source``; it runs by EVALSHA and reloads on NOSCRIPT."""
+        script = self._scripts.get(source)
+        if script is None:
+            script = self._scripts[source] = client.register_script(source)
+        return script
+
+    def _reset_job_ids(self) -> None:
+        self._id_pid = os.getpid()
+        self._id_prefix = f'{time.time_ns() // 1000}-{self._id_pid}'
+        self._id_sequence = itertools.count()
+
+    def _next_job_id(self, queue: str) -> str:
+        """Return a job id that is unique among the jobs this driver pushes."""
+        # A forked child inherits the cached driver; give it its own prefix and sequence
+        if os.getpid() != self._id_pid:
+            self._reset_job_ids()
+        return f'{queue}:{self._id_prefix}-{next(self._id_sequence)}'
 
     def _get_queue_key(self, queue: str) -> str:
         """Get the Redis key for a queue."""
@@ -31,10 +146,26 @@ class RedisQueue(QueueDriver):
         """Get the Redis key for delayed jobs in a queue."""
         return f'routemq:queue:{queue}:delayed'
 
+    def _get_reserved_hash_key(self, queue: str) -> str:
+        """Get the Redis hash of reserved jobs in a queue, keyed by job id."""
+        return f'routemq:queue:{queue}:reserved:jobs'
+
+    def _get_reserved_zset_key(self, queue: str) -> str:
+        """Get the Redis sorted set of reserved job ids, scored by reservation time."""
+        return f'routemq:queue:{queue}:reserved:at'
+
+    def _get_attempts_key(self, queue: str) -> str:
+        """Get the Redis hash of attempt counts for jobs in a queue, keyed by job id."""
+        return f'routemq:queue:{queue}:attempts'
+
     def _get_reserved_key(self, queue: str) -> str:
-        """Get the Redis key for reserved jobs in a queue."""
+        """Get the legacy Redis list of reserved jobs, drained by the reaper after an upgrade."""
         return f'routemq:queue:{queue}:reserved'
 
+    def _get_wake_key(self, queue: str) -> str:
+        """Get the Redis pub/sub channel that announces pushes to a queue."""
+        return f'routemq:queue:{queue}:wake'
+
     def _get_worker_key(self, worker_id: str) -> str:
         """Get the Redis key for worker heartbeat metadata."""
         return f'routemq:queue:workers:{worker_id}'
@@ -50,107 +181,250 @@ class RedisQueue(QueueDriver):
         delay: int = 0,
     ) -> None:
         """Push a new job onto the queue."""
-        if not self.redis.is_enabled():
+        client = cast(Any, self.redis.get_client())
+        if client is None:
             logger.error('Cannot push job to Redis queue - Redis is disabled')
             raise RuntimeError('Redis is disabled. Enable it to use RedisQueue.')
 
-        client = cast(Any, self.redis.get_client())
         try:
             job_data = {
-                'id': f'{queue}:{int(time.time() * 1000000)}',  # Unique ID with microseconds
+                'id': self._next_job_id(queue),
                 'payload': payload,
                 'attempts': 0,
                 'created_at': datetime.now(UTC).isoformat(),
             }
-            job_json = json.dumps(job_data)
+            job_json = json_codec.dumps(job_data)
 
             if delay > 0:
                 # Use sorted set for delayed jobs (score = available timestamp)
                 available_at = time.time() + delay
                 with _redis_span(self.redis, 'ZADD', 2):
                     await client.zadd(self._get_delayed_key(queue), {job_json: available_at})
-                logger.debug(f"Job pushed to delayed queue '{queue}' with {delay}s delay")
+                logger.debug("Job pushed to delayed queue '%s' with %ss delay", queue, delay)
             else:
                 # Use list for immediate jobs (FIFO)
                 with _redis_span(self.redis, 'RPUSH', 2):
                     await client.rpush(self._get_queue_key(queue), job_json)
-                logger.debug(f"Job pushed to queue '{queue}'")
+                await self._notify_push(client, queue)
+                logger.debug("Job pushed to queue '%s'", queue)
 
         except Exception as e:
             logger.error(f'Failed to push job to Redis queue: {str(e)}')
             raise
 
-    async def _migrate_delayed_jobs(self, queue: str) -> None:
-        """Move delayed jobs that are now available to the main queue."""
-        if not self.redis.is_enabled():
+    async def push_many(self, payloads: list[str], queue: str = 'default', delay: int = 0) -> None:
+        """Push a batch of jobs with a single RPUSH (or ZADD for delayed jobs)."""
+        client = cast(Any, self.redis.get_client())
+        if client is None:
+            logger.error('Cannot push jobs to Redis queue - Redis is disabled')
+            raise RuntimeError('Redis is disabled. Enable it to use RedisQueue.')
+        if not payloads:
             return
 
-        client = cast(Any, self.redis.get_client())
         try:
-            delayed_key = self._get_delayed_key(queue)
-            current_time = time.time()
+            created_at = datetime.now(UTC).isoformat()
+            jobs = [
+                json_codec.dumps(
+                    {
+                        'id': self._next_job_id(queue),
+                        'payload': payload,
+                        'attempts': 0,
+                        'created_at': created_at,
+                    }
+                )
+                for payload in payloads
+            ]
 
-            # Get all jobs that are now available (score <= current_time)
-            with _redis_span(self.redis, 'ZRANGEBYSCORE', 3):
-                available_jobs = await client.zrangebyscore(delayed_key, '-inf', current_time)
+            if delay > 0:
+                available_at = time.time() + delay
+                with _redis_span(self.redis, 'ZADD', 1 + len(jobs)):
+                    await client.zadd(self._get_delayed_key(queue), dict.fromkeys(jobs, available_at))
+            else:
+                with _redis_span(self.redis, 'RPUSH', 1 + len(jobs)):
+                    await client.rpush(self._get_queue_key(queue), *jobs)
+                await self._notify_push(client, queue)
+            logger.debug('%d job(s) pushed to queue %r with delay %ss', len(jobs), queue, delay)
 
-            if available_jobs:
-                # Move jobs to main queue
-                pipeline = client.pipeline()
-                for job_json in available_jobs:
-                    pipeline.rpush(self._get_queue_key(queue), job_json)
-                    pipeline.zrem(delayed_key, job_json)
-                with _redis_span(self.redis, 'PIPELINE', len(available_jobs) * 2):
-                    await pipeline.execute()
+        except Exception as e:
+            logger.error(f'Failed to push jobs to Redis queue: {str(e)}')
+            raise
 
-                logger.debug(f"Migrated {len(available_jobs)} delayed jobs to queue '{queue}'")
+    def push_fast(self, payload: str, queue: str = 'default', delay: int = 0) -> None:
+        """
+        Buffer a job and return without waiting for Redis.
+
+        A background task writes the buffer with :meth:`push_many` every few
+        milliseconds, or as soon as enough jobs wait. Jobs are lost if the
+        process exits before they are written or the write fails, so call
+        :meth:`flush_pushes` before shutdown and use :meth:`push` when the
+        caller needs to know the job was stored.
+        """
+        self._push_buffer.setdefault((queue, delay), []).append(payload)
+        self._buffered_pushes += 1
+        if self._buffered_pushes >= _PUSH_FLUSH_SIZE:
+            self._push_ready.set()
+        if self._push_flusher is None or self._push_flusher.done():
+            self._push_flusher = asyncio.get_running_loop().create_task(self._run_push_flusher())
+
+    async def flush_pushes(self) -> None:
+        """Write every job buffered by :meth:`push_fast` and stop the background flusher."""
+        async with self._push_lock:
+            await self._write_buffered_pushes()
+            flusher, self._push_flusher = self._push_flusher, None
+            if flusher is not None:
+                # Nothing is in flight while the lock is held, so no buffered job is cut off
+                flusher.cancel()
+        if flusher is not None:
+            with contextlib.suppress(asyncio.CancelledError):
+                await flusher
+
+    async def _run_push_flusher(self) -> None:
+        # Exits once the buffer is empty; the next push_fast() starts a new flusher
+        while self._push_buffer:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._push_ready.wait(), _PUSH_FLUSH_INTERVAL)
+            async with self._push_lock:
+                await self._write_buffered_pushes()
+
+    async def _write_buffered_pushes(self) -> None:
+        buffered, self._push_buffer = self._push_buffer, {}
+        self._buffered_pushes = 0
+        self._push_ready.clear()
+        for (queue, delay), payloads in buffered.items():
+            try:
+                await self.push_many(payloads, queue, delay)
+            except Exception as e:
+                logger.error(f"Dropped {len(payloads)} buffered job(s) for queue '{queue}': {str(e)}")
+                # Audit Accept: push_fast is fire-and-forget; callers that need delivery use push().
+
+    async def _notify_push(self, client: Any, queue: str) -> None:
+        """Wake idle workers of ``queue`` when push notifications are enabled."""
+        if not self.wake_notify:
+            return
+        try:
+            with _redis_span(self.redis, 'PUBLISH', 2):
+                await client.publish(self._get_wake_key(queue), queue)
+        except Exception as e:
+            # The job is already queued; workers still find it on their next poll
+            logger.warning(f'Failed to publish queue wake-up: {str(e)}')
+
+    async def listen_for_jobs(self, queue: str, wake: Callable[[], None]) -> None:
+        """Subscribe to the queue's wake-up channel and call ``wake`` per message."""
+        client = cast(Any, self.redis.get_client())
+        if not self.wake_notify or client is None:
+            return
+
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self._get_wake_key(queue))
+        try:
+            async for _message in pubsub.listen():
+                wake()
+        finally:
+            await pubsub.aclose()
+
+    async def _migrate_delayed_jobs(self, client: Any, queue: str) -> None:
+        """Move delayed jobs that are now available to the main queue."""
+        try:
+            # Read, append and remove in one script so two workers never move the same job
+            with _redis_span(self.redis, 'EVALSHA', 6):
+                migrated = await self._script(client, _MIGRATE_DELAYED_SCRIPT)(
+                    keys=[self._get_delayed_key(queue), self._get_queue_key(queue)],
+                    args=[time.time(), _MIGRATE_BATCH_LIMIT],
+                    client=client,
+                )
+
+            if migrated:
+                logger.debug("Migrated %d delayed jobs to queue '%s'", migrated, queue)
 
         except Exception as e:
             logger.error(f'Failed to migrate delayed jobs: {str(e)}')
             # Audit Accept: best-effort delayed migration; the next poll retries migration.
 
+    @property
+    def pop_blocks(self) -> bool:
+        return self.block_timeout > 0
+
     async def pop(self, queue: str = 'default') -> Optional[dict]:
-        """Pop the next available job from the queue."""
-        if not self.redis.is_enabled():
+        """Pop the next available job, waiting up to ``block_timeout`` seconds for one."""
+        return await self._pop(queue, self.block_timeout)
+
+    async def pop_batch(self, queue: str = 'default', limit: int = 1) -> list[dict]:
+        """Pop up to ``limit`` jobs; only the first pop waits for the queue to fill."""
+        jobs = []
+        block_timeout = self.block_timeout
+        for _ in range(limit):
+            job = await self._pop(queue, block_timeout)
+            if job is None:
+                break
+            jobs.append(job)
+            block_timeout = 0.0
+        return jobs
+
+    async def _pop(self, queue: str, block_timeout: float) -> Optional[dict]:
+        client = cast(Any, self.redis.get_client())
+        if client is None:
             logger.error('Cannot pop job from Redis queue - Redis is disabled')
+            await _idle(block_timeout)
             return None
 
-        client = cast(Any, self.redis.get_client())
         try:
-            # First, migrate any delayed jobs that are now available
-            await self._migrate_delayed_jobs(queue)
-
-            # Pop from main queue (FIFO) and move to reserved
-            with _redis_span(self.redis, 'RPOPLPUSH', 2):
-                job_json = await client.rpoplpush(self._get_queue_key(queue), self._get_reserved_key(queue))
+            reserved = await self._reserve_job(client, queue)
+            if not reserved and block_timeout > 0:
+                await self._wait_for_job(client, queue, block_timeout)
+                reserved = await self._reserve_job(client, queue)
 
-            if not job_json:
+            if not reserved:
                 return None
 
-            job_data = json.loads(job_json)
-            job_data['attempts'] += 1
-            job_data['reserved_at'] = datetime.now(UTC).isoformat()
+            job_json, counted_attempts = reserved
+            job_data = json_codec.loads(job_json)
+            attempts = _stored_attempts(job_data) + int(counted_attempts)
 
-            # Update the reserved job with new attempt count
-            updated_job_json = json.dumps(job_data)
-            with _redis_span(self.redis, 'LREM', 3):
-                await client.lrem(self._get_reserved_key(queue), 1, job_json)
-            with _redis_span(self.redis, 'RPUSH', 2):
-                await client.rpush(self._get_reserved_key(queue), updated_job_json)
-
-            logger.debug(f"Job {job_data['id']} popped from queue '{queue}' (attempt {job_data['attempts']})")
+            logger.debug("Job %s popped from queue '%s' (attempt %s)", job_data['id'], queue, attempts)
 
             return {
                 'id': job_data['id'],
                 'payload': job_data['payload'],
-                'attempts': job_data['attempts'],
+                'attempts': attempts,
             }
 
         except Exception as e:
             logger.error(f'Failed to pop job from Redis queue: {str(e)}')
             # Audit Accept: polling treats backend errors as no job after logging.
+            await _idle(block_timeout)
             return None
 
+    async def _reserve_job(self, client: Any, queue: str) -> Optional[list[Any]]:
+        # First, migrate any delayed jobs that are now available
+        await self._migrate_delayed_jobs(client, queue)
+
+        # Pop from the main queue into reserved, counting the attempt server-side
+        with _redis_span(self.redis, 'EVALSHA', 5):
+            return await self._script(client, _POP_JOB_SCRIPT)(
+                keys=[
+                    self._get_queue_key(queue),
+                    self._get_reserved_hash_key(queue),
+                    self._get_reserved_zset_key(queue),
+                    self._get_attempts_key(queue),
+                ],
+                args=[time.time()],
+                client=client,
+            )
+
+    async def _wait_for_job(self, client: Any, queue: str, block_timeout: float) -> None:
+        """Block until the queue list is non-empty, the next delayed job is due, or the timeout passes."""
+        with _redis_span(self.redis, 'ZRANGE', 4):
+            next_delayed = await client.zrange(self._get_delayed_key(queue), 0, 0, withscores=True)
+        if next_delayed:
+            # Wake in time to migrate the delayed job; a timeout of 0 would block forever
+            block_timeout = min(block_timeout, max(next_delayed[0][1] - time.time(), 0.01))
+
+        # Lua scripts cannot block, so wait with BLMOVE onto the same end of the
+        # same list: the job stays where it is for the pop script to reserve
+        queue_key = self._get_queue_key(queue)
+        with _redis_span(self.redis, 'BLMOVE', 5):
+            await client.blmove(queue_key, queue_key, block_timeout, 'RIGHT', 'RIGHT')
+
     async def release(
         self,
         job_id: Union[int, str],
@@ -158,112 +432,153 @@ class RedisQueue(QueueDriver):
         delay: int = 0,
     ) -> None:
         """Release a job back to the queue for retry."""
-        if not self.redis.is_enabled():
+        client = cast(Any, self.redis.get_client())
+        if client is None:
             logger.error('Cannot release job - Redis is disabled')
             return
 
-        client = cast(Any, self.redis.get_client())
         try:
-            reserved_key = self._get_reserved_key(queue)
-
-            # Find the job in reserved list
-            with _redis_span(self.redis, 'LRANGE', 3):
-                reserved_jobs = await client.lrange(reserved_key, 0, -1)
-            job_json = None
-            job_data: dict[str, Any] | None = None
-
-            for reserved_job in reserved_jobs:
-                candidate = json.loads(reserved_job)
-                if candidate['id'] == job_id:
-                    job_json = reserved_job
-                    job_data = candidate
-                    break
-
-            if not job_json or job_data is None:
+            available_at = time.time() + delay if delay > 0 else 0
+            with _redis_span(self.redis, 'EVALSHA', 6):
+                released = await self._release_reserved(client, job_id, queue, available_at)
+
+            if not released:
                 logger.warning(f"Job {job_id} not found in reserved queue '{queue}'")
                 return
 
-            # Remove from reserved
-            with _redis_span(self.redis, 'LREM', 3):
-                await client.lrem(reserved_key, 1, job_json)
-            job_data.pop('reserved_at', None)
-            job_json = json.dumps(job_data)
+            logger.debug("Job %s released back to queue '%s' with delay %ss", job_id, queue, delay)
 
-            # Add back to queue (with delay if specified)
-            if delay > 0:
-                available_at = time.time() + delay
-                with _redis_span(self.redis, 'ZADD', 2):
-                    await client.zadd(self._get_delayed_key(queue), {job_json: available_at})
-            else:
-                with _redis_span(self.redis, 'RPUSH', 2):
-                    await client.rpush(self._get_queue_key(queue), job_json)
+        except Exception as e:
+            logger.error(f'Failed to release job: {str(e)}')
+            raise
 
-            logger.debug(f"Job {job_id} released back to queue '{queue}' with delay {delay}s")
+    async def unreserve_many(self, job_ids: list[Union[int, str]], queue: str) -> None:
+        """Return unrun reserved jobs to the front of the queue and undo their counted attempt."""
+        client = cast(Any, self.redis.get_client())
+        if client is None:
+            logger.error('Cannot unreserve jobs - Redis is disabled')
+            return
+        if not job_ids:
+            return
+
+        try:
+            with _redis_span(self.redis, 'EVALSHA', 6):
+                returned = await self._script(client, _UNRESERVE_JOBS_SCRIPT)(
+                    keys=[
+                        self._get_reserved_hash_key(queue),
+                        self._get_reserved_zset_key(queue),
+                        self._get_queue_key(queue),
+                        self._get_attempts_key(queue),
+                    ],
+                    # Pushing the last-popped job first leaves the first-popped one next in line
+                    args=list(reversed(job_ids)),
+                    client=client,
+                )
+            logger.debug('%d unprocessed job(s) returned to queue %r', returned, queue)
 
         except Exception as e:
-            logger.error(f'Failed to release job: {str(e)}')
+            logger.error(f'Failed to unreserve jobs: {str(e)}')
             raise
 
+    async def _release_reserved(self, client: Any, job_id: Union[int, str], queue: str, available_at: float) -> bool:
+        released = await self._script(client, _RELEASE_JOB_SCRIPT)(
+            keys=[
+                self._get_reserved_hash_key(queue),
+                self._get_reserved_zset_key(queue),
+                self._get_queue_key(queue),
+                self._get_delayed_key(queue),
+            ],
+            args=[job_id, available_at],
+            client=client,
+        )
+        return bool(released)
+
     async def reap_expired(self, queue: str = 'default', visibility_timeout: int = 300) -> int:
         """Return expired reserved jobs to the queue or fail exhausted ones."""
-        if not self.redis.is_enabled():
+        client = cast(Any, self.redis.get_client())
+        if client is None:
             return 0
 
-        client = cast(Any, self.redis.get_client())
-        reserved_key = self._get_reserved_key(queue)
-        now = datetime.now(UTC)
+        hash_key = self._get_reserved_hash_key(queue)
+        zset_key = self._get_reserved_zset_key(queue)
         reaped = 0
         try:
-            with _redis_span(self.redis, 'LRANGE', 3):
-                reserved_jobs = await client.lrange(reserved_key, 0, -1)
-            for job_json in reserved_jobs:
-                job_data = json.loads(job_json)
-                if not _reserved_job_expired(job_data, now, visibility_timeout):
-                    continue
-
-                with _redis_span(self.redis, 'LREM', 3):
-                    await client.lrem(reserved_key, 1, job_json)
-                payload = job_data.get('payload', '')
-                max_tries = _payload_max_tries(payload)
-                attempts = int(job_data.get('attempts', 0) or 0)
-                if attempts >= max_tries:
-                    await self.failed(
-                        self.connection_name,
-                        queue,
-                        payload,
-                        f'Job reservation expired after {visibility_timeout}s visibility timeout',
-                    )
-                else:
-                    job_data.pop('reserved_at', None)
-                    with _redis_span(self.redis, 'RPUSH', 2):
-                        await client.rpush(self._get_queue_key(queue), json.dumps(job_data))
-                reaped += 1
-            return reaped
+            # Only reservations older than the timeout are read; live ones are never scanned
+            with _redis_span(self.redis, 'ZRANGEBYSCORE', 3):
+                expired_ids = await client.zrangebyscore(zset_key, '-inf', time.time() - visibility_timeout)
+            if expired_ids:
+                with _redis_span(self.redis, 'HMGET', 1 + len(expired_ids)):
+                    job_jsons = await client.hmget(hash_key, expired_ids)
+                with _redis_span(self.redis, 'HMGET', 1 + len(expired_ids)):
+                    counted_attempts = await client.hmget(self._get_attempts_key(queue), expired_ids)
+                for job_id, job_json, counted in zip(expired_ids, job_jsons, counted_attempts):
+                    if job_json is None:
+                        # Finished after the range read, or left behind without its record
+                        with _redis_span(self.redis, 'ZREM', 2):
+                            await client.zrem(zset_key, job_id)
+                        continue
+                    job_data = json_codec.loads(job_json)
+                    payload = job_data.get('payload', '')
+                    attempts = _stored_attempts(job_data) + int(counted or 0)
+                    if attempts >= _payload_max_tries(payload):
+                        if not await self._remove_reserved(client, [job_id], queue):
+                            continue
+                        await self.failed(
+                            self.connection_name,
+                            queue,
+                            payload,
+                            f'Job reservation expired after {visibility_timeout}s visibility timeout',
+                        )
+                    elif not await self._release_reserved(client, job_id, queue, 0):
+                        continue
+                    reaped += 1
+            return reaped + await self._reap_legacy_reserved(client, queue, visibility_timeout)
         except Exception as e:
             logger.error(f'Failed to reap expired Redis jobs: {str(e)}')
             raise
 
+    async def _reap_legacy_reserved(self, client: Any, queue: str, visibility_timeout: int) -> int:
+        """Recover jobs left in the pre-hash reserved list; it stays empty once drained."""
+        reserved_key = self._get_reserved_key(queue)
+        now = datetime.now(UTC)
+        reaped = 0
+        with _redis_span(self.redis, 'LRANGE', 3):
+            reserved_jobs = await client.lrange(reserved_key, 0, -1)
+        for job_json in reserved_jobs:
+            job_data = json_codec.loads(job_json)
+            if not _reserved_job_expired(job_data, now, visibility_timeout):
+                continue
+
+            with _redis_span(self.redis, 'LREM', 3):
+                await client.lrem(reserved_key, 1, job_json)
+            payload = job_data.get('payload', '')
+            max_tries = _payload_max_tries(payload)
+            attempts = _stored_attempts(job_data)
+            if attempts >= max_tries:
+                await self.failed(
+                    self.connection_name,
+                    queue,
+                    payload,
+                    f'Job reservation expired after {visibility_timeout}s visibility timeout',
+                )
+            else:
+                job_data.pop('reserved_at', None)
+                with _redis_span(self.redis, 'RPUSH', 2):
+                    await client.rpush(self._get_queue_key(queue), json_codec.dumps(job_data))
+            reaped += 1
+        return reaped
+
     async def delete(self, job_id: Union[int, str], queue: str) -> None:
         """Delete a job from the queue."""
-        if not self.redis.is_enabled():
+        client = cast(Any, self.redis.get_client())
+        if client is None:
             logger.error('Cannot delete job - Redis is disabled')
             return
 
-        client = cast(Any, self.redis.get_client())
         try:
-            reserved_key = self._get_reserved_key(queue)
-
-            # Find and remove the job from reserved list
-            with _redis_span(self.redis, 'LRANGE', 3):
-                reserved_jobs = await client.lrange(reserved_key, 0, -1)
-
-            for job_json in reserved_jobs:
-                job_data = json.loads(job_json)
-                if job_data['id'] == job_id:
-                    with _redis_span(self.redis, 'LREM', 3):
-                        await client.lrem(reserved_key, 1, job_json)
-                    logger.debug(f"Job {job_id} deleted from queue '{queue}'")
-                    return
+            if await self._remove_reserved(client, [job_id], queue):
+                logger.debug("Job %s deleted from queue '%s'", job_id, queue)
+                return
 
             logger.warning(f"Job {job_id} not found in reserved queue '{queue}'")
 
@@ -271,44 +586,63 @@ class RedisQueue(QueueDriver):
             logger.error(f'Failed to delete job: {str(e)}')
             raise
 
+    async def delete_many(self, job_ids: list[Union[int, str]], queue: str) -> None:
+        """Delete a batch of reserved jobs with one HDEL and one ZREM."""
+        client = cast(Any, self.redis.get_client())
+        if client is None:
+            logger.error('Cannot delete jobs - Redis is disabled')
+            return
+        if not job_ids:
+            return
+
+        try:
+            removed = await self._remove_reserved(client, job_ids, queue)
+            logger.debug('%d job(s) deleted from queue %r', removed, queue)
+
+        except Exception as e:
+            logger.error(f'Failed to delete jobs: {str(e)}')
+            raise
+
+    async def _remove_reserved(self, client: Any, job_ids: list[Union[int, str]], queue: str) -> int:
+        """Drop reserved jobs and their attempt counts in one transaction; returns how many were held."""
+        pipeline = client.pipeline(transaction=True)
+        pipeline.hdel(self._get_reserved_hash_key(queue), *job_ids)
+        pipeline.zrem(self._get_reserved_zset_key(queue), *job_ids)
+        pipeline.hdel(self._get_attempts_key(queue), *job_ids)
+        with _redis_span(self.redis, 'MULTI', 3 * (1 + len(job_ids))):
+            removed, _, _ = await pipeline.execute()
+        return int(removed or 0)
+
     async def heartbeat(self, job_id: Union[int, str], queue: str) -> bool:
         """Refresh the reservation timestamp for an active Redis job."""
-        if not self.redis.is_enabled():
+        client = cast(Any, self.redis.get_client())
+        if client is None:
             return False
 
-        client = cast(Any, self.redis.get_client())
-        reserved_key = self._get_reserved_key(queue)
-        with _redis_span(self.redis, 'LRANGE', 3):
-            reserved_jobs = await client.lrange(reserved_key, 0, -1)
-        for job_json in reserved_jobs:
-            job_data = json.loads(job_json)
-            if job_data.get('id') != job_id:
-                continue
-            job_data['reserved_at'] = datetime.now(UTC).isoformat()
-            with _redis_span(self.redis, 'LREM', 3):
-                await client.lrem(reserved_key, 1, job_json)
-            with _redis_span(self.redis, 'RPUSH', 2):
-                await client.rpush(reserved_key, json.dumps(job_data))
-            return True
-        return False
+        # XX only touches jobs that are still reserved; CH reports whether one was
+        with _redis_span(self.redis, 'ZADD', 4):
+            refreshed = await client.zadd(self._get_reserved_zset_key(queue), {job_id: time.time()}, xx=True, ch=True)
+        return bool(refreshed)
 
     async def write_worker_heartbeat(self, heartbeat: dict[str, Any], ttl: int) -> None:
         """Persist worker heartbeat state in Redis with a TTL."""
-        if not self.redis.is_enabled():
+        client = cast(Any, self.redis.get_client())
+        if client is None:
             return
         worker_id = str(heartbeat['worker_id'])
         key = self._get_worker_key(worker_id)
-        client = cast(Any, self.redis.get_client())
-        with _redis_span(self.redis, 'HSET', 2):
-            await client.hset(key, mapping={key: str(value) for key, value in heartbeat.items()})
-        with _redis_span(self.redis, 'EXPIRE', 2):
-            await client.expire(key, ttl)
+        # Write the fields and their TTL in one round trip, and never leave the hash without a TTL
+        pipeline = client.pipeline(transaction=True)
+        pipeline.hset(key, mapping={key: str(value) for key, value in heartbeat.items()})
+        pipeline.expire(key, ttl)
+        with _redis_span(self.redis, 'MULTI', 4):
+            await pipeline.execute()
 
     async def mark_worker_dead(self, worker_id: str) -> None:
         """Mark a worker heartbeat as dead."""
-        if not self.redis.is_enabled():
-            return
         client = cast(Any, self.redis.get_client())
+        if client is None:
+            return
         with _redis_span(self.redis, 'HSET', 2):
             await client.hset(self._get_worker_key(worker_id), mapping={'state': 'dead'})
 
@@ -326,16 +660,18 @@ class RedisQueue(QueueDriver):
         try:
             if Model._is_enabled:
                 # Store in database
-                session = cast(Any, await Model.get_session())
+                session = cast(Any, Model.get_session())
                 try:
-                    failed_job = QueueFailedJob(
-                        connection=connection,
-                        queue=queue,
-                        payload=payload,
-                        exception=exception,
-                        failed_at=datetime.now(UTC),
+                    # Core INSERT: the row is never read back, so skip the ORM unit of work.
+                    # failed_at is left to the column default so it comes from the database clock
+                    await session.execute(
+                        insert(QueueFailedJob).values(
+                            connection=connection,
+                            queue=queue,
+                            payload=payload,
+                            exception=exception,
+                        )
                     )
-                    session.add(failed_job)
                     await session.commit()
                     logger.info(f"Failed job stored in database for queue '{queue}'")
                 finally:
@@ -343,17 +679,9 @@ class RedisQueue(QueueDriver):
             elif self.redis.is_enabled():
                 # Fallback to Redis if database not available
                 client = cast(Any, self.redis.get_client())
-                failed_key = self._get_failed_key(queue)
-                failed_data = {
-                    'id': f'failed:{queue}:{int(time.time() * 1000000)}',
-                    'connection': connection,
-                    'queue': queue,
-                    'payload': payload,
-                    'exception': exception,
-                    'failed_at': datetime.now(UTC).isoformat(),
-                }
+                failed_json = self._failed_record(connection, queue, payload, exception)
                 with _redis_span(self.redis, 'RPUSH', 2):
-                    await client.rpush(failed_key, json.dumps(failed_data))
+                    await client.rpush(self._get_failed_key(queue), failed_json)
                 logger.info(f"Failed job stored in Redis for queue '{queue}'")
             else:
                 logger.error('Cannot store failed job - both MySQL and Redis are disabled')
@@ -362,13 +690,67 @@ class RedisQueue(QueueDriver):
             logger.error(f'Failed to store failed job: {str(e)}')
             # Audit Accept: failure persistence errors are logged; job retry/fail semantics stay unchanged.
 
+    async def failed_many(self, failed_jobs: list[dict[str, str]]) -> None:
+        """
+        Store a batch of failed jobs with one INSERT, or one RPUSH per queue.
+
+        Unlike :meth:`failed`, storage errors are raised so the worker keeps the
+        records and their reserved jobs for its next flush.
+        """
+        if not failed_jobs:
+            return
+        if Model._is_enabled:
+            session = cast(Any, Model.get_session())
+            try:
+                await session.execute(insert(QueueFailedJob), failed_jobs)
+                await session.commit()
+            finally:
+                await session.close()
+            logger.info('%d failed job(s) stored in database', len(failed_jobs))
+            return
+
+        client = cast(Any, self.redis.get_client())
+        if client is None:
+            logger.error('Cannot store failed jobs - both MySQL and Redis are disabled')
+            return
+        by_queue: dict[str, list[str]] = {}
+        for failed_job in failed_jobs:
+            by_queue.setdefault(failed_job['queue'], []).append(self._failed_record(**failed_job))
+        if len(by_queue) == 1:
+            [(queue, records)] = by_queue.items()
+            with _redis_span(self.redis, 'RPUSH', 1 + len(records)):
+                await client.rpush(self._get_failed_key(queue), *records)
+        else:
+            pipeline = client.pipeline(transaction=False)
+            for queue, records in by_queue.items():
+                pipeline.rpush(self._get_failed_key(queue), *records)
+            with _redis_span(self.redis, 'PIPELINE', sum(1 + len(records) for records in by_queue.values())):
+                await pipeline.execute()
+        logger.info('%d failed job(s) stored in Redis', len(failed_jobs))
+
+    def _failed_record(self, connection: str, queue: str, payload: str, exception: str) -> str:
+        """Encode a failed job for the Redis failed list, with an id no earlier record of this driver used."""
+        now_ns = time.time_ns()
+        # Several failures can land in one microsecond; bump the id rather than reuse one
+        failed_us = self._last_failed_us = max(now_ns // 1000, self._last_failed_us + 1)
+        return json_codec.dumps(
+            {
+                'id': f'failed:{queue}:{failed_us}',
+                'connection': connection,
+                'queue': queue,
+                'payload': payload,
+                'exception': exception,
+                'failed_at': datetime.fromtimestamp(now_ns / 1e9, UTC).isoformat(),
+            }
+        )
+
     async def list_failed_jobs(self, queue: str | None = None) -> list[dict[str, Any]]:
-        if not self.redis.is_enabled() or queue is None:
-            return []
         client = cast(Any, self.redis.get_client())
+        if client is None or queue is None:
+            return []
         with _redis_span(self.redis, 'LRANGE', 3):
             failed_jobs = await client.lrange(self._get_failed_key(queue), 0, -1)
-        return [json.loads(job_json) for job_json in failed_jobs]
+        return [json_codec.loads(job_json) for job_json in failed_jobs]
 
     async def get_failed_job(self, job_id: Union[int, str]) -> dict[str, Any] | None:
         queue = _failed_job_queue_from_id(str(job_id))
@@ -388,13 +770,13 @@ class RedisQueue(QueueDriver):
 
     async def forget_failed_job(self, job_id: Union[int, str]) -> bool:
         queue = _failed_job_queue_from_id(str(job_id))
-        if queue is None or not self.redis.is_enabled():
-            return False
         client = cast(Any, self.redis.get_client())
+        if queue is None or client is None:
+            return False
         with _redis_span(self.redis, 'LRANGE', 3):
             failed_job_jsons = await client.lrange(self._get_failed_key(queue), 0, -1)
         for failed_job_json in failed_job_jsons:
-            failed_job = json.loads(failed_job_json)
+            failed_job = json_codec.loads(failed_job_json)
             if str(failed_job.get('id')) == str(job_id):
                 with _redis_span(self.redis, 'LREM', 3):
                     removed = await client.lrem(self._get_failed_key(queue), 1, failed_job_json)
@@ -402,20 +784,20 @@ class RedisQueue(QueueDriver):
         return False
 
     async def flush_failed_jobs(self, queue: str | None = None) -> int:
-        if queue is None or not self.redis.is_enabled():
-            return 0
         client = cast(Any, self.redis.get_client())
+        if queue is None or client is None:
+            return 0
         with _redis_span(self.redis, 'DEL', 1):
             deleted = await client.delete(self._get_failed_key(queue))
         return int(deleted or 0)
 
     async def size(self, queue: str = 'default') -> int:
         """Get the size of the queue."""
-        if not self.redis.is_enabled():
+        client = cast(Any, self.redis.get_client())
+        if client is None:
             logger.error('Cannot get queue size - Redis is disabled')
             return 0
 
-        client = cast(Any, self.redis.get_client())
         try:
             # Count jobs in main queue
             with _redis_span(self.redis, 'LLEN', 1):
@@ -435,15 +817,15 @@ class RedisQueue(QueueDriver):
     async def stats(self, queue: str = 'default') -> dict[str, Any]:
         """Return ready/reserved/delayed/failed queue depth statistics."""
         empty_stats = _empty_queue_stats(queue)
-        if not self.redis.is_enabled():
+        client = cast(Any, self.redis.get_client())
+        if client is None:
             return empty_stats
 
-        client = cast(Any, self.redis.get_client())
         try:
             with _redis_span(self.redis, 'LLEN', 1):
                 ready_count = int(await client.llen(self._get_queue_key(queue)) or 0)
-            with _redis_span(self.redis, 'LLEN', 1):
-                reserved_count = int(await client.llen(self._get_reserved_key(queue)) or 0)
+            with _redis_span(self.redis, 'HLEN', 1):
+                reserved_count = int(await client.hlen(self._get_reserved_hash_key(queue)) or 0)
             with _redis_span(self.redis, 'ZCARD', 1):
                 delayed_count = int(await client.zcard(self._get_delayed_key(queue)) or 0)
             with _redis_span(self.redis, 'LLEN', 1):
@@ -467,7 +849,7 @@ class RedisQueue(QueueDriver):
         if not job_json:
             return 0.0
         try:
-            job_data = json.loads(job_json)
+            job_data = json_codec.loads(job_json)
         except (TypeError, json.JSONDecodeError):
             return 0.0
         created_at = job_data.get('created_at') or _created_at_from_redis_job_id(str(job_data.get('id', '')))
@@ -482,9 +864,21 @@ class RedisQueue(QueueDriver):
         return max(0.0, (datetime.now(UTC) - created_at_dt).total_seconds())
 
 
+async def _idle(block_timeout: float) -> None:
+    # Workers skip their own idle sleep after a blocking pop, so a pop that could
+    # not block still waits out its timeout instead of letting them spin
+    if block_timeout > 0:
+        await asyncio.sleep(block_timeout)
+
+
+def _stored_attempts(job_data: dict[str, Any]) -> int:
+    # Jobs reserved before attempts moved to the attempts hash carry their count in the JSON
+    return int(job_data.get('attempts', 0) or 0)
+
+
 def _payload_max_tries(payload: str, default: int = 3) -> int:
     try:
-        value = json.loads(payload).get('max_tries', default)
+        value = json_codec.loads(payload).get('max_tries', default)
         return max(1, int(value))
     except (TypeError, ValueError, json.JSONDecodeError):
         return default
@@ -511,6 +905,7 @@ def _failed_job_queue_from_id(job_id: str) -> str | None:
 
 
 def _created_at_from_redis_job_id(job_id: str) -> str | None:
+    # Only ids of the older '{queue}:{microseconds}' form carry their push time
     try:
         _queue, timestamp = job_id.rsplit(':', 1)
         seconds = int(timestamp) / 1_000_000
@@ -1,5 +1,7 @@
+import asyncio
 import logging
 import os
+from collections.abc import AsyncIterator
 from typing import Optional, Union, Any, Dict, TYPE_CHECKING, cast
 import json
 
@@ -15,6 +17,7 @@ except ImportError:  # pragma: no cover - optional dependency fallback
 if TYPE_CHECKING:
     from redis.asyncio import ConnectionPool, Redis
 
+from . import json_codec
 from .observability import start_span
 
 
@@ -49,6 +52,11 @@ class RedisManager:
         self.max_connections = int(os.getenv('REDIS_MAX_CONNECTIONS', '10'))
         self.socket_timeout = float(os.getenv('REDIS_SOCKET_TIMEOUT', '5.0'))
         self.socket_connect_timeout = float(os.getenv('REDIS_SOCKET_CONNECT_TIMEOUT', '5.0'))
+        self.scan_count = int(os.getenv('REDIS_SCAN_COUNT', '1000'))
+        self.health_check_interval = int(os.getenv('REDIS_HEALTH_CHECK_INTERVAL', '30'))
+        self.retry_on_timeout = os.getenv('REDIS_RETRY_ON_TIMEOUT', 'false').lower() == 'true'
+        # Serializes initialize() so concurrent callers share one pool
+        self._init_lock = asyncio.Lock()
 
         self._initialized = True
 
@@ -65,11 +73,20 @@ class RedisManager:
         """
         Initialize Redis connection pool.
 
+        Safe to call concurrently or repeatedly: callers after the first wait
+        for it and reuse its connected client.
+
         Returns:
             bool: True if connection successful, False otherwise
         """
-        if not self.enabled:
-            return False
+        async with self._init_lock:
+            if self._redis_client is not None:
+                return True
+            if not self.enabled:
+                return False
+            return await self._connect()
+
+    async def _connect(self) -> bool:
         if redis is None:  # pragma: no cover - guarded by __init__ when Redis is enabled
             self.logger.error('Redis is enabled but redis package is not installed. Install with: uv add redis')
             self.enabled = False
@@ -78,7 +95,7 @@ class RedisManager:
         try:
             # Create connection pool
             redis_module = cast(Any, redis)
-            self._redis_pool = redis_module.ConnectionPool(
+            pool = redis_module.ConnectionPool(
                 host=self.host,
                 port=self.port,
                 db=self.db,
@@ -88,15 +105,18 @@ class RedisManager:
                 socket_timeout=self.socket_timeout,
                 socket_connect_timeout=self.socket_connect_timeout,
                 decode_responses=True,
-                health_check_interval=30,
+                health_check_interval=self.health_check_interval,
+                retry_on_timeout=self.retry_on_timeout,
             )
 
             # Create Redis client
-            self._redis_client = redis_module.Redis(connection_pool=self._redis_pool)
+            client = redis_module.Redis(connection_pool=pool)
 
-            # Test connection
+            # Test connection; publish the client only once it answers
             with _redis_span(self, 'PING'):
-                await cast(Any, self._redis_client).ping()
+                await cast(Any, client).ping()
+            self._redis_pool = pool
+            self._redis_client = client
             self.logger.info('Successfully connected to Redis')
             return True
 
@@ -194,6 +214,23 @@ class RedisManager:
             # Audit Accept: cache writes report False so callers can continue.
             return False
 
+    async def set_with_ttl(self, key: str, value: Union[str, int, float], ttl: int) -> bool:
+        """
+        Set a value that expires after ``ttl`` seconds with a single SET ... EX.
+
+        Prefer this over ``set`` followed by ``expire``, which costs a second
+        round trip and leaves the key without a TTL if the second call fails.
+
+        Args:
+            key: Redis key
+            value: Value to set
+            ttl: Expire time in seconds
+
+        Returns:
+            True if successful, False otherwise
+        """
+        return await self.set(key, value, ex=ttl)
+
     async def incr(self, key: str, amount: int = 1) -> Optional[int]:
         """
         Increment key value.
@@ -347,6 +384,24 @@ class RedisManager:
             value: Field value (if setting single field)
             mapping: Dictionary of field-value pairs
 
+        Returns:
+            Number of fields added
+        """
+        if mapping is not None:
+            return await self.hset_mapping(name, mapping)
+        if key is not None and value is not None:
+            return await self.hset_field(name, key, value)
+        return 0
+
+    async def hset_field(self, name: str, key: str, value: str) -> int:
+        """
+        Set a single hash field.
+
+        Args:
+            name: Hash name
+            key: Field key
+            value: Field value
+
         Returns:
             Number of fields added
         """
@@ -355,19 +410,62 @@ class RedisManager:
         client = cast(Any, self._redis_client)
 
         try:
-            if mapping:
-                with _redis_span(self, 'HSET', 2):
-                    return await client.hset(name, mapping=mapping)
-            elif key and value is not None:
-                with _redis_span(self, 'HSET', 3):
-                    return await client.hset(name, key, value)
-            else:
-                return 0
+            with _redis_span(self, 'HSET', 3):
+                return await client.hset(name, key, value)
+        except Exception as e:
+            self.logger.error(f"Redis HSET error for hash '{name}': {e}")
+            # Audit Accept: hash writes report zero changed fields after logging.
+            return 0
+
+    async def hset_mapping(self, name: str, mapping: Dict[str, Any]) -> int:
+        """
+        Set several hash fields; an empty mapping writes nothing.
+
+        Args:
+            name: Hash name
+            mapping: Dictionary of field-value pairs
+
+        Returns:
+            Number of fields added
+        """
+        if not mapping or not self.is_enabled():
+            return 0
+        client = cast(Any, self._redis_client)
+
+        try:
+            with _redis_span(self, 'HSET', 2):
+                return await client.hset(name, mapping=mapping)
         except Exception as e:
             self.logger.error(f"Redis HSET error for hash '{name}': {e}")
             # Audit Accept: hash writes report zero changed fields after logging.
             return 0
 
+    async def scan_iter(self, match: str, count: Optional[int] = None) -> AsyncIterator[str]:
+        """
+        Iterate over keys matching a glob pattern with SCAN.
+
+        Use this instead of KEYS, which blocks the server while it walks the
+        whole keyspace.
+
+        Args:
+            match: Glob-style key pattern
+            count: Keys hinted per SCAN call (defaults to REDIS_SCAN_COUNT)
+
+        Yields:
+            Matching key names
+        """
+        if not self.is_enabled():
+            return
+        client = cast(Any, self._redis_client)
+
+        try:
+            async for key in client.scan_iter(match=match, count=count or self.scan_count):
+                yield key
+        except Exception as e:
+            self.logger.error(f"Redis SCAN error for pattern '{match}': {e}")
+            # Audit Accept: key scans end early after logging, like other read misses.
+            return
+
     async def get_json(self, key: str) -> Optional[Any]:
         """
         Get and deserialize JSON value.
@@ -383,7 +481,7 @@ class RedisManager:
             return None
 
         try:
-            return json.loads(value)
+            return json_codec.loads(value)
         except json.JSONDecodeError as e:
             self.logger.error(f"JSON decode error for key '{key}': {e}")
             # Audit Accept: malformed cached JSON behaves as a cache miss.
@@ -413,7 +511,7 @@ class RedisManager:
             True if successful, False otherwise
         """
         try:
-            json_value = json.dumps(value)
+            json_value = json_codec.dumps(value)
             return await self.set(key, json_value, ex=ex, px=px, nx=nx, xx=xx)
         except (TypeError, ValueError) as e:
             self.logger.error(f"JSON encode error for key '{key}': {e}")
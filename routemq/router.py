@@ -1,10 +1,37 @@
+import functools
 import re
-from typing import Callable, List, Any
+import sys
+from typing import Callable, List, Any, cast
 
 from .middleware import Middleware
 from .observability import enrich_context, get_correlation_id, lifecycle, reset_context, snapshot_context, start_span
 
 
+_PARAM_SEGMENT = re.compile(r'^{([^/{}]+)}$')
+_TOPIC_PARAM = re.compile(r'{([^/]+)}')
+_REGEX_METACHARACTERS = frozenset('.^$*+?{}[]\\|()')
+# Trie node keys that cannot collide with a literal topic segment
+_PARAM = object()
+_ROUTES = object()
+_TOPIC_CACHE_SIZE = 4096
+
+
+def _regex_union(routes: list[tuple[int, 'Route']]) -> re.Pattern | None:
+    """Join the regex-only routes into one alternation, each alternative named after its route index.
+
+    Alternatives are tried in order, so the first registered route that matches
+    wins, as with a scan. Returns ``None`` when there is nothing to join or a
+    topic cannot be embedded; dispatch then scans the routes one by one.
+    """
+    if not routes:
+        return None
+    alternatives = (f'(?P<_r{index}>{_TOPIC_PARAM.sub("[^/]+", route.topic)}$)' for index, route in routes)
+    try:
+        return re.compile('|'.join(alternatives))
+    except re.error:
+        return None
+
+
 def _callable_name(handler: Callable) -> str:
     name = getattr(handler, '__qualname__', None)
     if isinstance(name, str):
@@ -16,6 +43,22 @@ def _callable_name(handler: Callable) -> str:
 
 
 class Route:
+    # Routes live for the whole process and dispatch reads them per message; no per-instance dict
+    __slots__ = (
+        'topic',
+        'handler',
+        'qos',
+        'middleware',
+        'shared',
+        'worker_count',
+        'pattern',
+        '_tokens',
+        '_param_slots',
+        'mqtt_topic',
+        'span_attributes',
+        'chain',
+    )
+
     def __init__(
         self,
         topic: str,
@@ -32,20 +75,97 @@ class Route:
         self.shared = shared
         self.worker_count = worker_count if shared else 1  # Only apply worker_count for shared subscriptions
         self.pattern = self._compile_topic_pattern()
+        self._tokens, self._param_slots = self._compile_param_slots()
         self.mqtt_topic = self._get_mqtt_subscription_topic()
+        self.span_attributes = {
+            'messaging.system': 'mqtt',
+            'messaging.operation.type': 'process',
+            'messaging.destination.template': topic,
+            'routemq.route.pattern': topic,
+        }
+        # Handler wrapped in its middleware once, so dispatch builds no closures per message
+        self.chain = self._build_chain()
+
+    def _build_chain(self) -> Callable:
+        """Compose the middleware around the handler; each layer takes the dispatch context."""
+        handler = self.handler
+        handler_attributes = {**self.span_attributes, 'routemq.handler.name': _callable_name(handler)}
+
+        async def execute_handler(ctx):
+            with start_span(
+                'router.handler',
+                {**handler_attributes, 'messaging.destination': ctx['topic']},
+                kind='internal',
+            ):
+                return await handler(**ctx['params'], payload=ctx['payload'], client=ctx['client'])
+
+        chain: Callable = execute_handler
+        for middleware in reversed(self.middleware):
+            chain = self._wrap_middleware(middleware, chain)
+        return chain
+
+    def _wrap_middleware(self, middleware: Middleware, next_handler: Callable) -> Callable:
+        middleware_attributes = {**self.span_attributes, 'routemq.middleware.name': middleware.__class__.__name__}
+
+        async def middleware_handler(ctx):
+            with start_span(
+                'router.middleware',
+                {**middleware_attributes, 'messaging.destination': ctx['topic']},
+                kind='internal',
+            ):
+                return await middleware.handle(ctx, next_handler)
+
+        return middleware_handler
 
     def _compile_topic_pattern(self) -> re.Pattern:
         """Convert Laravel-style route params to regex pattern."""
         pattern = self.topic
-        pattern = re.sub(r'{([^/]+)}', r'(?P<\1>[^/]+)', pattern)
+        pattern = _TOPIC_PARAM.sub(r'(?P<\1>[^/]+)', pattern)
         return re.compile(f'^{pattern}$')
 
+    def _compile_param_slots(self) -> tuple[list[str] | None, list[tuple[str, int]]]:
+        """Split the topic into tokens and the ``(param, index)`` slots they bind.
+
+        Returns ``(None, [])`` when a segment is not a plain literal or a whole
+        ``{param}``; :meth:`matches` then falls back to the compiled pattern.
+        """
+        tokens = self.topic.split('/')
+        slots = []
+        for index, token in enumerate(tokens):
+            param = _PARAM_SEGMENT.match(token)
+            if param:
+                slots.append((param.group(1), index))
+            elif not _REGEX_METACHARACTERS.isdisjoint(token):
+                return None, []
+        return tokens, slots
+
+    def _trie_segments(self) -> list[object] | None:
+        """Split the topic for the router trie; ``None`` when a segment needs the regex to match."""
+        segments: list[object] = []
+        for segment in self.topic.split('/'):
+            if _PARAM_SEGMENT.match(segment):
+                segments.append(_PARAM)
+            elif _REGEX_METACHARACTERS.isdisjoint(segment):
+                segments.append(sys.intern(segment))
+            else:
+                return None
+        return segments
+
     def _get_mqtt_subscription_topic(self) -> str:
         """Convert Laravel-style route params to MQTT subscription topic with wildcards."""
         return re.sub(r'{[^/]+}', '+', self.topic)
 
     def matches(self, topic: str) -> dict[str, str | Any] | None:
         """Check if a topic matches this route and extract parameters."""
+        tokens = self._tokens
+        if tokens is not None:
+            parts = topic.split('/')
+            if len(parts) != len(tokens):
+                return None
+            for token, part in zip(tokens, parts):
+                if token != part and not (part and token[:1] == '{'):
+                    return None
+            return {name: parts[index] for name, index in self._param_slots}
         match = self.pattern.match(topic)
         if match:
             return match.groupdict()
@@ -92,6 +212,77 @@ class RouterGroup:
 class Router:
     def __init__(self):
         self.routes: List[Route] = []
+        self._compiled_count = -1
+        self._compiled_routes: List[Route] | None = None
+        self._trie: dict[object, Any] = {}
+        self._regex_routes: list[tuple[int, Route]] = []
+        self._regex_union: re.Pattern | None = None
+        self._lookup: Callable[[str], Route | None] = self._find_route
+
+    def compile(self) -> None:
+        """Index ``routes`` in a topic-segment trie and reset the per-topic lookup cache.
+
+        Dispatch compiles on demand whenever routes were added since the last
+        call, so calling this after loading routers only moves the work to startup.
+        """
+        trie: dict[object, Any] = {}
+        regex_routes: list[tuple[int, Route]] = []
+        for index, route in enumerate(self.routes):
+            segments = route._trie_segments()
+            if segments is None:
+                regex_routes.append((index, route))
+                continue
+            node = trie
+            for segment in segments:
+                node = node.setdefault(segment, {})
+            node.setdefault(_ROUTES, []).append(index)
+
+        self._trie = trie
+        self._regex_routes = regex_routes
+        self._regex_union = _regex_union(regex_routes)
+        self._compiled_routes = self.routes
+        self._compiled_count = len(self.routes)
+        self._lookup = functools.lru_cache(maxsize=_TOPIC_CACHE_SIZE)(self._find_route)
+
+    def _find_route(self, topic: str) -> Route | None:
+        """Return the first registered route matching ``topic``, walking one trie branch per segment.
+
+        Only runs on a topic-cache miss, so each distinct topic is split once.
+        """
+        segments = topic.split('/')
+        best: int | None = None
+        stack = [(self._trie, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if depth == len(segments):
+                indexes = node.get(_ROUTES)
+                if indexes and (best is None or indexes[0] < best):
+                    best = indexes[0]
+                continue
+            segment = segments[depth]
+            child = node.get(segment)
+            if child is not None:
+                stack.append((child, depth + 1))
+            if segment:
+                child = node.get(_PARAM)
+                if child is not None:
+                    stack.append((child, depth + 1))
+
+        if self._regex_union is not None:
+            match = self._regex_union.match(topic)
+            if match is not None:
+                index = int(cast(str, match.lastgroup)[2:])
+                if best is None or index < best:
+                    best = index
+            return None if best is None else self.routes[best]
+
+        for index, route in self._regex_routes:
+            if best is not None and index > best:
+                break
+            if route.matches(topic) is not None:
+                best = index
+                break
+        return None if best is None else self.routes[best]
 
     def on(
         self,
@@ -112,7 +303,10 @@ class Router:
 
     async def dispatch(self, topic: str, payload: Any, client) -> None:
         """Find a matching route and dispatch the request through middleware to handler."""
-        for route in self.routes:
+        if self._compiled_routes is not self.routes or self._compiled_count != len(self.routes):
+            self.compile()
+        route = self._lookup(topic)
+        if route is not None:
             params = route.matches(topic)
             if params is not None:
                 route_attributes = {
@@ -130,43 +324,14 @@ class Router:
                     'route_pattern': route.topic,
                 }
                 token = enrich_context(**route_attributes)
-                span_attributes = {
-                    'messaging.system': 'mqtt',
-                    'messaging.operation.type': 'process',
-                    'messaging.destination': topic,
-                    'messaging.destination.template': route.topic,
-                    'routemq.route.pattern': route.topic,
-                }
-                handler_name = _callable_name(route.handler)
-
-                async def execute_handler(ctx):
+                try:
                     with start_span(
-                        'router.handler',
-                        {**span_attributes, 'routemq.handler.name': handler_name},
-                        kind='internal',
+                        'router.dispatch',
+                        {**route.span_attributes, 'messaging.destination': topic},
+                        kind='consumer',
                     ):
-                        return await route.handler(**ctx['params'], payload=ctx['payload'], client=ctx['client'])
-
-                handler = execute_handler
-
-                def wrap_middleware(middleware: Middleware, next_handler: Callable) -> Callable:
-                    async def middleware_handler(ctx):
-                        with start_span(
-                            'router.middleware',
-                            {**span_attributes, 'routemq.middleware.name': middleware.__class__.__name__},
-                            kind='internal',
-                        ):
-                            return await middleware.handle(ctx, next_handler)
-
-                    return middleware_handler
-
-                for middleware in reversed(route.middleware):
-                    handler = wrap_middleware(middleware, handler)
-
-                try:
-                    with start_span('router.dispatch', span_attributes, kind='consumer'):
                         lifecycle('router.dispatch.started', route_attributes)
-                        result = await handler(context)
+                        result = await route.chain(context)
                         lifecycle('router.dispatch.succeeded', route_attributes)
                     return result
                 except Exception as exc:
@@ -12,6 +12,7 @@ _DATABASE_POOL_CLASSES = {'default', 'null'}
 _DATABASE_CONNECTIONS = {'mysql', 'postgres'}
 _TELEMETRY_CONNECTIONS = {'clickhouse', 'timescaledb', 'influxdb', 'iotdb'}
 _TELEMETRY_QUEUE_FULL_STRATEGIES = {'block', 'fail', 'drop_newest', 'drop_oldest'}
+_MQTT_INGRESS_FULL_STRATEGIES = {'drop_newest', 'drop_oldest'}
 
 
 def _environment(env: Mapping[str, str] | None) -> Mapping[str, str]:
@@ -79,6 +80,10 @@ class MqttConnectionSettings:
     port: int = 1883
     username: str | None = None
     password: str | None = None
+    socket_path: str | None = None
+    keepalive: int = 60
+    max_inflight: int = 20
+    publisher_pool_size: int = 0
 
 
 @dataclass(frozen=True, slots=True)
@@ -98,6 +103,13 @@ class MqttRetrySettings:
     jitter: float = 0.0
 
 
+@dataclass(frozen=True, slots=True)
+class MqttIngressSettings:
+    queue_size: int = 10000
+    consumers: int = 8
+    full_strategy: str = 'drop_newest'
+
+
 @dataclass(frozen=True, slots=True)
 class MqttSettings:
     connection: MqttConnectionSettings
@@ -106,6 +118,8 @@ class MqttSettings:
     main_client_id: str
     worker_client_id_prefix: str
     group_name: str = 'mqtt_framework_group'
+    ingress: MqttIngressSettings = field(default_factory=MqttIngressSettings)
+    worker_cpu_affinity: bool = False
 
 
 @dataclass(frozen=True, slots=True)
@@ -174,6 +188,9 @@ class QueueReliabilitySettings:
     reaper_interval: int = 30
     shutdown_grace: int = 300
     heartbeat_interval: int = 10
+    complete_batch_delay_ms: int = 0
+    wake_notify: bool = False
+    block_timeout: int = 0
 
 
 def _parse_int_env(env: Mapping[str, str], name: str, default: int, *, fallback_on_invalid: bool = True) -> int:
@@ -188,12 +205,19 @@ def _parse_bool_env(env: Mapping[str, str], name: str, default: bool) -> bool:
 def load_mqtt_settings(env: Mapping[str, str] | None = None) -> MqttSettings:
     """Load MQTT-related settings from an environment mapping."""
     values = _environment(env)
+    ingress_strategy = env_str(values, 'MQTT_INGRESS_FULL_STRATEGY', 'drop_newest').lower()
+    if ingress_strategy not in _MQTT_INGRESS_FULL_STRATEGIES:
+        ingress_strategy = 'drop_newest'
     return MqttSettings(
         connection=MqttConnectionSettings(
             broker=env_str(values, 'MQTT_BROKER', 'localhost'),
             port=env_int(values, 'MQTT_PORT', 1883),
             username=env_optional_str(values, 'MQTT_USERNAME'),
             password=env_optional_str(values, 'MQTT_PASSWORD'),
+            socket_path=env_optional_str(values, 'MQTT_SOCKET_PATH'),
+            keepalive=_positive_int(values, 'MQTT_KEEPALIVE', 60),
+            max_inflight=_positive_int(values, 'MQTT_MAX_INFLIGHT', 20),
+            publisher_pool_size=_parse_int_env(values, 'MQTT_PUB_POOL', 0),
         ),
         tls=MqttTlsSettings(
             enabled=env_bool(values, 'MQTT_TLS_ENABLED', False),
@@ -211,6 +235,12 @@ def load_mqtt_settings(env: Mapping[str, str] | None = None) -> MqttSettings:
         main_client_id=env_str(values, 'MQTT_CLIENT_ID', f'mqtt-framework-main-{os.getpid()}'),
         worker_client_id_prefix=env_str(values, 'MQTT_CLIENT_ID', 'mqtt-worker'),
         group_name=env_str(values, 'MQTT_GROUP_NAME', 'mqtt_framework_group'),
+        ingress=MqttIngressSettings(
+            queue_size=_positive_int(values, 'MQTT_INGRESS_QUEUE_SIZE', 10000),
+            consumers=_positive_int(values, 'MQTT_INGRESS_CONSUMERS', 8),
+            full_strategy=ingress_strategy,
+        ),
+        worker_cpu_affinity=env_bool(values, 'MQTT_WORKER_CPU_AFFINITY', False),
     )
 
 
@@ -442,4 +472,7 @@ def load_queue_reliability_settings(env: Mapping[str, str] | None = None) -> Que
         reaper_interval=_parse_int_env(values, 'QUEUE_REAPER_INTERVAL', 30),
         shutdown_grace=_parse_int_env(values, 'QUEUE_SHUTDOWN_GRACE', 300),
         heartbeat_interval=_parse_int_env(values, 'QUEUE_HEARTBEAT_INTERVAL', 10),
+        complete_batch_delay_ms=_parse_int_env(values, 'QUEUE_COMPLETE_BATCH_DELAY_MS', 0),
+        wake_notify=_parse_bool_env(values, 'QUEUE_WAKE_NOTIFY', False),
+        block_timeout=_parse_int_env(values, 'QUEUE_BLOCK_TIMEOUT', 0),
     )
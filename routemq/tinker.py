@@ -3,20 +3,23 @@ RouteMQ Tinker - Interactive REPL for testing ORM relationships and queries
 Similar to Laravel Artisan Tinker
 """
 
+import ast
 import asyncio
+import importlib
+import importlib.util
 import os
+import pkgutil
 import sys
 from pathlib import Path
-import nest_asyncio  # pyright: ignore[reportMissingImports]
-
-from IPython import embed  # pyright: ignore[reportMissingImports]
-from IPython.terminal.interactiveshell import TerminalInteractiveShell  # pyright: ignore[reportMissingImports]
-from IPython.core.magic import Magics, magics_class, line_magic  # pyright: ignore[reportMissingImports]
 
 from bootstrap.app import Application
 from routemq.model import Model, Base
 from routemq.redis_manager import redis_manager
 
+embed = None
+TerminalInteractiveShell = None
+AsyncMagics = None
+
 Console = None
 Panel = None
 Table = None
@@ -77,8 +80,31 @@ def _install_tracebacks():
         _rich_install_traceback(show_locals=True)
 
 
-# Enable nested event loops for IPython compatibility
-nest_asyncio.apply()
+def _load_ipython():
+    """Lazy-load IPython, which only the interactive shell needs."""
+    global embed, TerminalInteractiveShell, AsyncMagics
+
+    if AsyncMagics is not None:
+        return
+
+    from IPython import embed as _embed  # pyright: ignore[reportMissingImports]
+    from IPython.terminal.interactiveshell import (  # pyright: ignore[reportMissingImports]
+        TerminalInteractiveShell as _TerminalInteractiveShell,
+    )
+    from IPython.core.magic import Magics, magics_class, line_magic  # pyright: ignore[reportMissingImports]
+
+    @magics_class
+    class AsyncMagics(Magics):
+        """Custom magic commands for async operations."""
+
+        @line_magic
+        def arun(self, line):
+            """Execute async code using line magic."""
+            code = f'await {line}'
+            return self.shell.run_cell_async(code)
+
+    embed = _embed
+    TerminalInteractiveShell = _TerminalInteractiveShell
 
 
 def _make_repl_helpers(console):
@@ -267,20 +293,63 @@ def _print_helpers_table_rich(console, db_enabled: bool):
         console.print('\n[yellow]Database is disabled. Enable in .env with ENABLE_MYSQL=true.[/yellow]')
 
 
-@magics_class
-class AsyncMagics(Magics):
-    """Custom magic commands for async operations."""
+def _allow_nested_loop(loop):
+    """Let ``loop.run_until_complete`` be called while ``loop`` is already running."""
+    import nest_asyncio  # pyright: ignore[reportMissingImports]
+
+    nest_asyncio.apply(loop)
+
+
+def _cached_import(module_name):
+    """Return ``module_name`` from ``sys.modules``, importing it first only when missing."""
+    modules = sys.modules
+    if module_name not in modules:
+        importlib.import_module(module_name)
+    return modules[module_name]
+
+
+def _is_model(attr):
+    return isinstance(attr, type) and hasattr(attr, '__tablename__') and issubclass(attr, Base)
+
 
-    @line_magic
-    def arun(self, line):
-        """Execute async code using line magic."""
-        code = f'await {line}'
-        return self.shell.run_cell_async(code)
+def _public_top_level_names(source):
+    """Names a module defines or imports at top level, read from its source without importing it."""
+    names = set()
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.ClassDef):
+            names.add(node.name)
+        elif isinstance(node, ast.ImportFrom):
+            names.update(alias.asname or alias.name for alias in node.names if alias.name != '*')
+    return sorted(name for name in names if not name.startswith('_'))
+
+
+class _LazyModelNamespace(dict):
+    """REPL namespace that imports an app model module the first time one of its names is looked up."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Candidate model name -> module that may define it
+        self.lazy_models: dict[str, str] = {}
+
+    def __missing__(self, key):
+        module_name = self.lazy_models.get(key)
+        if module_name is None:
+            raise KeyError(key)
+        attr = getattr(_cached_import(module_name), key, None)
+        if not _is_model(attr):
+            # Only Base models are injected; other imported names stay out of the namespace
+            del self.lazy_models[key]
+            raise KeyError(key)
+        self[key] = attr
+        return attr
 
 
 class TinkerEnvironment:
     """Environment setup for the tinker REPL session."""
 
+    # Candidate model names per model module, valid while its file's mtime is unchanged
+    _model_cache: dict[str, tuple[float, list[str]]] = {}
+
     def __init__(self, app: Application):
         self.app = app
         self.session = None
@@ -289,7 +358,7 @@ class TinkerEnvironment:
     async def _setup_database_session(self):
         """Setup database session for the REPL."""
         if Model._is_enabled:
-            self.session = await Model.get_session()
+            self.session = Model.get_session()
             print(f'✓ Database session established')
         else:
             print('⚠ Database is disabled in configuration')
@@ -305,9 +374,7 @@ class TinkerEnvironment:
             try:
                 loop = asyncio.get_event_loop()
                 if loop.is_running():
-                    import nest_asyncio  # pyright: ignore[reportMissingImports]
-
-                    nest_asyncio.apply()
+                    _allow_nested_loop(loop)
                     return loop.run_until_complete(coro)
                 else:
                     return loop.run_until_complete(coro)
@@ -315,59 +382,76 @@ class TinkerEnvironment:
                 # Audit Accept: no active REPL loop, so asyncio.run is the safe fallback.
                 return asyncio.run(coro)
 
-        self.globals = {
-            'app': self.app,
-            'Model': Model,
-            'Base': Base,
-            'session': None,  # Will be set after async setup
-            'redis_manager': redis_manager if self.app.redis_enabled else None,
-            'asyncio': asyncio,
-            'os': os,
-            'sys': sys,
-            'Path': Path,
-            # SQLAlchemy query helpers
-            'select': select,
-            'and_': and_,
-            'or_': or_,
-            'func': func,
-            'desc': desc,
-            'asc': asc,
-            # Helper functions
-            'run_async': run_async,
-        }
+        self.globals = _LazyModelNamespace(
+            {
+                'app': self.app,
+                'Model': Model,
+                'Base': Base,
+                'session': None,  # Will be set after async setup
+                'redis_manager': redis_manager if self.app.redis_enabled else None,
+                'asyncio': asyncio,
+                'os': os,
+                'sys': sys,
+                'Path': Path,
+                # SQLAlchemy query helpers
+                'select': select,
+                'and_': and_,
+                'or_': or_,
+                'func': func,
+                'desc': desc,
+                'asc': asc,
+                # Helper functions
+                'run_async': run_async,
+            }
+        )
 
         if _load_rich():
             self.globals.update(_make_repl_helpers(_console))
 
-        # Import all models dynamically
-        self._import_models()
+        # Register app models; their modules are imported on first use
+        if Model._is_enabled:
+            self._import_models()
 
     def _import_models(self):
-        """Dynamically import all models from app.models."""
+        """Expose the models in app.models; each module is imported when one of its names is first used."""
         try:
-            models_path = Path('app/models')
-            if models_path.exists():
-                for model_file in models_path.glob('*.py'):
-                    if model_file.name != '__init__.py':
-                        module_name = f'app.models.{model_file.stem}'
-                        try:
-                            __import__(module_name)
-                            module = sys.modules[module_name]
-
-                            # Add all classes that inherit from Base to globals
-                            for attr_name in dir(module):
-                                attr = getattr(module, attr_name)
-                                if isinstance(attr, type) and hasattr(attr, '__tablename__') and issubclass(attr, Base):
-                                    self.globals[attr_name] = attr
-                                    if not _RICH_AVAILABLE:
-                                        print(f'✓ Imported model: {attr_name}')
-                        except ImportError as e:
-                            # Audit Accept: optional app model import failures are displayed in the REPL.
-                            print(f'⚠ Could not import {module_name}: {e}')
+            package = importlib.util.find_spec('app.models')
+            if package is not None and package.submodule_search_locations is not None:
+                # iter_modules reads the import system's finders, so packaged installs are listed too
+                for info in pkgutil.iter_modules(package.submodule_search_locations):
+                    if info.ispkg:
+                        continue
+                    module_name = f'app.models.{info.name}'
+                    try:
+                        spec = info.module_finder.find_spec(module_name)
+                        if spec is None:
+                            continue
+                        for attr_name in self._model_names(spec):
+                            self.globals.lazy_models.setdefault(attr_name, module_name)
+                    except (ImportError, OSError, SyntaxError, ValueError) as e:
+                        # Audit Accept: optional app model discovery failures are displayed in the REPL.
+                        print(f'⚠ Could not read {module_name}: {e}')
         except Exception as e:
             # Audit Accept: model discovery is optional convenience for tinker startup.
             print(f'⚠ Error importing models: {e}')
 
+    def _model_names(self, spec):
+        """Return the names that may be models in the module ``spec`` describes, without importing it."""
+        try:
+            mtime = os.stat(spec.origin).st_mtime
+        except (OSError, TypeError):
+            # No file on disk to check (e.g. a zipped install); read the source every time
+            mtime = None
+        cached = self._model_cache.get(spec.origin)
+        if mtime is not None and cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        source = spec.loader.get_source(spec.name)
+        names = _public_top_level_names(source) if source is not None else []
+        if mtime is not None:
+            self._model_cache[spec.origin] = (mtime, names)
+        return names
+
     async def setup(self):
         """Async setup for the tinker environment."""
         rich_loaded = _load_rich()
@@ -439,6 +523,8 @@ def start_tinker_sync(env_file='.env'):  # pragma: no cover - interactive IPytho
 
     async def _start_tinker():
         tinker_env = None
+        # The REPL blocks inside this coroutine, so run_async() needs to re-enter its loop
+        _allow_nested_loop(asyncio.get_running_loop())
         try:
             # Create application instance
             app = Application(env_file=env_file, show_banner=False, log_to_console=False)
@@ -448,7 +534,7 @@ def start_tinker_sync(env_file='.env'):  # pragma: no cover - interactive IPytho
             await tinker_env.setup()
 
             # Configure IPython for better async support
-            from IPython.terminal.interactiveshell import TerminalInteractiveShell  # pyright: ignore[reportMissingImports]
+            _load_ipython()
 
             # Get or create IPython instance
             shell = TerminalInteractiveShell.instance()
@@ -456,8 +542,9 @@ def start_tinker_sync(env_file='.env'):  # pragma: no cover - interactive IPytho
             # Enable autoawait for async support
             shell.autoawait = True
 
-            # Register custom magic commands
-            shell.register_magics(AsyncMagics)
+            # Register custom magic commands, once per shell across tinker launches
+            if AsyncMagics.__name__ not in shell.magics_manager.registry:
+                shell.register_magics(AsyncMagics)
 
             # Start the embedding with our custom namespace
             embed(
@@ -481,32 +568,16 @@ def start_tinker_sync(env_file='.env'):  # pragma: no cover - interactive IPytho
             if tinker_env is not None and tinker_env.session:
                 await tinker_env.session.close()
 
-    # Check if we're already in an event loop
     try:
         loop = asyncio.get_running_loop()
-        # If we get here, there's already a running loop
-        # Use nest_asyncio to handle this
-        nest_asyncio.apply()
-        # Create a new event loop in a thread
-        import threading
-
-        def run_in_thread():
-            # Create new event loop for this thread
-            new_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(new_loop)
-            try:
-                new_loop.run_until_complete(_start_tinker())
-            finally:
-                new_loop.close()
-
-        thread = threading.Thread(target=run_in_thread)
-        thread.start()
-        thread.join()
-
     except RuntimeError:
         # Audit Accept: no running event loop, safe to use asyncio.run.
-        # No running loop, safe to use asyncio.run
         asyncio.run(_start_tinker())
+        return
+
+    # Already inside a loop: run the REPL on it rather than on a second loop in a thread
+    _allow_nested_loop(loop)
+    loop.run_until_complete(_start_tinker())
 
 
 def run_tinker():  # pragma: no cover - console script entrypoint
@@ -1,13 +1,16 @@
 import asyncio
 import logging
 import multiprocessing
+import os
+import pickle
+import signal
 import threading
-import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
+from .event_loop import new_event_loop
 from .router import Router
 from .router_registry import RouterRegistry
-from .logging_config import configure_logging
+from .logging_config import configure_logging, stop_async_logging
 from .observability import lifecycle, reset_context, set_context, start_span
 from .mqtt_utils import (
     build_worker_broker_config,
@@ -16,6 +19,7 @@ from .mqtt_utils import (
     create_mqtt_client,
     extract_trace_context,
     get_mqtt_group_name,
+    get_worker_cpu_affinity,
     is_network_startup_error,
     parse_mqtt_payload,
 )
@@ -38,28 +42,41 @@ class WorkerProcess:
         shared_routes: List[Dict[str, Any]],
         broker_config: Dict[str, Any],
         group_name: str,
+        router: Router | None = None,
     ):
         self.worker_id = worker_id
         self.router_directory = router_directory
-        self.router: Any = None
+        # A forked worker gets the parent's router as-is; otherwise setup_router() loads its own
+        self.router: Any = router
         self.shared_routes = shared_routes
         self.broker_config = broker_config
         self.group_name = group_name
+        # Built once; every message checks its topic against the prefix, every reconnect resubscribes
+        self._share_prefix = f'$share/{group_name}/'
+        self._share_prefix_len = len(self._share_prefix)
+        self._subscribe_specs: List[Tuple[str, int]] = [
+            (f'{self._share_prefix}{route_info["mqtt_topic"]}', route_info['qos']) for route_info in shared_routes
+        ]
         self.client: Any = None
         self.loop: asyncio.AbstractEventLoop | None = None
         self._loop_thread: threading.Thread | None = None
+        # run() blocks on this until SIGTERM; paho's network thread does the work meanwhile
+        self._stop_event = threading.Event()
         self.logger = logging.getLogger(f'RouteMQ.Worker-{self.worker_id}')
 
     def setup_router(self):
         """Setup router by dynamically loading from router directory."""
+        if self.router is not None:
+            self.logger.info('Worker %s using the router inherited from the parent process', self.worker_id)
+            return
         try:
             if self.router_directory:
                 registry = RouterRegistry(self.router_directory)
                 self.router = registry.discover_and_load_routers()
-                self.logger.info(f'Worker {self.worker_id} loaded router dynamically from {self.router_directory}')
+                self.logger.info('Worker %s loaded router dynamically from %s', self.worker_id, self.router_directory)
             else:
                 self.router = Router()
-                self.logger.warning(f'Worker {self.worker_id} using empty router')
+                self.logger.warning('Worker %s using empty router', self.worker_id)
         except Exception as e:
             self.logger.error(
                 f'Worker {self.worker_id} failed to load router: {e}',
@@ -83,29 +100,33 @@ class WorkerProcess:
             on_message=self._on_message,
             username=username,
             password=password,
+            socket_path=self.broker_config.get('socket_path'),
+            max_inflight=self.broker_config.get('max_inflight'),
         )
 
-        self.logger.info(f'Worker {self.worker_id} connecting with client ID: {client_id}')
+        self.logger.info('Worker %s connecting with client ID: %s', self.worker_id, client_id)
 
     def _on_connect(self, client, userdata, flags, rc):
         """Callback for when the client receives a CONNACK response from the server."""
-        self.logger.info(f'Worker {self.worker_id} connected with result code {rc}')
+        self.logger.info('Worker %s connected with result code %s', self.worker_id, rc)
 
-        for route_info in self.shared_routes:
-            topic = f'$share/{self.group_name}/{route_info["mqtt_topic"]}'
-            self.logger.info(f'Worker {self.worker_id} subscribing to {topic}')
-            client.subscribe(topic, route_info['qos'])
+        if self._subscribe_specs:
+            # One SUBSCRIBE packet for every shared route instead of one round trip per topic
+            client.subscribe(self._subscribe_specs)
+            self.logger.info('Worker %s subscribing to %d topic(s)', self.worker_id, len(self._subscribe_specs))
+            self.logger.debug('Worker %s subscriptions: %s', self.worker_id, self._subscribe_specs)
 
     def _on_message(self, client, userdata, msg):
         """Callback for when a PUBLISH message is received from the server."""
-        self.logger.debug(f'Worker {self.worker_id} received message on topic {msg.topic}')
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug('Worker %s received message on topic %s', self.worker_id, msg.topic)
 
         try:
             payload = parse_mqtt_payload(msg.payload)
 
             actual_topic = msg.topic
-            if msg.topic.startswith(f'$share/{self.group_name}/'):
-                actual_topic = msg.topic[len(f'$share/{self.group_name}/') :]
+            if actual_topic.startswith(self._share_prefix):
+                actual_topic = actual_topic[self._share_prefix_len :]
 
             context = {
                 'source': 'mqtt',
@@ -137,7 +158,7 @@ class WorkerProcess:
     def _schedule_dispatch(self, topic: str, payload: Any, client: Any, context: Dict[str, Any]) -> None:
         """Schedule MQTT dispatch on the worker's persistent loop."""
         if self.loop is None:
-            self.loop = asyncio.new_event_loop()
+            self.loop = new_event_loop()
 
         coro = self._dispatch_mqtt_message(topic, payload, client, context)
         if self.loop.is_running():
@@ -187,7 +208,7 @@ class WorkerProcess:
         self._start_dispatch_loop()
         self.setup_client()
 
-        broker = self.broker_config['broker']
+        broker = self.broker_config.get('socket_path') or self.broker_config['broker']
         port = int(self.broker_config['port'])
         retry_config = self.broker_config.get('retry_config')
 
@@ -198,6 +219,7 @@ class WorkerProcess:
                 port,
                 retry_config=retry_config,
                 process='worker',
+                keepalive=int(self.broker_config.get('keepalive', 60)),
             )
         except OSError as exc:
             if not is_network_startup_error(exc):
@@ -211,23 +233,48 @@ class WorkerProcess:
             return
 
         self.client.loop_start()
+        previous_handlers = self._install_signal_handlers()
 
         try:
-            self.logger.info(f'Worker {self.worker_id} started')
-            while True:
-                time.sleep(1)
+            self.logger.info('Worker %s started', self.worker_id)
+            self._stop_event.wait()
+            self.logger.info('Worker %s shutting down...', self.worker_id)
         except KeyboardInterrupt:
             # Audit Accept: Ctrl+C is the expected graceful shutdown path.
-            self.logger.info(f'Worker {self.worker_id} shutting down...')
+            self.logger.info('Worker %s shutting down...', self.worker_id)
         finally:
+            self._restore_signal_handlers(previous_handlers)
             self.client.loop_stop()
             self.client.disconnect()
             self._stop_dispatch_loop()
 
+    def _request_stop(self, signum, frame) -> None:
+        """Signal handler that lets run() return and clean up."""
+        self._stop_event.set()
+
+    def _install_signal_handlers(self) -> Dict[int, Any]:
+        """Install the SIGTERM handler where the platform/thread allows it."""
+        previous_handlers: Dict[int, Any] = {}
+        try:
+            previous_handlers[signal.SIGTERM] = signal.getsignal(signal.SIGTERM)
+            signal.signal(signal.SIGTERM, self._request_stop)
+        except (ValueError, RuntimeError):
+            # Audit Accept: signal handlers can only be installed on the main thread.
+            self.logger.debug('SIGTERM handler not installed outside the main thread')
+        return previous_handlers
+
+    def _restore_signal_handlers(self, previous_handlers: Dict[int, Any]) -> None:
+        for signum, handler in previous_handlers.items():
+            try:
+                signal.signal(signum, handler)
+            except (ValueError, RuntimeError):
+                # Audit Accept: best-effort signal restore during shutdown.
+                pass
+
     def _start_dispatch_loop(self) -> None:
         """Start the worker's persistent asyncio loop in a thread."""
         if self.loop is None:
-            self.loop = asyncio.new_event_loop()
+            self.loop = new_event_loop()
         loop = self.loop
         if loop.is_running():
             return
@@ -253,13 +300,27 @@ class WorkerProcess:
 
 
 def worker_process_main(
-    worker_id: int, router_directory: str, shared_routes: List[Dict], broker_config: Dict, group_name: str
+    worker_id: int,
+    router_directory: str,
+    shared_routes: List[Dict],
+    broker_config: Dict,
+    group_name: str,
+    router: Router | None = None,
 ):
     """Main function for worker process."""
     configure_logging(log_to_console=True)
 
-    worker = WorkerProcess(worker_id, router_directory, shared_routes, broker_config, group_name)
-    worker.run()
+    worker = WorkerProcess(worker_id, router_directory, shared_routes, broker_config, group_name, router)
+    try:
+        worker.run()
+    finally:
+        # multiprocessing children skip atexit hooks, so flush queued log records here
+        stop_async_logging()
+
+
+def _pickled_worker_process_main(worker_id: int, worker_config: bytes):
+    """Run :func:`worker_process_main` with the config :meth:`WorkerManager.start_workers` pickled once."""
+    worker_process_main(worker_id, *pickle.loads(worker_config))
 
 
 class WorkerManager:
@@ -269,23 +330,32 @@ class WorkerManager:
         self.router = router
         self.group_name = group_name or get_mqtt_group_name()
         self.router_directory = router_directory
+        self.cpu_affinity = get_worker_cpu_affinity()
         self.workers: List[multiprocessing.Process] = []
         self.logger = logging.getLogger('RouteMQ.WorkerManager')
+        # Rebuilt when the route list was replaced or grew since the last call, as Router.dispatch checks
+        self._shared_routes_info: List[Dict[str, Any]] = []
+        self._shared_routes_source: List[Any] | None = None
+        self._shared_routes_count = -1
 
     def get_shared_routes_info(self) -> List[Dict[str, Any]]:
         """Extract information about shared routes."""
-        shared_routes = []
-        for route in self.router.routes:
-            if route.shared:
-                shared_routes.append(
-                    {
-                        'topic': route.topic,
-                        'mqtt_topic': route.mqtt_topic,
-                        'qos': route.qos,
-                        'worker_count': route.worker_count,
-                    }
-                )
-        return shared_routes
+        routes = self.router.routes
+        if self._shared_routes_source is routes and self._shared_routes_count == len(routes):
+            return self._shared_routes_info
+        self._shared_routes_info = [
+            {
+                'topic': route.topic,
+                'mqtt_topic': route.mqtt_topic,
+                'qos': route.qos,
+                'worker_count': route.worker_count,
+            }
+            for route in routes
+            if route.shared
+        ]
+        self._shared_routes_source = routes
+        self._shared_routes_count = len(routes)
+        return self._shared_routes_info
 
     def start_workers(self, num_workers: int | None = None):
         """Start one process per shared route worker slot and skip failed starts."""
@@ -306,15 +376,23 @@ class WorkerManager:
 
         broker_config = build_worker_broker_config()
 
-        self.logger.info(f'Starting {num_workers} workers for shared subscriptions')
+        self.logger.info('Starting %d workers for shared subscriptions', num_workers)
 
         worker_topics = [route_info['topic'] for route_info in shared_routes for _ in range(route_info['worker_count'])]
+        worker_config = (self.router_directory, shared_routes, broker_config, self.group_name)
+        # Forked children inherit the args as they are, so they also get this router copy-on-write
+        # instead of re-importing every route module; spawn and forkserver pickle the args per
+        # process, so hand those one pre-pickled blob and let each worker load its own router
+        forked = multiprocessing.get_start_method() == 'fork'
+        pickled_config = None if forked else pickle.dumps(worker_config)
 
         for worker_id in range(num_workers):
-            process = multiprocessing.Process(
-                target=worker_process_main,
-                args=(worker_id, self.router_directory, shared_routes, broker_config, self.group_name),
-            )
+            if pickled_config is None:
+                process = multiprocessing.Process(
+                    target=worker_process_main, args=(worker_id, *worker_config, self.router)
+                )
+            else:
+                process = multiprocessing.Process(target=_pickled_worker_process_main, args=(worker_id, pickled_config))
             try:
                 process.start()
             except (OSError, RuntimeError) as exc:
@@ -325,7 +403,25 @@ class WorkerManager:
                 )
                 continue
             self.workers.append(process)
-            self.logger.info(f'Started worker {worker_id} (PID: {process.pid})')
+            self.logger.info('Started worker %s (PID: %s)', worker_id, process.pid)
+            if self.cpu_affinity:
+                self._pin_worker(process, worker_id)
+
+    def _pin_worker(self, process: multiprocessing.Process, worker_id: int) -> None:
+        """Pin a worker to one of the CPUs this process may run on, round-robin by worker id."""
+        if not hasattr(os, 'sched_setaffinity') or process.pid is None:
+            self.logger.warning('Worker CPU affinity is not supported on this platform')
+            return
+        # Pick from the CPUs this process is allowed, which a container cpuset may narrow
+        cpus = sorted(os.sched_getaffinity(0))
+        cpu = cpus[worker_id % len(cpus)]
+        try:
+            os.sched_setaffinity(process.pid, {cpu})
+        except OSError as exc:
+            # Audit Accept: affinity is a tuning hint; an unpinned worker still runs correctly.
+            self.logger.warning('Could not pin worker %s to CPU %s: %s', worker_id, cpu, exc)
+            return
+        self.logger.info('Pinned worker %s to CPU %s', worker_id, cpu)
 
     def stop_workers(self):
         """Stop all worker processes."""
@@ -333,12 +429,12 @@ class WorkerManager:
 
         for i, worker in enumerate(self.workers):
             if worker.is_alive():
-                self.logger.info(f'Terminating worker {i} (PID: {worker.pid})')
+                self.logger.info('Terminating worker %s (PID: %s)', i, worker.pid)
                 worker.terminate()
                 worker.join(timeout=5)
 
                 if worker.is_alive():
-                    self.logger.warning(f'Force killing worker {i}')
+                    self.logger.warning('Force killing worker %s', i)
                     worker.kill()
                     worker.join()
             if worker.pid is not None:
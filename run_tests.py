@@ -3,6 +3,7 @@
 Test runner for RouteMQ framework
 """
 
+import json
 import unittest
 import os
 import sys
@@ -10,11 +11,64 @@ import sys
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
+TESTS_DIR = 'tests'
+DISCOVERY_CACHE = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'routemq_tests.json')
+
+
+def _latest_test_mtime(start_dir):
+    """Newest mtime among test files and directories; adding, removing or editing a test file moves it."""
+    latest = 0
+    for root, _dirs, files in os.walk(start_dir):
+        latest = max(latest, os.stat(root).st_mtime_ns)
+        for name in files:
+            if name.startswith('test_') and name.endswith('.py'):
+                latest = max(latest, os.stat(os.path.join(root, name)).st_mtime_ns)
+    return latest
+
+
+def _test_module_names(suite):
+    """Yield the module of every test case in ``suite``, skipping modules that failed to import."""
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _test_module_names(test)
+        elif not isinstance(test, unittest.loader._FailedTest):
+            yield type(test).__module__
+
+
+def load_test_suite(start_dir=TESTS_DIR):
+    """Load the tests under ``start_dir``, reusing the module list of the last discovery while no test changed."""
+    start_dir = os.path.abspath(start_dir)
+    latest = _latest_test_mtime(start_dir)
+    try:
+        with open(DISCOVERY_CACHE) as f:
+            cached = json.load(f)
+        if cached['start_dir'] == start_dir and cached['mtime'] >= latest:
+            # discover() puts the start directory on sys.path; the cached names are relative to it
+            if start_dir not in sys.path:
+                sys.path.insert(0, start_dir)
+            return unittest.defaultTestLoader.loadTestsFromNames(cached['names'])
+    except (OSError, ValueError, KeyError, TypeError):
+        # Audit Accept: a missing or unreadable cache just means discovering again.
+        pass
+
+    loader = unittest.TestLoader()
+    suite = loader.discover(start_dir, pattern='test_*.py')
+    if not loader.errors:
+        try:
+            os.makedirs(os.path.dirname(DISCOVERY_CACHE), exist_ok=True)
+            with open(DISCOVERY_CACHE, 'w') as f:
+                names = list(dict.fromkeys(_test_module_names(suite)))
+                json.dump({'start_dir': start_dir, 'mtime': latest, 'names': names}, f)
+        except OSError:
+            # Audit Accept: caching discovery is optional; the suite still runs.
+            pass
+    return suite
+
 
 def run_tests():
     """Run all tests in the tests directory"""
     # Discover and run tests
-    test_suite = unittest.defaultTestLoader.discover('tests', pattern='test_*.py')
+    test_suite = load_test_suite()
     result = unittest.TextTestRunner().run(test_suite)
 
     # Return proper exit code (0 if all tests pass, 1 otherwise)
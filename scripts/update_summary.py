@@ -5,10 +5,27 @@ This script scans all markdown files and directories in the docs folder and gene
 a properly formatted GitBook-style table of contents.
 """
 
+import functools
 import os
-import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+# Characters that may separate an H1's '#' from its title
+_H1_SEPARATORS = (b' ', b'\t')
+
+
+@functools.lru_cache(maxsize=2048)
+def _read_h1_title(path: str, mtime_ns: int) -> Optional[str]:
+    """Return the first H1 title in a markdown file, or None; cached until the file's mtime changes."""
+    # Read line by line and stop at the first H1; the title is nearly always near the top
+    with open(path, 'rb') as f:
+        for line in f:
+            if line[:1] == b'#' and line[1:2] in _H1_SEPARATORS:
+                title = line[2:].strip()
+                if title:
+                    return title.decode('utf-8')
+    return None
 
 
 class SummaryGenerator:
@@ -17,13 +34,13 @@ class SummaryGenerator:
         self.base_path = Path.cwd()
         self.summary_file = self.docs_dir / 'SUMMARY.md'
 
-        # Files to exclude from the summary
-        self.excluded_files = {'SUMMARY.md', '.gitkeep'}
+        # Files to exclude from the summary; frozen so scans can share them safely
+        self.excluded_files = frozenset({'SUMMARY.md', '.gitkeep'})
 
         # Local/private working docs to exclude from published GitBook navigation.
         # Keep this aligned with .gitignore so generated SUMMARY.md never links
         # private planning/specification files that are not meant for git.
-        self.excluded_dirs = {'plans', 'superpowers'}
+        self.excluded_dirs = frozenset({'plans', 'superpowers'})
 
         # Priority order for main sections (will appear first)
         self.priority_sections = [
@@ -49,17 +66,17 @@ class SummaryGenerator:
             'tinker.md',
             'docker-deployment.md',
         ]
+        # Position of each priority section, for constant-time lookups while sorting
+        self.priority_index: Dict[str, int] = {}
+        for position, name in enumerate(self.priority_sections):
+            self.priority_index.setdefault(name, position)
 
     def extract_title_from_markdown(self, file_path: Path) -> str:
         """Extract the first H1 title from a markdown file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Look for the first H1 heading
-            h1_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
-            if h1_match:
-                return h1_match.group(1).strip()
+            title = _read_h1_title(str(file_path), os.stat(file_path).st_mtime_ns)
+            if title is not None:
+                return title
 
             # Fallback to filename
             return self.filename_to_title(file_path.stem)
@@ -90,82 +107,62 @@ class SummaryGenerator:
         return ' '.join(word.capitalize() for word in title.split())
 
     def scan_directory(self, directory: Path, relative_to: Path | None = None) -> List[Dict]:
-        """Recursively scan directory for markdown files and subdirectories."""
+        """Scan directory and its subdirectories for markdown files in a single os.walk pass."""
         if relative_to is None:
             relative_to = self.docs_dir
 
         items = []
-
-        if not directory.exists():
-            return items
-
-        # Get all items in directory
-        all_items = list(directory.iterdir())
-
-        # Separate files and directories
-        files = [
-            item
-            for item in all_items
-            if item.is_file() and item.suffix == '.md' and item.name not in self.excluded_files
-        ]
-        directories = [
-            item
-            for item in all_items
-            if item.is_dir() and not item.name.startswith('.') and item.name not in self.excluded_dirs
-        ]
-
-        # Process README.md first if it exists
-        readme_file = directory / 'README.md'
-        if readme_file.exists() and readme_file.name not in self.excluded_files:
-            relative_path = readme_file.relative_to(relative_to)
-            title = self.extract_title_from_markdown(readme_file)
-            items.append(
-                {
-                    'type': 'file',
-                    'title': title,
-                    'path': str(relative_path).replace('\\', '/'),
-                    'level': len(relative_path.parts) - 1,
-                }
-            )
-            files = [f for f in files if f.name != 'README.md']
-
-        # Process other markdown files (sorted)
-        for file in sorted(files, key=lambda x: x.name.lower()):
-            relative_path = file.relative_to(relative_to)
-            title = self.extract_title_from_markdown(file)
-            items.append(
-                {
-                    'type': 'file',
-                    'title': title,
-                    'path': str(relative_path).replace('\\', '/'),
-                    'level': len(relative_path.parts) - 1,
-                }
+        # Markdown file -> items whose title comes from its H1, filled in once the walk is done
+        pending_titles: Dict[Path, List[Dict]] = {}
+
+        # Top-down, so a directory's entry is added before anything inside it
+        for root, dirs, files in os.walk(directory, followlinks=True):
+            root_path = Path(root)
+            relative_root = root_path.relative_to(relative_to)
+            # Computed once per directory; entries inside it extend these
+            root_parts = relative_root.parts
+            root_level = len(root_parts) - 1
+            root_prefix = '/'.join(root_parts) + '/' if root_parts else ''
+
+            # Prune hidden and excluded directories so os.walk never descends into them
+            dirs[:] = sorted(
+                (name for name in dirs if not name.startswith('.') and name not in self.excluded_dirs),
+                key=str.lower,
             )
 
-        # Process subdirectories
-        for subdir in sorted(directories, key=lambda x: x.name.lower()):
-            relative_path = subdir.relative_to(relative_to)
-
-            # Check if directory has a README.md for the title
-            subdir_readme = subdir / 'README.md'
-            if subdir_readme.exists():
-                title = self.extract_title_from_markdown(subdir_readme)
-            else:
-                title = self.filename_to_title(subdir.name)
-
-            # Add directory entry
-            items.append(
-                {
+            if root_path != directory:
+                item = {
                     'type': 'directory',
-                    'title': title,
-                    'path': str(relative_path).replace('\\', '/'),
-                    'level': len(relative_path.parts) - 1,
+                    'title': self.filename_to_title(root_path.name),
+                    'path': relative_root.as_posix(),
+                    'level': root_level,
                 }
-            )
+                # Use the directory's README.md for its title if it has one
+                if 'README.md' in files:
+                    pending_titles.setdefault(root_path / 'README.md', []).append(item)
+                items.append(item)
+
+            markdown_files = [
+                name for name in files if os.path.splitext(name)[1] == '.md' and name not in self.excluded_files
+            ]
+
+            # Process README.md first if it exists, then other markdown files (sorted)
+            for name in sorted(markdown_files, key=lambda name: (name != 'README.md', name.lower())):
+                item = {
+                    'type': 'file',
+                    'title': None,
+                    'path': root_prefix + name,
+                    'level': root_level + 1,
+                }
+                pending_titles.setdefault(root_path / name, []).append(item)
+                items.append(item)
 
-            # Recursively scan subdirectory
-            subitems = self.scan_directory(subdir, relative_to)
-            items.extend(subitems)
+        # Title extraction is file I/O, so overlap the reads on a small thread pool
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            titles = executor.map(self.extract_title_from_markdown, pending_titles)
+            for title, titled_items in zip(titles, pending_titles.values()):
+                for item in titled_items:
+                    item['title'] = title
 
         return items
 
@@ -176,11 +173,8 @@ class SummaryGenerator:
             path_parts = item['path'].split('/')
             first_part = path_parts[0]
 
-            # Check if it's in priority list
-            if first_part in self.priority_sections:
-                priority = self.priority_sections.index(first_part)
-            else:
-                priority = len(self.priority_sections)  # Put at end
+            # Check if it's in priority list; anything else goes at the end
+            priority = self.priority_index.get(first_part, len(self.priority_sections))
 
             return (priority, item['level'], item['path'].lower())
 
@@ -195,28 +189,28 @@ class SummaryGenerator:
 
         # Remove duplicates - prefer directory entries over individual README entries
         seen_paths = set()
-        filtered_items = []
+        # Kept items by path, in insertion order
+        filtered_items: Dict[str, Dict] = {}
 
         for item in all_items:
             # For README.md files that are in directories, check if we already have the directory
             if item['type'] == 'file' and item['path'].endswith('/README.md'):
                 dir_path = item['path'][:-10]  # Remove '/README.md'
                 # Skip if we already have this directory or if it's the root README
-                if dir_path and any(existing['path'] == dir_path for existing in filtered_items):
+                if dir_path and dir_path in filtered_items:
                     continue
 
             # For directories, check if we already have the README
             if item['type'] == 'directory':
-                readme_path = f'{item["path"]}/README.md'
                 # Remove any existing README entry for this directory
-                filtered_items = [existing for existing in filtered_items if existing['path'] != readme_path]
+                filtered_items.pop(f'{item["path"]}/README.md', None)
 
             if item['path'] not in seen_paths:
                 seen_paths.add(item['path'])
-                filtered_items.append(item)
+                filtered_items[item['path']] = item
 
         # Sort items according to priority
-        sorted_items = self.sort_items(filtered_items)
+        sorted_items = self.sort_items(list(filtered_items.values()))
 
         # Generate content
         lines = ['# Table of contents\n']
@@ -234,9 +228,38 @@ class SummaryGenerator:
 
         return '\n'.join(lines) + '\n'
 
-    def update_summary(self) -> bool:
+    def summary_is_current(self) -> bool:
+        """Check whether SUMMARY.md is newer than every markdown file and directory in the docs tree."""
+        try:
+            summary_mtime = self.summary_file.stat().st_mtime_ns
+            if self.docs_dir.stat().st_mtime_ns > summary_mtime:
+                return False
+
+            # DirEntry.stat() reuses what scandir already fetched where the platform allows
+            pending = [str(self.docs_dir)]
+            while pending:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            if entry.name.startswith('.') or entry.name in self.excluded_dirs:
+                                continue
+                            # A directory's mtime changes when files are added, removed or renamed in it
+                            pending.append(entry.path)
+                        elif not entry.name.endswith('.md') or entry.name in self.excluded_files:
+                            continue
+                        if entry.stat().st_mtime_ns > summary_mtime:
+                            return False
+        except OSError:
+            return False
+        return True
+
+    def update_summary(self, force: bool = False) -> bool:
         """Update the SUMMARY.md file with generated content."""
         try:
+            if not force and self.summary_is_current():
+                print('SUMMARY.md is already up to date.')
+                return False
+
             new_content = self.generate_summary_content()
 
             # Check if content has changed
@@ -268,6 +291,9 @@ def main():
     parser = argparse.ArgumentParser(description='Update docs/SUMMARY.md based on directory structure')
     parser.add_argument('--docs-dir', default='docs', help='Documentation directory path')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be generated without writing')
+    parser.add_argument(
+        '--force', action='store_true', help='Regenerate even when no doc is newer than the current SUMMARY.md'
+    )
 
     args = parser.parse_args()
 
@@ -279,7 +305,7 @@ def main():
         print(generator.generate_summary_content())
         print('=' * 50)
     else:
-        changed = generator.update_summary()
+        changed = generator.update_summary(force=args.force)
         if changed:
             print('SUMMARY.md has been updated!')
         else:
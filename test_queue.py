@@ -4,6 +4,7 @@ Quick test script to verify the queue system works correctly.
 """
 
 import asyncio
+import os
 import sys
 from pathlib import Path
 
@@ -27,6 +28,8 @@ class TestJob(Job):
     max_tries = 2
     timeout = 10
     queue = 'test'
+    # Simulated work per job; QUEUE_TEST_FAST_SLEEP=0 skips it when running jobs in a tight loop
+    sleep_seconds = float(os.environ.get('QUEUE_TEST_FAST_SLEEP', '1'))
 
     def __init__(self):
         super().__init__()
@@ -34,7 +37,7 @@ class TestJob(Job):
 
     async def handle(self):
         logger.info(f'Processing TestJob with data: {self.test_data}')
-        await asyncio.sleep(1)
+        await asyncio.sleep(self.sleep_seconds)
         logger.info('TestJob completed successfully!')
 
     async def failed(self, exception: Exception):
@@ -100,6 +103,7 @@ async def main():
         logger.info('1. Enable Redis or MySQL in your .env file')
         logger.info('2. Run: routemq --queue-work --queue test')
         logger.info('3. In another terminal, dispatch a job using the example jobs')
+        logger.info('Set QUEUE_TEST_FAST_SLEEP=0 to skip the 1 second of simulated work in TestJob.handle')
 
     except Exception as e:
         logger.error(f'❌ Test failed: {e}')
@@ -9,8 +9,7 @@ os.environ['ENABLE_MYSQL'] = 'false'
 
 def load_tests(loader, tests, pattern):
     """Discovery function for unittest to find all tests."""
-    suite = unittest.TestSuite()
-    for all_test_suite in unittest.defaultTestLoader.discover('.', pattern='test_*.py'):
-        for test_suite in all_test_suite:
-            suite.addTests(test_suite)
-    return suite
+    # Discover from this package, named relative to the project root, whatever the working directory
+    tests_dir = os.path.dirname(os.path.abspath(__file__))
+    tests.addTests(loader.discover(tests_dir, pattern=pattern or 'test_*.py', top_level_dir=os.path.dirname(tests_dir)))
+    return tests
@@ -38,7 +38,7 @@ class MqttBrokerIntegrationTests(DockerIntegrationTestCase, unittest.IsolatedAsy
 
         router.on('test/devices/{id}/status', handle_status, qos=1)
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         sub_client = mqtt_client.Client(
             client_id='integration-sub',
             callback_api_version=CallbackAPIVersion.VERSION2,
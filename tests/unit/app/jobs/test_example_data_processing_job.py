@@ -0,0 +1,54 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from app.jobs.example_data_processing_job import ProcessDataJob, SensorBatcher
+
+
+class TestProcessDataJobReadings(unittest.TestCase):
+    def test_single_reading_is_used_without_batch(self) -> None:
+        """Legacy device_id/sensor_data jobs still process one reading."""
+        job = ProcessDataJob()
+        job.device_id = 'sensor-001'
+        job.sensor_data = {'temperature': 25.5}
+        self.assertEqual(job.get_readings(), [('sensor-001', {'temperature': 25.5})])
+
+    def test_readings_survive_serialization(self) -> None:
+        """Batched readings travel in the job payload."""
+        job = ProcessDataJob()
+        job.readings = [['a', {'temperature': 1}], ['b', {'humidity': 2}]]
+        restored = ProcessDataJob.unserialize(job.serialize())
+        self.assertEqual(restored.get_readings(), [('a', {'temperature': 1}), ('b', {'humidity': 2})])
+
+
+class TestSensorBatcher(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_readings_become_one_job(self) -> None:
+        """Readings queued together are dispatched as a single job."""
+        batcher = SensorBatcher(max_batch_size=10, max_queue_time=0.01)
+        with patch('app.jobs.example_data_processing_job.dispatch', AsyncMock()) as dispatch:
+            await asyncio.gather(batcher.process('a', {'t': 1}), batcher.process('b', {'t': 2}))
+
+        dispatch.assert_awaited_once()
+        job = dispatch.await_args.args[0]
+        self.assertIsInstance(job, ProcessDataJob)
+        self.assertEqual(job.readings, [['a', {'t': 1}], ['b', {'t': 2}]])
+
+    async def test_full_batch_dispatches_without_waiting(self) -> None:
+        """Reaching max_batch_size flushes before the timer fires."""
+        batcher = SensorBatcher(max_batch_size=2, max_queue_time=60)
+        with patch('app.jobs.example_data_processing_job.dispatch', AsyncMock()) as dispatch:
+            await asyncio.wait_for(asyncio.gather(batcher.process('a', 1), batcher.process('b', 2)), timeout=1)
+
+        dispatch.assert_awaited_once()
+
+    async def test_dispatch_failure_reaches_every_caller(self) -> None:
+        """Each reading in a failed batch sees the dispatch error."""
+        batcher = SensorBatcher(max_batch_size=2)
+        with patch('app.jobs.example_data_processing_job.dispatch', AsyncMock(side_effect=RuntimeError('down'))):
+            results = await asyncio.gather(batcher.process('a', 1), batcher.process('b', 2), return_exceptions=True)
+
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+
+
+if __name__ == '__main__':
+    unittest.main()
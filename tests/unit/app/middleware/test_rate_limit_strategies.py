@@ -1,10 +1,14 @@
+import asyncio
+import importlib.util
 import time
 import unittest
+from collections import deque
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 from app.middleware.rate_limit import (
     ClientRateLimitMiddleware,
+    RateLimitBatcher,
     RateLimitMiddleware,
     TopicRateLimitMiddleware,
 )
@@ -35,6 +39,13 @@ class RateLimitConstructionTests(unittest.TestCase):
         mw = RateLimitMiddleware(max_requests=10, whitelist=['a', 'b', 'a'])
         self.assertEqual(mw.whitelist, {'a', 'b'})
 
+    def test_token_bucket_constants_are_precomputed(self) -> None:
+        mw = RateLimitMiddleware(max_requests=7, window_seconds=60, burst_allowance=3)
+        self.assertEqual(mw._rate, 7 / 60)
+        self.assertEqual(mw._inv_rate, 60 / 7)
+        self.assertEqual(mw._max_capacity, 10)
+        self.assertEqual(mw._refill_seconds, 9)
+
     def test_default_key_generator_uses_topic(self) -> None:
         mw = RateLimitMiddleware(max_requests=10)
         self.assertEqual(mw._default_key_generator({'topic': 'devices/1'}), 'topic:devices/1')
@@ -57,6 +68,16 @@ class WhitelistTests(unittest.TestCase):
         mw = RateLimitMiddleware(max_requests=10, whitelist=['admin'])
         self.assertFalse(mw._is_whitelisted('topic:user/status'))
 
+    def test_trailing_star_matches_by_prefix(self) -> None:
+        mw = RateLimitMiddleware(max_requests=10, whitelist=['topic:admin/*'])
+        self.assertTrue(mw._is_whitelisted('topic:admin/status'))
+        self.assertFalse(mw._is_whitelisted('client:topic:admin/status'))
+
+    def test_exact_key_matches(self) -> None:
+        mw = RateLimitMiddleware(max_requests=10, whitelist=['topic:health', 'topic:admin/*'])
+        self.assertTrue(mw._is_whitelisted('topic:health'))
+        self.assertEqual(mw._wl_prefix, ('topic:admin/',))
+
     def test_empty_whitelist_never_matches(self) -> None:
         mw = RateLimitMiddleware(max_requests=10)
         self.assertFalse(mw._is_whitelisted('anything'))
@@ -98,6 +119,20 @@ class HandleBehaviorTests(unittest.IsolatedAsyncioTestCase):
         next_handler.assert_not_awaited()
         self.assertTrue(ctx['rate_limit']['exceeded'])
 
+    async def test_blocked_responses_do_not_share_state(self) -> None:
+        mw = RateLimitMiddleware(max_requests=10, window_seconds=60)
+
+        with patch.object(mw, '_check_rate_limit', AsyncMock(side_effect=[(False, 0, 30), (False, 0, 5)])):
+            first = await mw.handle({'topic': 'a'}, AsyncMock())
+            second = await mw.handle({'topic': 'b'}, AsyncMock())
+
+        self.assertIsNot(first, second)
+        self.assertEqual(first['message'], 'Rate limit exceeded. Try again in 30 seconds.')
+        self.assertEqual(second['message'], 'Rate limit exceeded. Try again in 5 seconds.')
+        self.assertEqual(
+            second['rate_limit'], {'max_requests': 10, 'window_seconds': 60, 'remaining': 0, 'reset_time': 5}
+        )
+
 
 class CheckRateLimitDispatchTests(unittest.IsolatedAsyncioTestCase):
     async def test_redis_path_used_when_enabled(self) -> None:
@@ -195,6 +230,12 @@ class CheckRateLimitDispatchTests(unittest.IsolatedAsyncioTestCase):
             await mw._check_rate_limit_redis('k')
         mock_method.assert_awaited_once()
 
+    async def test_redis_dispatch_routes_to_approximate_sliding(self) -> None:
+        mw = RateLimitMiddleware(max_requests=10, strategy='approximate_sliding')
+        with patch.object(mw, '_approx_sliding_redis', AsyncMock(return_value=(True, 5, 60))) as mock_method:
+            await mw._check_rate_limit_redis('k')
+        mock_method.assert_awaited_once()
+
 
 class MemoryStrategiesTests(unittest.IsolatedAsyncioTestCase):
     async def test_memory_dispatch_unknown_strategy_raises(self) -> None:
@@ -219,6 +260,22 @@ class MemoryStrategiesTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(remaining, 0)
         self.assertGreaterEqual(reset, 1)
 
+    async def test_memory_sliding_window_evicts_expired_requests_from_head(self) -> None:
+        mw = RateLimitMiddleware(max_requests=2, window_seconds=10, strategy='sliding_window')
+        cache_entry: dict[str, Any] = {'requests': deque([100.0, 105.0])}
+
+        allowed, remaining, _ = mw._sliding_window_memory(cache_entry, 111.0)
+
+        self.assertTrue(allowed)
+        self.assertEqual(remaining, 0)
+        self.assertEqual(list(cache_entry['requests']), [105.0, 111.0])
+
+    async def test_memory_sliding_window_reset_uses_oldest_request(self) -> None:
+        mw = RateLimitMiddleware(max_requests=2, window_seconds=10, strategy='sliding_window')
+        cache_entry: dict[str, Any] = {'requests': deque([100.0, 104.0])}
+
+        self.assertEqual(mw._sliding_window_memory(cache_entry, 106.0), (False, 0, 4))
+
     async def test_memory_fixed_window_under_limit_allows(self) -> None:
         mw = RateLimitMiddleware(max_requests=3, window_seconds=60, strategy='fixed_window')
         allowed, remaining, reset = await mw._check_rate_limit_memory('k')
@@ -257,6 +314,39 @@ class MemoryStrategiesTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(remaining, 0)
         self.assertGreaterEqual(reset, 1)
 
+    async def test_memory_approx_sliding_blocks_at_limit(self) -> None:
+        mw = RateLimitMiddleware(max_requests=2, window_seconds=60, strategy='approximate_sliding')
+        with patch('app.middleware.rate_limit.time.time', return_value=600.0):
+            first = await mw._check_rate_limit_memory('k')
+            second = await mw._check_rate_limit_memory('k')
+            third = await mw._check_rate_limit_memory('k')
+        self.assertEqual(first, (True, 1, 60))
+        self.assertEqual(second, (True, 0, 60))
+        self.assertEqual(third, (False, 0, 60))
+
+    def test_memory_approx_sliding_weights_previous_window(self) -> None:
+        mw = RateLimitMiddleware(max_requests=10, window_seconds=60, strategy='approximate_sliding')
+        cache_entry = {'cur_count': 8, 'prev_count': 0, 'window_start': 540}
+
+        # Halfway through the next window, half of the previous eight still count.
+        allowed, remaining, reset = mw._approx_sliding_memory(cache_entry, 630.0)
+
+        self.assertTrue(allowed)
+        self.assertEqual(remaining, 5)
+        self.assertEqual(reset, 30)
+        self.assertEqual(cache_entry['prev_count'], 8)
+        self.assertEqual(cache_entry['cur_count'], 1)
+
+    def test_memory_approx_sliding_drops_counts_after_idle_gap(self) -> None:
+        mw = RateLimitMiddleware(max_requests=10, window_seconds=60, strategy='approximate_sliding')
+        cache_entry = {'cur_count': 10, 'prev_count': 10, 'window_start': 0}
+
+        allowed, remaining, _ = mw._approx_sliding_memory(cache_entry, 600.0)
+
+        self.assertTrue(allowed)
+        self.assertEqual(remaining, 9)
+        self.assertEqual(cache_entry['prev_count'], 0)
+
 
 class CleanupMemoryCacheTests(unittest.IsolatedAsyncioTestCase):
     async def test_cleanup_removes_entries_older_than_two_windows(self) -> None:
@@ -271,6 +361,17 @@ class CleanupMemoryCacheTests(unittest.IsolatedAsyncioTestCase):
         self.assertIn('fresh', mw._memory_cache)
         self.assertEqual(mw._last_cleanup, now)
 
+    async def test_cleanup_stops_at_first_fresh_entry(self) -> None:
+        mw = RateLimitMiddleware(max_requests=10, window_seconds=60)
+        now = time.time()
+        mw._memory_cache['stale-1'] = {'requests': [], 'created': now - 300}
+        mw._memory_cache['stale-2'] = {'requests': [], 'created': now - 200}
+        mw._memory_cache['fresh'] = {'requests': [], 'created': now - 10}
+
+        await mw._cleanup_memory_cache(now)
+
+        self.assertEqual(list(mw._memory_cache), ['fresh'])
+
     async def test_cleanup_is_triggered_on_interval_in_check(self) -> None:
         mw = RateLimitMiddleware(max_requests=5, window_seconds=60, strategy='sliding_window')
         mw._last_cleanup = 0.0
@@ -284,34 +385,125 @@ class RedisSlidingWindowTests(unittest.IsolatedAsyncioTestCase):
         mw = RateLimitMiddleware(max_requests=5, window_seconds=60, strategy='sliding_window')
         with patch('app.middleware.rate_limit.redis_manager') as mock_redis:
             client = MagicMock()
-            pipe = MagicMock()
-            pipe.execute = AsyncMock(return_value=[0, 2, 1, True])
-            client.pipeline.return_value = pipe
+            client.evalsha = AsyncMock(return_value=[1, 2, 60])
             mock_redis.get_client.return_value = client
 
             allowed, remaining, reset = await mw._sliding_window_redis('rk', 1000)
 
         self.assertTrue(allowed)
-        self.assertEqual(remaining, 5 - 2 - 1)
+        self.assertEqual(remaining, 2)
         self.assertEqual(reset, 60)
+        client.evalsha.assert_awaited_once_with(RateLimitMiddleware._sliding_sha, 1, 'rk', 940, 1000, 5, 60, ANY)
 
     async def test_at_limit_blocks_and_reports_reset(self) -> None:
         mw = RateLimitMiddleware(max_requests=5, window_seconds=60, strategy='sliding_window')
         with patch('app.middleware.rate_limit.redis_manager') as mock_redis:
             client = MagicMock()
-            pipe = MagicMock()
-            pipe.execute = AsyncMock(return_value=[0, 5, 1, True])
-            client.pipeline.return_value = pipe
-            client.zrange = AsyncMock(return_value=[(b'998', 998.0)])
-            client.zrem = AsyncMock(return_value=1)
+            client.evalsha = AsyncMock(return_value=[0, 0, 58])
             mock_redis.get_client.return_value = client
 
             allowed, remaining, reset = await mw._sliding_window_redis('rk', 1000)
 
         self.assertFalse(allowed)
         self.assertEqual(remaining, 0)
-        self.assertGreaterEqual(reset, 1)
-        client.zrem.assert_awaited_once()
+        self.assertEqual(reset, 58)
+
+    async def test_blocked_reset_time_is_at_least_one_second(self) -> None:
+        mw = RateLimitMiddleware(max_requests=5, window_seconds=60, strategy='sliding_window')
+        with patch('app.middleware.rate_limit.redis_manager') as mock_redis:
+            client = MagicMock()
+            client.evalsha = AsyncMock(return_value=[0, 0, 0])
+            mock_redis.get_client.return_value = client
+
+            _, _, reset = await mw._sliding_window_redis('rk', 1000)
+
+        self.assertEqual(reset, 1)
+
+    async def test_noscript_falls_back_to_eval(self) -> None:
+        from redis.exceptions import NoScriptError
+
+        mw = RateLimitMiddleware(max_requests=5, window_seconds=60, strategy='sliding_window')
+        with patch('app.middleware.rate_limit.redis_manager') as mock_redis:
+            client = MagicMock()
+            client.evalsha = AsyncMock(side_effect=NoScriptError('NOSCRIPT No matching script'))
+            client.eval = AsyncMock(return_value=[1, 4, 60])
+            mock_redis.get_client.return_value = client
+
+            allowed, remaining, _ = await mw._sliding_window_redis('rk', 1000)
+
+        self.assertTrue(allowed)
+        self.assertEqual(remaining, 4)
+        client.eval.assert_awaited_once_with(RateLimitMiddleware.SLIDING_LUA, 1, 'rk', 940, 1000, 5, 60, ANY)
+
+
+lua_redis_available = importlib.util.find_spec('fakeredis') is not None and importlib.util.find_spec('lupa') is not None
+
+
+@unittest.skipUnless(lua_redis_available, 'fakeredis[lua] is not installed')
+class RedisScriptExecutionTests(unittest.IsolatedAsyncioTestCase):
+    """Run the Lua scripts against fakeredis so script bugs are not hidden by mocked EVALSHA replies."""
+
+    async def asyncSetUp(self) -> None:
+        import fakeredis
+
+        self.client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        redis_patch = patch('app.middleware.rate_limit.redis_manager')
+        mock_redis = redis_patch.start()
+        self.addCleanup(redis_patch.stop)
+        mock_redis.get_client.return_value = self.client
+
+    async def asyncTearDown(self) -> None:
+        await self.client.aclose()
+
+    async def test_sliding_window_counts_requests_in_the_same_second(self) -> None:
+        mw = RateLimitMiddleware(max_requests=3, window_seconds=60, strategy='sliding_window')
+
+        results = [await mw._sliding_window_redis('rk', 1000) for _ in range(5)]
+
+        self.assertEqual(
+            results,
+            [(True, 2, 60), (True, 1, 60), (True, 0, 60), (False, 0, 60), (False, 0, 60)],
+        )
+        self.assertEqual(await self.client.zcard('rk'), 3)
+
+    async def test_sliding_window_frees_slots_after_the_window(self) -> None:
+        mw = RateLimitMiddleware(max_requests=1, window_seconds=10, strategy='sliding_window')
+
+        self.assertTrue((await mw._sliding_window_redis('rk', 100))[0])
+        self.assertEqual(await mw._sliding_window_redis('rk', 105), (False, 0, 5))
+        self.assertTrue((await mw._sliding_window_redis('rk', 111))[0])
+
+    async def test_token_bucket_deny_reset_matches_memory_fallback(self) -> None:
+        mw = RateLimitMiddleware(max_requests=7, window_seconds=60, strategy='token_bucket')
+        for _ in range(7):
+            await mw._token_bucket_redis('rk', 1000)
+        redis_result = await mw._token_bucket_redis('rk', 1000)
+
+        cache_entry = {'tokens': 0.0, 'last_refill': 1000.0}
+        memory_result = mw._token_bucket_memory(cache_entry, 1000.0)
+
+        self.assertEqual(redis_result, (False, 0, 9))
+        self.assertEqual(memory_result, redis_result)
+
+    async def test_approx_sliding_does_not_share_fixed_window_counters(self) -> None:
+        fixed = RateLimitMiddleware(max_requests=2, window_seconds=60, strategy='fixed_window')
+        approx = RateLimitMiddleware(max_requests=2, window_seconds=60, strategy='approximate_sliding')
+        await fixed._fixed_window_redis('rk', 1000)
+        await fixed._fixed_window_redis('rk', 1000)
+
+        self.assertEqual(await approx._approx_sliding_redis('rk', 1000), (True, 1, 20))
+        self.assertEqual(await self.client.get('rk:16'), '2')
+        self.assertEqual(await self.client.get('rk:approx:16'), '1')
+
+    async def test_approx_sliding_weights_previous_window(self) -> None:
+        mw = RateLimitMiddleware(max_requests=4, window_seconds=60, strategy='approximate_sliding')
+        await self.client.set('rk:approx:15', 4)
+
+        # 40s into window 16: 4 * (1 - 40/60) = 1.33 carried over, so two more fit.
+        results = [await mw._approx_sliding_redis('rk', 1000) for _ in range(3)]
+
+        self.assertEqual([allowed for allowed, _, _ in results], [True, True, False])
+        self.assertGreater(await self.client.ttl('rk:approx:15'), 0)
 
 
 class RedisFixedWindowTests(unittest.IsolatedAsyncioTestCase):
@@ -346,33 +538,168 @@ class RedisFixedWindowTests(unittest.IsolatedAsyncioTestCase):
 
 class RedisTokenBucketTests(unittest.IsolatedAsyncioTestCase):
     async def test_fresh_bucket_allows_request(self) -> None:
-        mw = RateLimitMiddleware(max_requests=10, window_seconds=60, strategy='token_bucket')
+        mw = RateLimitMiddleware(max_requests=10, window_seconds=60, strategy='token_bucket', burst_allowance=5)
         with patch('app.middleware.rate_limit.redis_manager') as mock_redis:
             client = MagicMock()
-            pipe = MagicMock()
-            pipe.execute = AsyncMock(return_value=[None, None])
-            client.pipeline.return_value = pipe
+            client.evalsha = AsyncMock(return_value=[1, 9, 6])
             mock_redis.get_client.return_value = client
 
-            allowed, remaining, _ = await mw._token_bucket_redis('rk', 1000)
+            allowed, remaining, reset = await mw._token_bucket_redis('rk', 1000)
 
         self.assertTrue(allowed)
-        self.assertGreaterEqual(remaining, 8)
+        self.assertEqual(remaining, 9)
+        self.assertEqual(reset, 6)
+        client.evalsha.assert_awaited_once_with(
+            RateLimitMiddleware._token_bucket_sha, 1, 'rk:tb', 10, 1000, 10 / 60, 15, 120, 6.0
+        )
 
     async def test_empty_bucket_denies(self) -> None:
         mw = RateLimitMiddleware(max_requests=10, window_seconds=60, strategy='token_bucket')
         with patch('app.middleware.rate_limit.redis_manager') as mock_redis:
             client = MagicMock()
-            pipe = MagicMock()
-            pipe.execute = AsyncMock(return_value=[b'0', b'1000'])
-            client.pipeline.return_value = pipe
+            client.evalsha = AsyncMock(return_value=[0, 0, 0])
             mock_redis.get_client.return_value = client
 
             allowed, remaining, reset = await mw._token_bucket_redis('rk', 1000)
 
         self.assertFalse(allowed)
         self.assertEqual(remaining, 0)
-        self.assertGreaterEqual(reset, 1)
+        self.assertEqual(reset, 6)
+
+
+class RedisApproxSlidingTests(unittest.IsolatedAsyncioTestCase):
+    async def test_uses_current_and_previous_window_keys(self) -> None:
+        mw = RateLimitMiddleware(max_requests=10, window_seconds=60, strategy='approximate_sliding')
+        with patch('app.middleware.rate_limit.redis_manager') as mock_redis:
+            client = MagicMock()
+            client.evalsha = AsyncMock(return_value=[1, 7, 20])
+            mock_redis.get_client.return_value = client
+
+            allowed, remaining, reset = await mw._approx_sliding_redis('rk', 1000)
+
+        self.assertEqual((allowed, remaining, reset), (True, 7, 20))
+        client.evalsha.assert_awaited_once_with(
+            RateLimitMiddleware._approx_sliding_sha, 2, 'rk:approx:16', 'rk:approx:15', 1000, 60, 10
+        )
+
+    async def test_over_limit_denies(self) -> None:
+        mw = RateLimitMiddleware(max_requests=10, window_seconds=60, strategy='approximate_sliding')
+        with patch('app.middleware.rate_limit.redis_manager') as mock_redis:
+            client = MagicMock()
+            client.evalsha = AsyncMock(return_value=[0, 0, 20])
+            mock_redis.get_client.return_value = client
+
+            allowed, remaining, reset = await mw._approx_sliding_redis('rk', 1000)
+
+        self.assertEqual((allowed, remaining, reset), (False, 0, 20))
+
+
+def _pipeline_client(*responses: list[Any]) -> MagicMock:
+    client = MagicMock()
+    pipes = []
+    for response in responses:
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=response)
+        pipes.append(pipe)
+    client.pipeline.side_effect = pipes
+    client.pipes = pipes
+    return client
+
+
+class RateLimitBatcherTests(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_calls_share_one_pipeline(self) -> None:
+        client = _pipeline_client([[1, 4, 60], [0, 0, 30]])
+        batcher = RateLimitBatcher(lambda: client, max_batch_size=10, max_queue_time=0.001)
+
+        first, second = await asyncio.gather(
+            batcher.process('script', 'sha', ['a'], [1]),
+            batcher.process('script', 'sha', ['b'], [2]),
+        )
+
+        self.assertEqual(first, [1, 4, 60])
+        self.assertEqual(second, [0, 0, 30])
+        client.pipeline.assert_called_once_with(transaction=False)
+        pipe = client.pipes[0]
+        self.assertEqual(pipe.evalsha.call_args_list[0].args, ('sha', 1, 'a', 1))
+        self.assertEqual(pipe.evalsha.call_args_list[1].args, ('sha', 1, 'b', 2))
+
+    async def test_full_batch_flushes_without_waiting(self) -> None:
+        client = _pipeline_client([[1, 0, 60], [1, 0, 60]])
+        batcher = RateLimitBatcher(lambda: client, max_batch_size=2, max_queue_time=60)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                batcher.process('script', 'sha', ['a'], []),
+                batcher.process('script', 'sha', ['b'], []),
+            ),
+            timeout=1,
+        )
+
+        self.assertEqual(results, [[1, 0, 60], [1, 0, 60]])
+
+    async def test_noscript_results_are_retried_with_eval(self) -> None:
+        from redis.exceptions import NoScriptError
+
+        client = _pipeline_client([NoScriptError('NOSCRIPT'), [1, 3, 60]], [[1, 2, 60]])
+        batcher = RateLimitBatcher(lambda: client, max_queue_time=0)
+
+        first, second = await asyncio.gather(
+            batcher.process('script-a', 'sha-a', ['a'], [1]),
+            batcher.process('script-b', 'sha-b', ['b'], [2]),
+        )
+
+        self.assertEqual(first, [1, 2, 60])
+        self.assertEqual(second, [1, 3, 60])
+        client.pipes[1].eval.assert_called_once_with('script-a', 1, 'a', 1)
+
+    async def test_per_call_errors_only_fail_that_call(self) -> None:
+        client = _pipeline_client([RuntimeError('WRONGTYPE'), [1, 3, 60]])
+        batcher = RateLimitBatcher(lambda: client, max_queue_time=0)
+
+        first, second = await asyncio.gather(
+            batcher.process('script', 'sha', ['a'], []),
+            batcher.process('script', 'sha', ['b'], []),
+            return_exceptions=True,
+        )
+
+        self.assertIsInstance(first, RuntimeError)
+        self.assertEqual(second, [1, 3, 60])
+
+    async def test_pipeline_failure_fails_every_pending_call(self) -> None:
+        def unavailable() -> Any:
+            raise RuntimeError('Redis client is not available')
+
+        batcher = RateLimitBatcher(unavailable, max_queue_time=0)
+
+        results = await asyncio.gather(
+            batcher.process('script', 'sha', ['a'], []),
+            batcher.process('script', 'sha', ['b'], []),
+            return_exceptions=True,
+        )
+
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+
+    async def test_middleware_routes_scripts_through_batcher_when_enabled(self) -> None:
+        mw = RateLimitMiddleware(max_requests=5, window_seconds=60, redis_batch_window=0.001)
+        with patch('app.middleware.rate_limit.redis_manager') as mock_redis:
+            client = _pipeline_client([[1, 4, 60]])
+            mock_redis.get_client.return_value = client
+
+            allowed, remaining, _ = await mw._sliding_window_redis('rk', 1000)
+
+        self.assertTrue(allowed)
+        self.assertEqual(remaining, 4)
+        client.evalsha.assert_not_called()
+
+    def test_batching_disabled_by_default(self) -> None:
+        self.assertIsNone(RateLimitMiddleware(max_requests=5)._batcher)
+
+    def test_topic_limiters_share_parent_batcher(self) -> None:
+        mw = TopicRateLimitMiddleware(topic_limits={'devices/*': {'max_requests': 5}}, redis_batch_window=0.001)
+        matched = mw._match_topic_middleware('devices/abc')
+        assert matched is not None
+        self.assertIsNotNone(mw._batcher)
+        self.assertIs(matched._batcher, mw._batcher)
 
 
 class TopicRateLimitMiddlewareTests(unittest.IsolatedAsyncioTestCase):
@@ -384,9 +711,35 @@ class TopicRateLimitMiddlewareTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(mw.topic_limits, {'devices/+/status': {'max_requests': 50, 'window_seconds': 30}})
 
     def test_pattern_matches_uses_fnmatch_wildcards(self) -> None:
-        mw = TopicRateLimitMiddleware()
-        self.assertTrue(mw._topic_matches_pattern('devices/abc/status', 'devices/*/status'))
-        self.assertFalse(mw._topic_matches_pattern('users/abc/status', 'devices/*/status'))
+        mw = TopicRateLimitMiddleware(topic_limits={'devices/*/status': {'max_requests': 5}})
+        matched = mw._match_topic_middleware('devices/abc/status')
+        assert matched is not None
+        self.assertEqual(matched.max_requests, 5)
+        self.assertIsNone(mw._match_topic_middleware('users/abc/status'))
+
+    def test_first_matching_pattern_wins(self) -> None:
+        mw = TopicRateLimitMiddleware(
+            topic_limits={'devices/abc': {'max_requests': 5}, 'devices/*': {'max_requests': 50}}
+        )
+        specific = mw._match_topic_middleware('devices/abc')
+        broad = mw._match_topic_middleware('devices/xyz')
+        assert specific is not None and broad is not None
+        self.assertEqual(specific.max_requests, 5)
+        self.assertEqual(broad.max_requests, 50)
+
+    def test_topic_middleware_inherits_unset_options(self) -> None:
+        mw = TopicRateLimitMiddleware(
+            topic_limits={'devices/*': {'window_seconds': 10}},
+            default_limit={'max_requests': 100, 'window_seconds': 60},
+            strategy='fixed_window',
+            redis_key_prefix='custom',
+        )
+        matched = mw._match_topic_middleware('devices/abc')
+        assert matched is not None
+        self.assertEqual(matched.max_requests, 100)
+        self.assertEqual(matched.window_seconds, 10)
+        self.assertEqual(matched.strategy, 'fixed_window')
+        self.assertEqual(matched.redis_key_prefix, 'custom')
 
     async def test_handle_falls_through_to_default_when_no_match(self) -> None:
         mw = TopicRateLimitMiddleware(default_limit={'max_requests': 10, 'window_seconds': 60})
@@ -412,6 +765,20 @@ class TopicRateLimitMiddlewareTests(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(result, 'topic-specific')
 
+    async def test_topic_limiter_memory_persists_across_messages(self) -> None:
+        mw = TopicRateLimitMiddleware(
+            topic_limits={'devices/*': {'max_requests': 1, 'window_seconds': 60}},
+            default_limit={'max_requests': 100, 'window_seconds': 60},
+        )
+        next_handler = AsyncMock(return_value='ok')
+
+        with patch('app.middleware.rate_limit.redis_manager.is_enabled', return_value=False):
+            first = await mw.handle({'topic': 'devices/abc'}, next_handler)
+            second = await mw.handle({'topic': 'devices/abc'}, next_handler)
+
+        self.assertEqual(first, 'ok')
+        self.assertEqual(second['error'], 'rate_limit_exceeded')
+
 
 class ClientRateLimitMiddlewareTests(unittest.TestCase):
     def test_uses_client_id_field(self) -> None:
@@ -438,6 +805,11 @@ class ClientRateLimitMiddlewareTests(unittest.TestCase):
         ctx = {'payload': b'binary-blob', 'topic': 'binary/topic'}
         self.assertEqual(mw._default_key_generator(ctx), 'topic:binary/topic')
 
+    def test_key_generator_handles_missing_payload_and_text_payload(self) -> None:
+        mw = ClientRateLimitMiddleware(max_requests=10, client_id_field='device_id')
+        self.assertEqual(mw._default_key_generator({'device_id': 'ctx-id'}), 'client:ctx-id')
+        self.assertEqual(mw._default_key_generator({'payload': 'plain text'}), 'topic:unknown')
+
 
 if __name__ == '__main__':
     unittest.main()
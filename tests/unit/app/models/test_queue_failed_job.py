@@ -1,10 +1,10 @@
 import unittest
 
-from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy import BigInteger, Integer, String, create_engine, insert, select
 
 from app.models.queue_failed_job import QueueFailedJob
 from routemq.model import Model
-from routemq.queue.models import QueueFailedJob as CoreQueueFailedJob
+from routemq.queue.models import CompressedText, QueueFailedJob as CoreQueueFailedJob, epoch_ms
 
 
 class TestAppQueueFailedJobModel(unittest.TestCase):
@@ -40,8 +40,30 @@ class TestAppQueueFailedJobModel(unittest.TestCase):
 
         self.assertIsInstance(columns['id'].type, Integer)
         self.assertIsInstance(columns['connection'].type, String)
-        self.assertIsInstance(columns['payload'].type, Text)
-        self.assertIsInstance(columns['failed_at'].type, DateTime)
+        self.assertIsInstance(columns['payload'].type, CompressedText)
+        self.assertIsInstance(columns['failed_at'].type, BigInteger)
+        self.assertIsInstance(columns['exception'].type, CompressedText)
+
+    def test_failed_job_failed_at_is_filled_by_database(self) -> None:
+        """Bulk failed-job inserts may omit failed_at; the database supplies epoch milliseconds."""
+        engine = create_engine('sqlite://')
+        QueueFailedJob.__table__.create(engine)
+        before = epoch_ms()
+        with engine.begin() as connection:
+            connection.execute(
+                insert(QueueFailedJob.__table__),
+                [{'connection': 'database', 'queue': 'q', 'payload': 'p', 'exception': 'boom'}] * 2,
+            )
+            failed_at = [row.failed_at for row in connection.execute(select(QueueFailedJob.__table__))]
+
+        self.assertEqual(len(failed_at), 2)
+        for value in failed_at:
+            self.assertLessEqual(abs(value - before), 5_000)
+
+    def test_failed_job_failed_at_is_indexed(self) -> None:
+        """Cleanup queries by failed_at use a dedicated index."""
+        indexes = {index.name: index for index in QueueFailedJob.__table__.indexes}
+        self.assertEqual([column.name for column in indexes['queue_failed_jobs_failed_at_idx'].columns], ['failed_at'])
 
 
 EXPECTED_FAILED_JOB_COLUMNS = {'id', 'connection', 'queue', 'payload', 'exception', 'failed_at'}
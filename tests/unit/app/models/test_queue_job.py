@@ -1,10 +1,10 @@
 import unittest
 
-from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy import BigInteger, Integer, String
 
 from app.models.queue_job import QueueJob
 from routemq.model import Model
-from routemq.queue.models import QueueJob as CoreQueueJob
+from routemq.queue.models import CompressedText, QueueJob as CoreQueueJob
 
 
 class TestAppQueueJobModel(unittest.TestCase):
@@ -38,10 +38,57 @@ class TestAppQueueJobModel(unittest.TestCase):
         """Column SQL types remain compatible with serialized jobs."""
         columns = QueueJob.__table__.columns
 
-        self.assertIsInstance(columns['payload'].type, Text)
+        self.assertIsInstance(columns['payload'].type, CompressedText)
         self.assertIsInstance(columns['attempts'].type, Integer)
         self.assertIsInstance(columns['queue'].type, String)
-        self.assertIsInstance(columns['available_at'].type, DateTime)
+        for name in ('reserved_at', 'available_at', 'created_at'):
+            self.assertIsInstance(columns[name].type, BigInteger)
+
+    def test_queue_job_dequeue_index_covers_pop_filters(self) -> None:
+        """pop() filters on queue, reserved_at and available_at and orders by id through one index."""
+        indexes = {index.name: index for index in QueueJob.__table__.indexes}
+
+        self.assertEqual(
+            [column.name for column in indexes['queue_jobs_dequeue_idx'].columns],
+            ['queue', 'reserved_at', 'available_at', 'id'],
+        )
+        self.assertFalse(QueueJob.__table__.columns['queue'].index)
+        pending = indexes['queue_jobs_pending_idx']
+        self.assertEqual(str(pending.dialect_options['postgresql']['where']), 'reserved_at IS NULL')
+
+
+class TestCompressedText(unittest.TestCase):
+    def setUp(self) -> None:
+        self.column_type = CompressedText()
+
+    def round_trip(self, value: str) -> tuple[bytes, str]:
+        stored = self.column_type.process_bind_param(value, None)
+        return stored, self.column_type.process_result_value(stored, None)
+
+    def test_large_payload_is_compressed(self) -> None:
+        """Repetitive job payloads are stored zlib-compressed and read back unchanged."""
+        payload = '{"class": "app.jobs.example_email_job.SendEmailJob", "data": {}}' * 20
+        stored, loaded = self.round_trip(payload)
+
+        self.assertTrue(stored.startswith(CompressedText.ZLIB))
+        self.assertLess(len(stored), len(payload) // 3)
+        self.assertEqual(loaded, payload)
+
+    def test_small_payload_is_stored_raw(self) -> None:
+        """Short values skip compression but keep the marker byte."""
+        stored, loaded = self.round_trip('{"a": "ü"}')
+
+        self.assertEqual(stored, CompressedText.RAW + '{"a": "ü"}'.encode('utf-8'))
+        self.assertEqual(loaded, '{"a": "ü"}')
+
+    def test_unmarked_legacy_bytes_are_read_as_utf8(self) -> None:
+        """Rows converted from the old TEXT column load without a marker byte."""
+        self.assertEqual(self.column_type.process_result_value(b'{"class": "x"}', None), '{"class": "x"}')
+        self.assertEqual(self.column_type.process_result_value('{"class": "x"}', None), '{"class": "x"}')
+
+    def test_none_passes_through(self) -> None:
+        self.assertIsNone(self.column_type.process_bind_param(None, None))
+        self.assertIsNone(self.column_type.process_result_value(None, None))
 
 
 EXPECTED_QUEUE_JOB_COLUMNS = {'id', 'queue', 'payload', 'attempts', 'reserved_at', 'available_at', 'created_at'}
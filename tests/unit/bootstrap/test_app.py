@@ -1,24 +1,43 @@
+import asyncio
 import logging
 import logging.handlers
 import os
 import tempfile
 import unittest
+from collections import deque
 from importlib.metadata import PackageNotFoundError
 from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from bootstrap.app import Application, _combine_metrics_payloads, _without_openmetrics_eof
+from bootstrap.app import (
+    Application,
+    _IngressQueue,
+    _combine_metrics_payloads,
+    _load_env_file,
+    _without_openmetrics_eof,
+)
+from routemq import logging_config
 from routemq.health import HealthStatus
+from routemq.logging_config import stop_async_logging
 from routemq.metrics import MetricsRegistry
 from routemq.settings import (
     DatabaseConnectionSettings,
     DatabasePoolSettings,
     MetricsHttpSettings,
     load_metrics_http_settings,
+    load_mqtt_settings,
 )
 
 
+def _runner_for(loop: Any) -> MagicMock:
+    """asyncio.Runner stand-in that hands out ``loop``."""
+    runner = MagicMock(name='runner')
+    runner.__enter__.return_value = runner
+    runner.get_loop.return_value = loop
+    return runner
+
+
 class TestApplicationInitialization(unittest.TestCase):
     def test_constructor_uses_supplied_router_and_disables_services(self) -> None:
         """Constructor honors explicit router and service env gates."""
@@ -28,9 +47,7 @@ class TestApplicationInitialization(unittest.TestCase):
             patch.object(Application, 'print_banner') as print_banner,
             patch.object(Application, '_setup_logging', lambda app, **_: setattr(app, 'logger', MagicMock())),
             patch.object(Application, '_setup_database') as setup_database,
-            patch('bootstrap.app.load_dotenv') as load_dotenv,
-            patch('bootstrap.app.asyncio.new_event_loop', return_value=MagicMock(name='loop')),
-            patch('bootstrap.app.asyncio.set_event_loop'),
+            patch('bootstrap.app._load_env_file') as load_env_file,
             patch('bootstrap.app.WorkerManager') as worker_manager,
             patch.dict(
                 os.environ,
@@ -41,8 +58,9 @@ class TestApplicationInitialization(unittest.TestCase):
             app = Application(router=router, env_file='custom.env', router_directory='custom.routers')
 
         self.assertIs(app.router, router)
+        self.assertIsNone(app.loop)
         print_banner.assert_called_once_with()
-        load_dotenv.assert_called_once_with('custom.env')
+        load_env_file.assert_called_once_with('custom.env')
         setup_database.assert_not_called()
         worker_manager.assert_called_once_with(router, 'mqtt_framework_group', 'custom.routers')
 
@@ -54,8 +72,6 @@ class TestApplicationInitialization(unittest.TestCase):
             patch.object(Application, 'print_banner') as print_banner,
             patch.object(Application, '_setup_logging', lambda app, **_: setattr(app, 'logger', MagicMock())),
             patch.object(Application, '_setup_database') as setup_database,
-            patch('bootstrap.app.asyncio.new_event_loop', return_value=MagicMock()),
-            patch('bootstrap.app.asyncio.set_event_loop'),
             patch('bootstrap.app.WorkerManager'),
             patch.dict(os.environ, {'ENABLE_MYSQL': 'false', 'ENABLE_REDIS': 'false'}, clear=True),
         ):
@@ -72,8 +88,6 @@ class TestApplicationInitialization(unittest.TestCase):
             patch.object(Application, 'print_banner') as print_banner,
             patch.object(Application, '_setup_logging', lambda app, **_: setattr(app, 'logger', MagicMock())),
             patch.object(Application, '_setup_database') as setup_database,
-            patch('bootstrap.app.asyncio.new_event_loop', return_value=MagicMock()),
-            patch('bootstrap.app.asyncio.set_event_loop'),
             patch('bootstrap.app.WorkerManager'),
             patch.dict(
                 os.environ,
@@ -94,8 +108,6 @@ class TestApplicationInitialization(unittest.TestCase):
             patch.object(Application, 'print_banner'),
             patch.object(Application, '_setup_logging', autospec=True) as setup_logging,
             patch.object(Application, '_setup_database') as setup_database,
-            patch('bootstrap.app.asyncio.new_event_loop', return_value=MagicMock()),
-            patch('bootstrap.app.asyncio.set_event_loop'),
             patch('bootstrap.app.WorkerManager'),
             patch.dict(os.environ, {'ENABLE_MYSQL': 'false', 'ENABLE_REDIS': 'false'}, clear=True),
         ):
@@ -111,8 +123,6 @@ class TestApplicationInitialization(unittest.TestCase):
             patch.object(Application, 'print_banner'),
             patch.object(Application, '_setup_logging', lambda app, **_: setattr(app, 'logger', MagicMock())),
             patch.object(Application, '_setup_database') as setup_database,
-            patch('bootstrap.app.asyncio.new_event_loop', return_value=MagicMock()),
-            patch('bootstrap.app.asyncio.set_event_loop'),
             patch('bootstrap.app.WorkerManager'),
             patch.dict(os.environ, {'ENABLE_MYSQL': 'true', 'ENABLE_REDIS': 'false'}, clear=True),
         ):
@@ -126,8 +136,6 @@ class TestApplicationInitialization(unittest.TestCase):
             patch.object(Application, 'print_banner'),
             patch.object(Application, '_setup_logging', lambda app, **_: setattr(app, 'logger', MagicMock())),
             patch.object(Application, '_setup_database'),
-            patch('bootstrap.app.asyncio.new_event_loop', return_value=MagicMock()),
-            patch('bootstrap.app.asyncio.set_event_loop'),
             patch('bootstrap.app.WorkerManager'),
             patch.dict(os.environ, {'ENABLE_MYSQL': 'false', 'ENABLE_REDIS': 'true'}, clear=True),
         ):
@@ -136,7 +144,50 @@ class TestApplicationInitialization(unittest.TestCase):
         self.assertTrue(app.redis_enabled)
 
 
+class TestLoadEnvFile(unittest.TestCase):
+    def test_env_file_is_parsed_once_until_it_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            env_path = Path(tmp) / '.env'
+            env_path.write_text('ROUTEMQ_TEST_A=one\n', encoding='utf-8')
+
+            with (
+                patch.dict(os.environ, {}, clear=True),
+                patch('bootstrap.app.dotenv_values', return_value={'ROUTEMQ_TEST_A': 'one'}) as parse,
+            ):
+                _load_env_file(str(env_path))
+                _load_env_file(str(env_path))
+                self.assertEqual(os.environ['ROUTEMQ_TEST_A'], 'one')
+
+            parse.assert_called_once_with(str(env_path))
+
+            env_path.write_text('ROUTEMQ_TEST_A=two\n', encoding='utf-8')
+            os.utime(env_path, (0, 0))
+            with patch.dict(os.environ, {}, clear=True):
+                _load_env_file(str(env_path))
+                self.assertEqual(os.environ['ROUTEMQ_TEST_A'], 'two')
+
+    def test_existing_environment_wins_over_env_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            env_path = Path(tmp) / '.env'
+            env_path.write_text('ROUTEMQ_TEST_B=file\nROUTEMQ_TEST_C=file\n', encoding='utf-8')
+
+            with patch.dict(os.environ, {'ROUTEMQ_TEST_B': 'env'}, clear=True):
+                _load_env_file(str(env_path))
+                self.assertEqual(os.environ['ROUTEMQ_TEST_B'], 'env')
+                self.assertEqual(os.environ['ROUTEMQ_TEST_C'], 'file')
+
+    def test_missing_env_file_falls_back_to_load_dotenv(self) -> None:
+        with patch('bootstrap.app.load_dotenv') as load_dotenv:
+            _load_env_file('does-not-exist.env')
+
+        load_dotenv.assert_called_once_with('does-not-exist.env')
+
+
 class TestApplicationBanner(unittest.TestCase):
+    def setUp(self) -> None:
+        Application.get_version.cache_clear()
+        self.addCleanup(Application.get_version.cache_clear)
+
     def test_get_version_reads_installed_package_version(self) -> None:
         """Version source is the installed routemq distribution metadata."""
         with patch('importlib.metadata.version', return_value='9.8.7') as version:
@@ -152,6 +203,14 @@ class TestApplicationBanner(unittest.TestCase):
 
         self.assertEqual(version, '0.0.0+dev')
 
+    def test_get_version_reads_metadata_once(self) -> None:
+        """Repeated banner and tinker calls reuse the first metadata lookup."""
+        with patch('importlib.metadata.version', return_value='9.8.7') as version:
+            Application.get_version()
+            Application.get_version()
+
+        version.assert_called_once_with('routemq')
+
     def test_print_banner_includes_version_and_system_info(self) -> None:
         """Banner output keeps version and runtime facts visible."""
         memory = MagicMock(total=2 * 1024**3)
@@ -206,8 +265,29 @@ class TestApplicationLogging(unittest.TestCase):
             ):
                 app._setup_logging(log_to_console=False)
 
+            listener = logging_config._queue_listener
+            stop_async_logging()
+
+        handlers = basic_config.call_args.kwargs['handlers']
+        self.assertEqual(len(handlers), 1)
+        self.assertIsInstance(handlers[0], logging.handlers.QueueHandler)
+        assert listener is not None
+        self.assertFalse(any(type(handler) is logging.StreamHandler for handler in listener.handlers))
+        self.assertTrue(any(isinstance(h, logging.handlers.RotatingFileHandler) for h in listener.handlers))
+
+    def test_setup_logging_keeps_file_handler_inline_when_log_async_disabled(self) -> None:
+        """LOG_ASYNC=false opts file logging out of the listener thread."""
+        app = object.__new__(Application)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = str(Path(tmpdir) / 'app.log')
+            with (
+                patch('routemq.logging_config.logging.basicConfig') as basic_config,
+                patch.dict(os.environ, {'LOG_FILE': log_file, 'LOG_TO_FILE': 'true', 'LOG_ASYNC': 'false'}, clear=True),
+            ):
+                app._setup_logging(log_to_console=False)
+
         handlers = basic_config.call_args.kwargs['handlers']
-        self.assertFalse(any(type(handler) is logging.StreamHandler for handler in handlers))
         self.assertTrue(any(isinstance(handler, logging.handlers.RotatingFileHandler) for handler in handlers))
         for handler in handlers:
             handler.close()
@@ -241,10 +321,9 @@ class TestApplicationLogging(unittest.TestCase):
                 ),
             ):
                 app._setup_logging()
+            stop_async_logging()
 
         self.assertEqual(logging.getLogger('RouteMQ.Application').name, app.logger.name)
-        for handler in basic_config.call_args.kwargs['handlers']:
-            handler.close()
 
 
 class TestApplicationMetrics(unittest.TestCase):
@@ -260,8 +339,6 @@ class TestApplicationMetrics(unittest.TestCase):
             patch.object(Application, '_setup_metrics'),
             patch('bootstrap.app.MetricsRegistry', return_value=registry) as registry_cls,
             patch('bootstrap.app.install_default_hooks', return_value=hook_handle) as install_hooks,
-            patch('bootstrap.app.asyncio.new_event_loop', return_value=MagicMock()),
-            patch('bootstrap.app.asyncio.set_event_loop'),
             patch('bootstrap.app.WorkerManager'),
             patch.dict(
                 os.environ,
@@ -397,15 +474,15 @@ class TestApplicationMetrics(unittest.TestCase):
         app.redis_enabled = False
         app.tsdb_enabled = False
         app.start_workers = MagicMock()
-        app.initialize_database = MagicMock(return_value=None)
-        app.initialize_redis = MagicMock(return_value=None)
-        app.initialize_tsdb = MagicMock(return_value=None)
-        app.initialize_telemetry = MagicMock(return_value=None)
+        app._initialize_connections = MagicMock(return_value=None)
         app.health_status = HealthStatus()
         app.health_server = MagicMock(name='health_server')
         app.metrics_health_server = MagicMock(name='metrics_health_server')
+        app._start_ingress = MagicMock()
+        app._stop_ingress = MagicMock()
 
-        app.run()
+        with patch('bootstrap.app.asyncio.Runner', return_value=_runner_for(app.loop)):
+            app.run()
 
         app.health_server.start.assert_called_once_with()
         app.metrics_health_server.start.assert_called_once_with()
@@ -605,9 +682,44 @@ class TestApplicationMqtt(unittest.TestCase):
             app.connect()
 
         client_class.assert_called_once_with(client_id='client')
-        fake_client.connect.assert_called_once_with('broker', 1884)
+        fake_client.connect.assert_called_once_with('broker', 1884, keepalive=60)
         self.assertEqual(fake_client.on_message, app._on_message)
 
+    def test_connect_reuses_settings_loaded_at_startup(self) -> None:
+        """connect() reads the MQTT settings parsed in __init__ instead of the live environment."""
+        app = object.__new__(Application)
+        app.logger = MagicMock()
+        app.mqtt_settings = load_mqtt_settings({'MQTT_BROKER': 'cached', 'MQTT_CLIENT_ID': 'cached-client'})
+        fake_client = MagicMock(name='mqtt_client')
+
+        with (
+            patch('routemq.mqtt_utils.mqtt_client.Client', return_value=fake_client) as client_class,
+            patch.dict(os.environ, {'MQTT_BROKER': 'live', 'MQTT_CLIENT_ID': 'live-client'}, clear=True),
+        ):
+            app.connect()
+
+        client_class.assert_called_once_with(client_id='cached-client')
+        fake_client.connect.assert_called_once_with('cached', 1883, keepalive=60)
+
+    def test_connect_opens_publisher_pool_when_configured(self) -> None:
+        """MQTT_PUB_POOL adds publish-only connections next to the main client."""
+        app = object.__new__(Application)
+        app.logger = MagicMock()
+        app.mqtt_settings = load_mqtt_settings({'MQTT_CLIENT_ID': 'client', 'MQTT_PUB_POOL': '2'})
+        clients = [MagicMock(name=f'mqtt_client_{index}') for index in range(3)]
+
+        with patch('routemq.mqtt_utils.mqtt_client.Client', side_effect=clients) as client_class:
+            app.connect()
+
+        self.assertEqual(
+            [item.kwargs['client_id'] for item in client_class.call_args_list],
+            ['client', 'client-pub-0', 'client-pub-1'],
+        )
+        self.assertIs(app.publisher.client, clients[0])
+        self.assertEqual(app.publisher.publishers, clients[1:])
+        for client in clients:
+            client.connect.assert_called_once_with('localhost', 1883, keepalive=60)
+
     def test_connect_sets_credentials_when_both_are_present(self) -> None:
         """MQTT credentials are applied only when username and password exist."""
         app = object.__new__(Application)
@@ -622,65 +734,54 @@ class TestApplicationMqtt(unittest.TestCase):
 
         fake_client.username_pw_set.assert_called_once_with('user', 'pass')
 
-    def test_on_message_dispatches_decoded_json_to_router_loop(self) -> None:
-        """MQTT messages bridge into router.dispatch on the application loop."""
+    def test_on_message_hands_message_to_router_loop(self) -> None:
+        """The Paho callback only schedules the message onto the application loop."""
         app = object.__new__(Application)
         app.logger = MagicMock()
         app.loop = MagicMock(name='loop')
         app.router = MagicMock(name='router')
-        app.router.dispatch.return_value = MagicMock(name='coroutine')
+        app._ingress_pending = deque()
+        app._ingress_wakeup = False
         msg = MagicMock(topic='devices/1', payload=b'{"ok": true}')
         client = MagicMock(name='client')
 
-        with patch('bootstrap.app.asyncio.run_coroutine_threadsafe') as run_threadsafe:
-            app._on_message(client, None, msg)
+        app._on_message(client, None, msg)
 
         app.router.dispatch.assert_not_called()
-        run_threadsafe.assert_called_once()
-        coro, loop = run_threadsafe.call_args.args
-        self.assertIs(loop, app.loop)
-        coro.close()
+        app.loop.call_soon_threadsafe.assert_called_once_with(app._drain_ingress_pending)
+        self.assertEqual(list(app._ingress_pending), [(client, msg)])
 
-    def test_on_message_uses_raw_payload_when_json_decode_fails(self) -> None:
-        """Invalid JSON payloads are still dispatched as raw bytes."""
+    def test_on_message_wakes_loop_once_per_burst(self) -> None:
+        """Messages arriving before the loop drains share a single wakeup."""
         app = object.__new__(Application)
         app.logger = MagicMock()
-        app.loop = MagicMock()
-        app.router = MagicMock()
-        app.router.dispatch.return_value = MagicMock(name='coroutine')
-        msg = MagicMock(topic='raw/topic', payload=b'not-json')
+        app.loop = MagicMock(name='loop')
+        app._ingress = asyncio.Queue()
+        app._ingress_pending = deque()
+        app._ingress_wakeup = False
 
-        with patch('bootstrap.app.asyncio.run_coroutine_threadsafe') as run_threadsafe:
-            app._on_message(MagicMock(), None, msg)
+        for topic in ('a', 'b', 'c'):
+            app._on_message(MagicMock(), None, MagicMock(topic=topic))
+        app.loop.call_soon_threadsafe.assert_called_once_with(app._drain_ingress_pending)
 
-        app.router.dispatch.assert_not_called()
-        run_threadsafe.call_args.args[0].close()
+        app._drain_ingress_pending()
+        self.assertEqual([app._ingress.get_nowait()[1].topic for _ in range(3)], ['a', 'b', 'c'])
 
-    def test_on_message_uses_raw_payload_when_unicode_decode_fails(self) -> None:
-        """Non-UTF8 payloads are dispatched as their original bytes."""
-        app = object.__new__(Application)
-        app.logger = MagicMock()
-        app.loop = MagicMock()
-        app.router = MagicMock()
-        app.router.dispatch.return_value = MagicMock(name='coroutine')
-        msg = MagicMock(topic='raw/topic', payload=b'\xff\xfe binary')
-
-        with patch('bootstrap.app.asyncio.run_coroutine_threadsafe') as run_threadsafe:
-            app._on_message(MagicMock(), None, msg)
-
-        app.router.dispatch.assert_not_called()
-        run_threadsafe.call_args.args[0].close()
+        app._on_message(MagicMock(), None, MagicMock(topic='d'))
+        self.assertEqual(app.loop.call_soon_threadsafe.call_count, 2)
 
     def test_on_message_logs_and_lifecycles_scheduling_failure(self) -> None:
         """Scheduling failures emit a failed lifecycle before being swallowed by Paho."""
         app = object.__new__(Application)
         app.logger = logging.getLogger('RouteMQ.Application')
         app.loop = MagicMock(name='loop')
+        app.loop.call_soon_threadsafe.side_effect = RuntimeError('loop down')
         app.router = MagicMock(name='router')
+        app._ingress_pending = deque()
+        app._ingress_wakeup = False
         msg = MagicMock(topic='devices/1', payload=b'{}')
 
         with (
-            patch('bootstrap.app.asyncio.run_coroutine_threadsafe', side_effect=RuntimeError('loop down')),
             patch('bootstrap.app.observability.lifecycle') as lifecycle,
             self.assertLogs('RouteMQ.Application', level='ERROR') as logs,
         ):
@@ -692,6 +793,73 @@ class TestApplicationMqtt(unittest.TestCase):
         )
         self.assertIn('Error processing message on topic devices/1', logs.output[0])
         self.assertIsNotNone(logs.records[0].exc_info)
+        self.assertFalse(app._ingress_wakeup)
+
+    def test_enqueue_ingress_drops_and_lifecycles_when_full(self) -> None:
+        """A full ingress queue drops the message instead of blocking the loop."""
+        app = object.__new__(Application)
+        app.logger = logging.getLogger('RouteMQ.Application')
+        app._ingress = _IngressQueue(maxsize=1)
+        app._ingress_drop_oldest = False
+        app._ingress_dropped = 0
+        app._enqueue_ingress(MagicMock(), MagicMock(topic='devices/1'))
+        msg = MagicMock(topic='devices/2')
+
+        with (
+            patch('bootstrap.app.observability.lifecycle') as lifecycle,
+            self.assertLogs('RouteMQ.Application', level='WARNING') as logs,
+        ):
+            app._enqueue_ingress(MagicMock(), msg)
+
+        self.assertEqual(app._ingress.qsize(), 1)
+        lifecycle.assert_called_once_with(
+            'mqtt.message.failed',
+            {'process': 'main', 'error': 'QueueFull', 'mqtt_topic': 'devices/2'},
+        )
+        self.assertIn('ingress queue is full', logs.output[0])
+
+    def test_enqueue_ingress_drop_oldest_keeps_newest_message(self) -> None:
+        """drop_oldest evicts the longest-waiting message and logs only the first drop of a burst."""
+        app = object.__new__(Application)
+        app.logger = logging.getLogger('RouteMQ.Application')
+        app._ingress = _IngressQueue(maxsize=1)
+        app._ingress_drop_oldest = True
+        app._ingress_dropped = 0
+        app._enqueue_ingress(MagicMock(), MagicMock(topic='devices/1', qos=0))
+
+        with (
+            patch('bootstrap.app.observability.lifecycle') as lifecycle,
+            self.assertLogs('RouteMQ.Application', level='WARNING') as logs,
+        ):
+            app._enqueue_ingress(MagicMock(), MagicMock(topic='devices/2', qos=0))
+            app._enqueue_ingress(MagicMock(), MagicMock(topic='devices/3', qos=0))
+
+        self.assertEqual(app._ingress.get_nowait()[1].topic, 'devices/3')
+        self.assertEqual(
+            [item.args[1]['mqtt_topic'] for item in lifecycle.call_args_list],
+            ['devices/1', 'devices/2'],
+        )
+        self.assertEqual(len(logs.output), 1)
+        self.assertEqual(app._ingress_dropped, 2)
+
+    def test_enqueue_ingress_drop_oldest_never_evicts_acknowledged_qos1_message(self) -> None:
+        """drop_oldest falls back to dropping the arriving message when the oldest one is QoS 1/2."""
+        app = object.__new__(Application)
+        app.logger = logging.getLogger('RouteMQ.Application')
+        app._ingress = _IngressQueue(maxsize=1)
+        app._ingress_drop_oldest = True
+        app._ingress_dropped = 0
+        app._enqueue_ingress(MagicMock(), MagicMock(topic='devices/1', qos=1))
+
+        with (
+            patch('bootstrap.app.observability.lifecycle') as lifecycle,
+            self.assertLogs('RouteMQ.Application', level='WARNING'),
+        ):
+            app._enqueue_ingress(MagicMock(), MagicMock(topic='devices/2', qos=0))
+
+        self.assertEqual(app._ingress.get_nowait()[1].topic, 'devices/1')
+        self.assertEqual(lifecycle.call_args.args[1]['mqtt_topic'], 'devices/2')
+        self.assertEqual(app._ingress_dropped, 1)
 
     def test_run_drives_loop_lifecycle_and_cleanup(self) -> None:
         """Run uses the stored event loop and always stops client and workers."""
@@ -706,17 +874,26 @@ class TestApplicationMqtt(unittest.TestCase):
         app.redis_enabled = False
         app.tsdb_enabled = False
         app.start_workers = MagicMock()
-        app.initialize_database = MagicMock(return_value=None)
-        app.initialize_redis = MagicMock(return_value=None)
-        app.initialize_tsdb = MagicMock(return_value=None)
-        app.initialize_telemetry = MagicMock(return_value=None)
+        app._initialize_connections = MagicMock(return_value=None)
         app._cleanup_connections = MagicMock(return_value=None)
+        app._start_ingress = MagicMock()
+        app._stop_ingress = MagicMock()
         app.health_status = HealthStatus()
         app.health_server = None
 
-        app.run()
+        loop = app.loop
+        app.loop = None
+        with (
+            patch('bootstrap.app.loop_factory', return_value='factory'),
+            patch('bootstrap.app.asyncio.Runner', return_value=_runner_for(loop)) as runner_cls,
+        ):
+            app.run()
 
+        runner_cls.assert_called_once_with(loop_factory='factory')
+        self.assertIs(app.loop, loop)
         app.start_workers.assert_called_once_with()
+        app._start_ingress.assert_called_once_with()
+        app._stop_ingress.assert_called_once_with()
         app.client.loop_stop.assert_called_once_with()
         app.worker_manager.stop_workers.assert_called_once_with()
 
@@ -733,6 +910,16 @@ class TestApplicationMqtt(unittest.TestCase):
         self.assertTrue(app.health_status.shutting_down)
         app.loop.call_soon_threadsafe.assert_called_once_with(app.loop.stop)
 
+    def test_request_shutdown_before_run_has_no_loop_to_stop(self) -> None:
+        app = object.__new__(Application)
+        app.logger = MagicMock()
+        app.health_status = HealthStatus()
+        app.loop = None
+
+        app._request_shutdown(15, None)
+
+        self.assertTrue(app._shutdown_requested)
+
     def test_install_signal_handlers_logs_when_signal_install_fails(self) -> None:
         app = object.__new__(Application)
         app.logger = MagicMock()
@@ -750,6 +937,92 @@ class TestApplicationMqtt(unittest.TestCase):
             app._restore_signal_handlers({15: MagicMock(name='handler')})
 
 
+class TestApplicationIngress(unittest.IsolatedAsyncioTestCase):
+    async def test_process_message_dispatches_decoded_json_with_context(self) -> None:
+        """Consumers decode JSON and carry MQTT correlation context into dispatch."""
+        app = object.__new__(Application)
+        app.logger = MagicMock()
+        app._dispatch_mqtt_message = AsyncMock()
+        client = MagicMock(name='client')
+        msg = MagicMock(topic='devices/1', payload=b'{"ok": true}', mid=7, properties=None)
+
+        await app._process_mqtt_message(client, msg)
+
+        topic, payload, dispatch_client, context = app._dispatch_mqtt_message.await_args.args
+        self.assertEqual((topic, payload, dispatch_client), ('devices/1', {'ok': True}, client))
+        self.assertEqual(context['mqtt_topic'], 'devices/1')
+        self.assertEqual(context['messaging.message.id'], '7')
+
+    async def test_process_message_skips_debug_log_when_debug_disabled(self) -> None:
+        """The per-message debug record is not built unless DEBUG is enabled."""
+        app = object.__new__(Application)
+        app.logger = MagicMock()
+        app.logger.isEnabledFor.return_value = False
+        app._dispatch_mqtt_message = AsyncMock()
+
+        await app._process_mqtt_message(MagicMock(), MagicMock(topic='t', payload=b'{}', mid=None))
+
+        app.logger.isEnabledFor.assert_called_once_with(logging.DEBUG)
+        app.logger.debug.assert_not_called()
+
+    async def test_process_message_uses_raw_payload_when_json_decode_fails(self) -> None:
+        """Invalid JSON and non-UTF8 payloads are still dispatched as raw bytes."""
+        app = object.__new__(Application)
+        app.logger = MagicMock()
+        app._dispatch_mqtt_message = AsyncMock()
+
+        for raw in (b'not-json', b'\xff\xfe binary'):
+            with self.subTest(raw=raw):
+                await app._process_mqtt_message(MagicMock(), MagicMock(topic='raw/topic', payload=raw, mid=None))
+                self.assertEqual(app._dispatch_mqtt_message.await_args.args[1], raw)
+
+    async def test_consumers_dispatch_queued_messages_and_survive_failures(self) -> None:
+        """A failing message is logged and the consumer keeps draining the queue."""
+        app = object.__new__(Application)
+        app.logger = MagicMock()
+        app.loop = asyncio.get_running_loop()
+        seen: list[str] = []
+
+        async def dispatch(topic, payload, client, context):
+            seen.append(topic)
+            if topic == 'bad':
+                raise RuntimeError('handler failed')
+
+        app._dispatch_mqtt_message = dispatch
+        with patch('bootstrap.app.get_mqtt_ingress_config', return_value=MagicMock(queue_size=10, consumers=2)):
+            app._start_ingress()
+        for topic in ('bad', 'good'):
+            app._enqueue_ingress(MagicMock(), MagicMock(topic=topic, payload=b'{}', mid=None))
+
+        await asyncio.wait_for(app._ingress.join(), timeout=1)
+
+        self.assertEqual(sorted(seen), ['bad', 'good'])
+        app.logger.error.assert_called_once()
+        self.assertEqual(len(app._ingress_consumers), 2)
+        for task in app._ingress_consumers:
+            task.cancel()
+        await asyncio.gather(*app._ingress_consumers, return_exceptions=True)
+
+
+class TestApplicationIngressShutdown(unittest.TestCase):
+    def test_stop_ingress_cancels_consumers(self) -> None:
+        """Shutdown cancels every consumer and reports discarded messages."""
+        app = object.__new__(Application)
+        app.logger = MagicMock()
+        app.loop = asyncio.new_event_loop()
+        self.addCleanup(app.loop.close)
+        with patch('bootstrap.app.get_mqtt_ingress_config', return_value=MagicMock(queue_size=10, consumers=3)):
+            app._start_ingress()
+        consumers = list(app._ingress_consumers)
+        app._ingress.put_nowait((MagicMock(), MagicMock(topic='late')))
+
+        app._stop_ingress()
+
+        self.assertTrue(all(task.cancelled() for task in consumers))
+        self.assertEqual(app._ingress_consumers, [])
+        app.logger.warning.assert_called_once_with('Discarded 1 queued MQTT message(s) during shutdown')
+
+
 class MetricsPayloadHelperTests(unittest.TestCase):
     def test_combine_metrics_payloads_for_text_adds_separator_when_needed(self) -> None:
         self.assertEqual(_combine_metrics_payloads(b'prom 1', b'std 2\n', openmetrics=False), b'prom 1\nstd 2\n')
@@ -1,15 +1,31 @@
+import asyncio
 import logging
 import os
 import unittest
+from collections import deque
 from importlib.metadata import PackageNotFoundError
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from bootstrap.app import Application
 from routemq.health import HealthStatus
+from routemq.logging_config import stop_async_logging
 from routemq.settings import DatabaseConnectionSettings
 
 
+def _runner_for(loop: Any) -> MagicMock:
+    """asyncio.Runner stand-in that hands out ``loop``."""
+    runner = MagicMock(name='runner')
+    runner.__enter__.return_value = runner
+    runner.get_loop.return_value = loop
+    return runner
+
+
 class GetVersionExceptionPathTests(unittest.TestCase):
+    def setUp(self) -> None:
+        Application.get_version.cache_clear()
+        self.addCleanup(Application.get_version.cache_clear)
+
     def test_returns_dev_sentinel_when_package_metadata_missing(self) -> None:
         with patch('importlib.metadata.version', side_effect=PackageNotFoundError):
             self.assertEqual(Application.get_version(), '0.0.0+dev')
@@ -27,8 +43,6 @@ class ConstructorRouterAutoLoadTests(unittest.TestCase):
             patch.object(Application, '_setup_logging', lambda app, **_: setattr(app, 'logger', MagicMock())),
             patch.object(Application, '_setup_database'),
             patch('bootstrap.app.RouterRegistry') as registry_cls,
-            patch('bootstrap.app.asyncio.new_event_loop', return_value=MagicMock()),
-            patch('bootstrap.app.asyncio.set_event_loop'),
             patch('bootstrap.app.WorkerManager'),
             patch.dict(os.environ, {'ENABLE_MYSQL': 'false', 'ENABLE_REDIS': 'false'}, clear=True),
         ):
@@ -45,8 +59,6 @@ class ConstructorRouterAutoLoadTests(unittest.TestCase):
             patch.object(Application, '_setup_logging', lambda app, **_: setattr(app, 'logger', MagicMock())),
             patch.object(Application, '_setup_database'),
             patch('bootstrap.app.RouterRegistry', side_effect=RuntimeError('registry boom')),
-            patch('bootstrap.app.asyncio.new_event_loop', return_value=MagicMock()),
-            patch('bootstrap.app.asyncio.set_event_loop'),
             patch('bootstrap.app.WorkerManager'),
             patch.dict(os.environ, {'ENABLE_MYSQL': 'false', 'ENABLE_REDIS': 'false'}, clear=True),
         ):
@@ -80,10 +92,9 @@ class SetupLoggingExtraPathsTests(unittest.TestCase):
         ):
             path_cls.return_value.parent.mkdir = MagicMock()
             app._setup_logging()
+        stop_async_logging()
 
         self.assertEqual(app.logger.name, 'RouteMQ.Application')
-        for handler in basic_config.call_args.kwargs['handlers']:
-            handler.close()
 
     def test_setup_logging_file_handler_failure_falls_back(self) -> None:
         app = object.__new__(Application)
@@ -172,6 +183,40 @@ class ConnectionsEnabledTests(unittest.IsolatedAsyncioTestCase):
         app.initialize_tsdb.assert_awaited_once()
         app.initialize_telemetry.assert_awaited_once()
 
+    async def test_initialize_connections_runs_initializers_concurrently(self) -> None:
+        app = object.__new__(Application)
+        started: list[str] = []
+        release = asyncio.Event()
+        both_started = asyncio.Event()
+
+        async def blocking(name: str) -> None:
+            started.append(name)
+            if len(started) == 2:
+                both_started.set()
+            await release.wait()
+
+        app.initialize_database = lambda: blocking('database')
+        app.initialize_redis = lambda: blocking('redis')
+        app.initialize_tsdb = AsyncMock()
+        app.initialize_telemetry = AsyncMock()
+
+        task = asyncio.create_task(app._initialize_connections())
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        self.assertEqual(started, ['database', 'redis'])
+        release.set()
+        await task
+
+    async def test_initialize_connections_raises_after_all_initializers_settle(self) -> None:
+        app = object.__new__(Application)
+        app.initialize_database = AsyncMock(side_effect=RuntimeError('db down'))
+        app.initialize_redis = AsyncMock()
+        app.initialize_tsdb = AsyncMock()
+        app.initialize_telemetry = AsyncMock()
+
+        with self.assertRaisesRegex(RuntimeError, 'db down'):
+            await app._initialize_connections()
+        app.initialize_telemetry.assert_awaited_once()
+
     async def test_cleanup_connections_disconnects_redis_and_model_when_enabled(self) -> None:
         app = object.__new__(Application)
         app.redis_enabled = True
@@ -194,6 +239,7 @@ class OnConnectTests(unittest.TestCase):
     def test_on_connect_subscribes_to_non_shared_routes(self) -> None:
         app = object.__new__(Application)
         app.logger = MagicMock()
+        app._nonshared_subs = None
         route_shared = MagicMock(shared=True)
         route_normal = MagicMock(shared=False, qos=1)
         route_normal.get_subscription_topic.return_value = 'devices/+/status'
@@ -202,12 +248,60 @@ class OnConnectTests(unittest.TestCase):
 
         app._on_connect(client, None, None, 0)
 
-        client.subscribe.assert_called_once_with('devices/+/status', 1)
+        client.subscribe.assert_called_once_with([('devices/+/status', 1)])
+
+    def test_on_connect_reuses_subscription_list_until_routes_change(self) -> None:
+        app = object.__new__(Application)
+        app.logger = MagicMock()
+        app._nonshared_subs = None
+        route_a = MagicMock(shared=False, qos=0)
+        route_a.get_subscription_topic.return_value = 'a/+'
+        app.router = MagicMock(routes=[route_a])
+        client = MagicMock()
+
+        app._on_connect(client, None, None, 0)
+        app._on_connect(client, None, None, 0)
+        route_b = MagicMock(shared=False, qos=2)
+        route_b.get_subscription_topic.return_value = 'b/#'
+        app.router.routes.append(route_b)
+        app._on_connect(client, None, None, 0)
+
+        self.assertEqual(route_a.get_subscription_topic.call_count, 2)
+        self.assertEqual(client.subscribe.call_args.args[0], [('a/+', 0), ('b/#', 2)])
+
+    def test_on_connect_rebuilds_subscriptions_when_routes_are_replaced(self) -> None:
+        app = object.__new__(Application)
+        app.logger = MagicMock()
+        app._nonshared_subs = None
+        route_a = MagicMock(shared=False, qos=0)
+        route_a.get_subscription_topic.return_value = 'a/+'
+        route_b = MagicMock(shared=False, qos=1)
+        route_b.get_subscription_topic.return_value = 'b/+'
+        app.router = MagicMock(routes=[route_a])
+        client = MagicMock()
+
+        app._on_connect(client, None, None, 0)
+        app.router.routes = [route_b]
+        app._on_connect(client, None, None, 0)
+
+        self.assertEqual(client.subscribe.call_args.args[0], [('b/+', 1)])
+
+    def test_on_connect_skips_subscribe_without_non_shared_routes(self) -> None:
+        app = object.__new__(Application)
+        app.logger = MagicMock()
+        app._nonshared_subs = None
+        app.router = MagicMock(routes=[MagicMock(shared=True)])
+        client = MagicMock()
+
+        app._on_connect(client, None, None, 0)
+
+        client.subscribe.assert_not_called()
 
     def test_on_connect_updates_health_status(self) -> None:
         app = object.__new__(Application)
         app.logger = MagicMock()
         app.health_status = HealthStatus()
+        app._nonshared_subs = None
         app.router = MagicMock(routes=[])
 
         app._on_connect(MagicMock(), None, None, 0)
@@ -229,13 +323,12 @@ class OnMessageErrorTests(unittest.TestCase):
         app = object.__new__(Application)
         app.logger = MagicMock()
         app.loop = MagicMock()
+        app.loop.call_soon_threadsafe.side_effect = RuntimeError('schedule failed')
         app.router = MagicMock()
-        with patch(
-            'bootstrap.app.asyncio.run_coroutine_threadsafe',
-            side_effect=RuntimeError('schedule failed'),
-        ):
-            msg = MagicMock(topic='t', payload=b'{}')
-            app._on_message(MagicMock(), None, msg)
+        app._ingress_pending = deque()
+        app._ingress_wakeup = False
+        msg = MagicMock(topic='t', payload=b'{}')
+        app._on_message(MagicMock(), None, msg)
         app.logger.error.assert_called()
 
 
@@ -273,18 +366,20 @@ class RunCleanupTests(unittest.TestCase):
         app.redis_enabled = True
         app.tsdb_enabled = False
         app.start_workers = MagicMock()
-        app.initialize_database = MagicMock(return_value=None)
-        app.initialize_redis = MagicMock(return_value=None)
-        app.initialize_tsdb = MagicMock(return_value=None)
-        app.initialize_telemetry = MagicMock(return_value=None)
+        app._initialize_connections = MagicMock(return_value=None)
+        app._start_ingress = MagicMock()
+        app._stop_ingress = MagicMock()
 
         with (
             patch('bootstrap.app.redis_manager.disconnect', new=MagicMock()) as disconnect,
             patch('bootstrap.app.Model.cleanup', new=MagicMock()) as cleanup,
+            patch('bootstrap.app.asyncio.Runner', return_value=_runner_for(app.loop)),
         ):
             app.run()
 
-        self.assertGreaterEqual(app.loop.run_until_complete.call_count, 4)
+        app._initialize_connections.assert_called_once_with()
+        disconnect.assert_called_once_with()
+        cleanup.assert_called_once_with()
 
     def test_run_closes_telemetry_and_tsdb_when_enabled(self) -> None:
         app = object.__new__(Application)
@@ -302,16 +397,16 @@ class RunCleanupTests(unittest.TestCase):
         app.telemetry_enabled = True
         app.health_status = HealthStatus()
         app.start_workers = MagicMock()
-        app.initialize_database = MagicMock(return_value=None)
-        app.initialize_redis = MagicMock(return_value=None)
-        app.initialize_tsdb = MagicMock(return_value=None)
-        app.initialize_telemetry = MagicMock(return_value=None)
+        app._initialize_connections = MagicMock(return_value=None)
+        app._start_ingress = MagicMock()
+        app._stop_ingress = MagicMock()
 
         with (
             patch('bootstrap.app.telemetry.close', new=MagicMock(return_value='telemetry-close')) as telemetry_close,
             patch(
                 'bootstrap.app.tsdb_manager.disconnect', new=MagicMock(return_value='tsdb-disconnect')
             ) as tsdb_disconnect,
+            patch('bootstrap.app.asyncio.Runner', return_value=_runner_for(app.loop)),
         ):
             app.run()
 
@@ -0,0 +1,66 @@
+import asyncio
+import unittest
+
+from routemq.batching import Batcher
+
+
+class TestBatcher(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_items_share_one_flush(self) -> None:
+        flushed = []
+
+        async def flush(items):
+            flushed.append(items)
+            return [item * 10 for item in items]
+
+        batcher = Batcher(flush, max_batch_size=10, max_queue_time=0.001)
+
+        results = await asyncio.gather(batcher.process(1), batcher.process(2))
+
+        self.assertEqual(results, [10, 20])
+        self.assertEqual(flushed, [[1, 2]])
+
+    async def test_full_batch_flushes_without_waiting(self) -> None:
+        async def flush(items):
+            return items
+
+        batcher = Batcher(flush, max_batch_size=2, max_queue_time=60)
+
+        results = await asyncio.wait_for(asyncio.gather(batcher.process('a'), batcher.process('b')), timeout=1)
+
+        self.assertEqual(results, ['a', 'b'])
+
+    async def test_exception_result_fails_only_that_item(self) -> None:
+        async def flush(items):
+            return [RuntimeError('bad'), items[1]]
+
+        batcher = Batcher(flush, max_batch_size=2, max_queue_time=0)
+
+        first, second = await asyncio.gather(batcher.process('a'), batcher.process('b'), return_exceptions=True)
+
+        self.assertIsInstance(first, RuntimeError)
+        self.assertEqual(second, 'b')
+
+    async def test_flush_error_fails_every_item(self) -> None:
+        async def flush(items):
+            raise RuntimeError('down')
+
+        batcher = Batcher(flush, max_batch_size=2, max_queue_time=0)
+
+        results = await asyncio.gather(batcher.process('a'), batcher.process('b'), return_exceptions=True)
+
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+
+    async def test_missing_results_fail_the_remaining_items(self) -> None:
+        async def flush(items):
+            return items[:1]
+
+        batcher = Batcher(flush, max_batch_size=2, max_queue_time=0)
+
+        first, second = await asyncio.gather(batcher.process('a'), batcher.process('b'), return_exceptions=True)
+
+        self.assertEqual(first, 'a')
+        self.assertIsInstance(second, RuntimeError)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,12 +1,14 @@
 import logging
 import unittest
-from datetime import UTC, datetime, timedelta
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from sqlalchemy.sql import ClauseElement
+
 from routemq import observability
 from routemq.model import Model as BaseModel
 from routemq.queue.database_queue import DatabaseQueue
+from routemq.queue.models import epoch_ms, epoch_ms_now
 
 
 def _mock_session() -> MagicMock:
@@ -20,6 +22,20 @@ def _mock_session() -> MagicMock:
     return session
 
 
+def _mock_engine(connection: MagicMock) -> MagicMock:
+    engine = MagicMock()
+    engine.connect.return_value.__aenter__ = AsyncMock(return_value=connection)
+    engine.connect.return_value.__aexit__ = AsyncMock(return_value=False)
+    return engine
+
+
+def _mock_connection() -> MagicMock:
+    connection = MagicMock()
+    connection.execution_options = AsyncMock()
+    connection.execute = AsyncMock()
+    return connection
+
+
 class DatabaseQueueBase(unittest.IsolatedAsyncioTestCase):
     def setUp(self) -> None:
         logger = logging.getLogger('RouteMQ.DatabaseQueue')
@@ -45,7 +61,7 @@ class DatabaseQueuePushTests(DatabaseQueueBase):
             patch('routemq.queue.database_queue.QueueJob') as mock_job_cls,
         ):
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model.get_session = MagicMock(return_value=session)
             mock_job_cls.return_value = MagicMock()
 
             await driver.push('p', 'q', 0)
@@ -54,6 +70,24 @@ class DatabaseQueuePushTests(DatabaseQueueBase):
         session.commit.assert_awaited_once()
         session.close.assert_awaited_once()
 
+    async def test_push_takes_timestamps_from_the_database_clock(self) -> None:
+        driver = DatabaseQueue()
+        session = _mock_session()
+        with (
+            patch('routemq.queue.database_queue.Model') as mock_model,
+            patch('routemq.queue.database_queue.QueueJob') as mock_job_cls,
+        ):
+            mock_model._is_enabled = True
+            mock_model.get_session = MagicMock(return_value=session)
+
+            await driver.push('p', 'q', 5)
+
+        kwargs = mock_job_cls.call_args.kwargs
+        self.assertNotIn('created_at', kwargs)
+        available_at = kwargs['available_at']
+        self.assertIsInstance(available_at, ClauseElement)
+        self.assertEqual(available_at.right.value, 5000)
+
     async def test_push_emits_database_client_span_with_redacted_query(self) -> None:
         driver = DatabaseQueue()
         session = _mock_session()
@@ -66,7 +100,7 @@ class DatabaseQueuePushTests(DatabaseQueueBase):
             patch('routemq.queue.database_queue.QueueJob') as mock_job_cls,
         ):
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model.get_session = MagicMock(return_value=session)
             mock_job_cls.return_value = MagicMock()
 
             await driver.push('payload-with-secret', 'q', 0)
@@ -88,7 +122,7 @@ class DatabaseQueuePushTests(DatabaseQueueBase):
         session.commit.side_effect = RuntimeError('db fail')
         with patch('routemq.queue.database_queue.Model') as mock_model:
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model.get_session = MagicMock(return_value=session)
 
             with self.assertRaises(RuntimeError):
                 await driver.push('p', 'q', 0)
@@ -97,6 +131,38 @@ class DatabaseQueuePushTests(DatabaseQueueBase):
         session.close.assert_awaited_once()
 
 
+class DatabaseQueueWakeNotifyTests(DatabaseQueueBase):
+    async def test_push_notifies_listeners_on_postgresql(self) -> None:
+        driver = DatabaseQueue()
+        driver.wake_notify = True
+        session = _mock_session()
+
+        with patch('routemq.queue.database_queue.Model') as mock_model:
+            mock_model._is_enabled = True
+            mock_model._db_system = 'postgresql'
+            mock_model.get_session = MagicMock(return_value=session)
+            await driver.push('p', 'q', 0)
+
+        session.execute.assert_awaited_once()
+        self.assertIn('pg_notify', str(session.execute.await_args.args[0]))
+        session.commit.assert_awaited_once()
+
+    async def test_push_does_not_notify_on_mysql(self) -> None:
+        driver = DatabaseQueue()
+        driver.wake_notify = True
+        session = _mock_session()
+
+        with patch('routemq.queue.database_queue.Model') as mock_model:
+            mock_model._is_enabled = True
+            mock_model._db_system = 'mysql'
+            mock_model.get_session = MagicMock(return_value=session)
+            await driver.push('p', 'q', 0)
+            await driver.listen_for_jobs('q', MagicMock())
+
+        session.execute.assert_not_called()
+        mock_model._engine.connect.assert_not_called()
+
+
 class DatabaseQueuePopTests(DatabaseQueueBase):
     async def test_disabled_returns_none(self) -> None:
         driver = DatabaseQueue()
@@ -107,40 +173,53 @@ class DatabaseQueuePopTests(DatabaseQueueBase):
     async def test_no_jobs_returns_none(self) -> None:
         driver = DatabaseQueue()
         session = _mock_session()
-        scalars = MagicMock()
-        scalars.first.return_value = None
         result = MagicMock()
-        result.scalars.return_value = scalars
+        result.first.return_value = None
         session.execute.return_value = result
 
         with patch('routemq.queue.database_queue.Model') as mock_model:
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model.get_session = MagicMock(return_value=session)
             self.assertIsNone(await driver.pop('q'))
 
+        session.execute.assert_awaited_once()
+        session.commit.assert_not_awaited()
+
+    async def test_pop_reuses_one_cached_statement_across_queues(self) -> None:
+        driver = DatabaseQueue()
+        statements = []
+        for queue in ('emails', 'reports'):
+            session = _mock_session()
+            result = MagicMock()
+            result.first.return_value = None
+            session.execute.return_value = result
+            with patch('routemq.queue.database_queue.Model') as mock_model:
+                mock_model._is_enabled = True
+                mock_model.get_session = MagicMock(return_value=session)
+                await driver.pop(queue)
+            statements.append(session.execute.await_args.args[0])
+
+        self.assertEqual(statements[0]._generate_cache_key().key, statements[1]._generate_cache_key().key)
+        self.assertEqual(statements[1].compile().params['queue_1'], 'reports')
+
     async def test_pop_returns_job_payload(self) -> None:
         driver = DatabaseQueue()
         session = _mock_session()
 
-        job = MagicMock()
-        job.id = 42
-        job.payload = 'serialized'
-        job.attempts = 0
-        scalars = MagicMock()
-        scalars.first.return_value = job
-        result = MagicMock()
-        result.scalars.return_value = scalars
-        session.execute.return_value = result
+        select_result = MagicMock()
+        select_result.first.return_value = MagicMock(id=42, payload='serialized', attempts=0)
+        session.execute.side_effect = [select_result, MagicMock()]
 
         with patch('routemq.queue.database_queue.Model') as mock_model:
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model.get_session = MagicMock(return_value=session)
             popped = await driver.pop('q')
 
-        self.assertIsNotNone(popped)
-        assert popped is not None
-        self.assertEqual(popped['id'], 42)
-        self.assertEqual(popped['attempts'], 1)
+        self.assertEqual(popped, {'id': 42, 'payload': 'serialized', 'attempts': 1})
+        self.assertEqual(session.execute.await_count, 2)
+        self.assertIn('attempts=(queue_jobs.attempts', str(session.execute.await_args_list[1].args[0]))
+        session.commit.assert_awaited_once()
+        session.refresh.assert_not_called()
 
     async def test_pop_returns_none_on_db_error(self) -> None:
         driver = DatabaseQueue()
@@ -149,12 +228,190 @@ class DatabaseQueuePopTests(DatabaseQueueBase):
 
         with patch('routemq.queue.database_queue.Model') as mock_model:
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model.get_session = MagicMock(return_value=session)
             self.assertIsNone(await driver.pop('q'))
 
         session.rollback.assert_awaited_once()
 
 
+class DatabaseQueuePopBatchTests(DatabaseQueueBase):
+    async def test_pop_batch_reserves_rows_with_one_update(self) -> None:
+        driver = DatabaseQueue()
+        session = _mock_session()
+        rows = [MagicMock(id=1, payload='a', attempts=0), MagicMock(id=2, payload='b', attempts=2)]
+        select_result = MagicMock()
+        select_result.all.return_value = rows
+        session.execute.side_effect = [select_result, MagicMock()]
+
+        with patch('routemq.queue.database_queue.Model') as mock_model:
+            mock_model._is_enabled = True
+            mock_model.get_session = MagicMock(return_value=session)
+            popped = await driver.pop_batch('q', 5)
+
+        self.assertEqual(
+            popped,
+            [{'id': 1, 'payload': 'a', 'attempts': 1}, {'id': 2, 'payload': 'b', 'attempts': 3}],
+        )
+        self.assertEqual(session.execute.await_count, 2)
+        self.assertIn('UPDATE queue_jobs', str(session.execute.await_args_list[1].args[0]))
+        session.commit.assert_awaited_once()
+        session.close.assert_awaited_once()
+
+    async def test_pop_batch_returns_empty_without_update_when_queue_is_empty(self) -> None:
+        driver = DatabaseQueue()
+        session = _mock_session()
+        select_result = MagicMock()
+        select_result.all.return_value = []
+        session.execute.return_value = select_result
+
+        with patch('routemq.queue.database_queue.Model') as mock_model:
+            mock_model._is_enabled = True
+            mock_model.get_session = MagicMock(return_value=session)
+            self.assertEqual(await driver.pop_batch('q', 5), [])
+
+        session.execute.assert_awaited_once()
+        session.commit.assert_not_awaited()
+
+    async def test_pop_batch_returns_empty_on_db_error(self) -> None:
+        driver = DatabaseQueue()
+        session = _mock_session()
+        session.execute.side_effect = RuntimeError('db error')
+
+        with patch('routemq.queue.database_queue.Model') as mock_model:
+            mock_model._is_enabled = True
+            mock_model.get_session = MagicMock(return_value=session)
+            self.assertEqual(await driver.pop_batch('q', 5), [])
+
+        session.rollback.assert_awaited_once()
+
+
+class DatabaseQueuePushManyTests(DatabaseQueueBase):
+    async def test_push_many_inserts_all_rows_under_one_commit(self) -> None:
+        driver = DatabaseQueue()
+        session = _mock_session()
+
+        with patch('routemq.queue.database_queue.Model') as mock_model:
+            mock_model._is_enabled = True
+            mock_model.get_session = MagicMock(return_value=session)
+            await driver.push_many(['a', 'b', 'c'], 'q', 5)
+
+        session.execute.assert_awaited_once()
+        stmt, rows = session.execute.await_args.args
+        self.assertEqual([row['payload'] for row in rows], ['a', 'b', 'c'])
+        self.assertEqual({row['queue'] for row in rows}, {'q'})
+        self.assertNotIn('available_at', rows[0])
+        self.assertIn('available_at', str(stmt))
+        session.commit.assert_awaited_once()
+        session.close.assert_awaited_once()
+
+    async def test_push_many_rolls_back_on_error(self) -> None:
+        driver = DatabaseQueue()
+        session = _mock_session()
+        session.execute.side_effect = RuntimeError('boom')
+
+        with patch('routemq.queue.database_queue.Model') as mock_model:
+            mock_model._is_enabled = True
+            mock_model.get_session = MagicMock(return_value=session)
+            with self.assertRaises(RuntimeError):
+                await driver.push_many(['a'], 'q')
+
+        session.rollback.assert_awaited_once()
+
+
+class DatabaseQueueFailedManyTests(DatabaseQueueBase):
+    async def test_failed_many_inserts_all_records_under_one_commit(self) -> None:
+        driver = DatabaseQueue()
+        session = _mock_session()
+        records = [
+            {'connection': 'database', 'queue': 'q', 'payload': 'a', 'exception': 'boom'},
+            {'connection': 'database', 'queue': 'q', 'payload': 'b', 'exception': 'boom'},
+        ]
+
+        with patch('routemq.queue.database_queue.Model') as mock_model:
+            mock_model._is_enabled = True
+            mock_model.get_session = MagicMock(return_value=session)
+            await driver.failed_many(records)
+
+        session.execute.assert_awaited_once()
+        self.assertIs(session.execute.await_args.args[1], records)
+        session.commit.assert_awaited_once()
+
+
+class DatabaseQueueDeleteManyTests(DatabaseQueueBase):
+    async def test_delete_many_issues_one_statement(self) -> None:
+        driver = DatabaseQueue()
+        session = _mock_session()
+
+        with patch('routemq.queue.database_queue.Model') as mock_model:
+            mock_model._is_enabled = True
+            mock_model.get_session = MagicMock(return_value=session)
+            await driver.delete_many([1, 2, 3], 'q')
+
+        session.execute.assert_awaited_once()
+        self.assertIn('DELETE FROM queue_jobs', str(session.execute.await_args.args[0]))
+        session.commit.assert_awaited_once()
+
+    async def test_delete_many_skips_empty_batch(self) -> None:
+        driver = DatabaseQueue()
+        with patch('routemq.queue.database_queue.Model') as mock_model:
+            mock_model._is_enabled = True
+            await driver.delete_many([], 'q')
+
+        mock_model.get_session.assert_not_called()
+
+
+class DatabaseQueueReleaseManyTests(DatabaseQueueBase):
+    async def test_release_many_issues_one_statement(self) -> None:
+        driver = DatabaseQueue()
+        session = _mock_session()
+
+        with patch('routemq.queue.database_queue.Model') as mock_model:
+            mock_model._is_enabled = True
+            mock_model.get_session = MagicMock(return_value=session)
+            await driver.release_many([1, 2, 3], 'q', 5)
+
+        session.execute.assert_awaited_once()
+        statement = str(session.execute.await_args.args[0])
+        self.assertIn('UPDATE queue_jobs', statement)
+        self.assertIn('queue_jobs.id IN', statement)
+        session.commit.assert_awaited_once()
+
+    async def test_release_many_skips_empty_batch(self) -> None:
+        driver = DatabaseQueue()
+        with patch('routemq.queue.database_queue.Model') as mock_model:
+            mock_model._is_enabled = True
+            await driver.release_many([], 'q')
+
+        mock_model.get_session.assert_not_called()
+
+
+class DatabaseQueueUnreserveManyTests(DatabaseQueueBase):
+    async def test_unreserve_many_clears_reservation_and_gives_back_the_attempt(self) -> None:
+        driver = DatabaseQueue()
+        session = _mock_session()
+
+        with patch('routemq.queue.database_queue.Model') as mock_model:
+            mock_model._is_enabled = True
+            mock_model.get_session = MagicMock(return_value=session)
+            await driver.unreserve_many([1, 2], 'q')
+
+        session.execute.assert_awaited_once()
+        statement = str(session.execute.await_args.args[0])
+        self.assertIn('UPDATE queue_jobs', statement)
+        self.assertIn('attempts=(queue_jobs.attempts - ', statement)
+        self.assertIn('queue_jobs.reserved_at IS NOT NULL', statement)
+        self.assertNotIn('available_at', statement)
+        session.commit.assert_awaited_once()
+
+    async def test_unreserve_many_skips_empty_batch(self) -> None:
+        driver = DatabaseQueue()
+        with patch('routemq.queue.database_queue.Model') as mock_model:
+            mock_model._is_enabled = True
+            await driver.unreserve_many([], 'q')
+
+        mock_model.get_session.assert_not_called()
+
+
 class DatabaseQueueReleaseTests(DatabaseQueueBase):
     async def test_release_when_disabled_is_noop(self) -> None:
         driver = DatabaseQueue()
@@ -167,7 +424,7 @@ class DatabaseQueueReleaseTests(DatabaseQueueBase):
         session = _mock_session()
         with patch('routemq.queue.database_queue.Model') as mock_model:
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model.get_session = MagicMock(return_value=session)
             await driver.release(1, 'q', 5)
         session.execute.assert_awaited_once()
         session.commit.assert_awaited_once()
@@ -179,7 +436,7 @@ class DatabaseQueueReleaseTests(DatabaseQueueBase):
         session.commit.side_effect = RuntimeError('db fail')
         with patch('routemq.queue.database_queue.Model') as mock_model:
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model.get_session = MagicMock(return_value=session)
             with self.assertRaises(RuntimeError):
                 await driver.release(1, 'q', 0)
         session.rollback.assert_awaited_once()
@@ -197,7 +454,7 @@ class DatabaseQueueDeleteTests(DatabaseQueueBase):
         session = _mock_session()
         with patch('routemq.queue.database_queue.Model') as mock_model:
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model.get_session = MagicMock(return_value=session)
             await driver.delete(1, 'q')
         session.execute.assert_awaited_once()
         session.commit.assert_awaited_once()
@@ -208,7 +465,7 @@ class DatabaseQueueDeleteTests(DatabaseQueueBase):
         session.execute.side_effect = RuntimeError('db fail')
         with patch('routemq.queue.database_queue.Model') as mock_model:
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model.get_session = MagicMock(return_value=session)
             with self.assertRaises(RuntimeError):
                 await driver.delete(1, 'q')
         session.rollback.assert_awaited_once()
@@ -229,7 +486,7 @@ class DatabaseQueueFailedTests(DatabaseQueueBase):
             patch('routemq.queue.database_queue.QueueFailedJob') as mock_failed_cls,
         ):
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model.get_session = MagicMock(return_value=session)
             mock_failed_cls.return_value = MagicMock()
             await driver.failed('c', 'q', 'p', 'e')
         session.add.assert_called_once()
@@ -244,7 +501,7 @@ class DatabaseQueueFailedTests(DatabaseQueueBase):
             patch('routemq.queue.database_queue.QueueFailedJob'),
         ):
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model.get_session = MagicMock(return_value=session)
             with self.assertRaises(RuntimeError):
                 await driver.failed('c', 'q', 'p', 'e')
         session.rollback.assert_awaited_once()
@@ -258,7 +515,7 @@ class DatabaseQueueFailedTests(DatabaseQueueBase):
         failed_job.queue = 'q'
         failed_job.payload = 'payload'
         failed_job.exception = 'boom'
-        failed_job.failed_at.isoformat.return_value = '2026-05-29T00:00:00+00:00'
+        failed_job.failed_at = 1_780_012_800_000
         scalars = MagicMock()
         scalars.all.return_value = [failed_job]
         scalars.first.return_value = failed_job
@@ -269,8 +526,10 @@ class DatabaseQueueFailedTests(DatabaseQueueBase):
 
         with patch('routemq.queue.database_queue.Model') as mock_model:
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
-            self.assertEqual((await driver.list_failed_jobs('q'))[0]['id'], 5)
+            mock_model.get_session = MagicMock(return_value=session)
+            listed = await driver.list_failed_jobs('q')
+            self.assertEqual(listed[0]['id'], 5)
+            self.assertEqual(listed[0]['failed_at'], '2026-05-29T00:00:00+00:00')
             failed_job = await driver.get_failed_job(5)
             self.assertIsNotNone(failed_job)
             assert failed_job is not None
@@ -304,7 +563,7 @@ class DatabaseQueueFailedTests(DatabaseQueueBase):
 
         with patch('routemq.queue.database_queue.Model') as mock_model:
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model.get_session = MagicMock(return_value=session)
             self.assertFalse(await driver.forget_failed_job(999))
 
         session.delete.assert_not_called()
@@ -316,7 +575,7 @@ class DatabaseQueueFailedTests(DatabaseQueueBase):
 
         with patch('routemq.queue.database_queue.Model') as mock_model:
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model.get_session = MagicMock(return_value=session)
             with self.assertRaises(RuntimeError):
                 await driver.forget_failed_job(5)
             with self.assertRaises(RuntimeError):
@@ -342,7 +601,7 @@ class DatabaseQueueHeartbeatTests(DatabaseQueueBase):
 
         with patch('routemq.queue.database_queue.Model') as mock_model:
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model.get_session = MagicMock(return_value=session)
             self.assertTrue(await driver.heartbeat(1, 'q'))
 
         session.commit.assert_awaited_once()
@@ -354,7 +613,7 @@ class DatabaseQueueHeartbeatTests(DatabaseQueueBase):
 
         with patch('routemq.queue.database_queue.Model') as mock_model:
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model.get_session = MagicMock(return_value=session)
             with self.assertRaises(RuntimeError):
                 await driver.heartbeat(1, 'q')
 
@@ -369,7 +628,7 @@ class DatabaseQueueVisibilityReaperTests(DatabaseQueueBase):
         job.id = 7
         job.payload = '{"max_tries": 3}'
         job.attempts = 1
-        job.reserved_at = datetime.now(UTC) - timedelta(seconds=301)
+        job.reserved_at = epoch_ms() - 301_000
         scalars = MagicMock()
         scalars.all.return_value = [job]
         result = MagicMock()
@@ -378,12 +637,12 @@ class DatabaseQueueVisibilityReaperTests(DatabaseQueueBase):
 
         with patch('routemq.queue.database_queue.Model') as mock_model:
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model.get_session = MagicMock(return_value=session)
             reaped = await driver.reap_expired('q', visibility_timeout=300)
 
         self.assertEqual(reaped, 1)
         self.assertIsNone(job.reserved_at)
-        self.assertIsInstance(job.available_at, datetime)
+        self.assertIsInstance(job.available_at, epoch_ms_now)
         session.add.assert_not_called()
         session.commit.assert_awaited_once()
 
@@ -401,7 +660,7 @@ class DatabaseQueueVisibilityReaperTests(DatabaseQueueBase):
 
         with patch('routemq.queue.database_queue.Model') as mock_model:
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model.get_session = MagicMock(return_value=session)
             with self.assertRaises(RuntimeError):
                 await driver.reap_expired('q', 300)
 
@@ -415,7 +674,7 @@ class DatabaseQueueVisibilityReaperTests(DatabaseQueueBase):
         job.id = 7
         job.payload = '{"max_tries": 1}'
         job.attempts = 1
-        job.reserved_at = datetime.now(UTC) - timedelta(seconds=301)
+        job.reserved_at = epoch_ms() - 301_000
         scalars = MagicMock()
         scalars.all.return_value = [job]
         result = MagicMock()
@@ -427,7 +686,7 @@ class DatabaseQueueVisibilityReaperTests(DatabaseQueueBase):
             patch('routemq.queue.database_queue.QueueFailedJob') as failed_cls,
         ):
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model.get_session = MagicMock(return_value=session)
             reaped = await driver.reap_expired('q', visibility_timeout=300)
 
         self.assertEqual(reaped, 1)
@@ -443,7 +702,7 @@ class DatabaseQueueVisibilityReaperTests(DatabaseQueueBase):
 
         with patch('routemq.queue.database_queue.Model') as mock_model:
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model.get_session = MagicMock(return_value=session)
             with self.assertRaises(RuntimeError):
                 await driver.reap_expired('q', visibility_timeout=300)
 
@@ -457,48 +716,79 @@ class DatabaseQueueSizeTests(DatabaseQueueBase):
             mock_model._is_enabled = False
             self.assertEqual(await driver.size('q'), 0)
 
-    async def test_size_returns_count(self) -> None:
+    async def test_size_returns_count_on_autocommit_connection(self) -> None:
         driver = DatabaseQueue()
-        session = _mock_session()
-        scalars = MagicMock()
-        scalars.all.return_value = ['a', 'b', 'c']
+        connection = _mock_connection()
         result = MagicMock()
-        result.scalars.return_value = scalars
-        session.execute.return_value = result
+        result.scalar_one.return_value = 3
+        connection.execute.return_value = result
 
         with patch('routemq.queue.database_queue.Model') as mock_model:
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model._engine = _mock_engine(connection)
             self.assertEqual(await driver.size('q'), 3)
 
+        connection.execution_options.assert_awaited_once_with(isolation_level='AUTOCOMMIT')
+        statement = str(connection.execute.await_args.args[0])
+        self.assertIn('count(queue_jobs.id)', statement)
+        mock_model.get_session.assert_not_called()
+
     async def test_size_returns_zero_on_error(self) -> None:
         driver = DatabaseQueue()
-        session = _mock_session()
-        session.execute.side_effect = RuntimeError('db fail')
+        connection = _mock_connection()
+        connection.execute.side_effect = RuntimeError('db fail')
 
         with patch('routemq.queue.database_queue.Model') as mock_model:
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model._engine = _mock_engine(connection)
             self.assertEqual(await driver.size('q'), 0)
 
+    async def test_size_approx_reads_mysql_table_rows(self) -> None:
+        driver = DatabaseQueue()
+        connection = _mock_connection()
+        result = MagicMock()
+        result.scalar.return_value = 42
+        connection.execute.return_value = result
+
+        with patch('routemq.queue.database_queue.Model') as mock_model:
+            mock_model._is_enabled = True
+            mock_model._db_system = 'mysql'
+            mock_model._engine = _mock_engine(connection)
+            self.assertEqual(await driver.size_approx('q'), 42)
+
+        statement, params = connection.execute.await_args.args
+        self.assertIn('information_schema.tables', str(statement))
+        self.assertEqual(params, {'table': 'queue_jobs'})
+
+    async def test_size_approx_falls_back_to_exact_count_on_sqlite(self) -> None:
+        driver = DatabaseQueue()
+
+        with patch('routemq.queue.database_queue.Model') as mock_model:
+            mock_model._is_enabled = True
+            mock_model._db_system = 'sqlite'
+            with patch.object(driver, 'size', new=AsyncMock(return_value=5)) as size:
+                self.assertEqual(await driver.size_approx('q'), 5)
+
+        size.assert_awaited_once_with('q')
+
 
 class DatabaseQueueStatsTests(DatabaseQueueBase):
     async def test_stats_returns_depths_and_oldest_ready_age(self) -> None:
         driver = DatabaseQueue()
         session = _mock_session()
-        now = datetime.now(UTC)
+        now = epoch_ms()
         ready = MagicMock()
         ready.reserved_at = None
-        ready.available_at = now - timedelta(seconds=5)
-        ready.created_at = now - timedelta(seconds=30)
+        ready.available_at = now - 5_000
+        ready.created_at = now - 30_000
         delayed = MagicMock()
         delayed.reserved_at = None
-        delayed.available_at = now + timedelta(seconds=30)
+        delayed.available_at = now + 30_000
         delayed.created_at = now
         reserved = MagicMock()
         reserved.reserved_at = now
-        reserved.available_at = now - timedelta(seconds=10)
-        reserved.created_at = now - timedelta(seconds=20)
+        reserved.available_at = now - 10_000
+        reserved.created_at = now - 20_000
         jobs_scalars = MagicMock()
         jobs_scalars.all.return_value = [ready, delayed, reserved]
         jobs_result = MagicMock()
@@ -508,10 +798,11 @@ class DatabaseQueueStatsTests(DatabaseQueueBase):
         failed_result = MagicMock()
         failed_result.scalars.return_value = failed_scalars
         session.execute.side_effect = [jobs_result, failed_result]
+        session.scalar = AsyncMock(return_value=now)
 
         with patch('routemq.queue.database_queue.Model') as mock_model:
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model.get_session = MagicMock(return_value=session)
             stats = await driver.stats('q')
 
         self.assertEqual(stats['queue'], 'q')
@@ -540,11 +831,9 @@ class DatabaseQueueStatsTests(DatabaseQueueBase):
     async def test_stats_counts_ready_delayed_reserved_and_failed_jobs(self) -> None:
         driver = DatabaseQueue()
         session = _mock_session()
-        now = datetime.now(UTC)
-        ready = MagicMock(
-            reserved_at=None, available_at=now - timedelta(seconds=1), created_at=now - timedelta(seconds=12)
-        )
-        delayed = MagicMock(reserved_at=None, available_at=now + timedelta(seconds=30), created_at=now)
+        now = epoch_ms()
+        ready = MagicMock(reserved_at=None, available_at=now - 1_000, created_at=now - 12_000)
+        delayed = MagicMock(reserved_at=None, available_at=now + 30_000, created_at=now)
         reserved = MagicMock(reserved_at=now, available_at=now, created_at=now)
         jobs_scalars = MagicMock()
         jobs_scalars.all.return_value = [ready, delayed, reserved]
@@ -555,10 +844,11 @@ class DatabaseQueueStatsTests(DatabaseQueueBase):
         failed_result = MagicMock()
         failed_result.scalars.return_value = failed_scalars
         session.execute.side_effect = [jobs_result, failed_result]
+        session.scalar = AsyncMock(return_value=now)
 
         with patch('routemq.queue.database_queue.Model') as mock_model:
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model.get_session = MagicMock(return_value=session)
             stats = await driver.stats('q')
 
         self.assertEqual(stats['ready'], 1)
@@ -567,6 +857,34 @@ class DatabaseQueueStatsTests(DatabaseQueueBase):
         self.assertEqual(stats['failed'], 2)
         self.assertGreaterEqual(stats['oldest_ready_age_seconds'], 0.0)
 
+    async def test_stats_classifies_jobs_by_the_database_clock(self) -> None:
+        driver = DatabaseQueue()
+        session = _mock_session()
+        host_now = epoch_ms()
+        db_now = host_now - 60_000
+        job = MagicMock(reserved_at=None, available_at=host_now - 5_000, created_at=host_now - 10_000)
+        jobs_scalars = MagicMock()
+        jobs_scalars.all.return_value = [job]
+        jobs_result = MagicMock()
+        jobs_result.scalars.return_value = jobs_scalars
+        failed_scalars = MagicMock()
+        failed_scalars.all.return_value = []
+        failed_result = MagicMock()
+        failed_result.scalars.return_value = failed_scalars
+        session.execute.side_effect = [jobs_result, failed_result]
+        session.scalar = AsyncMock(return_value=db_now)
+
+        with patch('routemq.queue.database_queue.Model') as mock_model:
+            mock_model._is_enabled = True
+            mock_model.get_session = MagicMock(return_value=session)
+            stats = await driver.stats('q')
+
+        # The host clock says the job is ready, but pop() compares with the database clock
+        self.assertEqual(stats['ready'], 0)
+        self.assertEqual(stats['delayed'], 1)
+        self.assertEqual(stats['oldest_ready_age_seconds'], 0.0)
+        self.assertIsInstance(session.scalar.await_args.args[0].selected_columns[0], epoch_ms_now)
+
     async def test_stats_returns_empty_values_on_query_error(self) -> None:
         driver = DatabaseQueue()
         session = _mock_session()
@@ -574,7 +892,7 @@ class DatabaseQueueStatsTests(DatabaseQueueBase):
 
         with patch('routemq.queue.database_queue.Model') as mock_model:
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model.get_session = MagicMock(return_value=session)
             stats = await driver.stats('q')
 
         self.assertEqual(stats['ready'], 0)
@@ -0,0 +1,31 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from routemq import event_loop
+
+
+class LoopFactoryTests(unittest.TestCase):
+    def test_stdlib_default_without_uvloop(self) -> None:
+        with patch.object(event_loop, 'uvloop', None):
+            self.assertIsNone(event_loop.loop_factory())
+
+    def test_uvloop_factory_when_installed(self) -> None:
+        fake = SimpleNamespace(new_event_loop=object())
+        with patch.object(event_loop, 'uvloop', fake):
+            self.assertIs(event_loop.loop_factory(), fake.new_event_loop)
+
+    def test_use_uvloop_false_keeps_stdlib_loop(self) -> None:
+        fake = SimpleNamespace(new_event_loop=object())
+        with patch.object(event_loop, 'uvloop', fake), patch.dict('os.environ', {'USE_UVLOOP': 'false'}):
+            self.assertIsNone(event_loop.loop_factory())
+
+    def test_new_event_loop_uses_factory(self) -> None:
+        sentinel = object()
+        fake = SimpleNamespace(new_event_loop=lambda: sentinel)
+        with patch.object(event_loop, 'uvloop', fake), patch.dict('os.environ', {'USE_UVLOOP': 'true'}):
+            self.assertIs(event_loop.new_event_loop(), sentinel)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,6 +19,10 @@ class SerializableJob(Job):
         return None
 
 
+class DeclaredFieldsJob(SerializableJob):
+    serializable_fields = ('name',)
+
+
 class OverrideDefaultsJob(Job):
     max_tries = 5
     queue = 'critical'
@@ -176,6 +180,15 @@ class TestJobSerialization(unittest.TestCase):
 
         self.assertEqual(job.get_data(), {'name': 'alpha', 'payload': {'count': 1}})
 
+    def test_get_data_reads_only_declared_serializable_fields(self) -> None:
+        """serializable_fields replaces the instance-dict scan."""
+        Job.register(DeclaredFieldsJob)
+        job = DeclaredFieldsJob()
+
+        self.assertEqual(job.get_data(), {'name': 'alpha'})
+        restored = Job.unserialize(job.serialize())
+        self.assertEqual(restored.name, 'alpha')
+
     def test_serialize_emits_expected_metadata(self) -> None:
         """Serialized JSON includes dispatch metadata beside job data."""
         data: dict[str, Any] = json.loads(SerializableJob().serialize())
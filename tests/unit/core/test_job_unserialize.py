@@ -1,3 +1,4 @@
+import importlib
 import json
 import unittest
 from collections.abc import Mapping
@@ -42,6 +43,21 @@ class TestJobUnserializeAllowList(unittest.TestCase):
 
         self.assertIsInstance(job, RegisteredRegressionJob)
 
+    def test_resolved_class_is_cached_but_allow_list_still_applies(self) -> None:
+        """Repeat payloads skip the import walk without bypassing the allow-list."""
+        Job.register(RegisteredRegressionJob)
+        payload = self.make_payload(f'{RegisteredRegressionJob.__module__}.{RegisteredRegressionJob.__name__}')
+
+        with patch.dict('routemq.job._CLASS_CACHE', clear=True):
+            with patch('routemq.job.import_module', wraps=importlib.import_module) as import_module:
+                Job.unserialize(payload)
+                Job.unserialize(payload)
+            import_module.assert_called_once_with(RegisteredRegressionJob.__module__)
+
+            Job._allowed_classes.clear()
+            with self.assertRaisesRegex(ValueError, 'unregistered job class'):
+                Job.unserialize(payload)
+
     def test_unregistered_job_class_is_rejected_before_import(self) -> None:
         """Unregistered classes raise the documented allow-list error."""
         payload = self.make_payload('builtins.eval')
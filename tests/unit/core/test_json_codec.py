@@ -0,0 +1,60 @@
+import json
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from routemq import json_codec
+
+
+def _fake_orjson() -> SimpleNamespace:
+    """Minimal orjson stand-in: bytes out of dumps, bytes or str into loads."""
+
+    def dumps(value, option=None):
+        if not isinstance(value, dict):
+            raise TypeError('unsupported')
+        return json.dumps(value, separators=(',', ':')).encode()
+
+    def loads(data):
+        return json.loads(data)
+
+    return SimpleNamespace(dumps=dumps, loads=loads, OPT_NON_STR_KEYS=1)
+
+
+class JsonCodecStdlibFallbackTests(unittest.TestCase):
+    def test_loads_accepts_bytes_and_str(self) -> None:
+        with patch.object(json_codec, 'orjson', None):
+            self.assertEqual(json_codec.loads(b'{"a": 1}'), {'a': 1})
+            self.assertEqual(json_codec.loads('{"a": 1}'), {'a': 1})
+
+    def test_loads_raises_stdlib_errors(self) -> None:
+        with patch.object(json_codec, 'orjson', None):
+            with self.assertRaises(json.JSONDecodeError):
+                json_codec.loads(b'not json')
+            with self.assertRaises(UnicodeDecodeError):
+                json_codec.loads(b'\xff\xfe')
+
+    def test_dumps_matches_stdlib(self) -> None:
+        with patch.object(json_codec, 'orjson', None):
+            self.assertEqual(json_codec.dumps({'a': [1, 2]}), json.dumps({'a': [1, 2]}))
+
+
+class JsonCodecOrjsonTests(unittest.TestCase):
+    def test_dumps_returns_str_from_orjson_bytes(self) -> None:
+        with patch.object(json_codec, 'orjson', _fake_orjson()):
+            self.assertEqual(json_codec.dumps({'a': 1}), '{"a":1}')
+
+    def test_dumps_falls_back_to_stdlib_on_type_error(self) -> None:
+        with patch.object(json_codec, 'orjson', _fake_orjson()):
+            self.assertEqual(json_codec.dumps([1, 2]), '[1, 2]')
+
+    def test_loads_passes_bytes_straight_to_orjson(self) -> None:
+        fake = _fake_orjson()
+        seen = []
+        fake.loads = lambda data: seen.append(data) or {'ok': True}
+        with patch.object(json_codec, 'orjson', fake):
+            self.assertEqual(json_codec.loads(b'{"ok": true}'), {'ok': True})
+        self.assertEqual(seen, [b'{"ok": true}'])
+
+
+if __name__ == '__main__':
+    unittest.main()
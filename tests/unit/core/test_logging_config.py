@@ -1,6 +1,8 @@
+import io
 import json
 import logging
 import os
+import queue
 import sys
 import unittest
 from unittest.mock import MagicMock, patch
@@ -8,12 +10,14 @@ from unittest.mock import MagicMock, patch
 from routemq import observability
 from routemq import logging_config
 from routemq.logging_config import (
+    ContextQueueHandler,
     RouteMQJsonFormatter,
     build_formatter,
     configure_lifecycle_logging,
     configure_logging,
     env_bool,
     get_formatter_name,
+    stop_async_logging,
 )
 
 
@@ -214,6 +218,59 @@ class RouteMQJsonFormatterTests(unittest.TestCase):
             self.assertIsNone(logging_config._lifecycle_unregister)
 
 
+class AsyncLoggingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root_handlers = logging.root.handlers[:]
+        self.root_level = logging.root.level
+
+    def tearDown(self) -> None:
+        stop_async_logging()
+        logging.root.handlers[:] = self.root_handlers
+        logging.root.setLevel(self.root_level)
+        configure_lifecycle_logging(enabled=False)
+        observability.clear_hooks()
+
+    def test_queue_handler_keeps_context_and_exception_for_listener_thread(self) -> None:
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        handler = ContextQueueHandler(log_queue)
+        token = observability.set_context({'correlation_id': 'corr-async'})
+        try:
+            try:
+                raise RuntimeError('boom')
+            except RuntimeError:
+                record = logging.getLogger('RouteMQ.Test').makeRecord(
+                    'RouteMQ.Test', logging.ERROR, __file__, 10, 'failed %s', ('job',), sys.exc_info()
+                )
+            handler.emit(record)
+        finally:
+            observability.reset_context(token)
+
+        queued = log_queue.get_nowait()
+        payload = json.loads(RouteMQJsonFormatter().format(queued))
+
+        self.assertEqual(payload['message'], 'failed job')
+        self.assertEqual(payload['correlation_id'], 'corr-async')
+        self.assertEqual(payload['exception.type'], 'RuntimeError')
+        self.assertNotIn('_routemq_context', payload['attributes'])
+
+    def test_log_async_routes_console_output_through_listener(self) -> None:
+        stream = io.StringIO()
+        env = {
+            'LOG_ASYNC': 'true',
+            'LOG_FORMATTER': 'plain',
+            'LOG_FORMAT': '%(message)s',
+            'LOG_LIFECYCLE_EVENTS': 'false',
+        }
+        with patch.dict(os.environ, env, clear=True), patch('sys.stdout', stream):
+            configure_logging(log_to_console=True)
+            self.assertIsInstance(logging.root.handlers[0], ContextQueueHandler)
+
+            logging.getLogger('RouteMQ.Test').info('queued %d', 1)
+            stop_async_logging()
+
+        self.assertEqual(stream.getvalue(), 'queued 1\n')
+
+
 class LoggingEnvironmentTests(unittest.TestCase):
     def tearDown(self) -> None:
         logging.getLogger('RouteMQ.Logging').handlers.clear()
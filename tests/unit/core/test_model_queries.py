@@ -25,19 +25,19 @@ class ModelStateGuard(unittest.IsolatedAsyncioTestCase):
 class ModelGetSessionTests(ModelStateGuard):
     async def test_returns_none_when_disabled(self) -> None:
         Model._is_enabled = False
-        self.assertIsNone(await Model.get_session())
+        self.assertIsNone(Model.get_session())
 
     async def test_raises_when_enabled_but_factory_missing(self) -> None:
         Model._is_enabled = True
         Model._session_factory = None
         with self.assertRaises(RuntimeError):
-            await Model.get_session()
+            Model.get_session()
 
     async def test_returns_session_from_factory(self) -> None:
         Model._is_enabled = True
         sentinel = MagicMock()
         Model._session_factory = MagicMock(return_value=sentinel)
-        result = await Model.get_session()
+        result = Model.get_session()
         self.assertIs(result, sentinel)
 
 
@@ -59,7 +59,7 @@ class ModelFindTests(ModelStateGuard):
         session.execute = AsyncMock(return_value=execute_result)
 
         with (
-            patch.object(Model, 'get_session', AsyncMock(return_value=session)),
+            patch.object(Model, 'get_session', MagicMock(return_value=session)),
             patch('routemq.model.select', return_value=MagicMock()),
         ):
             result = await Model.find(_StubModel, 42)
@@ -85,7 +85,7 @@ class ModelAllTests(ModelStateGuard):
         session.execute = AsyncMock(return_value=execute_result)
 
         with (
-            patch.object(Model, 'get_session', AsyncMock(return_value=session)),
+            patch.object(Model, 'get_session', MagicMock(return_value=session)),
             patch('routemq.model.select', return_value=MagicMock()),
         ):
             result = await Model.all(_StubModel)
@@ -112,7 +112,7 @@ class ModelCreateTests(ModelStateGuard):
             def __init__(self, **kwargs: Any) -> None:
                 self.kwargs = kwargs
 
-        with patch.object(Model, 'get_session', AsyncMock(return_value=session)):
+        with patch.object(Model, 'get_session', MagicMock(return_value=session)):
             result = await Model.create(_Created, name='value')
 
         self.assertIsInstance(result, _Created)
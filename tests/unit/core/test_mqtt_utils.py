@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, patch
 
 from routemq import observability
 from routemq.mqtt_utils import (
+    MqttPublisherPool,
     MqttTlsConfig,
     build_worker_broker_config,
     build_worker_client_id,
@@ -30,6 +31,7 @@ from routemq.mqtt_utils import (
     _valid_hex,
     _valid_trace_flags,
 )
+from routemq.settings import load_mqtt_settings
 
 
 class MqttTlsConfigTests(unittest.TestCase):
@@ -50,6 +52,23 @@ class MqttTlsConfigTests(unittest.TestCase):
         self.assertEqual(config.port, 1884)
         self.assertEqual(config.username, 'user')
         self.assertEqual(config.password, 'secret')
+        self.assertIsNone(config.socket_path)
+        self.assertEqual(config.host, 'broker.local')
+
+    def test_connection_config_prefers_socket_path_as_host(self) -> None:
+        with patch.dict(
+            os.environ, {'MQTT_BROKER': 'broker.local', 'MQTT_SOCKET_PATH': '/run/mosquitto.sock'}, clear=True
+        ):
+            config = get_mqtt_connection_config()
+
+        self.assertEqual(config.host, '/run/mosquitto.sock')
+        self.assertEqual(config.describe(), 'unix socket /run/mosquitto.sock')
+
+    def test_create_client_selects_unix_transport_for_socket_path(self) -> None:
+        with patch('routemq.mqtt_utils.mqtt_client.Client', return_value=MagicMock()) as client_class:
+            create_mqtt_client('client', on_connect=MagicMock(), on_message=MagicMock(), socket_path='/run/mqtt.sock')
+
+        client_class.assert_called_once_with(client_id='client', transport='unix')
 
     def test_client_id_and_group_helpers_read_central_settings(self) -> None:
         with patch.dict(os.environ, {'MQTT_CLIENT_ID': 'client', 'MQTT_GROUP_NAME': 'group'}, clear=True):
@@ -57,6 +76,12 @@ class MqttTlsConfigTests(unittest.TestCase):
             self.assertEqual(get_worker_client_id_prefix(), 'client')
             self.assertEqual(get_mqtt_group_name(), 'group')
 
+    def test_config_helpers_accept_preloaded_settings(self) -> None:
+        settings = load_mqtt_settings({'MQTT_BROKER': 'preloaded', 'MQTT_GROUP_NAME': 'group'})
+        with patch.dict(os.environ, {'MQTT_BROKER': 'live'}, clear=True):
+            self.assertEqual(get_mqtt_connection_config(settings).broker, 'preloaded')
+            self.assertEqual(get_mqtt_group_name(settings), 'group')
+
     def test_tls_config_defaults_to_disabled(self) -> None:
         with patch.dict(os.environ, {}, clear=True):
             config = get_mqtt_tls_config()
@@ -224,6 +249,53 @@ class MqttRetryTests(unittest.TestCase):
 
         self.assertEqual(sleeps, [])
 
+    def test_connect_passes_keepalive_to_paho(self) -> None:
+        fake_client = MagicMock()
+
+        connect_mqtt_client_with_retries(fake_client, 'broker', 1883, keepalive=300)
+
+        fake_client.connect.assert_called_once_with('broker', 1883, keepalive=300)
+
+    def test_create_client_sets_max_inflight_when_given(self) -> None:
+        fake_client = MagicMock()
+        with patch('routemq.mqtt_utils.mqtt_client.Client', return_value=fake_client):
+            create_mqtt_client('client', on_connect=MagicMock(), on_message=MagicMock(), max_inflight=1000)
+
+        fake_client.max_inflight_messages_set.assert_called_once_with(1000)
+
+    def test_connection_config_reads_keepalive_and_inflight(self) -> None:
+        with patch.dict(os.environ, {'MQTT_KEEPALIVE': '300', 'MQTT_MAX_INFLIGHT': '1000'}, clear=True):
+            config = get_mqtt_connection_config()
+
+        self.assertEqual((config.keepalive, config.max_inflight), (300, 1000))
+
+
+class MqttPublisherPoolTests(unittest.TestCase):
+    def test_publish_round_robins_across_publishers(self) -> None:
+        publishers = [MagicMock(name='first'), MagicMock(name='second')]
+        pool = MqttPublisherPool(MagicMock(name='main'), publishers)
+
+        for index in range(3):
+            pool.publish('reply/topic', f'{index}', qos=1)
+
+        self.assertEqual(publishers[0].publish.call_count, 2)
+        self.assertEqual(publishers[1].publish.call_count, 1)
+        publishers[1].publish.assert_called_once_with('reply/topic', '1', qos=1)
+
+    def test_other_attributes_come_from_main_client(self) -> None:
+        main = MagicMock(name='main')
+        pool = MqttPublisherPool(main, [MagicMock(name='publisher')])
+
+        pool.subscribe('status/#')
+
+        main.subscribe.assert_called_once_with('status/#')
+
+    def test_connection_config_reads_publisher_pool_size(self) -> None:
+        with patch.dict(os.environ, {'MQTT_PUB_POOL': '4'}, clear=True):
+            self.assertEqual(get_mqtt_connection_config().publisher_pool_size, 4)
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(get_mqtt_connection_config().publisher_pool_size, 0)
+
 
 class MqttTraceContextTests(unittest.TestCase):
     def tearDown(self) -> None:
@@ -511,6 +583,17 @@ class MqttHelperTests(unittest.TestCase):
         result = parse_mqtt_payload(payload)
         self.assertEqual(result, payload)
 
+    def test_parse_mqtt_payload_skips_decoder_for_non_json_first_byte(self) -> None:
+        with patch('routemq.mqtt_utils.json_codec.loads') as loads:
+            for payload in (b'', b'\x00\x01sensor', b'OK'):
+                self.assertEqual(parse_mqtt_payload(payload), payload)
+
+        loads.assert_not_called()
+
+    def test_parse_mqtt_payload_still_decodes_scalar_json(self) -> None:
+        payloads = (b' 42', b'-1', b'"on"', b'true', b'null')
+        self.assertEqual([parse_mqtt_payload(raw) for raw in payloads], [42, -1, 'on', True, None])
+
     def test_build_worker_broker_config(self) -> None:
         with patch.dict(
             os.environ,
@@ -493,7 +493,7 @@ class DbSpanTests(ObservabilityTestCase):
             self.assertEqual(span.attributes['db.collection.name'], 'queue_jobs')
             self.assertEqual(
                 span.attributes['db.query.text'],
-                'INSERT INTO queue_jobs (queue, payload, attempts, available_at, created_at) VALUES (:queue, :payload, :attempts, :available_at, :created_at)',
+                'INSERT INTO queue_jobs (queue, payload, attempts, available_at) VALUES (:queue, :payload, :attempts, :available_at)',
             )
             self.assertEqual(span.attributes['server.address'], 'localhost')
             self.assertEqual(span.attributes['server.port'], 3306)
@@ -512,7 +512,7 @@ class DbSpanTests(ObservabilityTestCase):
 
         mock_session = AsyncMock()
         mock_result = MagicMock()
-        mock_result.scalars.return_value.first.return_value = None
+        mock_result.first.return_value = None
         mock_session.execute.return_value = mock_result
         mock_session.__aenter__ = AsyncMock(return_value=mock_session)
         mock_session.__aexit__ = AsyncMock(return_value=False)
@@ -530,7 +530,9 @@ class DbSpanTests(ObservabilityTestCase):
             self.assertEqual(span.attributes['db.collection.name'], 'queue_jobs')
             self.assertEqual(
                 span.attributes['db.query.text'],
-                'SELECT * FROM queue_jobs WHERE queue = :queue AND reserved_at IS NULL AND available_at <= :now ORDER BY id LIMIT 1 FOR UPDATE SKIP LOCKED',
+                'SELECT id, payload, attempts FROM queue_jobs WHERE queue = :queue AND reserved_at IS NULL '
+                'AND available_at <= :now ORDER BY id LIMIT 1 FOR UPDATE SKIP LOCKED; '
+                'UPDATE queue_jobs SET reserved_at = :now, attempts = attempts + 1 WHERE id = :id',
             )
         finally:
             Model._is_enabled = original_enabled
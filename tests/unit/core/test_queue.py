@@ -1,14 +1,13 @@
 import json
 import os
 import unittest
-from datetime import datetime
 from typing import Any, cast
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from routemq.job import Job
 from routemq.model import Model
 from routemq.queue.database_queue import DatabaseQueue
-from routemq.queue.models import QueueFailedJob, QueueJob
+from routemq.queue.models import QueueFailedJob, QueueJob, epoch_ms
 from routemq.queue.queue_driver import QueueDriver
 from routemq.queue.queue_manager import QueueManager, dispatch, queue
 from routemq.queue.queue_worker import QueueWorker
@@ -160,16 +159,33 @@ class TestQueueManager(QueueTestCase):
         self.assertEqual(queue_name, 'scheduled')
         self.assertEqual(delay, 15)
 
-    async def test_bulk_dispatches_each_job(self) -> None:
+    async def test_bulk_pushes_all_jobs_in_one_driver_call(self) -> None:
         manager = QueueManager()
         driver = MagicMock(spec=QueueDriver)
         driver.push = AsyncMock()
+        driver.push_many = AsyncMock()
 
         with patch.object(manager, 'get_driver', return_value=driver):
             await manager.bulk([QueueTestJob('one'), QueueTestJob('two')], queue='bulk')
 
-        self.assertEqual(driver.push.await_count, 2)
-        self.assertEqual([call.args[1] for call in driver.push.await_args_list], ['bulk', 'bulk'])
+        driver.push.assert_not_called()
+        driver.push_many.assert_awaited_once()
+        payloads, queue_name = driver.push_many.await_args.args
+        self.assertEqual(len(payloads), 2)
+        self.assertEqual(queue_name, 'bulk')
+
+    async def test_bulk_groups_jobs_by_their_own_queue(self) -> None:
+        manager = QueueManager()
+        driver = MagicMock(spec=QueueDriver)
+        driver.push_many = AsyncMock()
+        first, second, third = QueueTestJob('one'), QueueTestJob('two'), QueueTestJob('three')
+        first.queue, second.queue, third.queue = 'a', 'b', 'a'
+
+        with patch.object(manager, 'get_driver', return_value=driver):
+            await manager.bulk([first, second, third])
+
+        calls = {call.args[1]: len(call.args[0]) for call in driver.push_many.await_args_list}
+        self.assertEqual(calls, {'a': 2, 'b': 1})
 
     async def test_dispatch_helper_uses_global_queue(self) -> None:
         with patch.object(queue, 'push', new=AsyncMock()) as push:
@@ -278,7 +294,7 @@ class TestRedisQueue(QueueTestCase):
         client.rpush = AsyncMock()
         client.zadd = AsyncMock()
         client.zrangebyscore = AsyncMock(return_value=[])
-        client.rpoplpush = AsyncMock(return_value=None)
+        client.register_script.return_value = AsyncMock(return_value=None)
         client.lrem = AsyncMock()
         client.lrange = AsyncMock(return_value=[])
         client.llen = AsyncMock(return_value=0)
@@ -309,33 +325,48 @@ class TestRedisQueue(QueueTestCase):
 
     async def test_pop_migrates_and_reserves_job(self) -> None:
         redis_queue, client = self.make_queue()
-        job_json = json.dumps({'id': 'redis-job', 'payload': 'payload', 'attempts': 0})
-        client.rpoplpush.return_value = job_json
+        pop_script = client.register_script.return_value
+        pop_script.return_value = [json.dumps({'id': 'redis-job', 'payload': 'payload', 'attempts': 0}), 1]
 
         job_data = await redis_queue.pop('fast')
 
         self.assertEqual(job_data, {'id': 'redis-job', 'payload': 'payload', 'attempts': 1})
-        client.lrem.assert_awaited_once_with('routemq:queue:fast:reserved', 1, job_json)
-        self.assertEqual(json.loads(client.rpush.await_args.args[1])['attempts'], 1)
+        self.assertEqual(
+            pop_script.await_args.kwargs['keys'],
+            [
+                'routemq:queue:fast',
+                'routemq:queue:fast:reserved:jobs',
+                'routemq:queue:fast:reserved:at',
+                'routemq:queue:fast:attempts',
+            ],
+        )
+        client.lrem.assert_not_called()
 
     async def test_release_moves_reserved_job_back_with_delay(self) -> None:
         redis_queue, client = self.make_queue()
-        job_json = json.dumps({'id': 'redis-job', 'payload': 'payload', 'attempts': 1})
-        client.lrange.return_value = [job_json]
+        release_script = client.register_script.return_value
+        release_script.return_value = 1
 
         await redis_queue.release('redis-job', 'fast', delay=3)
 
-        client.lrem.assert_awaited_once_with('routemq:queue:fast:reserved', 1, job_json)
-        client.zadd.assert_awaited_once()
+        keys = release_script.await_args.kwargs['keys']
+        self.assertEqual(keys[0], 'routemq:queue:fast:reserved:jobs')
+        self.assertEqual(keys[3], 'routemq:queue:fast:delayed')
+        job_id, available_at = release_script.await_args.kwargs['args']
+        self.assertEqual(job_id, 'redis-job')
+        self.assertGreater(available_at, 0)
+        client.lrem.assert_not_called()
 
     async def test_delete_removes_reserved_job(self) -> None:
         redis_queue, client = self.make_queue()
-        job_json = json.dumps({'id': 'redis-job', 'payload': 'payload', 'attempts': 1})
-        client.lrange.return_value = [job_json]
+        pipeline = client.pipeline.return_value
+        pipeline.execute = AsyncMock(return_value=[1, 1, 1])
 
         await redis_queue.delete('redis-job', 'fast')
 
-        client.lrem.assert_awaited_once_with('routemq:queue:fast:reserved', 1, job_json)
+        pipeline.hdel.assert_any_call('routemq:queue:fast:reserved:jobs', 'redis-job')
+        pipeline.hdel.assert_any_call('routemq:queue:fast:attempts', 'redis-job')
+        client.lrem.assert_not_called()
 
     async def test_failed_stores_failed_job_in_redis_when_database_disabled(self) -> None:
         redis_queue, client = self.make_queue()
@@ -376,7 +407,7 @@ class TestDatabaseQueue(QueueTestCase):
         session = self.make_session()
 
         with patch.object(Model, '_is_enabled', True):
-            with patch.object(Model, 'get_session', new=AsyncMock(return_value=session)):
+            with patch.object(Model, 'get_session', new=MagicMock(return_value=session)):
                 await database_queue.push('payload', 'db', delay=5)
 
         session.add.assert_called_once()
@@ -390,27 +421,25 @@ class TestDatabaseQueue(QueueTestCase):
     async def test_pop_reserves_and_returns_database_job(self) -> None:
         database_queue = DatabaseQueue()
         session = self.make_session()
-        job = QueueJob(queue='db', payload='payload', attempts=0, available_at=datetime.utcnow())
-        job.id = 42
         result = MagicMock()
-        result.scalars.return_value.first.return_value = job
+        result.first.return_value = MagicMock(id=42, payload='payload', attempts=0)
         session.execute.return_value = result
 
         with patch.object(Model, '_is_enabled', True):
-            with patch.object(Model, 'get_session', new=AsyncMock(return_value=session)):
+            with patch.object(Model, 'get_session', new=MagicMock(return_value=session)):
                 job_data = await database_queue.pop('db')
 
         self.assertEqual(job_data, {'id': 42, 'payload': 'payload', 'attempts': 1})
-        self.assertIsNotNone(job.reserved_at)
+        update_stmt = session.execute.await_args_list[1].args[0]
+        self.assertIn('reserved_at', str(update_stmt))
         session.commit.assert_awaited_once()
-        session.refresh.assert_awaited_once_with(job)
 
     async def test_release_executes_update_and_commits(self) -> None:
         database_queue = DatabaseQueue()
         session = self.make_session()
 
         with patch.object(Model, '_is_enabled', True):
-            with patch.object(Model, 'get_session', new=AsyncMock(return_value=session)):
+            with patch.object(Model, 'get_session', new=MagicMock(return_value=session)):
                 await database_queue.release(42, 'db', delay=1)
 
         session.execute.assert_awaited_once()
@@ -422,7 +451,7 @@ class TestDatabaseQueue(QueueTestCase):
         session = self.make_session()
 
         with patch.object(Model, '_is_enabled', True):
-            with patch.object(Model, 'get_session', new=AsyncMock(return_value=session)):
+            with patch.object(Model, 'get_session', new=MagicMock(return_value=session)):
                 await database_queue.delete(42, 'db')
 
         session.execute.assert_awaited_once()
@@ -434,7 +463,7 @@ class TestDatabaseQueue(QueueTestCase):
         session = self.make_session()
 
         with patch.object(Model, '_is_enabled', True):
-            with patch.object(Model, 'get_session', new=AsyncMock(return_value=session)):
+            with patch.object(Model, 'get_session', new=MagicMock(return_value=session)):
                 await database_queue.failed('database', 'db', 'payload', 'exception')
 
         session.add.assert_called_once()
@@ -448,17 +477,21 @@ class TestDatabaseQueue(QueueTestCase):
 
     async def test_size_counts_unreserved_jobs_from_mocked_result(self) -> None:
         database_queue = DatabaseQueue()
-        session = self.make_session()
+        connection = MagicMock()
+        connection.execution_options = AsyncMock()
         result = MagicMock()
-        result.scalars.return_value.all.return_value = [object(), object()]
-        session.execute.return_value = result
+        result.scalar_one.return_value = 2
+        connection.execute = AsyncMock(return_value=result)
+        engine = MagicMock()
+        engine.connect.return_value.__aenter__ = AsyncMock(return_value=connection)
+        engine.connect.return_value.__aexit__ = AsyncMock(return_value=False)
 
         with patch.object(Model, '_is_enabled', True):
-            with patch.object(Model, 'get_session', new=AsyncMock(return_value=session)):
+            with patch.object(Model, '_engine', engine):
                 size = await database_queue.size('db')
 
         self.assertEqual(size, 2)
-        session.execute.assert_awaited_once()
+        connection.execute.assert_awaited_once()
 
 
 class TestQueueModels(unittest.TestCase):
@@ -473,7 +506,7 @@ class TestQueueModels(unittest.TestCase):
         self.assertTrue(expected_fields.issubset(QueueFailedJob.__table__.columns.keys()))
 
     def test_queue_models_can_be_constructed_without_session(self) -> None:
-        available_at = datetime.utcnow()
+        available_at = epoch_ms()
         queue_job = QueueJob(queue='default', payload='payload', attempts=0, available_at=available_at)
         failed_job = QueueFailedJob(
             connection='redis',
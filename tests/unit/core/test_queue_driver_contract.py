@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import AsyncMock
 
 from routemq.queue.queue_driver import QueueDriver
 
@@ -33,6 +34,77 @@ class QueueDriverAbstractContractTests(unittest.IsolatedAsyncioTestCase):
         self.assertIsNone(await driver.failed('c', 'q', 'p', 'e'))
         self.assertIsNone(await driver.size())
 
+    async def test_default_pop_batch_pops_until_queue_is_empty(self) -> None:
+        driver = _StubDriver()
+        jobs = iter([{'id': 1}, {'id': 2}, None])
+
+        async def pop(queue='default'):
+            return next(jobs)
+
+        driver.pop = pop  # type: ignore[method-assign]
+        self.assertEqual(await driver.pop_batch('q', 5), [{'id': 1}, {'id': 2}])
+
+    async def test_default_push_many_pushes_each_payload(self) -> None:
+        driver = _StubDriver()
+        pushed = []
+
+        async def push(payload, queue='default', delay=0):
+            pushed.append((payload, queue, delay))
+
+        driver.push = push  # type: ignore[method-assign]
+        await driver.push_many(['a', 'b'], 'q', 3)
+        self.assertEqual(pushed, [('a', 'q', 3), ('b', 'q', 3)])
+
+    async def test_default_failed_many_stores_each_record(self) -> None:
+        driver = _StubDriver()
+        stored = []
+
+        async def failed(connection, queue, payload, exception):
+            stored.append((connection, queue, payload, exception))
+
+        driver.failed = failed  # type: ignore[method-assign]
+        await driver.failed_many([{'connection': 'c', 'queue': 'q', 'payload': 'p', 'exception': 'e'}])
+        self.assertEqual(stored, [('c', 'q', 'p', 'e')])
+
+    async def test_default_release_many_releases_each_job(self) -> None:
+        driver = _StubDriver()
+        released = []
+
+        async def release(job_id, queue, delay=0):
+            released.append((job_id, queue, delay))
+
+        driver.release = release  # type: ignore[method-assign]
+        await driver.release_many([1, 2], 'q', 4)
+        self.assertEqual(released, [(1, 'q', 4), (2, 'q', 4)])
+
+    async def test_default_unreserve_many_releases_without_delay(self) -> None:
+        driver = _StubDriver()
+        driver.release_many = AsyncMock()  # type: ignore[method-assign]
+
+        await driver.unreserve_many([1, 2], 'q')
+
+        driver.release_many.assert_awaited_once_with([1, 2], 'q', 0)
+
+    async def test_default_delete_many_deletes_each_job(self) -> None:
+        driver = _StubDriver()
+        deleted = []
+
+        async def delete(job_id, queue):
+            deleted.append((job_id, queue))
+
+        driver.delete = delete  # type: ignore[method-assign]
+        await driver.delete_many([1, 2], 'q')
+        self.assertEqual(deleted, [(1, 'q'), (2, 'q')])
+
+    async def test_default_size_approx_returns_exact_size(self) -> None:
+        driver = _StubDriver()
+
+        async def size(queue='default'):
+            return 7
+
+        driver.size = size  # type: ignore[method-assign]
+        self.assertEqual(await driver.size_approx('q'), 7)
+
     def test_direct_instantiation_raises_type_error(self) -> None:
         with self.assertRaises(TypeError):
             QueueDriver()  # type: ignore[abstract]
@@ -131,6 +131,23 @@ class QueueManagerExtraTestCase(unittest.IsolatedAsyncioTestCase):
 
         self.assertIsInstance(manager.get_driver('fake'), FakeQueueDriver)
 
+    def test_get_driver_reuses_instance_per_connection(self) -> None:
+        manager = QueueManager()
+        QueueManager.register_driver('fake', FakeQueueDriver)
+
+        self.assertIs(manager.get_driver('fake'), manager.get_driver('fake'))
+
+    def test_reregistering_driver_replaces_cached_instance(self) -> None:
+        manager = QueueManager()
+        QueueManager.register_driver('fake', FakeQueueDriver)
+        first = manager.get_driver('fake')
+        replacement = FakeQueueDriver()
+
+        QueueManager.register_driver('fake', lambda: replacement)
+
+        self.assertIsNot(first, replacement)
+        self.assertIs(manager.get_driver('fake'), replacement)
+
     def test_register_driver_rejects_empty_name(self) -> None:
         with self.assertRaisesRegex(ValueError, 'cannot be empty'):
             QueueManager.register_driver(' ', FakeQueueDriver)
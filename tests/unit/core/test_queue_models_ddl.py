@@ -0,0 +1,25 @@
+import unittest
+
+from sqlalchemy.dialects import mysql
+from sqlalchemy.schema import CreateTable
+
+from routemq.queue.models import QueueFailedJob, QueueJob
+
+
+class TestQueueModelsMysqlDdl(unittest.TestCase):
+    def compile_mysql(self, model) -> str:
+        return str(CreateTable(model.__table__).compile(dialect=mysql.dialect()))
+
+    def test_queue_jobs_created_at_default_is_parenthesized(self) -> None:
+        ddl = self.compile_mysql(QueueJob)
+
+        self.assertIn('created_at BIGINT NOT NULL DEFAULT (CAST(UNIX_TIMESTAMP(NOW(3)) * 1000 AS SIGNED))', ddl)
+
+    def test_queue_failed_jobs_failed_at_default_is_parenthesized(self) -> None:
+        ddl = self.compile_mysql(QueueFailedJob)
+
+        self.assertIn('failed_at BIGINT NOT NULL DEFAULT (CAST(UNIX_TIMESTAMP(NOW(3)) * 1000 AS SIGNED))', ddl)
+
+
+if __name__ == '__main__':
+    unittest.main()
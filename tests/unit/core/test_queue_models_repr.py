@@ -1,12 +1,11 @@
 import unittest
-from datetime import datetime
 
 from routemq.queue.models import QueueFailedJob, QueueJob
 
 
 class TestQueueJobRepr(unittest.TestCase):
     def test_queue_job_repr(self) -> None:
-        available_at = datetime(2026, 5, 27, 12, 0, 0)
+        available_at = 1_779_883_200_000
         job = QueueJob(queue='default', payload='payload', attempts=2, available_at=available_at)
 
         r = repr(job)
@@ -18,7 +17,7 @@ class TestQueueJobRepr(unittest.TestCase):
 
 class TestQueueFailedJobRepr(unittest.TestCase):
     def test_queue_failed_job_repr(self) -> None:
-        failed_at = datetime(2026, 5, 27, 12, 0, 0)
+        failed_at = 1_779_883_200_000
         job = QueueFailedJob(
             connection='redis',
             queue='critical',
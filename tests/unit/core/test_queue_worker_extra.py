@@ -1,5 +1,6 @@
 import logging
 import os
+import time
 import unittest
 import asyncio
 from typing import Any, cast
@@ -112,6 +113,16 @@ class QueueWorkerControlsTests(_WorkerSignalGuard):
         worker = self._make_worker()
         worker.stop()
         self.assertTrue(worker.should_quit)
+        self.assertTrue(worker._shutdown_event.is_set())
+
+    async def test_stop_ends_idle_sleep_immediately(self) -> None:
+        worker = self._make_worker()
+        sleeper = asyncio.create_task(worker._wait_for_jobs(60))
+        await asyncio.sleep(0)
+
+        worker.stop()
+
+        await asyncio.wait_for(sleeper, timeout=1)
 
     def test_handle_signal_sets_should_quit(self) -> None:
         worker = self._make_worker()
@@ -150,10 +161,7 @@ class QueueWorkerShouldStopTests(_WorkerSignalGuard):
     def test_max_time_exceeded_stops(self) -> None:
         worker = self._make_worker(max_time=5)
         worker.start_time = 1000.0
-        with patch(
-            'routemq.queue.queue_worker.asyncio.get_event_loop',
-            return_value=MagicMock(time=MagicMock(return_value=1100.0)),
-        ):
+        with patch('routemq.queue.queue_worker.time.monotonic', return_value=1100.0):
             self.assertTrue(worker._should_stop())
 
 
@@ -187,6 +195,100 @@ class QueueWorkerProcessJobTests(_WorkerSignalGuard):
         worker.driver.delete.assert_awaited_once()
         self.assertIsNone(worker.current_job_id)
 
+    async def test_successful_job_is_batched_when_complete_delay_is_set(self) -> None:
+        worker = self._make_worker()
+        worker.complete_batch_delay_ms = 50
+        worker.driver = MagicMock()
+        worker.driver.delete = AsyncMock()
+        worker.driver.delete_many = AsyncMock()
+
+        with patch('routemq.queue.queue_worker.Job') as mock_job_cls:
+            mock_job_cls.unserialize.side_effect = lambda payload: _DummyJob()
+            await worker._process_job({'id': 'j1', 'payload': 'p', 'attempts': 1})
+            await worker._process_job({'id': 'j2', 'payload': 'p', 'attempts': 1})
+
+        worker.driver.delete.assert_not_called()
+        await worker._flush_completions()
+        worker.driver.delete_many.assert_awaited_once_with(['j1', 'j2'], 'default')
+        self.assertEqual(worker._pending_deletes, [])
+
+    async def test_failed_batched_delete_is_retried_on_next_flush(self) -> None:
+        worker = self._make_worker()
+        worker.driver = MagicMock()
+        worker.driver.delete_many = AsyncMock(side_effect=[RuntimeError('db down'), None])
+        worker._pending_deletes = ['j1']
+
+        await worker._flush_completions()
+        self.assertEqual(worker._pending_deletes, ['j1'])
+        await worker._flush_completions()
+
+        self.assertEqual(worker.driver.delete_many.await_count, 2)
+        self.assertEqual(worker._pending_deletes, [])
+
+    async def test_failed_job_record_is_batched_and_stored_before_delete(self) -> None:
+        worker = self._make_worker(max_tries=1)
+        worker.complete_batch_delay_ms = 50
+        calls: list[str] = []
+        worker.driver = MagicMock()
+        worker.driver.failed = AsyncMock()
+        worker.driver.delete = AsyncMock()
+        worker.driver.failed_many = AsyncMock(side_effect=lambda jobs: calls.append('failed_many'))
+        worker.driver.delete_many = AsyncMock(side_effect=lambda ids, queue: calls.append('delete_many'))
+
+        with patch('routemq.queue.queue_worker.Job') as mock_job_cls:
+            mock_job_cls.unserialize.return_value = _DummyJob(raises=RuntimeError('boom'))
+            await worker._process_job({'id': 'j1', 'payload': 'p', 'attempts': 1})
+
+        worker.driver.failed.assert_not_called()
+        worker.driver.delete.assert_not_called()
+        await worker._flush_completions()
+        self.assertEqual(calls, ['failed_many', 'delete_many'])
+        self.assertEqual(worker.driver.failed_many.await_args.args[0][0]['queue'], 'default')
+
+    async def test_deletes_wait_while_failed_records_cannot_be_stored(self) -> None:
+        worker = self._make_worker()
+        worker.driver = MagicMock()
+        worker.driver.failed_many = AsyncMock(side_effect=RuntimeError('db down'))
+        worker.driver.delete_many = AsyncMock()
+        worker._pending_fails = [{'connection': 'default', 'queue': 'default', 'payload': 'p', 'exception': 'e'}]
+        worker._pending_deletes = ['j1']
+
+        await worker._flush_completions()
+
+        worker.driver.delete_many.assert_not_called()
+        self.assertEqual(len(worker._pending_fails), 1)
+        self.assertEqual(worker._pending_deletes, ['j1'])
+
+    async def test_retried_jobs_are_released_in_batches_per_delay(self) -> None:
+        worker = self._make_worker(max_tries=3)
+        worker.complete_batch_delay_ms = 50
+        worker.driver = MagicMock()
+        worker.driver.release = AsyncMock()
+        worker.driver.release_many = AsyncMock()
+
+        with patch('routemq.queue.queue_worker.Job') as mock_job_cls:
+            mock_job_cls.unserialize.side_effect = lambda payload: _DummyJob(raises=RuntimeError('boom'))
+            await worker._process_job({'id': 'j1', 'payload': 'p', 'attempts': 1})
+            await worker._process_job({'id': 'j2', 'payload': 'p', 'attempts': 1})
+
+        worker.driver.release.assert_not_called()
+        await worker._flush_completions()
+        worker.driver.release_many.assert_awaited_once_with(['j1', 'j2'], 'default', 10)
+        self.assertEqual(worker._pending_releases, {})
+
+    async def test_failed_batched_release_is_retried_on_next_flush(self) -> None:
+        worker = self._make_worker()
+        worker.driver = MagicMock()
+        worker.driver.release_many = AsyncMock(side_effect=[RuntimeError('db down'), None])
+        worker._pending_releases = {5: ['j1']}
+
+        await worker._flush_completions()
+        self.assertEqual(worker._pending_releases, {5: ['j1']})
+        await worker._flush_completions()
+
+        worker.driver.release_many.assert_awaited_with(['j1'], 'default', 5)
+        self.assertEqual(worker._pending_releases, {})
+
     async def test_shutdown_grace_releases_active_long_job(self) -> None:
         worker = self._make_worker(max_tries=3)
         cast(Any, worker).shutdown_grace = 0.01
@@ -279,7 +381,7 @@ class QueueWorkerReaperTests(_WorkerSignalGuard):
     async def test_run_reaper_is_throttled_until_interval_elapsed(self) -> None:
         worker = self._make_worker()
         worker.reaper_interval = 60
-        worker._last_reaper_run = asyncio.get_running_loop().time()
+        worker._last_reaper_run = time.monotonic()
         worker.driver = MagicMock()
         worker.driver.reap_expired = AsyncMock()
         worker.driver.stats = AsyncMock()
@@ -314,6 +416,39 @@ class QueueWorkerReaperTests(_WorkerSignalGuard):
 
         self.assertFalse(worker._shutdown_event.is_set())
 
+    async def test_wait_for_jobs_returns_early_on_push_notification(self) -> None:
+        worker = self._make_worker()
+        loop = asyncio.get_running_loop()
+        loop.call_soon(worker._wake_event.set)
+        started = loop.time()
+
+        await worker._wait_for_jobs(5)
+
+        self.assertLess(loop.time() - started, 1)
+        self.assertFalse(worker._wake_event.is_set())
+
+    async def test_idle_wait_is_skipped_after_a_blocking_pop(self) -> None:
+        worker = self._make_worker()
+        worker.driver = MagicMock()
+        worker.driver.pop_blocks = True
+        worker._wait_for_jobs = AsyncMock()  # type: ignore[method-assign]
+
+        await worker._wait_when_idle()
+        worker._wait_for_jobs.assert_not_awaited()
+
+        worker.driver.pop_blocks = False
+        await worker._wait_when_idle()
+        worker._wait_for_jobs.assert_awaited_once_with(worker.sleep)
+
+    async def test_listener_failure_falls_back_to_polling(self) -> None:
+        worker = self._make_worker()
+        worker.driver = MagicMock()
+        worker.driver.listen_for_jobs = AsyncMock(side_effect=RuntimeError('no pubsub'))
+
+        await worker._listen_for_jobs()
+
+        worker.driver.listen_for_jobs.assert_awaited_once_with('default', worker._wake_event.set)
+
     async def test_process_job_requires_initialized_driver(self) -> None:
         worker = self._make_worker()
 
@@ -542,7 +677,69 @@ class QueueWorkerWorkLoopTests(_WorkerSignalGuard):
         self.assertIn('Error in worker loop for queue default', logs.output[0])
         self.assertIsNotNone(logs.records[0].exc_info)
 
-    async def test_process_job_recovers_if_second_unserialize_succeeds(self) -> None:
+    async def test_work_lets_an_in_flight_flush_finish_on_stop(self) -> None:
+        worker = self._make_worker(sleep=0)
+        worker.complete_batch_delay_ms = 10
+        worker._pending_fails = [{'connection': 'default', 'queue': 'default', 'payload': 'p', 'exception': 'e'}]
+        worker._pending_deletes = [1]
+        calls: list[str] = []
+        flush_started = asyncio.Event()
+
+        async def slow_failed_many(jobs: Any) -> None:
+            flush_started.set()
+            await asyncio.sleep(0.05)
+            calls.append('failed_many')
+
+        async def pop_until_flushing(*args: Any, **kwargs: Any) -> None:
+            await flush_started.wait()
+            worker.should_quit = True
+
+        driver = MagicMock()
+        driver.pop = AsyncMock(side_effect=pop_until_flushing)
+        driver.failed_many = AsyncMock(side_effect=slow_failed_many)
+        driver.delete_many = AsyncMock(side_effect=lambda ids, queue: calls.append('delete_many'))
+        worker.queue_manager.get_driver = MagicMock(return_value=driver)
+
+        await asyncio.wait_for(worker.work(), timeout=1)
+
+        self.assertEqual(calls, ['failed_many', 'delete_many'])
+        self.assertEqual(worker._pending_fails, [])
+        self.assertEqual(worker._pending_deletes, [])
+
+    async def test_work_drains_local_batch_before_popping_again(self) -> None:
+        worker = self._make_worker(sleep=0, batch_size=3, max_jobs=2)
+        driver = MagicMock()
+        driver.pop_batch = AsyncMock(
+            return_value=[{'id': 1, 'payload': 'a', 'attempts': 1}, {'id': 2, 'payload': 'b', 'attempts': 1}]
+        )
+        driver.release = AsyncMock()
+        worker.queue_manager.get_driver = MagicMock(return_value=driver)
+        worker._process_job = AsyncMock()  # type: ignore[method-assign]
+
+        await worker.work()
+
+        driver.pop_batch.assert_awaited_once_with('default', 3)
+        driver.pop.assert_not_called()
+        self.assertEqual([call.args[0]['id'] for call in worker._process_job.await_args_list], [1, 2])
+        driver.release.assert_not_called()
+
+    async def test_work_unreserves_buffered_jobs_on_stop(self) -> None:
+        worker = self._make_worker(sleep=0, batch_size=3, max_jobs=1)
+        driver = MagicMock()
+        driver.pop_batch = AsyncMock(
+            return_value=[{'id': 1, 'payload': 'a', 'attempts': 1}, {'id': 2, 'payload': 'b', 'attempts': 1}]
+        )
+        driver.unreserve_many = AsyncMock()
+        worker.queue_manager.get_driver = MagicMock(return_value=driver)
+        worker._process_job = AsyncMock()  # type: ignore[method-assign]
+
+        await worker.work()
+
+        driver.unreserve_many.assert_awaited_once_with([2], 'default')
+        driver.release_many.assert_not_called()
+        driver.release.assert_not_called()
+
+    async def test_process_job_unserializes_payload_once_on_failure(self) -> None:
         worker = self._make_worker(connection='redis')
         driver = MagicMock()
         driver.delete = AsyncMock()
@@ -551,21 +748,76 @@ class QueueWorkerWorkLoopTests(_WorkerSignalGuard):
 
         job = _DummyJob(raises=RuntimeError('boom'))
         with patch('routemq.queue.queue_worker.Job') as mock_job_cls:
-            mock_job_cls.unserialize.side_effect = [ValueError('first fail'), job]
+            mock_job_cls.unserialize.return_value = job
             await worker._process_job({'id': 'j1', 'payload': 'p', 'attempts': 2})
 
+        mock_job_cls.unserialize.assert_called_once_with('p')
         driver.release.assert_awaited_once()
         driver.delete.assert_not_called()
 
 
+class QueueWorkerConcurrencyTests(_WorkerSignalGuard):
+    async def test_jobs_run_concurrently_up_to_the_limit(self) -> None:
+        worker = self._make_worker(max_jobs=3, sleep=0, concurrency=2)
+        running = 0
+        peak = 0
+        jobs = iter([{'id': i, 'payload': 'p', 'attempts': 1} for i in range(3)])
+        driver = MagicMock()
+        driver.pop = AsyncMock(side_effect=lambda queue: next(jobs, None))
+        worker.queue_manager.get_driver = MagicMock(return_value=driver)
+
+        async def process(job_data: dict) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        worker._process_job = process  # type: ignore[method-assign]
+
+        await worker.work()
+
+        self.assertEqual(peak, 2)
+        self.assertEqual(worker.jobs_processed, 3)
+        self.assertEqual(driver.pop.await_count, 3)
+
+    async def test_concurrent_job_failure_is_logged_with_its_job_id(self) -> None:
+        worker = self._make_worker(concurrency=2)
+        worker._process_job = AsyncMock(side_effect=RuntimeError('boom'))  # type: ignore[method-assign]
+        slots = cast(asyncio.Semaphore, worker._job_slots)
+        await slots.acquire()
+
+        with self.assertLogs('RouteMQ.QueueWorker', level='ERROR') as logs:
+            await worker._run_concurrent_job({'id': 'j7', 'payload': 'p', 'attempts': 1})
+
+        self.assertIn('Failed to process job j7 on queue default', logs.output[0])
+        self.assertEqual(cast(Any, logs.records[0]).job_id, 'j7')
+        self.assertIsNotNone(logs.records[0].exc_info)
+
+    async def test_heartbeat_continues_while_another_job_starts(self) -> None:
+        worker = self._make_worker()
+        worker._active_job_ids = {'j1', 'j2'}
+        worker.current_job_id = 'j2'
+        beats: list[Any] = []
+
+        async def heartbeat(method_name: str, *args: Any) -> None:
+            if method_name == 'heartbeat':
+                beats.append(args[0])
+                worker._active_job_ids.discard('j1')
+
+        worker._call_driver_optional = heartbeat  # type: ignore[method-assign]
+        worker.heartbeat_interval = 0
+
+        await worker._heartbeat_active_job('j1')
+
+        self.assertEqual(beats, ['j1'])
+
+
 class QueueWorkerShouldStopExtraTests(_WorkerSignalGuard):
     def test_max_time_not_exceeded_does_not_stop(self) -> None:
         worker = self._make_worker(max_time=10)
         worker.start_time = 1000.0
-        with patch(
-            'routemq.queue.queue_worker.asyncio.get_event_loop',
-            return_value=MagicMock(time=MagicMock(return_value=1005.0)),
-        ):
+        with patch('routemq.queue.queue_worker.time.monotonic', return_value=1005.0):
             self.assertFalse(worker._should_stop())
 
 
@@ -576,10 +828,11 @@ class QueueWorkerFailJobTests(_WorkerSignalGuard):
         worker.driver.failed = AsyncMock()
 
         job = _DummyJob()
-        await worker._fail_job(cast(Any, job), RuntimeError('boom'))
+        await worker._fail_job(cast(Any, job), RuntimeError('boom'), 'original-payload')
 
         self.assertTrue(job.failed_called)
         worker.driver.failed.assert_awaited_once()
+        self.assertEqual(worker.driver.failed.await_args.kwargs['payload'], 'original-payload')
 
     async def test_fail_job_swallows_exceptions(self) -> None:
         worker = self._make_worker()
@@ -588,7 +841,7 @@ class QueueWorkerFailJobTests(_WorkerSignalGuard):
 
         job = _DummyJob()
         with self.assertLogs('RouteMQ.QueueWorker', level='ERROR') as logs:
-            await worker._fail_job(cast(Any, job), RuntimeError('orig'))
+            await worker._fail_job(cast(Any, job), RuntimeError('orig'), 'p')
 
         self.assertIn('Error handling failed job', logs.output[0])
         self.assertIsNotNone(logs.records[0].exc_info)
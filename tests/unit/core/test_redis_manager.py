@@ -1,10 +1,12 @@
+import asyncio
 import importlib
+import json
 import os
 import sys
 import types
 import unittest
 from typing import Any, cast
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 
 class TestRedisManager(unittest.IsolatedAsyncioTestCase):
@@ -92,6 +94,8 @@ class TestRedisManager(unittest.IsolatedAsyncioTestCase):
                 'REDIS_MAX_CONNECTIONS': '23',
                 'REDIS_SOCKET_TIMEOUT': '1.5',
                 'REDIS_SOCKET_CONNECT_TIMEOUT': '2.5',
+                'REDIS_HEALTH_CHECK_INTERVAL': '15',
+                'REDIS_RETRY_ON_TIMEOUT': 'true',
             }
         )
 
@@ -108,13 +112,25 @@ class TestRedisManager(unittest.IsolatedAsyncioTestCase):
             socket_timeout=1.5,
             socket_connect_timeout=2.5,
             decode_responses=True,
-            health_check_interval=30,
+            health_check_interval=15,
+            retry_on_timeout=True,
         )
         self.fake_redis_asyncio.Redis.assert_called_once_with(connection_pool=self.fake_pool)
         self.fake_client.ping.assert_awaited_once_with()
         self.assertIs(module.redis_manager.get_client(), self.fake_client)
         self.assertTrue(module.redis_manager.is_enabled())
 
+    async def test_concurrent_initialize_creates_one_pool(self) -> None:
+        self.fake_client.ping = AsyncMock(return_value=True)
+        module = self._import_manager({'ENABLE_REDIS': 'true'})
+
+        results = await asyncio.gather(*(module.redis_manager.initialize() for _ in range(3)))
+        self.assertTrue(await module.redis_manager.initialize())
+
+        self.assertEqual(results, [True, True, True])
+        self.fake_redis_asyncio.ConnectionPool.assert_called_once()
+        self.fake_client.ping.assert_awaited_once_with()
+
     async def test_initialize_failure_disables_manager_and_returns_false(self) -> None:
         self.fake_client.ping = AsyncMock(side_effect=ConnectionError('boom'))
         module = self._import_manager({'ENABLE_REDIS': 'true'})
@@ -145,6 +161,7 @@ class TestRedisManager(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(await manager.get('key'), 'value')
         self.assertTrue(await manager.set('key', 'value', ex=10, px=20, nx=True, xx=False))
+        self.assertTrue(await manager.set_with_ttl('ttl-key', 'value', 60))
         self.assertEqual(await manager.incr('counter', 2), 3)
         self.assertTrue(await manager.expire('key', 30))
         self.assertEqual(await manager.delete('a', 'b'), 2)
@@ -154,12 +171,19 @@ class TestRedisManager(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(await manager.hset('hash', 'field', 'value'), 1)
         self.assertEqual(await manager.hset('hash', mapping={'field': 'value'}), 1)
         self.assertEqual(await manager.hset('hash'), 0)
+        self.assertEqual(await manager.hset('hash', mapping={}), 0)
+        self.assertEqual(await manager.hset_field('hash', 'other', 'value'), 1)
+        self.assertEqual(await manager.hset_mapping('hash', {'other': 'value'}), 1)
 
-        self.fake_client.set.assert_awaited_once_with('key', 'value', ex=10, px=20, nx=True, xx=False)
+        self.fake_client.set.assert_any_await('key', 'value', ex=10, px=20, nx=True, xx=False)
+        self.fake_client.set.assert_any_await('ttl-key', 'value', ex=60, px=None, nx=False, xx=False)
         self.fake_client.incrby.assert_awaited_once_with('counter', 2)
         self.fake_client.delete.assert_awaited_once_with('a', 'b')
         self.fake_client.hset.assert_any_await('hash', 'field', 'value')
         self.fake_client.hset.assert_any_await('hash', mapping={'field': 'value'})
+        self.fake_client.hset.assert_any_await('hash', 'other', 'value')
+        self.fake_client.hset.assert_any_await('hash', mapping={'other': 'value'})
+        self.assertEqual(self.fake_client.hset.await_count, 4)
 
     async def test_set_emits_redis_client_span_with_redacted_command_text(self) -> None:
         module = self._import_manager({'ENABLE_REDIS': 'true', 'REDIS_HOST': 'redis-host', 'REDIS_PORT': '6380'})
@@ -216,12 +240,45 @@ class TestRedisManager(unittest.IsolatedAsyncioTestCase):
         manager.set = AsyncMock(return_value=True)
         self.assertEqual(await manager.get_json('json-key'), {'count': 2})
         self.assertTrue(await manager.set_json('json-key', {'count': 2}, ex=5))
-        manager.set.assert_awaited_once_with('json-key', '{"count": 2}', ex=5, px=None, nx=False, xx=False)
+        manager.set.assert_awaited_once_with('json-key', ANY, ex=5, px=None, nx=False, xx=False)
+        self.assertEqual(json.loads(manager.set.await_args.args[1]), {'count': 2})
 
         manager.get = AsyncMock(return_value='not-json')
         self.assertIsNone(await manager.get_json('json-key'))
         self.assertFalse(await manager.set_json('bad', object()))
 
+    async def test_scan_iter_uses_configured_scan_count(self) -> None:
+        module = self._import_manager({'ENABLE_REDIS': 'true', 'REDIS_SCAN_COUNT': '500'})
+        manager = module.redis_manager
+        manager._redis_client = self.fake_client
+        scanned: list[dict[str, Any]] = []
+
+        async def scan_iter(**kwargs: Any):
+            scanned.append(kwargs)
+            for key in ('session:1', 'session:2'):
+                yield key
+
+        self.fake_client.scan_iter = scan_iter
+
+        self.assertEqual([key async for key in manager.scan_iter('session:*')], ['session:1', 'session:2'])
+        self.assertEqual([key async for key in manager.scan_iter('session:*', count=50)], ['session:1', 'session:2'])
+        self.assertEqual(scanned, [{'match': 'session:*', 'count': 500}, {'match': 'session:*', 'count': 50}])
+
+    async def test_scan_iter_stops_quietly_when_disabled_or_failing(self) -> None:
+        module = self._import_manager({'ENABLE_REDIS': 'true'})
+        manager = module.redis_manager
+        manager._redis_client = self.fake_client
+
+        async def scan_iter(**kwargs: Any):
+            yield 'first'
+            raise RuntimeError('scan')
+
+        self.fake_client.scan_iter = scan_iter
+        self.assertEqual([key async for key in manager.scan_iter('*')], ['first'])
+
+        manager.enabled = False
+        self.assertEqual([key async for key in manager.scan_iter('*')], [])
+
     async def test_disconnect_is_idempotent_and_clears_connections(self) -> None:
         module = self._import_manager({'ENABLE_REDIS': 'true'})
         manager = module.redis_manager
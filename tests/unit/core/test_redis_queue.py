@@ -2,8 +2,8 @@ import json
 import logging
 import unittest
 from datetime import UTC, datetime, timedelta
-from typing import Any
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import Any, cast
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 from routemq import observability
 from routemq.queue.redis_queue import (
@@ -26,7 +26,7 @@ class _RedisQueueBase(unittest.IsolatedAsyncioTestCase):
         driver = RedisQueue()
         driver.redis = MagicMock()
         driver.redis.is_enabled.return_value = enabled
-        driver.redis.get_client.return_value = client or MagicMock()
+        driver.redis.get_client.return_value = (client or MagicMock()) if enabled else None
         return driver
 
 
@@ -46,6 +46,57 @@ class RedisQueuePushTests(_RedisQueueBase):
         client.rpush.assert_awaited_once()
         client.zadd.assert_not_called()
 
+    async def test_push_many_sends_one_rpush_with_unique_ids(self) -> None:
+        client = MagicMock()
+        client.rpush = AsyncMock()
+        driver = self._make_driver(client=client)
+
+        await driver.push_many(['a', 'b'], 'q')
+
+        client.rpush.assert_awaited_once()
+        key, *jobs = client.rpush.await_args.args
+        self.assertEqual(key, 'routemq:queue:q')
+        decoded = [json.loads(job) for job in jobs]
+        self.assertEqual([job['payload'] for job in decoded], ['a', 'b'])
+        self.assertEqual(len({job['id'] for job in decoded}), 2)
+
+    async def test_push_and_push_many_never_reuse_a_job_id(self) -> None:
+        client = MagicMock()
+        client.rpush = AsyncMock()
+        driver = self._make_driver(client=client)
+
+        with patch('routemq.queue.redis_queue.time.time', return_value=1000.0):
+            await driver.push('a', 'q')
+            await driver.push_many(['b', 'c'], 'q')
+            await driver.push('d', 'q')
+
+        ids = [json.loads(job)['id'] for call in client.rpush.await_args_list for job in call.args[1:]]
+        self.assertEqual(len(set(ids)), 4)
+        self.assertTrue(all(job_id.startswith(f'q:{driver._id_prefix}-') for job_id in ids))
+        self.assertIsNone(_created_at_from_redis_job_id(ids[0]))
+
+    def test_job_ids_restart_with_a_new_prefix_after_fork(self) -> None:
+        driver = self._make_driver()
+        parent_id = driver._next_job_id('q')
+
+        with patch('routemq.queue.redis_queue.os.getpid', return_value=driver._id_pid + 1):
+            child_id = driver._next_job_id('q')
+
+        self.assertNotEqual(parent_id.rsplit('-', 1)[0], child_id.rsplit('-', 1)[0])
+        self.assertTrue(child_id.endswith(f'-{driver._id_pid}-0'))
+
+    async def test_delayed_push_many_uses_one_zadd(self) -> None:
+        client = MagicMock()
+        client.rpush = AsyncMock()
+        client.zadd = AsyncMock()
+        driver = self._make_driver(client=client)
+
+        await driver.push_many(['a', 'b'], 'q', 10)
+
+        client.zadd.assert_awaited_once()
+        self.assertEqual(len(client.zadd.await_args.args[1]), 2)
+        client.rpush.assert_not_called()
+
     async def test_immediate_push_emits_redis_client_span_with_redacted_args(self) -> None:
         client = MagicMock()
         client.rpush = AsyncMock()
@@ -69,6 +120,48 @@ class RedisQueuePushTests(_RedisQueueBase):
         self.assertNotIn('payload-with-secret', span.attributes['db.query.text'])
         self.assertNotIn('secret', span.attributes['db.query.text'])
 
+    async def test_push_publishes_wake_up_when_enabled(self) -> None:
+        client = MagicMock()
+        client.rpush = AsyncMock()
+        client.publish = AsyncMock()
+        driver = self._make_driver(client=client)
+        driver.wake_notify = True
+
+        await driver.push('p', 'q', 0)
+
+        client.publish.assert_awaited_once_with('routemq:queue:q:wake', 'q')
+
+    async def test_push_skips_wake_up_by_default(self) -> None:
+        client = MagicMock()
+        client.rpush = AsyncMock()
+        client.publish = AsyncMock()
+        driver = self._make_driver(client=client)
+
+        await driver.push('p', 'q', 0)
+
+        client.publish.assert_not_called()
+
+    async def test_listen_for_jobs_wakes_once_per_message(self) -> None:
+        async def listen():
+            yield {'type': 'message', 'data': 'q'}
+            yield {'type': 'message', 'data': 'q'}
+
+        pubsub = MagicMock()
+        pubsub.subscribe = AsyncMock()
+        pubsub.aclose = AsyncMock()
+        pubsub.listen = listen
+        client = MagicMock()
+        client.pubsub.return_value = pubsub
+        driver = self._make_driver(client=client)
+        driver.wake_notify = True
+        wake = MagicMock()
+
+        await driver.listen_for_jobs('q', wake)
+
+        pubsub.subscribe.assert_awaited_once_with('routemq:queue:q:wake')
+        self.assertEqual(wake.call_count, 2)
+        pubsub.aclose.assert_awaited_once()
+
     async def test_delayed_push_uses_zadd(self) -> None:
         client = MagicMock()
         client.rpush = AsyncMock()
@@ -88,6 +181,58 @@ class RedisQueuePushTests(_RedisQueueBase):
             await driver.push('p', 'q', 0)
 
 
+class RedisQueuePushFastTests(_RedisQueueBase):
+    async def test_buffered_jobs_are_written_in_one_push_many_per_queue_and_delay(self) -> None:
+        driver = self._make_driver()
+        driver.push_many = AsyncMock()  # type: ignore[method-assign]
+
+        driver.push_fast('a', 'q')
+        driver.push_fast('b', 'q')
+        driver.push_fast('c', 'q', delay=5)
+        driver.push_many.assert_not_called()
+        await driver.flush_pushes()
+
+        self.assertEqual(
+            driver.push_many.await_args_list,
+            [call(['a', 'b'], 'q', 0), call(['c'], 'q', 5)],
+        )
+        self.assertIsNone(driver._push_flusher)
+
+    async def test_background_flusher_writes_without_an_explicit_flush(self) -> None:
+        driver = self._make_driver()
+        driver.push_many = AsyncMock()  # type: ignore[method-assign]
+
+        driver.push_fast('a', 'q')
+        flusher = cast(Any, driver._push_flusher)
+        await flusher
+
+        driver.push_many.assert_awaited_once_with(['a'], 'q', 0)
+        self.assertEqual(driver._push_buffer, {})
+
+    async def test_full_buffer_wakes_the_flusher_early(self) -> None:
+        driver = self._make_driver()
+        driver.push_many = AsyncMock()  # type: ignore[method-assign]
+
+        with patch('routemq.queue.redis_queue._PUSH_FLUSH_SIZE', 2):
+            driver.push_fast('a', 'q')
+            self.assertFalse(driver._push_ready.is_set())
+            driver.push_fast('b', 'q')
+            self.assertTrue(driver._push_ready.is_set())
+        await driver.flush_pushes()
+
+    async def test_failed_write_is_logged_and_dropped(self) -> None:
+        driver = self._make_driver()
+        driver.push_many = AsyncMock(side_effect=[RuntimeError('down'), None])  # type: ignore[method-assign]
+        driver.push_fast('a', 'lost')
+        driver.push_fast('b', 'kept')
+
+        with self.assertLogs('RouteMQ.RedisQueue', level='ERROR') as logs:
+            await driver.flush_pushes()
+
+        self.assertIn("Dropped 1 buffered job(s) for queue 'lost'", logs.output[0])
+        driver.push_many.assert_awaited_with(['b'], 'kept', 0)
+
+
 class RedisQueuePopTests(_RedisQueueBase):
     async def test_disabled_redis_returns_none(self) -> None:
         driver = self._make_driver(enabled=False)
@@ -95,59 +240,167 @@ class RedisQueuePopTests(_RedisQueueBase):
 
     async def test_empty_queue_returns_none(self) -> None:
         client = MagicMock()
-        client.rpoplpush = AsyncMock(return_value=None)
-        client.zrangebyscore = AsyncMock(return_value=[])
+        client.register_script.return_value = AsyncMock(return_value=None)
         driver = self._make_driver(client=client)
         self.assertIsNone(await driver.pop('q'))
 
-    async def test_pop_increments_attempts_and_returns_payload(self) -> None:
-        job = {'id': 'q:1', 'payload': 'payload-blob', 'attempts': 2}
+    async def test_pop_reserves_job_with_one_script_call(self) -> None:
+        queued = {'id': 'q:1', 'payload': 'payload-blob', 'attempts': 0}
         client = MagicMock()
-        client.zrangebyscore = AsyncMock(return_value=[])
-        client.rpoplpush = AsyncMock(return_value=json.dumps(job))
+        pop_script = AsyncMock(return_value=[json.dumps(queued), 3])
+        client.register_script.return_value = pop_script
         client.lrem = AsyncMock()
         client.rpush = AsyncMock()
         driver = self._make_driver(client=client)
+        driver._migrate_delayed_jobs = AsyncMock()  # type: ignore[method-assign]
+
+        result = await driver.pop('q')
+
+        self.assertEqual(result, {'id': 'q:1', 'payload': 'payload-blob', 'attempts': 3})
+        pop_script.assert_awaited_once()
+        self.assertEqual(
+            pop_script.await_args.kwargs['keys'],
+            [
+                driver._get_queue_key('q'),
+                driver._get_reserved_hash_key('q'),
+                driver._get_reserved_zset_key('q'),
+                driver._get_attempts_key('q'),
+            ],
+        )
+        self.assertIs(pop_script.await_args.kwargs['client'], client)
+        driver.redis.get_client.assert_called_once_with()
+        driver.redis.is_enabled.assert_not_called()
+        client.lrem.assert_not_called()
+        client.rpush.assert_not_called()
+
+    async def test_pop_adds_attempts_stored_in_legacy_job_json(self) -> None:
+        reserved = {'id': 'q:1', 'payload': 'p', 'attempts': 2}
+        client = MagicMock()
+        client.register_script.return_value = AsyncMock(return_value=[json.dumps(reserved), 1])
+        driver = self._make_driver(client=client)
+        driver._migrate_delayed_jobs = AsyncMock()  # type: ignore[method-assign]
 
         result = await driver.pop('q')
-        self.assertIsNotNone(result)
-        assert result is not None
-        self.assertEqual(result['attempts'], 3)
-        self.assertEqual(result['id'], 'q:1')
+
+        self.assertEqual(cast(dict, result)['attempts'], 3)
+
+    async def test_pop_registers_each_script_once(self) -> None:
+        client = MagicMock()
+        client.register_script.side_effect = lambda source: AsyncMock(return_value=None)
+        driver = self._make_driver(client=client)
+
+        await driver.pop('q')
+        await driver.pop('q')
+
+        # One registration for the delayed-job migration, one for the pop itself
+        self.assertEqual(client.register_script.call_count, 2)
 
     async def test_pop_swallows_exceptions_and_returns_none(self) -> None:
         client = MagicMock()
-        client.zrangebyscore = AsyncMock(side_effect=RuntimeError('boom'))
-        client.rpoplpush = AsyncMock(side_effect=RuntimeError('boom'))
+        client.register_script.return_value = AsyncMock(side_effect=RuntimeError('boom'))
         driver = self._make_driver(client=client)
         self.assertIsNone(await driver.pop('q'))
 
 
+class RedisQueueBlockingPopTests(_RedisQueueBase):
+    def _blocking_driver(self, client: Any, reserved: list[Any]) -> RedisQueue:
+        driver = self._make_driver(client=client)
+        driver.block_timeout = 2.0
+        driver._migrate_delayed_jobs = AsyncMock()  # type: ignore[method-assign]
+        client.register_script.return_value = AsyncMock(side_effect=reserved)
+        client.zrange = AsyncMock(return_value=[])
+        client.blmove = AsyncMock(return_value=None)
+        return driver
+
+    def test_block_timeout_stays_below_socket_timeout(self) -> None:
+        with patch.dict('os.environ', {'QUEUE_BLOCK_TIMEOUT': '30'}):
+            driver = RedisQueue()
+
+        self.assertEqual(driver.block_timeout, driver.redis.socket_timeout - 1)
+        self.assertTrue(driver.pop_blocks)
+
+    async def test_empty_pop_blocks_on_queue_then_reserves(self) -> None:
+        job = {'id': 'q:1', 'payload': 'p', 'attempts': 1}
+        client = MagicMock()
+        driver = self._blocking_driver(client, [None, [json.dumps({**job, 'attempts': 0}), 1]])
+
+        result = await driver.pop('q')
+
+        self.assertEqual(result, job)
+        queue_key = driver._get_queue_key('q')
+        client.blmove.assert_awaited_once_with(queue_key, queue_key, 2.0, 'RIGHT', 'RIGHT')
+
+    async def test_ready_job_is_reserved_without_blocking(self) -> None:
+        client = MagicMock()
+        driver = self._blocking_driver(client, [[json.dumps({'id': 'q:1', 'payload': 'p', 'attempts': 0}), 1]])
+
+        await driver.pop('q')
+
+        client.blmove.assert_not_called()
+
+    async def test_block_ends_when_next_delayed_job_is_due(self) -> None:
+        client = MagicMock()
+        driver = self._blocking_driver(client, [None, None])
+        client.zrange.return_value = [('q:2', 1000.5)]
+
+        with patch('routemq.queue.redis_queue.time.time', return_value=1000.0):
+            self.assertIsNone(await driver.pop('q'))
+
+        self.assertEqual(client.blmove.await_args.args[2], 0.5)
+        self.assertEqual(driver._migrate_delayed_jobs.await_count, 2)
+
+    async def test_pop_batch_blocks_only_for_first_job(self) -> None:
+        job = [json.dumps({'id': 'q:1', 'payload': 'p', 'attempts': 0}), 1]
+        client = MagicMock()
+        driver = self._blocking_driver(client, [None, job, None])
+
+        jobs = await driver.pop_batch('q', 5)
+
+        self.assertEqual([j['id'] for j in jobs], ['q:1'])
+        client.blmove.assert_awaited_once()
+
+    async def test_failed_blocking_pop_waits_out_its_timeout(self) -> None:
+        client = MagicMock()
+        driver = self._blocking_driver(client, RuntimeError('boom'))
+
+        with patch('routemq.queue.redis_queue.asyncio.sleep', new=AsyncMock()) as sleep:
+            self.assertIsNone(await driver.pop('q'))
+
+        sleep.assert_awaited_once_with(2.0)
+
+
 class RedisQueueDelayedMigrationTests(_RedisQueueBase):
-    async def test_migrate_skips_when_disabled(self) -> None:
-        driver = self._make_driver(enabled=False)
-        await driver._migrate_delayed_jobs('q')
+    async def test_reserve_migrates_with_the_callers_client(self) -> None:
+        client = MagicMock()
+        client.register_script.return_value = AsyncMock(side_effect=[0, None])
+        driver = self._make_driver(client=client)
 
-    async def test_migrate_moves_available_jobs(self) -> None:
+        self.assertIsNone(await driver._reserve_job(client, 'q'))
+
+        driver.redis.get_client.assert_not_called()
+        self.assertEqual(client.register_script.return_value.await_count, 2)
+
+    async def test_migrate_moves_available_jobs_with_one_script_call(self) -> None:
         client = MagicMock()
-        pipe = MagicMock()
-        pipe.execute = AsyncMock()
-        pipe.rpush = MagicMock()
-        pipe.zrem = MagicMock()
-        client.pipeline.return_value = pipe
-        client.zrangebyscore = AsyncMock(return_value=['{"id":"q:1"}', '{"id":"q:2"}'])
+        migrate_script = AsyncMock(return_value=2)
+        client.register_script.return_value = migrate_script
         driver = self._make_driver(client=client)
 
-        await driver._migrate_delayed_jobs('q')
-        self.assertEqual(pipe.rpush.call_count, 2)
-        self.assertEqual(pipe.zrem.call_count, 2)
-        pipe.execute.assert_awaited_once()
+        with patch('routemq.queue.redis_queue.time.time', return_value=1000.0):
+            await driver._migrate_delayed_jobs(client, 'q')
+
+        migrate_script.assert_awaited_once()
+        self.assertEqual(
+            migrate_script.await_args.kwargs['keys'], [driver._get_delayed_key('q'), driver._get_queue_key('q')]
+        )
+        self.assertEqual(migrate_script.await_args.kwargs['args'], [1000.0, 1000])
+        client.pipeline.assert_not_called()
 
-    async def test_migrate_swallows_pipeline_failure(self) -> None:
+    async def test_migrate_swallows_script_failure(self) -> None:
         client = MagicMock()
-        client.zrangebyscore = AsyncMock(side_effect=RuntimeError('boom'))
+        client.register_script.return_value = AsyncMock(side_effect=RuntimeError('boom'))
         driver = self._make_driver(client=client)
-        await driver._migrate_delayed_jobs('q')
+        await driver._migrate_delayed_jobs(client, 'q')
 
 
 class RedisQueueReleaseTests(_RedisQueueBase):
@@ -155,95 +408,170 @@ class RedisQueueReleaseTests(_RedisQueueBase):
         driver = self._make_driver(enabled=False)
         await driver.release('q:1', 'q')
 
-    async def test_release_without_delay_pushes_back(self) -> None:
-        reserved = json.dumps({'id': 'q:1', 'payload': 'p', 'attempts': 1})
+    async def test_release_without_delay_runs_release_script(self) -> None:
         client = MagicMock()
-        client.lrange = AsyncMock(return_value=[reserved])
-        client.lrem = AsyncMock()
-        client.rpush = AsyncMock()
-        client.zadd = AsyncMock()
+        release_script = AsyncMock(return_value=1)
+        client.register_script.return_value = release_script
+        client.lrange = AsyncMock()
         driver = self._make_driver(client=client)
 
         await driver.release('q:1', 'q', delay=0)
-        client.lrem.assert_awaited_once()
-        client.rpush.assert_awaited_once()
-        client.zadd.assert_not_called()
 
-    async def test_release_with_delay_uses_zadd(self) -> None:
-        reserved = json.dumps({'id': 'q:1', 'payload': 'p', 'attempts': 1})
+        release_script.assert_awaited_once()
+        self.assertEqual(
+            release_script.await_args.kwargs['keys'],
+            [
+                driver._get_reserved_hash_key('q'),
+                driver._get_reserved_zset_key('q'),
+                driver._get_queue_key('q'),
+                driver._get_delayed_key('q'),
+            ],
+        )
+        self.assertEqual(release_script.await_args.kwargs['args'], ['q:1', 0])
+        client.lrange.assert_not_called()
+
+    async def test_release_with_delay_passes_available_time(self) -> None:
         client = MagicMock()
-        client.lrange = AsyncMock(return_value=[reserved])
-        client.lrem = AsyncMock()
-        client.rpush = AsyncMock()
-        client.zadd = AsyncMock()
+        release_script = AsyncMock(return_value=1)
+        client.register_script.return_value = release_script
         driver = self._make_driver(client=client)
 
-        await driver.release('q:1', 'q', delay=5)
-        client.zadd.assert_awaited_once()
-        client.rpush.assert_not_called()
+        with patch('routemq.queue.redis_queue.time.time', return_value=1000.0):
+            await driver.release('q:1', 'q', delay=5)
+
+        self.assertEqual(release_script.await_args.kwargs['args'], ['q:1', 1005.0])
 
     async def test_release_logs_warning_when_job_not_found(self) -> None:
         client = MagicMock()
-        client.lrange = AsyncMock(return_value=[])
+        client.register_script.return_value = AsyncMock(return_value=0)
         driver = self._make_driver(client=client)
-        await driver.release('missing', 'q', 0)
+        with self.assertLogs('RouteMQ.RedisQueue', level='WARNING') as logs:
+            await driver.release('missing', 'q', 0)
+        self.assertIn('not found in reserved queue', logs.output[0])
 
     async def test_release_propagates_unexpected_error(self) -> None:
         client = MagicMock()
-        client.lrange = AsyncMock(side_effect=RuntimeError('boom'))
+        client.register_script.return_value = AsyncMock(side_effect=RuntimeError('boom'))
         driver = self._make_driver(client=client)
         with self.assertRaises(RuntimeError):
             await driver.release('id', 'q')
 
 
+class RedisQueueUnreserveTests(_RedisQueueBase):
+    async def test_unreserve_many_returns_jobs_in_pop_order_and_undoes_attempts(self) -> None:
+        client = MagicMock()
+        unreserve_script = AsyncMock(return_value=2)
+        client.register_script.return_value = unreserve_script
+        driver = self._make_driver(client=client)
+
+        await driver.unreserve_many(['q:1', 'q:2'], 'q')
+
+        unreserve_script.assert_awaited_once()
+        self.assertEqual(
+            unreserve_script.await_args.kwargs['keys'],
+            [
+                driver._get_reserved_hash_key('q'),
+                driver._get_reserved_zset_key('q'),
+                driver._get_queue_key('q'),
+                driver._get_attempts_key('q'),
+            ],
+        )
+        self.assertEqual(unreserve_script.await_args.kwargs['args'], ['q:2', 'q:1'])
+        self.assertIn("HINCRBY', KEYS[4], job_id, -1", client.register_script.call_args.args[0])
+
+    async def test_unreserve_many_skips_empty_batch(self) -> None:
+        client = MagicMock()
+        driver = self._make_driver(client=client)
+        await driver.unreserve_many([], 'q')
+        client.register_script.assert_not_called()
+
+
+def _transaction(client: MagicMock, results: list[Any]) -> MagicMock:
+    pipeline = MagicMock()
+    pipeline.execute = AsyncMock(return_value=results)
+    client.pipeline.return_value = pipeline
+    return pipeline
+
+
 class RedisQueueDeleteTests(_RedisQueueBase):
     async def test_delete_when_disabled_is_noop(self) -> None:
         driver = self._make_driver(enabled=False)
         await driver.delete('q:1', 'q')
 
-    async def test_delete_removes_matching_job(self) -> None:
-        reserved = json.dumps({'id': 'q:1', 'payload': 'p', 'attempts': 1})
+    async def test_delete_removes_job_from_hash_and_sorted_set(self) -> None:
         client = MagicMock()
-        client.lrange = AsyncMock(return_value=[reserved])
-        client.lrem = AsyncMock()
+        pipeline = _transaction(client, [1, 1, 1])
         driver = self._make_driver(client=client)
 
         await driver.delete('q:1', 'q')
-        client.lrem.assert_awaited_once()
+
+        client.pipeline.assert_called_once_with(transaction=True)
+        self.assertEqual(
+            pipeline.hdel.call_args_list,
+            [call(driver._get_reserved_hash_key('q'), 'q:1'), call(driver._get_attempts_key('q'), 'q:1')],
+        )
+        pipeline.zrem.assert_called_once_with(driver._get_reserved_zset_key('q'), 'q:1')
+        pipeline.execute.assert_awaited_once()
 
     async def test_delete_warns_when_job_not_found(self) -> None:
         client = MagicMock()
-        client.lrange = AsyncMock(return_value=[])
+        _transaction(client, [0, 0, 0])
         driver = self._make_driver(client=client)
-        await driver.delete('missing', 'q')
+        with self.assertLogs('RouteMQ.RedisQueue', level='WARNING') as logs:
+            await driver.delete('missing', 'q')
+        self.assertIn('not found in reserved queue', logs.output[0])
 
     async def test_delete_propagates_unexpected_error(self) -> None:
         client = MagicMock()
-        client.lrange = AsyncMock(side_effect=RuntimeError('boom'))
+        pipeline = _transaction(client, [])
+        pipeline.execute.side_effect = RuntimeError('boom')
         driver = self._make_driver(client=client)
         with self.assertRaises(RuntimeError):
             await driver.delete('id', 'q')
 
+    async def test_delete_many_removes_batch_in_one_transaction(self) -> None:
+        client = MagicMock()
+        pipeline = _transaction(client, [2, 2, 2])
+        driver = self._make_driver(client=client)
+
+        await driver.delete_many(['q:1', 'q:2'], 'q')
+
+        pipeline.hdel.assert_any_call(driver._get_reserved_hash_key('q'), 'q:1', 'q:2')
+        pipeline.hdel.assert_any_call(driver._get_attempts_key('q'), 'q:1', 'q:2')
+        pipeline.zrem.assert_called_once_with(driver._get_reserved_zset_key('q'), 'q:1', 'q:2')
+        pipeline.execute.assert_awaited_once()
+
+    async def test_delete_many_skips_empty_batch(self) -> None:
+        client = MagicMock()
+        driver = self._make_driver(client=client)
+
+        await driver.delete_many([], 'q')
+
+        client.pipeline.assert_not_called()
+
 
 class RedisQueueFailedTests(_RedisQueueBase):
     async def test_failed_stores_in_database_when_model_enabled(self) -> None:
         session = MagicMock()
         session.add = MagicMock()
+        session.execute = AsyncMock()
         session.commit = AsyncMock()
         session.close = AsyncMock()
         driver = self._make_driver()
 
-        with (
-            patch('routemq.queue.redis_queue.Model') as mock_model,
-            patch('routemq.queue.redis_queue.QueueFailedJob') as mock_failed_cls,
-        ):
+        with patch('routemq.queue.redis_queue.Model') as mock_model:
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
-            mock_failed_cls.return_value = MagicMock()
+            mock_model.get_session = MagicMock(return_value=session)
 
             await driver.failed('redis', 'q', 'p', 'exc')
 
-        session.add.assert_called_once()
+        session.add.assert_not_called()
+        statement = session.execute.await_args.args[0]
+        self.assertEqual(statement.table.name, 'queue_failed_jobs')
+        params = statement.compile().params
+        self.assertEqual((params['connection'], params['queue'], params['payload']), ('redis', 'q', 'p'))
+        self.assertEqual(params['exception'], 'exc')
+        self.assertNotIn('failed_at', params)
         session.commit.assert_awaited_once()
         session.close.assert_awaited_once()
 
@@ -257,6 +585,70 @@ class RedisQueueFailedTests(_RedisQueueBase):
             await driver.failed('redis', 'q', 'p', 'exc')
 
         client.rpush.assert_awaited_once()
+        failed_data = json.loads(client.rpush.await_args.args[1])
+        self.assertEqual(failed_data['payload'], 'p')
+        micros = int(failed_data['id'].rsplit(':', 1)[1])
+        self.assertAlmostEqual(datetime.fromisoformat(failed_data['failed_at']).timestamp(), micros / 1e6, delta=1e-5)
+
+    async def test_failed_many_stores_one_queue_with_one_rpush_and_unique_ids(self) -> None:
+        client = MagicMock()
+        client.rpush = AsyncMock()
+        driver = self._make_driver(client=client)
+        failed_jobs = [{'connection': 'redis', 'queue': 'q', 'payload': f'p{i}', 'exception': 'exc'} for i in range(3)]
+
+        with (
+            patch('routemq.queue.redis_queue.Model') as mock_model,
+            patch('routemq.queue.redis_queue.time.time_ns', return_value=1_000_000_000_000),
+        ):
+            mock_model._is_enabled = False
+            await driver.failed_many(failed_jobs)
+
+        client.rpush.assert_awaited_once()
+        key, *records = client.rpush.await_args.args
+        self.assertEqual(key, 'routemq:queue:failed:q')
+        decoded = [json.loads(record) for record in records]
+        self.assertEqual([record['payload'] for record in decoded], ['p0', 'p1', 'p2'])
+        self.assertEqual(
+            [record['id'] for record in decoded], ['failed:q:1000000000', 'failed:q:1000000001', 'failed:q:1000000002']
+        )
+        client.pipeline.assert_not_called()
+
+    async def test_failed_many_pipelines_several_queues_and_raises_on_error(self) -> None:
+        client = MagicMock()
+        pipeline = _transaction(client, [])
+        pipeline.execute.side_effect = RuntimeError('redis down')
+        driver = self._make_driver(client=client)
+        failed_jobs = [
+            {'connection': 'redis', 'queue': 'a', 'payload': 'p', 'exception': 'exc'},
+            {'connection': 'redis', 'queue': 'b', 'payload': 'p', 'exception': 'exc'},
+        ]
+
+        with patch('routemq.queue.redis_queue.Model') as mock_model:
+            mock_model._is_enabled = False
+            with self.assertRaises(RuntimeError):
+                await driver.failed_many(failed_jobs)
+
+        self.assertEqual([c.args[0] for c in pipeline.rpush.call_args_list], [driver._get_failed_key(q) for q in 'ab'])
+
+    async def test_failed_many_inserts_database_rows_in_one_statement(self) -> None:
+        session = MagicMock()
+        session.execute = AsyncMock()
+        session.commit = AsyncMock()
+        session.close = AsyncMock()
+        driver = self._make_driver()
+        failed_jobs = [{'connection': 'redis', 'queue': 'q', 'payload': f'p{i}', 'exception': 'exc'} for i in range(2)]
+
+        with patch('routemq.queue.redis_queue.Model') as mock_model:
+            mock_model._is_enabled = True
+            mock_model.get_session = MagicMock(return_value=session)
+            await driver.failed_many(failed_jobs)
+
+        session.execute.assert_awaited_once()
+        rows = session.execute.await_args.args[1]
+        self.assertEqual([row['payload'] for row in rows], ['p0', 'p1'])
+        self.assertTrue(all('failed_at' not in row for row in rows))
+        session.commit.assert_awaited_once()
+        session.close.assert_awaited_once()
 
     async def test_list_get_retry_forget_and_flush_failed_jobs_in_redis(self) -> None:
         failed = json.dumps(
@@ -291,16 +683,14 @@ class RedisQueueFailedTests(_RedisQueueBase):
     async def test_failed_swallows_database_storage_errors(self) -> None:
         session = MagicMock()
         session.add = MagicMock()
+        session.execute = AsyncMock()
         session.commit = AsyncMock(side_effect=RuntimeError('db down'))
         session.close = AsyncMock()
         driver = self._make_driver()
 
-        with (
-            patch('routemq.queue.redis_queue.Model') as mock_model,
-            patch('routemq.queue.redis_queue.QueueFailedJob'),
-        ):
+        with patch('routemq.queue.redis_queue.Model') as mock_model:
             mock_model._is_enabled = True
-            mock_model.get_session = AsyncMock(return_value=session)
+            mock_model.get_session = MagicMock(return_value=session)
             await driver.failed('redis', 'q', 'p', 'exc')
 
         session.close.assert_awaited_once()
@@ -319,40 +709,35 @@ class RedisQueueFailedTests(_RedisQueueBase):
 
 
 class RedisQueueVisibilityReaperTests(_RedisQueueBase):
-    async def test_reap_expired_reserved_job_requeues_when_attempts_remain(self) -> None:
-        reserved_job = json.dumps(
-            {
-                'id': 'q:1',
-                'payload': json.dumps({'max_tries': 3}),
-                'attempts': 1,
-                'reserved_at': (datetime.now(UTC) - timedelta(seconds=301)).isoformat(),
-            }
-        )
+    def _reaper_client(
+        self, expired_ids: list[str], job_jsons: list[str | None], attempts: list[str | None] | None = None
+    ) -> MagicMock:
         client = MagicMock()
-        client.lrange = AsyncMock(return_value=[reserved_job])
-        client.lrem = AsyncMock()
-        client.rpush = AsyncMock()
+        client.zrangebyscore = AsyncMock(return_value=expired_ids)
+        # First HMGET reads the reserved jobs, the second their attempt counts
+        client.hmget = AsyncMock(side_effect=[job_jsons, attempts or [None] * len(job_jsons)])
+        client.zrem = AsyncMock()
+        client.lrange = AsyncMock(return_value=[])
+        client.register_script.return_value = AsyncMock(return_value=1)
+        return client
+
+    async def test_reap_expired_reserved_job_requeues_when_attempts_remain(self) -> None:
+        reserved_job = json.dumps({'id': 'q:1', 'payload': json.dumps({'max_tries': 3}), 'attempts': 0})
+        client = self._reaper_client(['q:1'], [reserved_job], ['2'])
         driver = self._make_driver(client=client)
 
-        reaped = await driver.reap_expired('q', visibility_timeout=300)
+        with patch('routemq.queue.redis_queue.time.time', return_value=1000.0):
+            reaped = await driver.reap_expired('q', visibility_timeout=300)
 
         self.assertEqual(reaped, 1)
-        client.lrem.assert_awaited_once_with(driver._get_reserved_key('q'), 1, reserved_job)
-        client.rpush.assert_awaited_once()
+        client.zrangebyscore.assert_awaited_once_with(driver._get_reserved_zset_key('q'), '-inf', 700.0)
+        release_script = client.register_script.return_value
+        self.assertEqual(release_script.await_args.kwargs['args'], ['q:1', 0])
 
     async def test_reap_expired_reserved_job_moves_exhausted_to_failed(self) -> None:
-        reserved_job = json.dumps(
-            {
-                'id': 'q:1',
-                'payload': json.dumps({'max_tries': 1}),
-                'attempts': 1,
-                'reserved_at': (datetime.now(UTC) - timedelta(seconds=301)).isoformat(),
-            }
-        )
-        client = MagicMock()
-        client.lrange = AsyncMock(return_value=[reserved_job])
-        client.lrem = AsyncMock()
-        client.rpush = AsyncMock()
+        reserved_job = json.dumps({'id': 'q:1', 'payload': json.dumps({'max_tries': 2}), 'attempts': 0})
+        client = self._reaper_client(['q:1'], [reserved_job], ['2'])
+        pipeline = _transaction(client, [1, 1, 1])
         driver = self._make_driver(client=client)
 
         with patch.object(driver, 'failed', new=AsyncMock()) as failed:
@@ -360,18 +745,52 @@ class RedisQueueVisibilityReaperTests(_RedisQueueBase):
 
         self.assertEqual(reaped, 1)
         failed.assert_awaited_once()
-        client.rpush.assert_not_called()
+        client.hmget.assert_awaited_with(driver._get_attempts_key('q'), ['q:1'])
+        pipeline.hdel.assert_any_call(driver._get_reserved_hash_key('q'), 'q:1')
+        pipeline.hdel.assert_any_call(driver._get_attempts_key('q'), 'q:1')
+        client.register_script.return_value.assert_not_called()
+
+    async def test_reap_skips_job_finished_by_its_worker_meanwhile(self) -> None:
+        reserved_job = json.dumps({'id': 'q:1', 'payload': json.dumps({'max_tries': 1}), 'attempts': 1})
+        client = self._reaper_client(['q:1'], [reserved_job])
+        _transaction(client, [0, 0, 0])
+        driver = self._make_driver(client=client)
+
+        with patch.object(driver, 'failed', new=AsyncMock()) as failed:
+            reaped = await driver.reap_expired('q', visibility_timeout=300)
+
+        self.assertEqual(reaped, 0)
+        failed.assert_not_called()
+
+    async def test_reap_drops_sorted_set_entries_without_a_job(self) -> None:
+        client = self._reaper_client(['q:gone'], [None])
+        driver = self._make_driver(client=client)
+
+        reaped = await driver.reap_expired('q', visibility_timeout=300)
+
+        self.assertEqual(reaped, 0)
+        client.zrem.assert_awaited_once_with(driver._get_reserved_zset_key('q'), 'q:gone')
 
     async def test_reap_ignores_unexpired_reserved_jobs(self) -> None:
+        client = self._reaper_client([], [])
+        driver = self._make_driver(client=client)
+
+        reaped = await driver.reap_expired('q', visibility_timeout=300)
+
+        self.assertEqual(reaped, 0)
+        client.hmget.assert_not_called()
+        client.register_script.return_value.assert_not_called()
+
+    async def test_reap_recovers_jobs_from_legacy_reserved_list(self) -> None:
         reserved_job = json.dumps(
             {
                 'id': 'q:1',
                 'payload': json.dumps({'max_tries': 3}),
                 'attempts': 1,
-                'reserved_at': datetime.now(UTC).isoformat(),
+                'reserved_at': (datetime.now(UTC) - timedelta(seconds=301)).isoformat(),
             }
         )
-        client = MagicMock()
+        client = self._reaper_client([], [])
         client.lrange = AsyncMock(return_value=[reserved_job])
         client.lrem = AsyncMock()
         client.rpush = AsyncMock()
@@ -379,9 +798,9 @@ class RedisQueueVisibilityReaperTests(_RedisQueueBase):
 
         reaped = await driver.reap_expired('q', visibility_timeout=300)
 
-        self.assertEqual(reaped, 0)
-        client.lrem.assert_not_called()
-        client.rpush.assert_not_called()
+        self.assertEqual(reaped, 1)
+        client.lrem.assert_awaited_once_with(driver._get_reserved_key('q'), 1, reserved_job)
+        self.assertNotIn('reserved_at', json.loads(client.rpush.await_args.args[1]))
 
     async def test_reap_returns_zero_when_disabled(self) -> None:
         driver = self._make_driver(enabled=False)
@@ -391,31 +810,35 @@ class RedisQueueVisibilityReaperTests(_RedisQueueBase):
 
 class RedisQueueHeartbeatTests(_RedisQueueBase):
     async def test_heartbeat_refreshes_reserved_job_timestamp(self) -> None:
-        reserved = json.dumps({'id': 'q:1', 'payload': 'p', 'attempts': 1, 'reserved_at': 'old'})
         client = MagicMock()
-        client.lrange = AsyncMock(return_value=[reserved])
-        client.lrem = AsyncMock()
-        client.rpush = AsyncMock()
+        client.zadd = AsyncMock(return_value=1)
         driver = self._make_driver(client=client)
 
-        refreshed = await driver.heartbeat('q:1', 'q')
+        with patch('routemq.queue.redis_queue.time.time', return_value=1000.0):
+            refreshed = await driver.heartbeat('q:1', 'q')
 
         self.assertTrue(refreshed)
-        client.lrem.assert_awaited_once_with(driver._get_reserved_key('q'), 1, reserved)
-        pushed_payload = client.rpush.await_args.args[1]
-        self.assertIn('reserved_at', json.loads(pushed_payload))
+        client.zadd.assert_awaited_once_with(driver._get_reserved_zset_key('q'), {'q:1': 1000.0}, xx=True, ch=True)
+
+    async def test_heartbeat_reports_lost_reservation(self) -> None:
+        client = MagicMock()
+        client.zadd = AsyncMock(return_value=0)
+        driver = self._make_driver(client=client)
+
+        self.assertFalse(await driver.heartbeat('q:1', 'q'))
 
     async def test_write_worker_heartbeat_uses_hash_with_ttl(self) -> None:
         client = MagicMock()
-        client.hset = AsyncMock()
-        client.expire = AsyncMock()
+        pipeline = _transaction(client, [3, 1])
         driver = self._make_driver(client=client)
         heartbeat = {'worker_id': 'worker-1', 'queue': 'default', 'state': 'running'}
 
         await driver.write_worker_heartbeat(heartbeat, ttl=30)
 
-        client.hset.assert_awaited_once()
-        client.expire.assert_awaited_once_with('routemq:queue:workers:worker-1', 30)
+        client.pipeline.assert_called_once_with(transaction=True)
+        pipeline.hset.assert_called_once()
+        pipeline.expire.assert_called_once_with('routemq:queue:workers:worker-1', 30)
+        pipeline.execute.assert_awaited_once()
 
     async def test_mark_worker_dead_sets_state_dead(self) -> None:
         client = MagicMock()
@@ -464,7 +887,8 @@ class RedisQueueStatsTests(_RedisQueueBase):
             }
         )
         client = MagicMock()
-        client.llen = AsyncMock(side_effect=[3, 2, 4])
+        client.llen = AsyncMock(side_effect=[3, 4])
+        client.hlen = AsyncMock(return_value=2)
         client.zcard = AsyncMock(return_value=1)
         client.lindex = AsyncMock(return_value=old_ready)
         driver = self._make_driver(client=client)
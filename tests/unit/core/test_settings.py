@@ -24,6 +24,10 @@ class MqttSettingsTests(unittest.TestCase):
         self.assertEqual(settings.main_client_id, 'mqtt-framework-main-1234')
         self.assertEqual(settings.worker_client_id_prefix, 'mqtt-worker')
         self.assertEqual(settings.group_name, 'mqtt_framework_group')
+        self.assertEqual(settings.ingress.queue_size, 10000)
+        self.assertEqual(settings.ingress.consumers, 8)
+        self.assertEqual(settings.ingress.full_strategy, 'drop_newest')
+        self.assertFalse(settings.worker_cpu_affinity)
 
     def test_load_mqtt_settings_parses_values(self) -> None:
         settings = load_mqtt_settings(
@@ -43,6 +47,10 @@ class MqttSettingsTests(unittest.TestCase):
                 'MQTT_RETRY_JITTER': '1.5',
                 'MQTT_CLIENT_ID': 'client',
                 'MQTT_GROUP_NAME': 'group',
+                'MQTT_INGRESS_QUEUE_SIZE': '50',
+                'MQTT_INGRESS_CONSUMERS': '0',
+                'MQTT_INGRESS_FULL_STRATEGY': 'DROP_OLDEST',
+                'MQTT_WORKER_CPU_AFFINITY': 'true',
             }
         )
 
@@ -62,6 +70,10 @@ class MqttSettingsTests(unittest.TestCase):
         self.assertEqual(settings.main_client_id, 'client')
         self.assertEqual(settings.worker_client_id_prefix, 'client')
         self.assertEqual(settings.group_name, 'group')
+        self.assertEqual(settings.ingress.queue_size, 50)
+        self.assertEqual(settings.ingress.consumers, 1)
+        self.assertEqual(settings.ingress.full_strategy, 'drop_oldest')
+        self.assertTrue(settings.worker_cpu_affinity)
 
     def test_load_mqtt_settings_raises_for_invalid_port(self) -> None:
         with self.assertRaises(ValueError):
@@ -416,6 +428,9 @@ class QueueReliabilitySettingsTests(unittest.TestCase):
         self.assertEqual(settings.reaper_interval, 30)
         self.assertEqual(settings.shutdown_grace, 300)
         self.assertEqual(settings.heartbeat_interval, 10)
+        self.assertEqual(settings.complete_batch_delay_ms, 0)
+        self.assertFalse(settings.wake_notify)
+        self.assertEqual(settings.block_timeout, 0)
 
     def test_load_queue_reliability_settings_parses_values(self) -> None:
         settings = load_queue_reliability_settings(
@@ -424,6 +439,9 @@ class QueueReliabilitySettingsTests(unittest.TestCase):
                 'QUEUE_REAPER_INTERVAL': '15',
                 'QUEUE_SHUTDOWN_GRACE': '45',
                 'QUEUE_HEARTBEAT_INTERVAL': '5',
+                'QUEUE_COMPLETE_BATCH_DELAY_MS': '50',
+                'QUEUE_WAKE_NOTIFY': 'true',
+                'QUEUE_BLOCK_TIMEOUT': '2',
             }
         )
 
@@ -431,6 +449,9 @@ class QueueReliabilitySettingsTests(unittest.TestCase):
         self.assertEqual(settings.reaper_interval, 15)
         self.assertEqual(settings.shutdown_grace, 45)
         self.assertEqual(settings.heartbeat_interval, 5)
+        self.assertEqual(settings.complete_batch_delay_ms, 50)
+        self.assertTrue(settings.wake_notify)
+        self.assertEqual(settings.block_timeout, 2)
 
     def test_load_queue_reliability_settings_falls_back_for_invalid_numbers(self) -> None:
         settings = load_queue_reliability_settings(
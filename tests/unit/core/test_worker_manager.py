@@ -2,8 +2,9 @@ import unittest
 from typing import Any, cast
 from unittest.mock import MagicMock, call, patch
 
+from routemq.mqtt_utils import build_worker_broker_config
 from routemq.router import Router
-from routemq.worker_manager import WorkerManager, WorkerProcess, worker_process_main
+from routemq.worker_manager import WorkerManager, WorkerProcess, _pickled_worker_process_main, worker_process_main
 
 
 async def first_handler(*, payload: Any, client: Any) -> None:
@@ -55,6 +56,34 @@ class TestWorkerManager(unittest.TestCase):
             ],
         )
 
+    def test_shared_routes_info_is_reused_until_routes_are_added(self) -> None:
+        router = self.make_router()
+        manager = WorkerManager(router, group_name='workers', router_directory='app.routers')
+
+        first = manager.get_shared_routes_info()
+        self.assertIs(manager.get_shared_routes_info(), first)
+
+        router.on('shared/three', first_handler, qos=0, shared=True, worker_count=1)
+        refreshed = manager.get_shared_routes_info()
+
+        self.assertIsNot(refreshed, first)
+        self.assertEqual(refreshed[-1]['topic'], 'shared/three')
+
+    def test_shared_routes_info_is_rebuilt_when_routes_are_replaced(self) -> None:
+        router = self.make_router()
+        manager = WorkerManager(router, group_name='workers', router_directory='app.routers')
+        first = manager.get_shared_routes_info()
+
+        replacement = Router()
+        replacement.on('plain/topic', first_handler)
+        replacement.on('replaced/one', first_handler, shared=True)
+        replacement.on('replaced/two', first_handler, shared=True)
+        router.routes = replacement.routes
+        refreshed = manager.get_shared_routes_info()
+
+        self.assertIsNot(refreshed, first)
+        self.assertEqual(refreshed[0]['topic'], 'replaced/one')
+
     def test_start_workers_spawns_processes_only_when_shared_routes_exist(self) -> None:
         router = Router()
         router.on('plain/topic', first_handler, shared=False, worker_count=5)
@@ -92,7 +121,10 @@ class TestWorkerManager(unittest.TestCase):
                 'MQTT_CLIENT_ID': 'route-worker',
             },
         ):
-            with patch('routemq.worker_manager.multiprocessing.Process', side_effect=processes) as process_cls:
+            with (
+                patch('routemq.worker_manager.multiprocessing.get_start_method', return_value='fork'),
+                patch('routemq.worker_manager.multiprocessing.Process', side_effect=processes) as process_cls,
+            ):
                 manager.start_workers(num_workers=2)
 
         first_call, second_call = process_cls.call_args_list
@@ -104,18 +136,90 @@ class TestWorkerManager(unittest.TestCase):
             'port': '1884',
             'username': 'user',
             'password': 'pass',
+            'socket_path': None,
+            'keepalive': 60,
+            'max_inflight': 20,
             'client_id_prefix': 'route-worker',
         }
 
         self.assertIs(first_kwargs['target'], worker_process_main)
         self.assertEqual(
-            first_kwargs['args'], (0, 'custom.routers', expected_shared_routes, expected_broker_config, 'workers')
+            first_kwargs['args'],
+            (0, 'custom.routers', expected_shared_routes, expected_broker_config, 'workers', manager.router),
         )
         self.assertIs(second_kwargs['target'], worker_process_main)
         self.assertEqual(
-            second_kwargs['args'], (1, 'custom.routers', expected_shared_routes, expected_broker_config, 'workers')
+            second_kwargs['args'],
+            (1, 'custom.routers', expected_shared_routes, expected_broker_config, 'workers', manager.router),
         )
 
+    def test_spawned_workers_share_one_pickled_config(self) -> None:
+        manager = WorkerManager(self.make_router(), group_name='workers', router_directory='custom.routers')
+        processes = [self.make_process(pid=220), self.make_process(pid=221)]
+
+        with (
+            patch('routemq.worker_manager.multiprocessing.get_start_method', return_value='spawn'),
+            patch('routemq.worker_manager.multiprocessing.Process', side_effect=processes) as process_cls,
+        ):
+            manager.start_workers(num_workers=2)
+
+        first_args, second_args = (c.kwargs['args'] for c in process_cls.call_args_list)
+        self.assertIs(process_cls.call_args.kwargs['target'], _pickled_worker_process_main)
+        self.assertEqual((first_args[0], second_args[0]), (0, 1))
+        self.assertIs(first_args[1], second_args[1])
+
+        with patch('routemq.worker_manager.worker_process_main') as worker_main:
+            _pickled_worker_process_main(*second_args)
+
+        worker_main.assert_called_once_with(
+            1, 'custom.routers', manager.get_shared_routes_info(), build_worker_broker_config(), 'workers'
+        )
+
+    def test_start_workers_pins_workers_round_robin_when_affinity_enabled(self) -> None:
+        manager = WorkerManager(self.make_router(), group_name='workers', router_directory='app.routers')
+        manager.cpu_affinity = True
+        processes = [self.make_process(pid=pid) for pid in (230, 231, 232, 233, 234)]
+
+        with (
+            patch('routemq.worker_manager.multiprocessing.Process', side_effect=processes),
+            patch('routemq.worker_manager.os.sched_getaffinity', return_value={4, 2}, create=True),
+            patch('routemq.worker_manager.os.sched_setaffinity', create=True) as set_affinity,
+        ):
+            manager.start_workers()
+
+        self.assertEqual(
+            set_affinity.call_args_list,
+            [call(230, {2}), call(231, {4}), call(232, {2}), call(233, {4}), call(234, {2})],
+        )
+
+    def test_start_workers_keeps_unpinned_worker_when_affinity_fails(self) -> None:
+        manager = WorkerManager(self.make_router(), group_name='workers', router_directory='app.routers')
+        manager.cpu_affinity = True
+        process = self.make_process(pid=240)
+
+        with (
+            patch('routemq.worker_manager.multiprocessing.Process', return_value=process),
+            patch('routemq.worker_manager.os.sched_getaffinity', return_value={0}, create=True),
+            patch('routemq.worker_manager.os.sched_setaffinity', side_effect=OSError('denied'), create=True),
+            self.assertLogs('RouteMQ.WorkerManager', level='WARNING') as logs,
+        ):
+            manager.start_workers(num_workers=1)
+
+        self.assertEqual(manager.workers, [process])
+        self.assertTrue(any('Could not pin worker 0' in message for message in logs.output))
+
+    def test_start_workers_leaves_affinity_alone_by_default(self) -> None:
+        manager = WorkerManager(self.make_router(), group_name='workers', router_directory='app.routers')
+
+        with (
+            patch('routemq.worker_manager.multiprocessing.Process', return_value=self.make_process(pid=250)),
+            patch('routemq.worker_manager.os.sched_setaffinity', create=True) as set_affinity,
+        ):
+            manager.start_workers(num_workers=1)
+
+        self.assertFalse(manager.cpu_affinity)
+        set_affinity.assert_not_called()
+
     def test_worker_broker_config_uses_framework_defaults(self) -> None:
         manager = WorkerManager(self.make_router(), group_name='workers', router_directory='app.routers')
         process = self.make_process(pid=210)
@@ -132,6 +236,9 @@ class TestWorkerManager(unittest.TestCase):
                 'port': '1883',
                 'username': None,
                 'password': None,
+                'socket_path': None,
+                'keepalive': 60,
+                'max_inflight': 20,
                 'client_id_prefix': 'mqtt-worker',
             },
         )
@@ -163,10 +270,7 @@ class TestWorkerManager(unittest.TestCase):
 
         self.assertEqual(
             client.subscribe.call_args_list,
-            [
-                call('$share/workers/shared/one', 1),
-                call('$share/workers/shared/two/+', 2),
-            ],
+            [call([('$share/workers/shared/one', 1), ('$share/workers/shared/two/+', 2)])],
         )
 
     def test_stop_workers_terminates_alive_processes_and_clears_tracking(self) -> None:
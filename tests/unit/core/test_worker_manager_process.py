@@ -1,4 +1,5 @@
 import logging
+import signal
 import unittest
 from typing import Any, cast
 from unittest.mock import MagicMock, patch
@@ -43,6 +44,17 @@ class WorkerProcessSetupRouterTests(unittest.TestCase):
         mock_registry_cls.assert_called_once_with('custom.routers')
         self.assertIs(worker.router, fake_router)
 
+    def test_setup_router_keeps_router_inherited_from_parent(self) -> None:
+        parent_router = Router()
+        worker = WorkerProcess(
+            0, 'custom.routers', [], {'broker': 'localhost', 'port': '1883'}, 'workers', router=parent_router
+        )
+        with patch('routemq.worker_manager.RouterRegistry') as mock_registry_cls:
+            worker.setup_router()
+
+        mock_registry_cls.assert_not_called()
+        self.assertIs(worker.router, parent_router)
+
     def test_setup_router_uses_empty_when_directory_empty(self) -> None:
         worker = _make_worker(router_directory='')
         worker.setup_router()
@@ -105,9 +117,15 @@ class WorkerProcessOnConnectTests(unittest.TestCase):
         worker = _make_worker(shared_routes=routes, group_name='workers')
         fake_client = MagicMock()
         worker._on_connect(fake_client, None, None, 0)
-        call_args = [c.args for c in fake_client.subscribe.call_args_list]
-        self.assertIn(('$share/workers/devices/+/status', 1), call_args)
-        self.assertIn(('$share/workers/sensors/+/data', 0), call_args)
+        fake_client.subscribe.assert_called_once_with(
+            [('$share/workers/devices/+/status', 1), ('$share/workers/sensors/+/data', 0)]
+        )
+
+    def test_on_connect_without_shared_routes_does_not_subscribe(self) -> None:
+        worker = _make_worker(shared_routes=[], group_name='workers')
+        fake_client = MagicMock()
+        worker._on_connect(fake_client, None, None, 0)
+        fake_client.subscribe.assert_not_called()
 
 
 class WorkerProcessOnMessageTests(unittest.TestCase):
@@ -258,16 +276,51 @@ class WorkerProcessRunTests(unittest.TestCase):
 
         with (
             patch('routemq.mqtt_utils.mqtt_client.Client', return_value=fake_client),
-            patch('routemq.worker_manager.time.sleep', side_effect=KeyboardInterrupt()),
+            patch.object(worker._stop_event, 'wait', side_effect=KeyboardInterrupt()),
             patch.object(worker, 'setup_router'),
         ):
             worker.run()
 
-        fake_client.connect.assert_called_once_with('h', 1883)
+        fake_client.connect.assert_called_once_with('h', 1883, keepalive=60)
         fake_client.loop_start.assert_called_once()
         fake_client.loop_stop.assert_called_once()
         fake_client.disconnect.assert_called_once()
 
+    def test_run_connects_over_unix_socket_when_configured(self) -> None:
+        worker = _make_worker(broker_config={'broker': 'h', 'port': '1883', 'socket_path': '/run/mqtt.sock'})
+        fake_client = MagicMock()
+
+        with (
+            patch('routemq.mqtt_utils.mqtt_client.Client', return_value=fake_client) as client_class,
+            patch.object(worker._stop_event, 'wait', side_effect=KeyboardInterrupt()),
+            patch.object(worker, 'setup_router'),
+        ):
+            worker.run()
+
+        self.assertEqual(client_class.call_args.kwargs['transport'], 'unix')
+        fake_client.connect.assert_called_once_with('/run/mqtt.sock', 1883, keepalive=60)
+
+    def test_run_returns_and_cleans_up_after_sigterm(self) -> None:
+        worker = _make_worker(broker_config={'broker': 'h', 'port': '1883'})
+        fake_client = MagicMock()
+        previous_handler = signal.getsignal(signal.SIGTERM)
+
+        def deliver_sigterm() -> bool:
+            signal.getsignal(signal.SIGTERM)(signal.SIGTERM, None)
+            return worker._stop_event.is_set()
+
+        with (
+            patch('routemq.mqtt_utils.mqtt_client.Client', return_value=fake_client),
+            patch.object(worker._stop_event, 'wait', side_effect=deliver_sigterm),
+            patch.object(worker, 'setup_router'),
+        ):
+            worker.run()
+
+        self.assertTrue(worker._stop_event.is_set())
+        fake_client.loop_stop.assert_called_once()
+        fake_client.disconnect.assert_called_once()
+        self.assertIs(signal.getsignal(signal.SIGTERM), previous_handler)
+
     def test_run_logs_expected_broker_connect_failure_without_loop_cleanup(self) -> None:
         worker = _make_worker(broker_config={'broker': 'h', 'port': '1883'})
         fake_client = MagicMock()
@@ -311,7 +364,7 @@ class WorkerProcessMainEntryTests(unittest.TestCase):
             worker_process_main(7, 'r', [], {'broker': 'h', 'port': '1883'}, 'group')
 
         configure_logging.assert_called_once_with(log_to_console=True)
-        mock_cls.assert_called_once_with(7, 'r', [], {'broker': 'h', 'port': '1883'}, 'group')
+        mock_cls.assert_called_once_with(7, 'r', [], {'broker': 'h', 'port': '1883'}, 'group', None)
         instance.run.assert_called_once_with()
 
 
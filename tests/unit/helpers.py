@@ -0,0 +1,26 @@
+from typing import Any, Callable
+
+
+def make_async_recorder(result: Any = None) -> Callable:
+    """Return a plain async handler that records each call's ``(args, kwargs)`` in ``.calls`` and returns ``result``."""
+    calls: list[tuple[tuple, dict]] = []
+
+    async def recorder(*args: Any, **kwargs: Any) -> Any:
+        calls.append((args, kwargs))
+        return result
+
+    recorder.calls = calls  # type: ignore[attr-defined]
+    return recorder
+
+
+class FakeClient:
+    """Minimal MQTT client stand-in; ``publish`` and ``subscribe`` record their arguments in ``.calls``."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple, dict]] = []
+
+    def publish(self, *args: Any, **kwargs: Any) -> None:
+        self.calls.append(('publish', args, kwargs))
+
+    def subscribe(self, *args: Any, **kwargs: Any) -> None:
+        self.calls.append(('subscribe', args, kwargs))
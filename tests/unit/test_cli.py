@@ -17,7 +17,7 @@ class TestCliSubcommands(unittest.TestCase):
             main()
 
     def test_run_subcommand_calls_application_run(self):
-        with patch('routemq.cli.create_app') as mock_create, patch('routemq.cli.create_env_file'):
+        with patch('routemq.cli.create_app') as mock_create, patch('routemq.cli.create_env_file') as create_env:
             mock_app = MagicMock()
             mock_create.return_value = mock_app
 
@@ -25,6 +25,7 @@ class TestCliSubcommands(unittest.TestCase):
 
             mock_app.connect.assert_called_once()
             mock_app.run.assert_called_once()
+            create_env.assert_not_called()
 
     def test_tinker_subcommand_calls_run_tinker(self):
         with patch('routemq.cli.tinker') as mock_tinker:
@@ -40,12 +41,16 @@ class TestCliSubcommands(unittest.TestCase):
 
     def test_queue_work_subcommand_passes_args(self):
         with patch('routemq.cli.queue_work') as mock_qw:
-            self._run_with_argv(['queue-work', '--queue', 'emails', '--sleep', '5'])
+            self._run_with_argv(
+                ['queue-work', '--queue', 'emails', '--sleep', '5', '--batch-size', '10', '--concurrency', '4']
+            )
 
             mock_qw.assert_called_once()
             _, kwargs = mock_qw.call_args
             self.assertEqual(kwargs['queue'], 'emails')
             self.assertEqual(kwargs['sleep'], 5)
+            self.assertEqual(kwargs['batch_size'], 10)
+            self.assertEqual(kwargs['concurrency'], 4)
 
     def test_queue_failed_subcommand_passes_filters(self):
         with patch('routemq.cli._cmd_queue_failed') as command:
@@ -114,7 +119,7 @@ class TestCliSubcommands(unittest.TestCase):
         )
 
     def test_no_args_defaults_to_run(self):
-        with patch('routemq.cli.create_app') as mock_create, patch('routemq.cli.create_env_file'):
+        with patch('routemq.cli.create_app') as mock_create:
             mock_app = MagicMock()
             mock_create.return_value = mock_app
 
@@ -125,7 +130,6 @@ class TestCliSubcommands(unittest.TestCase):
     def test_run_subcommand_exits_on_connection_refused(self):
         with (
             patch('routemq.cli.create_app') as mock_create,
-            patch('routemq.cli.create_env_file'),
             patch.dict(os.environ, {'LOG_FORMATTER': 'plain'}, clear=True),
             patch('sys.stderr', new_callable=io.StringIO) as mock_stderr,
         ):
@@ -146,7 +150,6 @@ class TestCliSubcommands(unittest.TestCase):
     def test_run_subcommand_exits_on_timeout_error(self):
         with (
             patch('routemq.cli.create_app') as mock_create,
-            patch('routemq.cli.create_env_file'),
             patch.dict(os.environ, {'LOG_FORMATTER': 'plain'}, clear=True),
             patch('sys.stderr', new_callable=io.StringIO),
         ):
@@ -163,7 +166,6 @@ class TestCliSubcommands(unittest.TestCase):
     def test_run_subcommand_exits_on_socket_gaierror(self):
         with (
             patch('routemq.cli.create_app') as mock_create,
-            patch('routemq.cli.create_env_file'),
             patch.dict(os.environ, {'LOG_FORMATTER': 'plain'}, clear=True),
             patch('sys.stderr', new_callable=io.StringIO),
         ):
@@ -180,7 +182,6 @@ class TestCliSubcommands(unittest.TestCase):
     def test_run_subcommand_exits_on_network_oserror(self):
         with (
             patch('routemq.cli.create_app') as mock_create,
-            patch('routemq.cli.create_env_file'),
             patch.dict(os.environ, {'LOG_FORMATTER': 'plain'}, clear=True),
             patch('sys.stderr', new_callable=io.StringIO),
         ):
@@ -195,7 +196,7 @@ class TestCliSubcommands(unittest.TestCase):
             mock_app.run.assert_not_called()
 
     def test_run_subcommand_propagates_non_network_oserror(self):
-        with patch('routemq.cli.create_app') as mock_create, patch('routemq.cli.create_env_file'):
+        with patch('routemq.cli.create_app') as mock_create:
             mock_app = MagicMock()
             mock_app.connect.side_effect = OSError(errno.ENOSPC, 'No space left on device')
             mock_create.return_value = mock_app
@@ -207,7 +208,7 @@ class TestCliSubcommands(unittest.TestCase):
             mock_app.run.assert_not_called()
 
     def test_run_subcommand_propagates_programmer_errors(self):
-        with patch('routemq.cli.create_app') as mock_create, patch('routemq.cli.create_env_file'):
+        with patch('routemq.cli.create_app') as mock_create:
             mock_app = MagicMock()
             mock_app.connect.side_effect = AttributeError("'NoneType' object has no attribute 'foo'")
             mock_create.return_value = mock_app
@@ -220,7 +221,6 @@ class TestCliSubcommands(unittest.TestCase):
     def test_no_args_defaults_to_run_exits_on_network_error(self):
         with (
             patch('routemq.cli.create_app') as mock_create,
-            patch('routemq.cli.create_env_file'),
             patch.dict(os.environ, {'LOG_FORMATTER': 'plain'}, clear=True),
             patch('sys.stderr', new_callable=io.StringIO),
         ):
@@ -238,7 +238,6 @@ class TestCliSubcommands(unittest.TestCase):
     def test_run_subcommand_logs_network_error_when_json_logging_enabled(self):
         with (
             patch('routemq.cli.create_app') as mock_create,
-            patch('routemq.cli.create_env_file'),
             patch('routemq.cli.logger.error') as log_error,
             patch.dict(os.environ, {'LOG_FORMATTER': 'json', 'MQTT_BROKER': 'mqtt', 'MQTT_PORT': '1884'}, clear=True),
             patch('sys.stderr', new_callable=io.StringIO) as mock_stderr,
@@ -263,5 +262,53 @@ class TestCliSubcommands(unittest.TestCase):
         self.assertFalse(is_network_startup_error(OSError(errno.ENOSPC, 'No space left on device')))
 
 
+class TestSetupExample(unittest.TestCase):
+    def test_setup_example_creates_missing_files_and_keeps_existing_ones(self):
+        import tempfile
+
+        from routemq.cli import setup_example
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cwd = os.getcwd()
+            os.chdir(tmp)
+            self.addCleanup(os.chdir, cwd)
+            os.makedirs('app/controllers')
+            with open('app/controllers/example_controller.py', 'w') as f:
+                f.write('# mine\n')
+
+            with patch('builtins.print'):
+                setup_example()
+
+            with open('app/controllers/example_controller.py') as f:
+                self.assertEqual(f.read(), '# mine\n')
+            for path in ('app/__init__.py', 'app/models/__init__.py'):
+                self.assertTrue(os.path.isfile(path), path)
+            with open('app/routers/example_device.py') as f:
+                self.assertIn('ExampleController.handle_message', f.read())
+            with open('app/middleware/example_middleware.py') as f:
+                self.assertIn('class LoggingMiddleware(Middleware)', f.read())
+            os.chdir(cwd)
+
+    def test_create_env_file_leaves_existing_env_untouched(self):
+        import tempfile
+
+        from routemq.cli import create_env_file
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cwd = os.getcwd()
+            os.chdir(tmp)
+            self.addCleanup(os.chdir, cwd)
+            with open('.env', 'w') as f:
+                f.write('MQTT_BROKER=broker.local\n')
+
+            with patch('builtins.print') as mock_print:
+                create_env_file()
+
+            with open('.env') as f:
+                self.assertEqual(f.read(), 'MQTT_BROKER=broker.local\n')
+            mock_print.assert_not_called()
+            os.chdir(cwd)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,17 +1,26 @@
 import unittest
+from types import MappingProxyType
 from unittest.mock import AsyncMock, MagicMock
 
 from routemq.middleware import Middleware
+from tests.unit.helpers import make_async_recorder
+
+
+_SHARED_CLIENT = MagicMock()
+_CONTEXT_TEMPLATE = MappingProxyType(
+    {
+        'topic': 'test/topic',
+        'payload': {'test': 'data'},
+        'params': {'id': '123'},
+        'client': _SHARED_CLIENT,
+    }
+)
 
 
 class TestMiddleware(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
-        self.test_context = {
-            'topic': 'test/topic',
-            'payload': {'test': 'data'},
-            'params': {'id': '123'},
-            'client': MagicMock(),
-        }
+        # Middleware writes into the context, so each test gets its own copy of the template
+        self.test_context = dict(_CONTEXT_TEMPLATE)
 
     async def test_middleware_chain(self):
         class _TestMiddleware(Middleware):
@@ -21,12 +30,12 @@ class TestMiddleware(unittest.IsolatedAsyncioTestCase):
                 result['middleware_processed'] = True
                 return result
 
-        mock_handler = AsyncMock(return_value={'status': 'success'})
+        handler = make_async_recorder({'status': 'success'})
         middleware = _TestMiddleware()
-        result = await middleware.handle(self.test_context, mock_handler)
+        result = await middleware.handle(self.test_context, handler)
 
-        mock_handler.assert_called_once()
-        context_arg = mock_handler.call_args[0][0]
+        self.assertEqual(len(handler.calls), 1)
+        context_arg = handler.calls[0][0][0]
         self.assertEqual(context_arg['modified_by'], 'middleware')
         self.assertTrue(result['middleware_processed'])
         self.assertEqual(result['status'], 'success')
@@ -1,13 +1,14 @@
 import unittest
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import AsyncMock
 
 from routemq.router import Router, Route
+from tests.unit.helpers import FakeClient, make_async_recorder
 
 
 class TestRouter(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
         self.router = Router()
-        self.test_client = MagicMock()
+        self.test_client = FakeClient()
 
     def test_route_creation(self):
         async def test_handler(device_id, payload, client):
@@ -30,6 +31,21 @@ class TestRouter(unittest.IsolatedAsyncioTestCase):
         params = route.matches('devices/123/sensors')
         self.assertIsNone(params)
 
+    def test_route_matches_by_param_slots_and_falls_back_to_pattern(self):
+        route = Route('devices/{device_id}/status', AsyncMock())
+
+        self.assertEqual(route._param_slots, [('device_id', 1)])
+        self.assertEqual(route.matches('devices/abc/status'), {'device_id': 'abc'})
+        self.assertIsNone(route.matches('devices//status'))
+        self.assertIsNone(route.matches('devices/abc/state'))
+        self.assertIsNone(route.matches('devices/abc/status/extra'))
+
+        partial = Route('devices/dev-{device_id}/status', AsyncMock())
+
+        self.assertIsNone(partial._tokens)
+        self.assertEqual(partial.matches('devices/dev-7/status'), {'device_id': '7'})
+        self.assertIsNone(partial.matches('devices/7/status'))
+
     def test_router_group(self):
         async def test_handler(device_id, payload, client):
             return {'status': 'success', 'device_id': device_id}
@@ -51,13 +67,13 @@ class TestRouter(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(self.router.routes[0].topic, 'devices/status/{device_id}')
 
     async def test_route_dispatch(self):
-        handler_mock = AsyncMock(return_value={'status': 'success'})
-        self.router.on('devices/{device_id}/status', handler_mock)
+        handler = make_async_recorder({'status': 'success'})
+        self.router.on('devices/{device_id}/status', handler)
 
         await self.router.dispatch('devices/123/status', {'value': 25}, self.test_client)
 
-        handler_mock.assert_called_once()
-        args, kwargs = handler_mock.call_args
+        self.assertEqual(len(handler.calls), 1)
+        args, kwargs = handler.calls[0]
         self.assertEqual(kwargs['device_id'], '123')
         self.assertEqual(kwargs['payload'], {'value': 25})
         self.assertEqual(kwargs['client'], self.test_client)
@@ -80,6 +96,15 @@ class TestRouter(unittest.IsolatedAsyncioTestCase):
         result = route.get_subscription_topic()
         self.assertEqual(result, 'devices/status')
 
+    def test_route_has_no_instance_dict(self):
+        async def test_handler(payload, client):
+            return {'status': 'success'}
+
+        route = Route('devices/status', test_handler)
+        self.assertFalse(hasattr(route, '__dict__'))
+        with self.assertRaises(AttributeError):
+            route.extra = True
+
     def test_group_combines_group_and_route_middleware(self):
         from routemq.middleware import Middleware
 
@@ -139,6 +164,95 @@ class TestRouter(unittest.IsolatedAsyncioTestCase):
         with self.assertRaisesRegex(ValueError, 'No route found for topic'):
             await self.router.dispatch('unknown/topic', {}, self.test_client)
 
+    async def test_dispatch_prefers_first_registered_route(self):
+        param_handler = AsyncMock()
+        literal_handler = AsyncMock()
+        self.router.on('devices/{device_id}/status', param_handler)
+        self.router.on('devices/main/status', literal_handler)
+
+        await self.router.dispatch('devices/main/status', {}, self.test_client)
+
+        param_handler.assert_called_once()
+        literal_handler.assert_not_called()
+
+    async def test_dispatch_keeps_regex_semantics_for_non_plain_segments(self):
+        handler = AsyncMock()
+        self.router.on('files/{name}.json', handler)
+
+        await self.router.dispatch('files/report.json', {}, self.test_client)
+
+        self.assertEqual(handler.call_args.kwargs['name'], 'report')
+
+    async def test_dispatch_matches_regex_routes_in_registration_order(self):
+        json_handler = AsyncMock()
+        any_handler = AsyncMock()
+        literal_handler = AsyncMock()
+        self.router.on('files/{name}.json', json_handler)
+        self.router.on('files/{name}.*', any_handler)
+        self.router.on('files/{name}', literal_handler)
+
+        await self.router.dispatch('files/report.json', {}, self.test_client)
+        await self.router.dispatch('files/report.csv', {}, self.test_client)
+
+        self.assertIsNotNone(self.router._regex_union)
+        self.assertEqual(json_handler.call_args.kwargs['name'], 'report')
+        any_handler.assert_called_once()
+        literal_handler.assert_not_called()
+
+    async def test_dispatch_scans_regex_routes_when_they_cannot_be_joined(self):
+        first_handler = AsyncMock()
+        second_handler = AsyncMock()
+        self.router.on('a/(?P<kind>x+)', first_handler)
+        self.router.on('b/(?P<kind>y+)', second_handler)
+
+        await self.router.dispatch('b/yy', {}, self.test_client)
+
+        self.assertIsNone(self.router._regex_union)
+        first_handler.assert_not_called()
+        self.assertEqual(second_handler.call_args.kwargs['kind'], 'yy')
+
+    async def test_dispatch_does_not_match_empty_segment_to_parameter(self):
+        self.router.on('devices/{device_id}/status', AsyncMock())
+
+        with self.assertRaisesRegex(ValueError, 'No route found for topic'):
+            await self.router.dispatch('devices//status', {}, self.test_client)
+
+    async def test_dispatch_picks_up_routes_added_after_compile(self):
+        self.router.on('first', AsyncMock())
+        self.router.compile()
+        handler = AsyncMock()
+        self.router.routes.append(Route('second/{id}', handler))
+
+        await self.router.dispatch('second/7', {}, self.test_client)
+
+        self.assertEqual(handler.call_args.kwargs['id'], '7')
+
+    async def test_dispatch_reuses_the_route_middleware_chain(self):
+        from routemq.middleware import Middleware
+
+        class _PassMW(Middleware):
+            async def handle(self, context, next_handler):
+                return await next_handler(context)
+
+        handler = AsyncMock()
+        self.router.on('devices/{device_id}/status', handler, middleware=[_PassMW()])
+        route = self.router.routes[0]
+        chain = route.chain
+
+        await self.router.dispatch('devices/1/status', {}, self.test_client)
+        await self.router.dispatch('devices/2/status', {}, self.test_client)
+
+        self.assertIs(route.chain, chain)
+        self.assertEqual([c.kwargs['device_id'] for c in handler.call_args_list], ['1', '2'])
+
+    async def test_dispatch_caches_topic_lookup(self):
+        self.router.on('devices/{device_id}/status', AsyncMock())
+
+        await self.router.dispatch('devices/1/status', {}, self.test_client)
+        await self.router.dispatch('devices/1/status', {}, self.test_client)
+
+        self.assertEqual(getattr(self.router._lookup, 'cache_info')().hits, 1)
+
 
 if __name__ == '__main__':
     unittest.main()
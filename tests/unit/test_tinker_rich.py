@@ -1,9 +1,12 @@
 import asyncio
+import sys
 import unittest
 from collections import namedtuple
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from sqlalchemy import Column, Integer
+
 
 def _rich_available():
     try:
@@ -269,7 +272,7 @@ class TestTinkerEnvironmentSetup(unittest.IsolatedAsyncioTestCase):
 
         with (
             patch.object(Model, '_is_enabled', True),
-            patch.object(Model, 'get_session', new=AsyncMock(return_value=session)),
+            patch.object(Model, 'get_session', new=MagicMock(return_value=session)),
             patch('builtins.print') as mock_print,
         ):
             await env._setup_database_session()
@@ -319,10 +322,141 @@ class TestTinkerEnvironmentSetup(unittest.IsolatedAsyncioTestCase):
         mock_plain.assert_called_once()
 
 
+class TestTinkerModelImport(unittest.TestCase):
+    def setUp(self):
+        from routemq.tinker import TinkerEnvironment
+
+        patcher = patch.object(TinkerEnvironment, '_model_cache', {})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cached_import_returns_loaded_module_without_importing(self):
+        from routemq.tinker import _cached_import
+
+        with patch('routemq.tinker.importlib.import_module') as import_module:
+            self.assertIs(_cached_import('routemq.tinker'), sys.modules['routemq.tinker'])
+
+        import_module.assert_not_called()
+
+    def test_import_models_exposes_models_without_importing_them(self):
+        from app.models.queue_job import QueueJob
+        from routemq.model import Model
+        from routemq.tinker import TinkerEnvironment
+
+        app = MagicMock()
+        app.redis_enabled = False
+        with patch.object(Model, '_is_enabled', True), patch('routemq.tinker._cached_import') as cached_import:
+            env = TinkerEnvironment(app)
+
+        cached_import.assert_not_called()
+        self.assertEqual(env.globals.lazy_models['QueueJob'], 'app.models.queue_job')
+        self.assertNotIn('QueueJob', env.globals)
+        self.assertIs(env.globals['QueueJob'], QueueJob)
+        self.assertIn('QueueJob', env.globals)
+
+    def test_import_models_reuses_scan_of_unchanged_model_files(self):
+        from routemq.model import Model
+        from routemq.tinker import TinkerEnvironment
+
+        app = MagicMock()
+        app.redis_enabled = False
+        with patch.object(Model, '_is_enabled', True):
+            first = TinkerEnvironment(app)
+            with patch('routemq.tinker._public_top_level_names') as scan:
+                second = TinkerEnvironment(app)
+
+        scan.assert_not_called()
+        self.assertEqual(second.globals.lazy_models, first.globals.lazy_models)
+
+    def test_import_models_lists_modules_from_zipped_install(self):
+        import importlib.util
+        import tempfile
+        import zipfile
+
+        from routemq.model import Model
+        from routemq.tinker import TinkerEnvironment
+
+        with tempfile.TemporaryDirectory() as tmp:
+            archive = f'{tmp}/models.zip'
+            with zipfile.ZipFile(archive, 'w') as bundle:
+                bundle.writestr('zipped_models/__init__.py', '')
+                bundle.writestr('zipped_models/gadget.py', 'class Gadget(Base):\n    pass\n')
+            sys.path.insert(0, archive)
+            self.addCleanup(sys.path.remove, archive)
+            package = importlib.util.find_spec('zipped_models')
+            self.addCleanup(sys.modules.pop, 'zipped_models', None)
+
+            app = MagicMock()
+            app.redis_enabled = False
+            with (
+                patch.object(Model, '_is_enabled', True),
+                patch('routemq.tinker.importlib.util.find_spec', return_value=package),
+            ):
+                env = TinkerEnvironment(app)
+
+        self.assertEqual(env.globals.lazy_models, {'Gadget': 'app.models.gadget'})
+
+    def test_import_models_skipped_when_database_disabled(self):
+        from routemq.model import Model
+        from routemq.tinker import TinkerEnvironment
+
+        app = MagicMock()
+        app.redis_enabled = False
+        with patch.object(Model, '_is_enabled', False), patch.object(TinkerEnvironment, '_import_models') as scan:
+            env = TinkerEnvironment(app)
+
+        scan.assert_not_called()
+        self.assertEqual(env.globals.lazy_models, {})
+
+    def test_public_top_level_names_reads_classes_and_imports_only(self):
+        from routemq.tinker import _public_top_level_names
+
+        source = (
+            'from sqlalchemy import Column\n'
+            'from routemq.queue.models import QueueJob as Job, _Private\n'
+            'class Device(Base):\n'
+            '    pass\n'
+            'def helper():\n'
+            '    pass\n'
+        )
+
+        self.assertEqual(_public_top_level_names(source), ['Column', 'Device', 'Job'])
+
+    def test_lazy_namespace_only_resolves_base_models(self):
+        import types
+
+        from routemq.model import Base
+        from routemq.tinker import _LazyModelNamespace
+
+        class Widget(Base):
+            __tablename__ = 'tinker_widgets'
+            __table_args__ = {'extend_existing': True}
+            id = Column(Integer, primary_key=True)
+
+        self.addCleanup(Base.metadata.remove, Widget.__table__)
+        module = types.ModuleType('app.models.tinker_widget')
+        module.Widget = Widget
+        module.Column = Column
+        namespace = _LazyModelNamespace({'app': object()})
+        namespace.lazy_models.update(Widget='app.models.tinker_widget', Column='app.models.tinker_widget')
+
+        with patch.dict(sys.modules, {'app.models.tinker_widget': module}):
+            self.assertIs(namespace['Widget'], Widget)
+            with self.assertRaises(KeyError):
+                namespace['Column']
+            with self.assertRaises(KeyError):
+                namespace['missing']
+
+        self.assertEqual(eval('Widget', namespace), Widget)
+        self.assertNotIn('Column', namespace.lazy_models)
+
+
 class TestAsyncMagics(unittest.TestCase):
     def test_arun_wraps_line_in_await(self):
-        from routemq.tinker import AsyncMagics
+        from routemq import tinker
 
+        tinker._load_ipython()
+        AsyncMagics = tinker.AsyncMagics
         shell = MagicMock()
         magics = AsyncMagics()
         magics.shell = shell
@@ -339,6 +473,14 @@ class TestRichFallback(unittest.TestCase):
 
         self.assertTrue(hasattr(routemq.tinker, '_RICH_AVAILABLE'))
 
+    def test_module_import_leaves_ipython_unloaded(self):
+        import subprocess
+
+        code = 'import sys, routemq.tinker; print(any(name.split(".")[0] == "IPython" for name in sys.modules))'
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+
+        self.assertEqual(result.stdout.strip(), 'False')
+
     def test_plain_banner_is_available_for_rich_fallback(self):
         from routemq.model import Model
         from routemq.tinker import TinkerEnvironment
@@ -387,7 +529,9 @@ class TestTinkerStartup(unittest.TestCase):
         with (
             patch('routemq.tinker.Application', return_value=app) as application,
             patch('routemq.tinker.TinkerEnvironment', return_value=env),
-            patch('routemq.tinker.TerminalInteractiveShell.instance', return_value=shell),
+            patch('routemq.tinker._load_ipython'),
+            patch('routemq.tinker._allow_nested_loop'),
+            patch('routemq.tinker.TerminalInteractiveShell', instance=MagicMock(return_value=shell)),
             patch('routemq.tinker.embed'),
             patch('routemq.tinker.asyncio.run', side_effect=original_run),
             patch('builtins.print'),
@@ -396,6 +540,50 @@ class TestTinkerStartup(unittest.TestCase):
 
         application.assert_called_once_with(env_file='custom.env', show_banner=False, log_to_console=False)
         env.setup.assert_awaited_once()
+        shell.register_magics.assert_called_once()
+
+    def test_start_tinker_sync_registers_magics_once_per_shell(self):
+        from routemq import tinker
+
+        tinker._load_ipython()
+        env = MagicMock()
+        env.globals = {}
+        env.session = None
+        env.setup = AsyncMock()
+        shell = MagicMock()
+        shell.magics_manager.registry = {'AsyncMagics': object()}
+
+        with (
+            patch('routemq.tinker.Application'),
+            patch('routemq.tinker.TinkerEnvironment', return_value=env),
+            patch('routemq.tinker._allow_nested_loop'),
+            patch('routemq.tinker.TerminalInteractiveShell', instance=MagicMock(return_value=shell)),
+            patch('routemq.tinker.embed') as embed,
+            patch('builtins.print'),
+        ):
+            tinker.start_tinker_sync()
+
+        shell.register_magics.assert_not_called()
+        self.assertIs(embed.call_args.kwargs['config'], shell.config)
+
+    def test_start_tinker_sync_reuses_an_already_running_loop(self):
+        from routemq.tinker import start_tinker_sync
+
+        loop = MagicMock()
+        loop.run_until_complete.side_effect = lambda coro: coro.close()
+
+        with (
+            patch('routemq.tinker.asyncio.get_running_loop', return_value=loop),
+            patch('routemq.tinker._allow_nested_loop') as allow_nested_loop,
+            patch('routemq.tinker.asyncio.run') as run,
+            patch('threading.Thread') as thread,
+        ):
+            start_tinker_sync()
+
+        allow_nested_loop.assert_called_once_with(loop)
+        loop.run_until_complete.assert_called_once()
+        run.assert_not_called()
+        thread.assert_not_called()
 
 
 if __name__ == '__main__':